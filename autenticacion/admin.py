@@ -1,7 +1,11 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.forms import ReadOnlyPasswordHashField
 from django import forms
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+from . import busqueda, estados
 from .models import Cliente, Persona, Proveedor, TipoCliente, Usuario, Rol, UsuarioRol, Permiso, RolPermiso
 from django.utils.html import format_html
 
@@ -53,6 +57,66 @@ class UsuarioChangeForm(forms.ModelForm):
         fields = '__all__'
 
 
+# ============= PAGINACIÓN Y BÚSQUEDA =============
+
+class PaginadorEstimado(Paginator):
+    """
+    Paginador que evita COUNT(*) sobre tablas grandes sin filtrar.
+    Sin filtros usa la estimación de PostgreSQL (pg_class.reltuples);
+    con filtros o en tablas pequeñas cuenta normalmente.
+    """
+    # Por debajo de este número de filas el COUNT(*) es barato
+    UMBRAL_ESTIMACION = 10000
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and not query.where and connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                    [self.object_list.model._meta.db_table]
+                )
+                fila = cursor.fetchone()
+            if fila and fila[0] > self.UMBRAL_ESTIMACION:
+                return fila[0]
+        return super().count
+
+
+class BusquedaIndexadaMixin:
+    """
+    Búsqueda del changelist y del autocompletado por la ruta indexada
+    de busqueda.py, con paginación estimada.
+    """
+    paginator = PaginadorEstimado
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term or not self.get_search_fields(request):
+            return queryset, False
+        if len(busqueda.palabras(search_term)) > busqueda.MAX_PALABRAS:
+            messages.warning(
+                request,
+                f'Solo se buscaron las primeras {busqueda.MAX_PALABRAS} palabras del término.',
+                fail_silently=True,
+            )
+        return busqueda.filtrar(queryset, search_term, self.get_search_fields(request)), False
+
+
+# ============= ACCIONES MASIVAS =============
+
+def _accion_estado(cambiar_estado, activo, descripcion):
+    """Acción del admin que cambia el estado de la selección con un UPDATE"""
+    @admin.action(description=descripcion)
+    def accion(modeladmin, request, queryset):
+        total = cambiar_estado(queryset, activo)
+        modeladmin.message_user(
+            request, f'{total} registros {"activados" if activo else "desactivados"}.'
+        )
+    accion.__name__ = f'{"activar" if activo else "desactivar"}_seleccionados'
+    return accion
+
+
 # ============= INLINE PARA RELACIONES =============
 
 class UsuarioRolInline(admin.TabularInline):
@@ -72,7 +136,7 @@ class RolPermisoInline(admin.TabularInline):
 # ============= ADMIN MODELS =============
 
 @admin.register(Persona)
-class PersonaAdmin(admin.ModelAdmin):
+class PersonaAdmin(BusquedaIndexadaMixin, admin.ModelAdmin):
     form = PersonaAdminForm
     list_display = ('cedula_identidad', 'nombre', 'apellido_paterno', 'apellido_materno', 
                     'numero_celular', 'correo', 'fecha_creacion')
@@ -95,13 +159,14 @@ class PersonaAdmin(admin.ModelAdmin):
 
 
 @admin.register(Usuario)
-class UsuarioAdmin(BaseUserAdmin):
+class UsuarioAdmin(BusquedaIndexadaMixin, BaseUserAdmin):
     form = UsuarioChangeForm
     add_form = UsuarioCreationForm
     
     list_display = ('nombre_usuario', 'get_nombre_completo', 'is_active', 'is_staff', 
                     'is_superuser', 'fecha_creacion')
     list_filter = ('is_staff', 'is_superuser', 'is_active', 'fecha_creacion')
+    list_select_related = ('persona',)
     
     fieldsets = (
         (None, {'fields': ('nombre_usuario', 'password')}),
@@ -124,6 +189,14 @@ class UsuarioAdmin(BaseUserAdmin):
     ordering = ('-fecha_creacion',)
     filter_horizontal = ()
     inlines = [UsuarioRolInline]
+    actions = [
+        _accion_estado(estados.cambiar_estado_usuarios, True, 'Activar usuarios seleccionados'),
+        _accion_estado(estados.cambiar_estado_usuarios, False, 'Desactivar usuarios seleccionados (y sus roles)'),
+    ]
+    
+    def get_queryset(self, request):
+        # El autocompletado muestra str(usuario), que incluye a la persona
+        return super().get_queryset(request).select_related('persona')
     
     def get_nombre_completo(self, obj):
         return obj.get_nombre_completo()
@@ -154,6 +227,7 @@ class RolAdmin(admin.ModelAdmin):
 class UsuarioRolAdmin(admin.ModelAdmin):
     list_display = ('usuario', 'rol', 'estado', 'fecha_asignacion')
     list_filter = ('rol', 'estado', 'fecha_asignacion')
+    list_select_related = ('usuario__persona', 'rol')
     search_fields = ('usuario__nombre_usuario', 'rol__nombre_rol')
     ordering = ('-fecha_asignacion',)
     
@@ -188,6 +262,7 @@ class PermisoAdmin(admin.ModelAdmin):
 class RolPermisoAdmin(admin.ModelAdmin):
     list_display = ('rol', 'permiso', 'asignado_por', 'fecha_asignacion')
     list_filter = ('rol', 'permiso__modulo', 'fecha_asignacion')
+    list_select_related = ('rol', 'permiso')
     search_fields = ('rol__nombre_rol', 'permiso__nombre_permiso')
     ordering = ('-fecha_asignacion',)
     
@@ -207,7 +282,7 @@ Admin para Clientes y Proveedores
 # ============= TIPO DE CLIENTE =============
 
 @admin.register(TipoCliente)
-class TipoClienteAdmin(admin.ModelAdmin):
+class TipoClienteAdmin(BusquedaIndexadaMixin, admin.ModelAdmin):
     list_display = ('nombre_tipo', 'codigo', 'fecha_creacion')
     list_filter = ('codigo',)
     search_fields = ('nombre_tipo', 'codigo', 'descripcion')
@@ -227,7 +302,7 @@ class TipoClienteAdmin(admin.ModelAdmin):
 # ============= CLIENTE ADMIN - CORREGIDO =============
 
 @admin.register(Cliente)
-class ClienteAdmin(admin.ModelAdmin):
+class ClienteAdmin(BusquedaIndexadaMixin, admin.ModelAdmin):
     list_display = (
         'get_nombre_completo',
         'get_cedula',
@@ -245,6 +320,8 @@ class ClienteAdmin(admin.ModelAdmin):
         'fecha_registro'
     )
     
+    list_select_related = ('usuario__persona', 'tipo_cliente')
+    
     search_fields = (
         'usuario__persona__nombre',
         'usuario__persona__apellido_paterno',
@@ -257,6 +334,10 @@ class ClienteAdmin(admin.ModelAdmin):
     
     readonly_fields = ('fecha_registro', 'fecha_actualizacion', 'mostrar_datos_persona')
     autocomplete_fields = ['usuario', 'tipo_cliente']
+    actions = [
+        _accion_estado(estados.cambiar_estado_clientes, True, 'Activar clientes seleccionados'),
+        _accion_estado(estados.cambiar_estado_clientes, False, 'Desactivar clientes seleccionados'),
+    ]
     
     fieldsets = (
         ('Usuario Asociado', {
@@ -324,7 +405,7 @@ class ClienteAdmin(admin.ModelAdmin):
 # ============= PROVEEDOR ADMIN - CORREGIDO =============
 
 @admin.register(Proveedor)
-class ProveedorAdmin(admin.ModelAdmin):
+class ProveedorAdmin(BusquedaIndexadaMixin, admin.ModelAdmin):
     list_display = (
         'get_nombre_completo',
         'get_cedula',
@@ -342,6 +423,8 @@ class ProveedorAdmin(admin.ModelAdmin):
         'fecha_registro'
     )
     
+    list_select_related = ('persona',)
+    
     search_fields = (
         'persona__nombre',
         'persona__apellido_paterno',
@@ -353,6 +436,10 @@ class ProveedorAdmin(admin.ModelAdmin):
     
     readonly_fields = ('fecha_registro', 'fecha_actualizacion', 'mostrar_datos_persona')
     autocomplete_fields = ['persona']
+    actions = [
+        _accion_estado(estados.cambiar_estado_proveedores, True, 'Activar proveedores seleccionados'),
+        _accion_estado(estados.cambiar_estado_proveedores, False, 'Desactivar proveedores seleccionados'),
+    ]
     
     fieldsets = (
         ('Información Personal', {
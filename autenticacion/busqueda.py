@@ -0,0 +1,103 @@
+"""
+Búsqueda por texto sobre columnas indexadas (ver migración 0006)
+
+Un OR de `icontains` entre columnas de varias tablas unidas por JOIN obliga
+a PostgreSQL a filtrar fila por fila después del JOIN, sin usar índices.
+Aquí las columnas se agrupan por tabla: las de cada tabla relacionada se
+resuelven en una subconsulta `pk IN (...)` que PostgreSQL combina con un
+BitmapOr de los índices trigram, y solo el resultado se une a la tabla
+principal.
+
+Cada palabra del término debe aparecer en alguna de las columnas (AND entre
+palabras, OR entre columnas), igual que la búsqueda estándar del admin, con
+los mismos prefijos por campo (^ prefijo, = exacto, @ texto completo) y
+frases entre comillas. El lookup `search` de @ solo existe con
+django.contrib.postgres, que no está instalado: @ busca como `icontains`. Con menos de 3 caracteres el índice trigram no
+ayuda, pero la palabra se sigue buscando como `icontains`.
+"""
+from collections import defaultdict
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+from django.utils.text import smart_split, unescape_string_literal
+
+# Palabras consideradas por búsqueda; cada una agrega subconsultas
+MAX_PALABRAS = 5
+
+# Búsqueda por defecto y la de cada prefijo del admin
+LOOKUP_POR_DEFECTO = 'icontains'
+LOOKUP_POR_PREFIJO = {
+    '^': 'istartswith',
+    '=': 'iexact',
+    '@': 'icontains',
+}
+
+
+def _modelo_relacionado(modelo, ruta):
+    for nombre in ruta.split('__'):
+        modelo = modelo._meta.get_field(nombre).related_model
+    return modelo
+
+
+def _separar(modelo, campo):
+    """'^persona__nombre' -> ('persona', 'nombre__istartswith')"""
+    lookup = LOOKUP_POR_PREFIJO.get(campo[:1])
+    if lookup:
+        campo = campo[1:]
+    partes = campo.split('__')
+    posicion = 0
+    while posicion < len(partes) - 1:
+        relacionado = modelo._meta.get_field(partes[posicion]).related_model
+        if relacionado is None:
+            break
+        modelo = relacionado
+        posicion += 1
+    ruta = '__'.join(partes[:posicion])
+    # Un lookup explícito (p. ej. 'nombre__iexact') se respeta tal cual
+    if posicion < len(partes) - 1:
+        return ruta, '__'.join(partes[posicion:])
+    return ruta, f'{partes[posicion]}__{lookup or LOOKUP_POR_DEFECTO}'
+
+
+def _agrupar(modelo, campos):
+    """{'ruta__relacion': [columna__lookup]}; la ruta vacía es la tabla principal"""
+    grupos = defaultdict(list)
+    for campo in campos:
+        ruta, columna = _separar(modelo, campo)
+        grupos[ruta].append(columna)
+    return grupos
+
+
+def condicion(modelo, palabra, campos):
+    """Q que exige `palabra` en alguna de las columnas de `campos`"""
+    condiciones = []
+    for ruta, columnas in _agrupar(modelo, campos).items():
+        q = reduce(or_, (Q(**{columna: palabra}) for columna in columnas))
+        if not ruta:
+            condiciones.append(q)
+        else:
+            relacionado = _modelo_relacionado(modelo, ruta)
+            condiciones.append(Q(**{f'{ruta}__in': relacionado.objects.filter(q).values('pk')}))
+    return reduce(or_, condiciones)
+
+
+def palabras(termino):
+    """Palabras de `termino` como las separa el admin; una frase entre comillas es una palabra"""
+    resultado = []
+    for palabra in smart_split(termino or ''):
+        if palabra.startswith(('"', "'")) and palabra[0] == palabra[-1]:
+            palabra = unescape_string_literal(palabra)
+        if palabra:
+            resultado.append(palabra)
+    return resultado
+
+
+def filtrar(queryset, termino, campos):
+    """
+    Filtra `queryset` por cada palabra de `termino` sobre `campos`. Solo se
+    usan las primeras MAX_PALABRAS; quien llama debe avisar si hubo más.
+    """
+    for palabra in palabras(termino)[:MAX_PALABRAS]:
+        queryset = queryset.filter(condicion(queryset.model, palabra, campos))
+    return queryset
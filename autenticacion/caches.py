@@ -0,0 +1,10 @@
+"""
+Espacios de caché de autenticacion (ver core/cache.py)
+
+Cada espacio agrupa resultados que se invalidan juntos.
+"""
+from core.cache import EspacioCache
+
+# Conteos de usuarios, clientes y proveedores. Se invalidan en altas y bajas
+# (signals.py y estados.py); el TTL cubre los cambios que no pasan por ahí.
+ESTADISTICAS = EspacioCache('estadisticas', ttl=60)
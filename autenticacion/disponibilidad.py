@@ -0,0 +1,224 @@
+"""
+Verificación de disponibilidad de usuario, cédula, correo y NIT
+
+Cada worker mantiene en memoria un filtro de Bloom por campo con los
+valores ya registrados. Un filtro de Bloom nunca da falsos negativos: si
+dice que un valor no está, el valor está libre y se responde sin tocar la
+BD. Solo los posibles positivos se confirman, todos juntos, con una única
+consulta UNION.
+
+Los valores nuevos se agregan al filtro del worker que los guarda y, al
+confirmarse la transacción, incrementan una versión en la caché compartida
+(ver signals.py), como los datos de referencia. Cada verificación compara
+esa versión y, si cambió, el worker reconstruye sus filtros antes de
+responder: un valor recién registrado en otro worker no aparece como
+disponible. Además los filtros se reconstruyen cada FILTRO_TTL segundos,
+para reflejar ediciones y bajas.
+"""
+import hashlib
+import math
+import re
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import CharField, Value
+
+from .models import Cliente, Persona, Proveedor, Usuario
+
+CLAVE_VERSION = 'disponibilidad:version'
+
+# Segundos antes de reconstruir los filtros desde la BD aunque la versión no cambie
+FILTRO_TTL = 300
+
+# Tasa de falsos positivos objetivo
+FILTRO_ERROR = 0.01
+
+CEDULA_REGEX = re.compile(r'^\d{7,8}(-[A-Z]{1,3})?$')
+
+
+class FiltroBloom:
+    """Filtro de Bloom sobre un bytearray con doble hashing (blake2b)"""
+
+    def __init__(self, capacidad, error=FILTRO_ERROR):
+        capacidad = max(capacidad, 1000)
+        self.num_bits = int(-capacidad * math.log(error) / (math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacidad * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _posiciones(self, valor):
+        digest = hashlib.blake2b(valor.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def agregar(self, valor):
+        for pos in self._posiciones(valor):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, valor):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._posiciones(valor))
+
+
+def normalizar(campo, valor):
+    """Normaliza igual que los serializers al guardar"""
+    valor = (valor or '').strip()
+    if campo == 'cedula_identidad':
+        return valor.upper()
+    if campo == 'nit':
+        return valor
+    return valor.lower()
+
+
+# campo -> [(modelo, columna)] de donde se cargan los valores existentes
+FUENTES = {
+    'nombre_usuario': [(Usuario, 'nombre_usuario')],
+    'cedula_identidad': [(Persona, 'cedula_identidad')],
+    'correo': [(Persona, 'correo')],
+    'nit': [(Cliente, 'nit'), (Proveedor, 'nit')],
+}
+
+CAMPOS = tuple(FUENTES)
+
+
+class RegistroFiltros:
+    """Filtros de Bloom del proceso, reconstruidos de forma perezosa"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._filtros = {}
+        self._version = None
+        self._construido = 0.0
+
+    def _construir(self):
+        filtros = {}
+        for campo, fuentes in FUENTES.items():
+            total = sum(modelo.objects.count() for modelo, _ in fuentes)
+            filtro = FiltroBloom(int(total * 1.5))
+            for modelo, columna in fuentes:
+                valores = modelo.objects.exclude(**{f'{columna}__isnull': True}).values_list(columna, flat=True)
+                for valor in valores.iterator(chunk_size=5000):
+                    filtro.agregar(normalizar(campo, valor))
+            filtros[campo] = filtro
+        return filtros
+
+    def version(self):
+        """Versión compartida de los valores registrados"""
+        version = cache.get(CLAVE_VERSION)
+        if version is None:
+            cache.add(CLAVE_VERSION, 1, None)
+            version = cache.get(CLAVE_VERSION, 1)
+        return version
+
+    def _vigentes(self, version):
+        return version == self._version and time.monotonic() - self._construido <= FILTRO_TTL
+
+    def filtros(self):
+        version = self.version()
+        if not self._vigentes(version):
+            with self._lock:
+                if not self._vigentes(version):
+                    # La versión se lee antes de construir: un alta confirmada
+                    # durante la construcción deja la versión desfasada y se
+                    # reconstruye en la próxima verificación
+                    self._filtros = self._construir()
+                    self._version = version
+                    self._construido = time.monotonic()
+        return self._filtros
+
+    def agregar(self, campo, valor):
+        """
+        Registra un valor recién guardado: se agrega al filtro de este worker
+        y, al confirmarse la transacción, se avisa a los demás
+        """
+        if not valor:
+            return
+        filtro = self._filtros.get(campo)
+        if filtro is not None:
+            filtro.agregar(normalizar(campo, valor))
+        transaction.on_commit(self._publicar)
+
+    def _publicar(self):
+        try:
+            version = cache.incr(CLAVE_VERSION)
+        except ValueError:
+            cache.add(CLAVE_VERSION, 2, None)
+            return
+        # Si nadie más registró nada desde que se construyeron, los filtros
+        # de este worker ya tienen el valor y no hace falta reconstruirlos
+        if self._version == version - 1:
+            self._version = version
+
+    def invalidar(self):
+        """Descarta los filtros de todos los workers (altas con bulk_create)"""
+        try:
+            cache.incr(CLAVE_VERSION)
+        except ValueError:
+            cache.add(CLAVE_VERSION, 2, None)
+        self._construido = 0.0
+
+
+registro = RegistroFiltros()
+
+
+def _confirmar(candidatos):
+    """Confirma en una sola consulta qué candidatos existen realmente"""
+    consultas = []
+    for campo, valor in candidatos.items():
+        for modelo, columna in FUENTES[campo]:
+            lookup = columna if campo in ('cedula_identidad', 'nit') else f'{columna}__iexact'
+            consultas.append(
+                modelo.objects.filter(**{lookup: valor})
+                .annotate(campo=Value(campo, output_field=CharField()))
+                .values_list('campo', flat=True)
+                .order_by()
+            )
+
+    if not consultas:
+        return set()
+
+    consulta = consultas[0].union(*consultas[1:]) if len(consultas) > 1 else consultas[0]
+    return set(consulta)
+
+
+def registrados(valores):
+    """
+    Retorna el conjunto de campos de {campo: valor} que ya están registrados,
+    consultando la BD directamente (una sola consulta, sin filtro de Bloom)
+    """
+    return _confirmar({
+        campo: normalizar(campo, valor)
+        for campo, valor in valores.items()
+        if campo in FUENTES and valor
+    })
+
+
+def verificar(valores):
+    """
+    Recibe {campo: valor} y retorna {campo: {'valor', 'disponible', 'valido'}}.
+    Ignora campos desconocidos o vacíos.
+    """
+    valores = {
+        campo: normalizar(campo, valor)
+        for campo, valor in valores.items()
+        if campo in FUENTES and valor and str(valor).strip()
+    }
+
+    resultados = {}
+    filtros = registro.filtros()
+    candidatos = {}
+
+    for campo, valor in valores.items():
+        if campo == 'cedula_identidad' and not CEDULA_REGEX.match(valor):
+            resultados[campo] = {'valor': valor, 'valido': False, 'disponible': False}
+            continue
+        resultados[campo] = {'valor': valor, 'valido': True, 'disponible': True}
+        if valor in filtros[campo]:
+            candidatos[campo] = valor
+
+    for campo in _confirmar(candidatos):
+        resultados[campo]['disponible'] = False
+
+    return resultados
@@ -0,0 +1,62 @@
+"""
+Activación y desactivación masiva de usuarios, clientes y proveedores
+
+Cada operación recibe un queryset y aplica UPDATE ... WHERE id IN (...)
+sin cargar las instancias, dentro de una sola transacción. Como update()
+no pasa por save(), fecha_actualizacion se asigna explícitamente y las
+estadísticas se invalidan al confirmar la transacción.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from .caches import ESTADISTICAS
+from .models import Usuario, UsuarioRol
+
+# Máximo de ids por petición
+MAXIMO_IDS = 5000
+
+
+def cambiar_estado_usuarios(usuarios, activo):
+    """
+    Activa o desactiva los usuarios del queryset. Al desactivar, sus roles
+    pasan a INACTIVO en la misma transacción (igual que eliminar_usuario).
+    Retorna la cantidad de usuarios actualizados.
+    """
+    ahora = timezone.now()
+    with transaction.atomic():
+        # Primero las filas dependientes: el queryset puede filtrar por el
+        # mismo campo que se actualiza y quedar vacío después del UPDATE
+        if not activo:
+            UsuarioRol.objects.filter(usuario__in=usuarios.values('pk')).exclude(estado='INACTIVO').update(
+                estado='INACTIVO', fecha_actualizacion=ahora
+            )
+        total = usuarios.order_by().update(is_active=activo, fecha_actualizacion=ahora)
+        transaction.on_commit(ESTADISTICAS.invalidar)
+    return total
+
+
+def cambiar_estado_clientes(clientes, activo):
+    """
+    Activa o desactiva los clientes del queryset junto con su usuario
+    (igual que actualizar_cliente). Retorna la cantidad de clientes actualizados.
+    """
+    ahora = timezone.now()
+    with transaction.atomic():
+        Usuario.objects.filter(cliente__in=clientes.values('pk')).update(
+            is_active=activo, fecha_actualizacion=ahora
+        )
+        total = clientes.order_by().update(
+            estado='ACTIVO' if activo else 'INACTIVO', fecha_actualizacion=ahora
+        )
+        transaction.on_commit(ESTADISTICAS.invalidar)
+    return total
+
+
+def cambiar_estado_proveedores(proveedores, activo):
+    """Activa o desactiva los proveedores del queryset. Retorna la cantidad actualizada."""
+    with transaction.atomic():
+        total = proveedores.order_by().update(
+            estado='ACTIVO' if activo else 'INACTIVO', fecha_actualizacion=timezone.now()
+        )
+        transaction.on_commit(ESTADISTICAS.invalidar)
+    return total
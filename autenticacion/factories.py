@@ -0,0 +1,140 @@
+"""
+Factories (factory-boy + Faker) para generar datos de prueba
+
+Los valores respetan los formatos que validan los serializers:
+- cédula: 8 dígitos, opcionalmente con extensión de departamento (1234567-LP)
+- celular: 8 dígitos que empiezan con 6 o 7
+- NIT: 10 dígitos
+
+Cédula, correo, nombre de usuario y NIT se derivan de la secuencia de la
+factory, así que son únicos sin consultar la BD. Las secuencias empiezan en
+un prefijo reservado para datos generados (ver generar_datos).
+
+Las factories sirven para casos puntuales (create() en tests) y como fuente
+de nombres y empresas para generar_datos, que arma las filas masivas con las
+funciones de este módulo en lugar de pasar cada objeto por factory-boy.
+"""
+import unicodedata
+
+import factory
+import factory.random
+from django.contrib.auth.hashers import make_password
+from factory.django import DjangoModelFactory
+
+from .models import Cliente, Persona, Proveedor, Usuario, UsuarioRol
+
+LOCALE = 'es_ES'
+
+# Extensiones de cédula por departamento
+EXTENSIONES_CEDULA = ['LP', 'CB', 'SC', 'OR', 'PT', 'CH', 'TJ', 'BE', 'PD']
+
+DOMINIOS_CORREO = ['gmail.com', 'hotmail.com', 'yahoo.com', 'outlook.com']
+
+# Prefijos de las secuencias: las cédulas generadas empiezan con 9 y los NIT
+# con 9 (clientes) u 8 (proveedores), fuera de los rangos de datos reales
+CEDULA_BASE = 90000000
+NIT_CLIENTE_BASE = 9000000000
+NIT_PROVEEDOR_BASE = 8000000000
+
+# Contraseña de todos los usuarios generados
+PASSWORD_GENERADA = 'roy12345'
+_password_hash = None
+
+
+def password_hash():
+    """Hash de PASSWORD_GENERADA calculado una sola vez (PBKDF2 es lento a propósito)"""
+    global _password_hash
+    if _password_hash is None:
+        _password_hash = make_password(PASSWORD_GENERADA)
+    return _password_hash
+
+
+def _ascii(texto):
+    texto = unicodedata.normalize('NFKD', texto).encode('ascii', 'ignore').decode('ascii')
+    return ''.join(c for c in texto.lower() if c.isalnum())
+
+
+def generar_cedula(n):
+    valor = str(CEDULA_BASE + n)
+    # Una de cada cuatro cédulas lleva extensión
+    if n % 4 == 0:
+        valor += '-' + EXTENSIONES_CEDULA[n % len(EXTENSIONES_CEDULA)]
+    return valor
+
+
+def generar_celular():
+    return factory.random.randgen.choice('67') + str(factory.random.randgen.randrange(10 ** 7)).zfill(7)
+
+
+def generar_correo(nombre, apellido, n):
+    return f'{_ascii(nombre)[:12]}.{_ascii(apellido)[:12]}{n}@{DOMINIOS_CORREO[n % len(DOMINIOS_CORREO)]}'
+
+
+def generar_nombre_usuario(nombre, apellido, n):
+    return f'{_ascii(nombre)[:1]}{_ascii(apellido)[:10]}{n}'
+
+
+def generar_nit_cliente(n):
+    return str(NIT_CLIENTE_BASE + n)
+
+
+def generar_nit_proveedor(n):
+    return str(NIT_PROVEEDOR_BASE + n)
+
+
+class PersonaFactory(DjangoModelFactory):
+    class Meta:
+        model = Persona
+
+    nombre = factory.Faker('first_name', locale=LOCALE)
+    apellido_paterno = factory.Faker('last_name', locale=LOCALE)
+    apellido_materno = factory.Faker('last_name', locale=LOCALE)
+    cedula_identidad = factory.Sequence(generar_cedula)
+    numero_celular = factory.LazyFunction(generar_celular)
+    correo = factory.LazyAttributeSequence(lambda o, n: generar_correo(o.nombre, o.apellido_paterno, n))
+
+
+class UsuarioFactory(DjangoModelFactory):
+    class Meta:
+        model = Usuario
+
+    persona = factory.SubFactory(PersonaFactory)
+    nombre_usuario = factory.LazyAttributeSequence(
+        lambda o, n: generar_nombre_usuario(o.persona.nombre, o.persona.apellido_paterno, n)
+    )
+    password = factory.LazyFunction(password_hash)
+    is_active = True
+
+
+class UsuarioRolFactory(DjangoModelFactory):
+    class Meta:
+        model = UsuarioRol
+
+    usuario = factory.SubFactory(UsuarioFactory)
+    estado = 'ACTIVO'
+
+
+class ClienteFactory(DjangoModelFactory):
+    class Meta:
+        model = Cliente
+
+    usuario = factory.SubFactory(UsuarioFactory)
+    estado = 'ACTIVO'
+
+    class Params:
+        # Clínicas y laboratorios facturan con NIT y razón social
+        empresa = factory.Trait(
+            razon_social=factory.Faker('company', locale=LOCALE),
+            nit=factory.Sequence(generar_nit_cliente),
+        )
+
+
+class ProveedorFactory(DjangoModelFactory):
+    class Meta:
+        model = Proveedor
+
+    persona = factory.SubFactory(PersonaFactory)
+    tipo_proveedor = factory.Iterator([codigo for codigo, _ in Proveedor.TIPO_PROVEEDOR])
+    nit = factory.Sequence(generar_nit_proveedor)
+    razon_social = factory.Faker('company', locale=LOCALE)
+    estado = 'ACTIVO'
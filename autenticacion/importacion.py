@@ -0,0 +1,582 @@
+"""
+Importación masiva de clientes y proveedores desde XLSX/CSV
+
+Las filas se validan por bloques: el formato se revisa en memoria y los
+duplicados (cédula, correo, NIT, nombre de usuario) se detectan con una
+sola consulta `__in` por campo y por bloque. Las filas válidas se insertan
+con `bulk_create`, de modo que cada bloque cuesta un número fijo de
+consultas sin importar cuántas filas tenga.
+
+El mismo mecanismo sirve para el alta masiva de usuarios desde JSON
+(ImportadorUsuarios): ahí las contraseñas se hashean en un pool de hilos,
+porque PBKDF2 domina el costo y hashlib libera el GIL mientras calcula. El
+hasheo se hace en preparar(), antes de abrir la transacción del bloque, para
+no retener locks mientras se calcula.
+"""
+import abc
+import csv
+import io
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import DataError, IntegrityError, transaction
+from django.db.models.functions import Lower
+
+from . import referencias
+from .caches import ESTADISTICAS
+from .disponibilidad import registro as filtros_disponibilidad
+from .models import Cliente, Persona, Proveedor, Rol, Usuario, UsuarioRol
+
+# Filas procesadas por transacción
+TAMANO_BLOQUE = 500
+
+CEDULA_REGEX = re.compile(r'^\d{7,8}(-[A-Z]{1,3})?$')
+CELULAR_REGEX = re.compile(r'^[67]\d{7}$')
+CORREO_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+NOMBRE_REGEX = re.compile(r'^[a-zA-ZÀ-ÿ\s]+$')
+USUARIO_REGEX = re.compile(r'^[a-zA-Z0-9._-]+$')
+NIT_REGEX = re.compile(r'^\d{5,20}$')
+
+
+class ArchivoInvalido(Exception):
+    """El archivo no se pudo leer como XLSX ni como CSV"""
+
+
+# ============ LECTURA DE ARCHIVOS ============
+
+def _normalizar_encabezado(valor):
+    return str(valor or '').strip().lower().replace(' ', '_')
+
+
+def _texto(valor):
+    """Convierte el valor de una celda a texto limpio"""
+    if valor is None:
+        return ''
+    if isinstance(valor, float) and valor.is_integer():
+        # Excel guarda cédulas y NIT numéricos como float
+        valor = int(valor)
+    return str(valor).strip()
+
+
+def leer_filas(archivo):
+    """
+    Genera un dict por fila (encabezados en minúscula) a partir de un
+    archivo subido. Soporta .xlsx y .csv (coma o punto y coma).
+    """
+    nombre = (getattr(archivo, 'name', '') or '').lower()
+
+    if nombre.endswith('.xlsx'):
+        # openpyxl solo se carga cuando realmente se importa un Excel
+        from openpyxl import load_workbook
+
+        try:
+            wb = load_workbook(archivo, read_only=True, data_only=True)
+        except Exception as e:
+            raise ArchivoInvalido(f'No se pudo leer el Excel: {str(e)}')
+
+        try:
+            filas = wb.active.iter_rows(values_only=True)
+            encabezados = [_normalizar_encabezado(h) for h in next(filas, [])]
+            for fila in filas:
+                if fila is None or all(v is None for v in fila):
+                    continue
+                yield {encabezados[i]: _texto(v) for i, v in enumerate(fila) if i < len(encabezados)}
+        finally:
+            wb.close()
+
+    elif nombre.endswith('.csv'):
+        texto = io.TextIOWrapper(archivo, encoding='utf-8-sig', newline='')
+        muestra = texto.read(4096)
+        texto.seek(0)
+        try:
+            dialecto = csv.Sniffer().sniff(muestra, delimiters=',;')
+        except csv.Error:
+            dialecto = csv.excel
+
+        reader = csv.reader(texto, dialecto)
+        encabezados = [_normalizar_encabezado(h) for h in next(reader, [])]
+        for fila in reader:
+            if not any(v.strip() for v in fila):
+                continue
+            yield {encabezados[i]: _texto(v) for i, v in enumerate(fila) if i < len(encabezados)}
+
+    else:
+        raise ArchivoInvalido('Formato no soportado. Use un archivo .xlsx o .csv')
+
+
+def leer_items(items):
+    """Normaliza una lista de dicts (JSON) al mismo formato que leer_filas"""
+    for item in items:
+        if not isinstance(item, dict):
+            yield {}
+            continue
+        yield {_normalizar_encabezado(k): _texto(v) for k, v in item.items()}
+
+
+def _en_bloques(filas, tamano=TAMANO_BLOQUE, inicio=2):
+    """Agrupa (numero_fila, datos) en listas de `tamano` elementos"""
+    bloque = []
+    for numero, datos in enumerate(filas, start=inicio):
+        bloque.append((numero, datos))
+        if len(bloque) >= tamano:
+            yield bloque
+            bloque = []
+    if bloque:
+        yield bloque
+
+
+# ============ CONTRASEÑAS ============
+
+_pool_hash = None
+_pool_hash_lock = threading.Lock()
+
+
+def hashear_passwords(passwords):
+    """
+    Hashea una lista de contraseñas en paralelo con el hasher configurado.
+    Las vacías producen una contraseña inutilizable (sin acceso).
+    """
+    con_valor = [p for p in passwords if p]
+    if len(con_valor) <= 1:
+        return [make_password(p or None) for p in passwords]
+    return list(_obtener_pool_hash().map(lambda p: make_password(p or None), passwords))
+
+
+def _obtener_pool_hash():
+    """Pool compartido, creado una sola vez aunque lleguen dos lotes a la vez"""
+    global _pool_hash
+    if _pool_hash is None:
+        with _pool_hash_lock:
+            if _pool_hash is None:
+                hilos = getattr(settings, 'IMPORTACION_HASH_WORKERS', None) or os.cpu_count() or 2
+                _pool_hash = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix='hash-password')
+    return _pool_hash
+
+
+# ============ VALIDACIÓN ============
+
+def _validar_persona(datos):
+    """Valida y normaliza los campos de Persona. Retorna (datos, errores)"""
+    errores = {}
+    limpio = {}
+
+    for campo, obligatorio in (('nombre', True), ('apellido_paterno', True), ('apellido_materno', False)):
+        valor = datos.get(campo, '')
+        if not valor:
+            if obligatorio:
+                errores[campo] = 'Campo obligatorio'
+            limpio[campo] = ''
+            continue
+        if len(valor) < 2 or len(valor) > 50 or not NOMBRE_REGEX.match(valor):
+            errores[campo] = 'Debe tener entre 2 y 50 letras'
+        limpio[campo] = valor.title()
+
+    cedula = datos.get('cedula_identidad', '').upper()
+    if not CEDULA_REGEX.match(cedula):
+        errores['cedula_identidad'] = 'Formato de cédula inválido. Ejemplos: 1234567, 1234567-LP'
+    limpio['cedula_identidad'] = cedula
+
+    celular = re.sub(r'[^\d]', '', datos.get('numero_celular', ''))
+    if not CELULAR_REGEX.match(celular):
+        errores['numero_celular'] = 'Debe tener 8 dígitos y empezar con 6 o 7'
+    limpio['numero_celular'] = celular
+
+    correo = datos.get('correo', '').lower()
+    if not CORREO_REGEX.match(correo):
+        errores['correo'] = 'Formato de correo electrónico inválido'
+    limpio['correo'] = correo
+
+    return limpio, errores
+
+
+def _marcar_duplicados(filas, campo, existentes, mensaje):
+    """
+    Marca como error las filas cuyo `campo` ya existe en BD o se repite
+    dentro del mismo archivo (la primera aparición se conserva).
+    """
+    vistos = set()
+    for fila in filas:
+        if fila['errores']:
+            continue
+        valor = fila['datos'].get(campo)
+        if not valor:
+            continue
+        clave = valor.lower()
+        if clave in existentes:
+            fila['errores'][campo] = mensaje
+        elif clave in vistos:
+            fila['errores'][campo] = 'Valor repetido dentro del archivo'
+        else:
+            vistos.add(clave)
+
+
+def _existentes(queryset, campo, valores, sin_mayusculas=False):
+    """
+    Una consulta `__in` que retorna el conjunto (en minúsculas) de valores ya
+    registrados. Con sin_mayusculas compara LOWER(campo), de modo que
+    Ana@x.com en la BD coincide con ana@x.com en el archivo.
+    """
+    valores = [v for v in valores if v]
+    if not valores:
+        return set()
+    if sin_mayusculas:
+        queryset = queryset.annotate(_valor=Lower(campo))
+        campo, valores = '_valor', [v.lower() for v in valores]
+    return {
+        v.lower() for v in queryset.filter(**{f'{campo}__in': valores}).values_list(campo, flat=True)
+    }
+
+
+def _longitudes(modelo, *campos):
+    """{campo: max_length} de los campos de texto de `modelo`"""
+    return {campo: modelo._meta.get_field(campo).max_length for campo in campos}
+
+
+# ============ IMPORTADORES ============
+
+class ImportadorBase(abc.ABC):
+    """Lógica común: lectura por bloques, reporte por fila y transacción por bloque"""
+    entidad = ''
+    # Número de la primera fila de datos (en archivos la fila 1 es el encabezado)
+    primera_fila = 2
+    # Incluir en el reporte el detalle de cada fila creada
+    detallar_creados = False
+
+    def __init__(self, solo_validar=False):
+        self.solo_validar = solo_validar
+        self.creados = 0
+        self.errores = []
+        self.detalle_creados = []
+        self.total = 0
+
+    def importar(self, archivo):
+        return self.procesar(leer_filas(archivo))
+
+    def procesar(self, filas_entrada):
+        for bloque in _en_bloques(filas_entrada, inicio=self.primera_fila):
+            self.total += len(bloque)
+            filas = [self.validar_fila(numero, datos) for numero, datos in bloque]
+            self.validar_longitudes(filas)
+            self.validar_contra_bd(filas)
+
+            validas = [f for f in filas if not f['errores']]
+            self.errores.extend(
+                {'fila': f['fila'], 'errores': f['errores']} for f in filas if f['errores']
+            )
+
+            if validas and not self.solo_validar:
+                self.preparar(validas)
+                try:
+                    with transaction.atomic():
+                        creados = self.insertar(validas)
+                    self.creados += len(validas)
+                    if self.detallar_creados:
+                        self.detalle_creados.extend(creados)
+                except (IntegrityError, DataError) as e:
+                    # Otro proceso insertó un duplicado entre la validación y el insert,
+                    # o un valor que la BD rechaza y validar_fila no detectó
+                    self.errores.extend(
+                        {'fila': f['fila'], 'errores': {'bloque': f'No se pudo insertar: {str(e)}'}}
+                        for f in validas
+                    )
+
+        if self.creados:
+            # bulk_create no emite post_save: el filtro se reconstruye en la próxima consulta
+            filtros_disponibilidad.invalidar()
+            ESTADISTICAS.invalidar()
+
+        self.errores.sort(key=lambda e: e['fila'])
+        return self.reporte()
+
+    def reporte(self):
+        reporte = {
+            'entidad': self.entidad,
+            'total_filas': self.total,
+            'creados': self.creados,
+            'validos': self.total - len(self.errores),
+            'con_errores': len(self.errores),
+            'solo_validar': self.solo_validar,
+            'errores': self.errores,
+        }
+        if self.detallar_creados:
+            reporte['resultados'] = sorted(
+                [{'fila': c['fila'], 'success': True, **c} for c in self.detalle_creados] +
+                [{'fila': e['fila'], 'success': False, **e} for e in self.errores],
+                key=lambda r: r['fila']
+            )
+        return reporte
+
+    @abc.abstractmethod
+    def validar_fila(self, numero, datos):
+        """Retorna {'fila': numero, 'datos': limpios, 'errores': {campo: mensaje}}"""
+
+    def longitudes(self):
+        """
+        {campo: max_length} de los valores que se guardan tal cual; por
+        defecto los de Persona
+        """
+        return _longitudes(
+            Persona, 'nombre', 'apellido_paterno', 'apellido_materno',
+            'cedula_identidad', 'numero_celular', 'correo',
+        )
+
+    def validar_longitudes(self, filas):
+        """
+        Un valor más largo que su columna es un error de la fila; en
+        PostgreSQL llegaría al INSERT como DataError
+        """
+        longitudes = self.longitudes()
+        for fila in filas:
+            for campo, maximo in longitudes.items():
+                valor = fila['datos'].get(campo)
+                if isinstance(valor, str) and len(valor) > maximo and campo not in fila['errores']:
+                    fila['errores'][campo] = f'Máximo {maximo} caracteres'
+
+    def unicos(self):
+        """
+        (campo, queryset, mensaje, sin_mayúsculas) de los campos que no se
+        pueden repetir; por defecto los de Persona
+        """
+        return [
+            ('cedula_identidad', Persona.objects, 'Esta cédula ya está registrada', False),
+            ('correo', Persona.objects, 'Este correo electrónico ya está registrado', True),
+        ]
+
+    def validar_contra_bd(self, filas):
+        """Una consulta por campo único para todo el bloque"""
+        for campo, queryset, mensaje, sin_mayusculas in self.unicos():
+            valores = [f['datos'][campo] for f in filas if not f['errores']]
+            if valores:
+                _marcar_duplicados(
+                    filas, campo, _existentes(queryset, campo, valores, sin_mayusculas), mensaje
+                )
+
+    def preparar(self, filas):
+        """Trabajo costoso previo a insertar(), fuera de la transacción del bloque"""
+
+    @abc.abstractmethod
+    def insertar(self, filas):
+        """Inserta las filas válidas del bloque dentro de su transacción"""
+
+    # Altas comunes para preparar() e insertar()
+
+    @staticmethod
+    def hashear(filas):
+        """Guarda en f['hash'] la contraseña hasheada de cada fila"""
+        hashes = hashear_passwords([f['datos']['password'] for f in filas])
+        for f, password in zip(filas, hashes):
+            f['hash'] = password
+
+    @staticmethod
+    def crear_personas(filas):
+        return Persona.objects.bulk_create([
+            Persona(
+                nombre=f['datos']['nombre'],
+                apellido_paterno=f['datos']['apellido_paterno'],
+                apellido_materno=f['datos']['apellido_materno'],
+                cedula_identidad=f['datos']['cedula_identidad'],
+                numero_celular=f['datos']['numero_celular'],
+                correo=f['datos']['correo'],
+            )
+            for f in filas
+        ])
+
+    @staticmethod
+    def crear_usuarios(filas, personas, roles):
+        """Usuarios activos con su rol; `roles` tiene un Rol por fila"""
+        usuarios = Usuario.objects.bulk_create([
+            Usuario(
+                nombre_usuario=f['datos']['nombre_usuario'],
+                persona=persona,
+                password=f['hash'],
+                is_active=True,
+            )
+            for f, persona in zip(filas, personas)
+        ])
+        UsuarioRol.objects.bulk_create([
+            UsuarioRol(usuario=usuario, rol=rol, estado='ACTIVO')
+            for usuario, rol in zip(usuarios, roles)
+        ])
+        return usuarios
+
+
+class ImportadorClientes(ImportadorBase):
+    """
+    Columnas: nombre, apellido_paterno, apellido_materno, cedula_identidad,
+    numero_celular, correo, tipo_cliente (código o nombre), razon_social,
+    nit, nombre_usuario (opcional, por defecto la cédula), password (opcional)
+    """
+    entidad = 'clientes'
+
+    def __init__(self, solo_validar=False):
+        super().__init__(solo_validar)
+        self.tipos = {}
+        for tipo in referencias.tipos_cliente():
+            self.tipos[tipo.codigo.upper()] = tipo
+            self.tipos[tipo.nombre_tipo.upper()] = tipo
+        try:
+            self.rol_cliente = referencias.obtener_rol('CLIENTE')
+        except Rol.DoesNotExist:
+            raise ArchivoInvalido('El rol CLIENTE no existe. Ejecute crear_roles primero')
+
+    def validar_fila(self, numero, datos):
+        limpio, errores = _validar_persona(datos)
+
+        tipo = self.tipos.get(datos.get('tipo_cliente', '').upper())
+        if tipo is None:
+            errores['tipo_cliente'] = 'Tipo de cliente no válido'
+        limpio['tipo_cliente'] = tipo
+
+        nit = datos.get('nit', '')
+        if nit and not NIT_REGEX.match(nit):
+            errores['nit'] = 'El NIT debe contener solo dígitos'
+        limpio['nit'] = nit or None
+        limpio['razon_social'] = datos.get('razon_social', '') or None
+
+        nombre_usuario = (datos.get('nombre_usuario', '') or limpio['cedula_identidad']).lower()
+        if not (3 <= len(nombre_usuario) <= 20) or not USUARIO_REGEX.match(nombre_usuario):
+            errores['nombre_usuario'] = 'Nombre de usuario inválido'
+        limpio['nombre_usuario'] = nombre_usuario
+        limpio['password'] = datos.get('password', '')
+
+        return {'fila': numero, 'datos': limpio, 'errores': errores}
+
+    def longitudes(self):
+        return {
+            **super().longitudes(),
+            **_longitudes(Cliente, 'razon_social', 'nit'),
+            **_longitudes(Usuario, 'nombre_usuario'),
+        }
+
+    def unicos(self):
+        return super().unicos() + [
+            ('nit', Cliente.objects, 'Este NIT ya está registrado', False),
+            ('nombre_usuario', Usuario.objects, 'Este nombre de usuario ya existe', True),
+        ]
+
+    def preparar(self, filas):
+        # Sin contraseña en el archivo la cuenta queda sin acceso hasta que se asigne una
+        self.hashear(filas)
+
+    def insertar(self, filas):
+        personas = self.crear_personas(filas)
+        usuarios = self.crear_usuarios(filas, personas, [self.rol_cliente] * len(filas))
+
+        Cliente.objects.bulk_create([
+            Cliente(
+                usuario=usuario,
+                tipo_cliente=f['datos']['tipo_cliente'],
+                razon_social=f['datos']['razon_social'],
+                nit=f['datos']['nit'],
+                estado='ACTIVO',
+            )
+            for f, usuario in zip(filas, usuarios)
+        ])
+
+
+class ImportadorProveedores(ImportadorBase):
+    """
+    Columnas: nombre, apellido_paterno, apellido_materno, cedula_identidad,
+    numero_celular, correo, tipo_proveedor, nit, razon_social
+    """
+    entidad = 'proveedores'
+    tipos_validos = {codigo for codigo, _ in Proveedor.TIPO_PROVEEDOR}
+
+    def validar_fila(self, numero, datos):
+        limpio, errores = _validar_persona(datos)
+
+        tipo = (datos.get('tipo_proveedor', '') or 'DISTRIBUIDOR').upper()
+        if tipo not in self.tipos_validos:
+            errores['tipo_proveedor'] = 'Tipo de proveedor no válido'
+        limpio['tipo_proveedor'] = tipo
+
+        nit = datos.get('nit', '')
+        if not NIT_REGEX.match(nit):
+            errores['nit'] = 'El NIT es obligatorio y debe contener solo dígitos'
+        limpio['nit'] = nit
+        limpio['razon_social'] = datos.get('razon_social', '') or None
+
+        return {'fila': numero, 'datos': limpio, 'errores': errores}
+
+    def longitudes(self):
+        return {**super().longitudes(), **_longitudes(Proveedor, 'razon_social', 'nit')}
+
+    def unicos(self):
+        return super().unicos() + [
+            ('nit', Proveedor.objects, 'Este NIT ya está registrado', False),
+        ]
+
+    def insertar(self, filas):
+        personas = self.crear_personas(filas)
+
+        Proveedor.objects.bulk_create([
+            Proveedor(
+                persona=persona,
+                tipo_proveedor=f['datos']['tipo_proveedor'],
+                nit=f['datos']['nit'],
+                razon_social=f['datos']['razon_social'],
+                estado='ACTIVO',
+            )
+            for f, persona in zip(filas, personas)
+        ])
+
+
+class ImportadorUsuarios(ImportadorBase):
+    """
+    Alta masiva de usuarios del sistema (sucursales nuevas).
+    Campos: nombre, apellido_paterno, apellido_materno, cedula_identidad,
+    numero_celular, correo, nombre_usuario, password, rol
+    """
+    entidad = 'usuarios'
+    primera_fila = 1
+    detallar_creados = True
+
+    def validar_fila(self, numero, datos):
+        limpio, errores = _validar_persona(datos)
+
+        nombre_usuario = datos.get('nombre_usuario', '').lower()
+        if not (3 <= len(nombre_usuario) <= 20) or not USUARIO_REGEX.match(nombre_usuario):
+            errores['nombre_usuario'] = 'Nombre de usuario inválido'
+        limpio['nombre_usuario'] = nombre_usuario
+
+        password = datos.get('password', '')
+        if len(password) < 6:
+            errores['password'] = 'La contraseña debe tener al menos 6 caracteres'
+        limpio['password'] = password
+
+        try:
+            limpio['rol'] = referencias.obtener_rol(datos.get('rol', '').upper())
+        except Rol.DoesNotExist:
+            errores['rol'] = f'El rol {datos.get("rol", "")} no existe'
+
+        return {'fila': numero, 'datos': limpio, 'errores': errores}
+
+    def longitudes(self):
+        return {**super().longitudes(), **_longitudes(Usuario, 'nombre_usuario')}
+
+    def unicos(self):
+        return [
+            ('nombre_usuario', Usuario.objects, 'El nombre de usuario ya existe', True),
+        ] + super().unicos()
+
+    def preparar(self, filas):
+        # PBKDF2 en paralelo, sin la transacción abierta
+        self.hashear(filas)
+
+    def insertar(self, filas):
+        personas = self.crear_personas(filas)
+        usuarios = self.crear_usuarios(filas, personas, [f['datos']['rol'] for f in filas])
+
+        return [
+            {
+                'fila': f['fila'],
+                'id': usuario.id,
+                'nombre_usuario': usuario.nombre_usuario,
+                'rol': f['datos']['rol'].nombre_rol,
+            }
+            for f, usuario in zip(filas, usuarios)
+        ]
@@ -0,0 +1,180 @@
+"""
+Consultas y filas de los listados de usuarios, clientes y proveedores
+
+Las usan tanto las vistas síncronas (views.py) como las async
+(views_async.py), así que los filtros y el formato de cada fila son los
+mismos en ambas. Las funciones reciben los parámetros GET y devuelven el
+queryset sin evaluar; las filas se arman solo con datos ya cargados
+(select_related / Prefetch), sin consultas adicionales.
+"""
+from django.db.models import Prefetch, Q
+
+from .models import Cliente, Proveedor, Usuario, UsuarioRol
+
+# Sucursal de los filtros del listado de usuarios -> rol que la atiende
+ROL_POR_SUCURSAL = {
+    'roydent': 'VENDEDOR_ROYDENT',
+    'mundo_medico': 'VENDEDOR_MUNDO_MEDICO',
+    'deposito': 'ADMINISTRADOR',
+}
+
+
+def roles_activos():
+    """Prefetch de los roles activos en usuario.roles_activos"""
+    return Prefetch(
+        'usuario_roles',
+        queryset=UsuarioRol.objects.filter(estado='ACTIVO').select_related('rol'),
+        to_attr='roles_activos'
+    )
+
+
+def info_rol(usuario_rol):
+    return {
+        'id': usuario_rol.rol.id,
+        'nombre': usuario_rol.rol.nombre_rol,
+        'descripcion': usuario_rol.rol.descripcion,
+        'sucursal': usuario_rol.get_sucursal_asignada()
+    }
+
+
+# ============ USUARIOS ============
+
+def filtrar_usuarios(params):
+    busqueda = params.get('busqueda', '').strip()
+    rol = params.get('rol', '').strip()
+    estado = params.get('estado', '').strip()
+    sucursal = params.get('sucursal', '').strip()
+
+    usuarios = Usuario.objects.select_related('persona').prefetch_related(roles_activos())
+
+    # Filtro por búsqueda de texto (nombre, usuario, email)
+    if busqueda:
+        usuarios = usuarios.filter(
+            Q(nombre_usuario__icontains=busqueda) |
+            Q(persona__nombre__icontains=busqueda) |
+            Q(persona__apellido_paterno__icontains=busqueda) |
+            Q(persona__apellido_materno__icontains=busqueda) |
+            Q(persona__correo__icontains=busqueda)
+        )
+
+    # Filtro por estado (activo/inactivo)
+    if estado == 'activo':
+        usuarios = usuarios.filter(is_active=True)
+    elif estado == 'inactivo':
+        usuarios = usuarios.filter(is_active=False)
+
+    # Filtro por rol
+    if rol and rol != 'todos':
+        usuarios = usuarios.filter(
+            usuario_roles__rol__nombre_rol=rol,
+            usuario_roles__estado='ACTIVO'
+        ).distinct()
+
+    # Filtro por sucursal
+    if sucursal in ROL_POR_SUCURSAL:
+        usuarios = usuarios.filter(
+            usuario_roles__rol__nombre_rol=ROL_POR_SUCURSAL[sucursal],
+            usuario_roles__estado='ACTIVO'
+        ).distinct()
+
+    # Ordenar por fecha de creación descendente
+    return usuarios.order_by('-fecha_creacion')
+
+
+def datos_usuario(usuario):
+    """Fila del listado; requiere persona y roles_activos cargados"""
+    return {
+        'id': usuario.id,
+        'nombre_usuario': usuario.nombre_usuario,
+        'nombre_completo': usuario.get_nombre_completo(),
+        'email': usuario.persona.correo,
+        'cedula': usuario.persona.cedula_identidad,
+        'celular': usuario.persona.numero_celular,
+        'roles': [info_rol(ur) for ur in usuario.roles_activos],
+        'is_active': usuario.is_active,
+        'fecha_creacion': usuario.fecha_creacion,
+        'ultimo_login': usuario.ultimo_login,
+    }
+
+
+def detalle_usuario(usuario):
+    """Detalle de obtener_usuario; requiere persona y roles_activos cargados"""
+    return {
+        'id': usuario.id,
+        'nombre_usuario': usuario.nombre_usuario,
+        'nombre': usuario.persona.nombre,
+        'apellido_paterno': usuario.persona.apellido_paterno,
+        'apellido_materno': usuario.persona.apellido_materno,
+        'cedula_identidad': usuario.persona.cedula_identidad,
+        'numero_celular': usuario.persona.numero_celular,
+        'correo': usuario.persona.correo,
+        'roles': [
+            {
+                'id': ur.rol.id,
+                'nombre': ur.rol.nombre_rol,
+                'sucursal': ur.get_sucursal_asignada()
+            }
+            for ur in usuario.roles_activos
+        ],
+        'is_active': usuario.is_active,
+    }
+
+
+# ============ CLIENTES ============
+
+def filtrar_clientes(params):
+    tipo_cliente = params.get('tipo_cliente', '').strip()
+    estado = params.get('estado', '').strip()
+    busqueda = params.get('busqueda', '').strip()
+
+    clientes = Cliente.objects.select_related('usuario__persona', 'tipo_cliente')
+
+    if tipo_cliente and tipo_cliente != 'todos':
+        clientes = clientes.filter(tipo_cliente__codigo=tipo_cliente)
+
+    if estado and estado != 'todos':
+        clientes = clientes.filter(estado=estado.upper())
+
+    # Búsqueda por texto
+    if busqueda:
+        clientes = clientes.filter(
+            Q(usuario__persona__nombre__icontains=busqueda) |
+            Q(usuario__persona__apellido_paterno__icontains=busqueda) |
+            Q(usuario__persona__apellido_materno__icontains=busqueda) |
+            Q(usuario__persona__cedula_identidad__icontains=busqueda) |
+            Q(usuario__persona__correo__icontains=busqueda) |
+            Q(razon_social__icontains=busqueda) |
+            Q(nit__icontains=busqueda)
+        )
+
+    return clientes.order_by('-fecha_registro')
+
+
+# ============ PROVEEDORES ============
+
+def filtrar_proveedores(params):
+    tipo_proveedor = params.get('tipo', '').strip()
+    estado = params.get('estado', '').strip()
+    busqueda = params.get('busqueda', '').strip()
+
+    proveedores = Proveedor.objects.select_related('persona')
+
+    if tipo_proveedor and tipo_proveedor != 'todos':
+        proveedores = proveedores.filter(tipo_proveedor=tipo_proveedor.upper())
+
+    if estado and estado != 'todos':
+        proveedores = proveedores.filter(estado=estado.upper())
+
+    # Búsqueda por texto
+    if busqueda:
+        proveedores = proveedores.filter(
+            Q(persona__nombre__icontains=busqueda) |
+            Q(persona__apellido_paterno__icontains=busqueda) |
+            Q(persona__apellido_materno__icontains=busqueda) |
+            Q(persona__cedula_identidad__icontains=busqueda) |
+            Q(persona__correo__icontains=busqueda) |
+            Q(razon_social__icontains=busqueda) |
+            Q(nit__icontains=busqueda)
+        )
+
+    return proveedores.order_by('persona__nombre')
@@ -0,0 +1,310 @@
+"""
+Management command para medir el rendimiento de los endpoints principales
+
+Siembra datos con generar_datos en escalas crecientes (por defecto 1.000,
+10.000 y 100.000 clientes) y, en cada escala, mide para cada endpoint:
+- latencia (mínima, mediana, p95 y media de varias repeticiones)
+- consultas SQL, tiempo en SQL y consultas duplicadas
+- pico de memoria asignada durante la petición (tracemalloc)
+
+Todo ocurre dentro de una transacción que se revierte al final: la BD queda
+como estaba. Las escalas son acumulativas (se siembra solo la diferencia con
+la escala anterior) y cuentan clientes generados, no filas previas de la BD.
+
+Los resultados se guardan en JSON con el commit actual, para comparar dos
+corridas:
+
+    python manage.py benchmark --salida benchmarks/antes.json
+    python manage.py benchmark --salida benchmarks/despues.json --comparar benchmarks/antes.json
+
+La memoria se mide en una ejecución aparte porque tracemalloc hace más
+lenta la petición; las latencias no incluyen ese costo.
+"""
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from io import StringIO
+
+import django
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from autenticacion import referencias
+from autenticacion.caches import ESTADISTICAS
+from autenticacion.disponibilidad import registro as filtros_disponibilidad
+from autenticacion.factories import PASSWORD_GENERADA, password_hash
+from autenticacion.models import Cliente, Persona, Proveedor, Usuario, UsuarioRol
+from core.consultas import registrar_consultas
+from core.estadistica import percentil
+
+ESCALAS = [1000, 10000, 100000]
+
+
+class Caso:
+    """Un endpoint a medir"""
+
+    def __init__(self, nombre, url, metodo='get', datos=None, autenticado=False, sin_cache=False):
+        self.nombre = nombre
+        self.url = url
+        self.metodo = metodo
+        self.datos = datos
+        self.autenticado = autenticado
+        # Las estadísticas se cachean: se invalida antes de cada ejecución
+        # para medir el cálculo y no la lectura de la caché
+        self.sin_cache = sin_cache
+
+
+class Command(BaseCommand):
+    help = 'Medir latencia, consultas y memoria de los endpoints con 1k, 10k y 100k filas'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--escalas', type=str, default=','.join(str(e) for e in ESCALAS),
+                            help='Cantidades de clientes separadas por coma')
+        parser.add_argument('--repeticiones', type=int, default=5,
+                            help='Ejecuciones medidas por endpoint y escala')
+        parser.add_argument('--casos', type=str, default='',
+                            help='Medir solo estos casos (nombres separados por coma)')
+        parser.add_argument('--semilla', type=int, default=2024, help='Semilla de generar_datos')
+        parser.add_argument('--salida', type=str, default='',
+                            help='Archivo JSON de resultados (por defecto benchmarks/<commit>.json)')
+        parser.add_argument('--comparar', type=str, default='',
+                            help='JSON de una corrida anterior para mostrar las diferencias')
+
+    def handle(self, *args, **options):
+        try:
+            escalas = sorted({int(e) for e in options['escalas'].split(',') if e.strip()})
+        except ValueError:
+            raise CommandError('--escalas debe ser una lista de enteros separados por coma')
+        if not escalas or escalas[0] <= 0:
+            raise CommandError('--escalas debe tener al menos una cantidad positiva')
+        if options['repeticiones'] < 1:
+            raise CommandError('--repeticiones debe ser al menos 1')
+
+        anterior = self._leer_anterior(options['comparar'])
+        seleccion = {c.strip() for c in options['casos'].split(',') if c.strip()}
+        resultado = {
+            'entorno': self._entorno(),
+            'repeticiones': options['repeticiones'],
+            'escalas': [],
+        }
+
+        # El middleware de métricas registraría como lentas las peticiones
+        # medidas bajo tracemalloc
+        metricas = logging.getLogger('core.metricas')
+        nivel = metricas.level
+        metricas.setLevel(logging.WARNING)
+
+        host = settings.ALLOWED_HOSTS + ['testserver']
+        with override_settings(ALLOWED_HOSTS=host):
+            try:
+                with transaction.atomic():
+                    self._medir_escalas(escalas, seleccion, options, resultado)
+                    transaction.set_rollback(True)
+            finally:
+                # Las cachés pueden haber guardado datos que ya no existen
+                referencias.limpiar()
+                filtros_disponibilidad.invalidar()
+                ESTADISTICAS.invalidar()
+                metricas.setLevel(nivel)
+
+        salida = options['salida'] or os.path.join(
+            'benchmarks', f'{resultado["entorno"]["commit"] or "sin-commit"}.json'
+        )
+        carpeta = os.path.dirname(salida)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+        with open(salida, 'w', encoding='utf-8') as archivo:
+            json.dump(resultado, archivo, ensure_ascii=False, indent=2)
+        self.stdout.write(self.style.SUCCESS(f'Resultados guardados en {salida}'))
+
+        if anterior:
+            self._comparar(anterior, resultado)
+
+    # ============ MEDICIÓN ============
+
+    def _medir_escalas(self, escalas, seleccion, options, resultado):
+        generados = 0
+        for escala in escalas:
+            self.stdout.write(self.style.MIGRATE_HEADING(f'Escala: {escala} clientes'))
+            inicio = time.perf_counter()
+            call_command(
+                'generar_datos',
+                clientes=escala - generados,
+                proveedores=max(1, (escala - generados) // 20),
+                personal=3 if generados == 0 else 0,
+                semilla=options['semilla'] + generados,
+                # Los datos se revierten al terminar la corrida
+                forzar=True,
+                stdout=StringIO(),
+            )
+            generados = escala
+            self.stdout.write(f'  datos sembrados en {time.perf_counter() - inicio:.1f}s')
+
+            cliente_http, token = self._autenticar()
+            casos = self._casos()
+            if seleccion:
+                desconocidos = seleccion - {caso.nombre for caso in casos}
+                if desconocidos:
+                    raise CommandError(f'Casos desconocidos: {", ".join(sorted(desconocidos))}')
+                casos = [caso for caso in casos if caso.nombre in seleccion]
+
+            medidas = {}
+            for caso in casos:
+                medidas[caso.nombre] = self._medir(cliente_http, token, caso, options['repeticiones'])
+                self._mostrar(caso.nombre, medidas[caso.nombre])
+
+            resultado['escalas'].append({
+                'escala': escala,
+                'filas': {
+                    'personas': Persona.objects.count(),
+                    'usuarios': Usuario.objects.count(),
+                    'clientes': Cliente.objects.count(),
+                    'proveedores': Proveedor.objects.count(),
+                },
+                'casos': medidas,
+            })
+
+    def _casos(self):
+        # Un apellido que existe en los datos generados, para que la búsqueda
+        # devuelva filas en todas las escalas
+        persona = Persona.objects.filter(usuario__cliente__isnull=False).order_by('id').first()
+        termino = persona.apellido_paterno[:4] if persona else 'a'
+        return [
+            Caso('login', '/auth/api/login/', metodo='post', datos=self.credenciales),
+            Caso('verificar_token', '/auth/api/verificar-token/', autenticado=True),
+            Caso('listar_usuarios', '/auth/api/usuarios/'),
+            Caso('listar_clientes', '/auth/api/clientes/'),
+            Caso('listar_clientes_busqueda', f'/auth/api/clientes/?busqueda={termino}'),
+            Caso('estadisticas', '/auth/api/estadisticas/', autenticado=True, sin_cache=True),
+            Caso('estadisticas_usuarios', '/auth/api/usuarios/estadisticas/', sin_cache=True),
+            Caso('estadisticas_clientes', '/auth/api/clientes/estadisticas/', sin_cache=True),
+            Caso('estadisticas_proveedores', '/auth/api/proveedores/estadisticas/', sin_cache=True),
+            Caso('exportar_clientes_excel', '/auth/api/clientes/exportar-excel/'),
+            Caso('exportar_proveedores_excel', '/auth/api/proveedores/exportar-excel/'),
+        ]
+
+    def _autenticar(self):
+        """Inicia sesión con un administrador generado y devuelve el cliente HTTP y su token"""
+        # generar_datos guarda el mismo hash (calculado una vez por proceso)
+        # en todos los usuarios que crea
+        administrador = UsuarioRol.objects.filter(
+            rol__nombre_rol='ADMINISTRADOR', estado='ACTIVO', usuario__password=password_hash(),
+        ).select_related('usuario').order_by('-id').first()
+        if administrador is None:
+            raise CommandError('No hay un administrador generado para autenticar')
+
+        self.credenciales = {
+            'nombre_usuario': administrador.usuario.nombre_usuario,
+            'password': PASSWORD_GENERADA,
+        }
+        cliente_http = Client()
+        response = cliente_http.post('/auth/api/login/', self.credenciales, content_type='application/json')
+        if response.status_code != 200:
+            raise CommandError(f'No se pudo iniciar sesión para el benchmark ({response.status_code})')
+        return cliente_http, response.json()['access']
+
+    def _ejecutar(self, cliente_http, token, caso):
+        if caso.sin_cache:
+            ESTADISTICAS.invalidar()
+        extra = {'HTTP_AUTHORIZATION': f'Bearer {token}'} if caso.autenticado else {}
+        if caso.metodo == 'post':
+            return cliente_http.post(caso.url, caso.datos, content_type='application/json', **extra)
+        return cliente_http.get(caso.url, **extra)
+
+    def _medir(self, cliente_http, token, caso, repeticiones):
+        # Primera ejecución sin medir: carga de módulos, cachés de plantillas, etc.
+        response = self._ejecutar(cliente_http, token, caso)
+
+        tiempos = []
+        for _ in range(repeticiones):
+            with registrar_consultas() as registro:
+                inicio = time.perf_counter()
+                response = self._ejecutar(cliente_http, token, caso)
+                tiempos.append((time.perf_counter() - inicio) * 1000)
+
+        tracemalloc.start()
+        try:
+            self._ejecutar(cliente_http, token, caso)
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        tiempos.sort()
+        return {
+            'estado': response.status_code,
+            'bytes': len(response.content),
+            'ms_min': round(tiempos[0], 2),
+            'ms_mediana': round(statistics.median(tiempos), 2),
+            'ms_p95': round(percentil(tiempos, 95), 2),
+            'ms_media': round(statistics.mean(tiempos), 2),
+            **registro.resumen(),
+            'memoria_pico_kb': round(pico / 1024, 1),
+        }
+
+    # ============ REPORTE ============
+
+    def _mostrar(self, nombre, medida):
+        estilo = self.style.ERROR if medida['estado'] >= 400 else (lambda texto: texto)
+        self.stdout.write(estilo(
+            f'  {nombre:<28} {medida["ms_mediana"]:>10.1f} ms  {medida["consultas"]:>5} consultas  '
+            f'{medida["memoria_pico_kb"]:>10.0f} KB  [{medida["estado"]}]'
+        ))
+
+    def _entorno(self):
+        try:
+            commit = subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5,
+            ).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            commit = ''
+        return {
+            'commit': commit,
+            'fecha': timezone.now().isoformat(),
+            'base_datos': connection.vendor,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'cpus': os.cpu_count(),
+        }
+
+    def _leer_anterior(self, ruta):
+        if not ruta:
+            return None
+        try:
+            with open(ruta, encoding='utf-8') as archivo:
+                return json.load(archivo)
+        except (OSError, ValueError) as error:
+            raise CommandError(f'No se pudo leer {ruta}: {error}')
+
+    def _comparar(self, anterior, actual):
+        """Variación de la mediana y de las consultas respecto a la corrida anterior"""
+        previas = {escala['escala']: escala['casos'] for escala in anterior.get('escalas', [])}
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f'Comparación con {anterior.get("entorno", {}).get("commit") or "corrida anterior"}'
+        ))
+        for escala in actual['escalas']:
+            casos_previos = previas.get(escala['escala'])
+            if not casos_previos:
+                continue
+            self.stdout.write(f'Escala: {escala["escala"]} clientes')
+            for nombre, medida in escala['casos'].items():
+                previa = casos_previos.get(nombre)
+                if not previa or not previa['ms_mediana']:
+                    continue
+                variacion = (medida['ms_mediana'] - previa['ms_mediana']) / previa['ms_mediana'] * 100
+                linea = (
+                    f'  {nombre:<28} {previa["ms_mediana"]:>10.1f} -> {medida["ms_mediana"]:>10.1f} ms '
+                    f'({variacion:+.0f}%)  consultas {previa["consultas"]} -> {medida["consultas"]}'
+                )
+                if variacion > 10 or medida['consultas'] > previa['consultas']:
+                    linea = self.style.WARNING(linea)
+                self.stdout.write(linea)
@@ -0,0 +1,144 @@
+"""
+Management command que compara el JSON de DRF con el del proyecto en
+listar_clientes
+
+Siembra clientes con generar_datos (dentro de una transacción que se
+revierte) y, sobre la respuesta de /auth/api/clientes/, mide:
+- render: JSONRenderer de DRF contra ORJSONRenderer (core/renderers.py),
+  comprobando que producen los mismos bytes
+- parse: JSONParser de DRF contra ORJSONParser
+- bytes en la red sin comprimir, con gzip y con Brotli, con el tiempo de
+  compresión según COMPRESION
+- petición completa sin Accept-Encoding y con 'br' / 'gzip'
+
+    python manage.py benchmark_json --clientes 10000 --repeticiones 10
+"""
+import gzip
+import io
+import logging
+import statistics
+import time
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client
+from django.test.utils import override_settings
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from autenticacion import referencias
+from autenticacion.caches import ESTADISTICAS
+from autenticacion.disponibilidad import registro as filtros_disponibilidad
+from core.renderers import ORJSONParser, ORJSONRenderer
+
+URL = '/auth/api/clientes/'
+
+
+def _mediana_ms(funcion, repeticiones):
+    funcion()
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return round(statistics.median(tiempos), 2)
+
+
+class Command(BaseCommand):
+    help = 'Tiempo de render/parse y bytes en la red de listar_clientes: DRF contra orjson + compresión'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clientes', type=int, default=10000, help='Clientes a generar')
+        parser.add_argument('--repeticiones', type=int, default=10, help='Ejecuciones medidas por caso')
+        parser.add_argument('--semilla', type=int, default=2024, help='Semilla de generar_datos')
+
+    def handle(self, *args, **options):
+        if options['clientes'] < 1 or options['repeticiones'] < 1:
+            raise CommandError('--clientes y --repeticiones deben ser positivos')
+
+        # Las peticiones con miles de clientes superan LENTA_MS y se registrarían
+        metricas = logging.getLogger('core.metricas')
+        nivel = metricas.level
+        metricas.setLevel(logging.WARNING)
+
+        host = settings.ALLOWED_HOSTS + ['testserver']
+        with override_settings(ALLOWED_HOSTS=host):
+            try:
+                with transaction.atomic():
+                    call_command(
+                        'generar_datos',
+                        clientes=options['clientes'],
+                        proveedores=1,
+                        personal=1,
+                        semilla=options['semilla'],
+                        # Los datos se revierten al terminar
+                        forzar=True,
+                        stdout=StringIO(),
+                    )
+                    self._medir(options['repeticiones'])
+                    transaction.set_rollback(True)
+            finally:
+                referencias.limpiar()
+                filtros_disponibilidad.invalidar()
+                ESTADISTICAS.invalidar()
+                metricas.setLevel(nivel)
+
+    def _medir(self, repeticiones):
+        cliente_http = Client()
+        response = cliente_http.get(URL)
+        if response.status_code != 200:
+            raise CommandError(f'{URL} respondió {response.status_code}')
+        datos = response.data
+        self.stdout.write(self.style.MIGRATE_HEADING(f'{URL}: {datos["count"]} clientes'))
+
+        drf = JSONRenderer().render(datos)
+        proyecto = ORJSONRenderer().render(datos)
+        self.stdout.write(self.style.MIGRATE_HEADING('Render'))
+        self._fila('JSONRenderer (DRF)', _mediana_ms(lambda: JSONRenderer().render(datos), repeticiones), len(drf))
+        self._fila('ORJSONRenderer', _mediana_ms(lambda: ORJSONRenderer().render(datos), repeticiones), len(proyecto))
+        if drf == proyecto:
+            self.stdout.write('  salida idéntica byte a byte')
+        else:
+            self.stdout.write(self.style.WARNING('  las salidas difieren'))
+
+        self.stdout.write(self.style.MIGRATE_HEADING('Parse'))
+        self._fila('JSONParser (DRF)', _mediana_ms(lambda: JSONParser().parse(io.BytesIO(drf)), repeticiones))
+        self._fila('ORJSONParser', _mediana_ms(lambda: ORJSONParser().parse(io.BytesIO(drf)), repeticiones))
+
+        compresion = getattr(settings, 'COMPRESION', {})
+        self.stdout.write(self.style.MIGRATE_HEADING('Compresión del cuerpo'))
+        self._fila('sin comprimir', 0, len(proyecto))
+        nivel_gzip = compresion.get('NIVEL_GZIP', 6)
+        self._fila(
+            f'gzip {nivel_gzip}',
+            _mediana_ms(lambda: gzip.compress(proyecto, compresslevel=nivel_gzip, mtime=0), repeticiones),
+            len(gzip.compress(proyecto, compresslevel=nivel_gzip, mtime=0)),
+        )
+        try:
+            import brotli
+        except ImportError:
+            self.stdout.write('  Brotli no está instalado')
+        else:
+            nivel_brotli = compresion.get('NIVEL_BROTLI', 4)
+            self._fila(
+                f'brotli {nivel_brotli}',
+                _mediana_ms(lambda: brotli.compress(proyecto, quality=nivel_brotli), repeticiones),
+                len(brotli.compress(proyecto, quality=nivel_brotli)),
+            )
+
+        self.stdout.write(self.style.MIGRATE_HEADING('Petición completa'))
+        for codificacion in ('', 'gzip', 'br'):
+            extra = {'HTTP_ACCEPT_ENCODING': codificacion} if codificacion else {}
+            response = cliente_http.get(URL, **extra)
+            self._fila(
+                f'Accept-Encoding: {codificacion or "-"}',
+                _mediana_ms(lambda: cliente_http.get(URL, **extra), repeticiones),
+                len(response.content),
+            )
+
+    def _fila(self, nombre, ms, bytes_=None):
+        tamano = f'{bytes_ / 1024:>10.1f} KB' if bytes_ is not None else ''
+        self.stdout.write(f'  {nombre:<24} {ms:>10.2f} ms {tamano}')
@@ -0,0 +1,29 @@
+"""
+Management command que carga los datos iniciales del sistema en una sola
+transacción: roles, permisos, permisos por defecto de cada rol y tipos de
+cliente (ver autenticacion/semillas.py)
+
+Reemplaza a ejecutar crear_roles, crear_permisos y crear_tipos_cliente por
+separado; se puede repetir sin efecto en una base ya sembrada:
+
+    python manage.py migrate
+    python manage.py bootstrap
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from autenticacion.semillas import sembrar
+
+
+class Command(BaseCommand):
+    help = 'Crear roles, permisos, permisos por rol y tipos de cliente (idempotente)'
+
+    def handle(self, *args, **options):
+        inicio = time.perf_counter()
+        creados = sembrar()
+        for tabla, cantidad in creados.items():
+            self.stdout.write(f'  {tabla:<16} {cantidad:>4} creados')
+        self.stdout.write(self.style.SUCCESS(
+            f'Datos iniciales listos en {(time.perf_counter() - inicio) * 1000:.0f} ms'
+        ))
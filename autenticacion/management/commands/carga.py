@@ -0,0 +1,343 @@
+"""
+Management command para generar carga concurrente contra las APIs
+
+N hilos repiten durante un tiempo fijo una mezcla ponderada de peticiones
+(login, listado y búsqueda de clientes, consultas de permisos, exportes) y al
+final se reporta el throughput y las latencias p50/p95/p99 por endpoint.
+
+Dos modos:
+- cliente: cada hilo usa su propio django.test.Client, sin red ni servidor.
+- wsgi: se levanta un servidor WSGI con hilos en un puerto local y los hilos
+  hacen peticiones HTTP reales, incluyendo el parseo y la serialización HTTP.
+
+Con --hilos igual a los threads de un worker de gunicorn, el throughput
+obtenido es la capacidad aproximada de un worker:
+
+    python manage.py carga --hilos 4 --duracion 30
+    python manage.py carga --modo wsgi --mezcla buscar_clientes=5,login=1
+
+La carga se ejecuta contra la BD configurada y escribe en ella (el login
+actualiza ultimo_login y crea sesiones). Para datos de prueba ver
+generar_datos.
+"""
+import http.client
+import json
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
+from django.test import Client
+from django.test.utils import override_settings
+
+from autenticacion.factories import PASSWORD_GENERADA
+from autenticacion.models import Persona, Usuario
+from core.estadistica import percentil
+
+# Peso de cada operación en la mezcla por defecto
+MEZCLA = {
+    'login': 1,
+    'verificar_token': 3,
+    'listar_clientes': 2,
+    'buscar_clientes': 4,
+    'permisos_usuario': 3,
+    'matriz_permisos': 1,
+    'exportar_clientes_excel': 0.2,
+}
+
+# Cantidad de términos de búsqueda y usuarios distintos que se usan
+MUESTRA = 50
+
+
+class EjecutorCliente:
+    """Peticiones en el mismo proceso con django.test.Client"""
+
+    def __init__(self):
+        self.cliente = Client()
+
+    def peticion(self, metodo, url, datos=None, token=None):
+        extra = {'HTTP_AUTHORIZATION': f'Bearer {token}'} if token else {}
+        if metodo == 'POST':
+            response = self.cliente.post(url, datos, content_type='application/json', **extra)
+        else:
+            response = self.cliente.get(url, **extra)
+        return response.status_code, response.content
+
+    def cerrar(self):
+        connections.close_all()
+
+
+class EjecutorHTTP:
+    """Peticiones HTTP contra el servidor WSGI local"""
+
+    def __init__(self, host, puerto):
+        self.host = host
+        self.puerto = puerto
+
+    def peticion(self, metodo, url, datos=None, token=None):
+        encabezados = {'Host': 'testserver'}
+        if token:
+            encabezados['Authorization'] = f'Bearer {token}'
+        cuerpo = None
+        if datos is not None:
+            cuerpo = json.dumps(datos)
+            encabezados['Content-Type'] = 'application/json'
+        conexion = http.client.HTTPConnection(self.host, self.puerto, timeout=60)
+        try:
+            conexion.request(metodo, url, body=cuerpo, headers=encabezados)
+            response = conexion.getresponse()
+            return response.status, response.read()
+        finally:
+            conexion.close()
+
+    def cerrar(self):
+        pass
+
+
+class ManejadorSilencioso(WSGIRequestHandler):
+    """No escribe una línea de log por petición"""
+
+    def log_message(self, *args):
+        pass
+
+
+class Command(BaseCommand):
+    help = 'Carga concurrente con una mezcla ponderada de peticiones; reporta throughput y p50/p95/p99'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hilos', type=int, default=4, help='Hilos concurrentes')
+        parser.add_argument('--duracion', type=float, default=30, help='Segundos de carga medida')
+        parser.add_argument('--calentamiento', type=float, default=2,
+                            help='Segundos iniciales que no se cuentan')
+        parser.add_argument('--modo', choices=['cliente', 'wsgi'], default='cliente')
+        parser.add_argument('--mezcla', type=str, default='',
+                            help='Pesos operacion=peso separados por coma (reemplazan la mezcla por defecto)')
+        parser.add_argument('--usuario', type=str, default='',
+                            help='Usuario para login y token (por defecto un administrador generado)')
+        parser.add_argument('--password', type=str, default=PASSWORD_GENERADA)
+        parser.add_argument('--semilla', type=int, default=2024)
+        parser.add_argument('--salida', type=str, default='', help='Guardar el reporte en JSON')
+
+    def handle(self, *args, **options):
+        if options['hilos'] < 1 or options['duracion'] <= 0:
+            raise CommandError('--hilos y --duracion deben ser positivos')
+        self.mezcla = self._leer_mezcla(options['mezcla'])
+
+        # Bajo carga casi todas las peticiones superan el umbral de lentas del
+        # middleware de métricas; el reporte ya las resume
+        metricas = logging.getLogger('core.metricas')
+        nivel = metricas.level
+        metricas.setLevel(logging.WARNING)
+
+        host = settings.ALLOWED_HOSTS + ['testserver']
+        with override_settings(ALLOWED_HOSTS=host):
+            self.credenciales = self._credenciales(options['usuario'], options['password'])
+            self._preparar_muestras()
+            if options['modo'] == 'wsgi':
+                servidor = self._iniciar_servidor()
+                direccion = servidor.server_address
+                crear_ejecutor = lambda: EjecutorHTTP(direccion[0], direccion[1])  # noqa: E731
+            else:
+                servidor = None
+                crear_ejecutor = EjecutorCliente
+
+            try:
+                self.token = self._login(crear_ejecutor())
+                reporte = self._ejecutar(crear_ejecutor, options)
+            finally:
+                if servidor:
+                    servidor.shutdown()
+                    servidor.server_close()
+                metricas.setLevel(nivel)
+
+        self._mostrar(reporte)
+        if options['salida']:
+            with open(options['salida'], 'w', encoding='utf-8') as archivo:
+                json.dump(reporte, archivo, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Reporte guardado en {options["salida"]}'))
+
+    # ============ PREPARACIÓN ============
+
+    def _leer_mezcla(self, texto):
+        if not texto:
+            return dict(MEZCLA)
+        mezcla = {}
+        for parte in texto.split(','):
+            nombre, _, peso = parte.partition('=')
+            nombre = nombre.strip()
+            if nombre not in MEZCLA:
+                raise CommandError(f'Operación desconocida: {nombre}. Disponibles: {", ".join(MEZCLA)}')
+            try:
+                mezcla[nombre] = float(peso or 1)
+            except ValueError:
+                raise CommandError(f'Peso inválido para {nombre}: {peso}')
+        if not any(peso > 0 for peso in mezcla.values()):
+            raise CommandError('La mezcla debe tener al menos un peso positivo')
+        return mezcla
+
+    def _credenciales(self, nombre_usuario, password):
+        if nombre_usuario:
+            return {'nombre_usuario': nombre_usuario, 'password': password}
+        # Administradores generados por generar_datos, que comparten la contraseña
+        candidatos = Usuario.objects.filter(
+            is_active=True,
+            usuario_roles__rol__nombre_rol='ADMINISTRADOR',
+            usuario_roles__estado='ACTIVO',
+        ).order_by('-id')[:5]
+        for usuario in candidatos:
+            if usuario.check_password(password):
+                return {'nombre_usuario': usuario.nombre_usuario, 'password': password}
+        raise CommandError('No se encontró un administrador con esa contraseña; indique --usuario y --password')
+
+    def _preparar_muestras(self):
+        apellidos = (
+            Persona.objects.filter(usuario__cliente__isnull=False)
+            .values_list('apellido_paterno', flat=True).distinct()[:MUESTRA]
+        )
+        self.terminos = [apellido[:4] for apellido in apellidos] or ['a']
+        self.usuarios = list(Usuario.objects.order_by('-id').values_list('id', flat=True)[:MUESTRA])
+        if not self.usuarios:
+            raise CommandError('No hay usuarios en la base de datos')
+
+    def _iniciar_servidor(self):
+        logging.getLogger('django.server').setLevel(logging.WARNING)
+        servidor = ThreadedWSGIServer(('127.0.0.1', 0), ManejadorSilencioso)
+        servidor.set_app(get_wsgi_application())
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+        self.stdout.write(f'Servidor WSGI en http://127.0.0.1:{servidor.server_address[1]}')
+        return servidor
+
+    def _login(self, ejecutor):
+        try:
+            estado, contenido = ejecutor.peticion('POST', '/auth/api/login/', self.credenciales)
+        finally:
+            ejecutor.cerrar()
+        if estado != 200:
+            raise CommandError(f'Login fallido ({estado}) con el usuario {self.credenciales["nombre_usuario"]}')
+        return json.loads(contenido)['access']
+
+    # ============ OPERACIONES ============
+
+    def _operacion(self, nombre, azar):
+        """(método, url, datos, token) de una operación de la mezcla"""
+        if nombre == 'login':
+            return 'POST', '/auth/api/login/', self.credenciales, None
+        if nombre == 'verificar_token':
+            return 'GET', '/auth/api/verificar-token/', None, self.token
+        if nombre == 'listar_clientes':
+            return 'GET', '/auth/api/clientes/?' + urlencode({'estado': 'ACTIVO'}), None, None
+        if nombre == 'buscar_clientes':
+            return 'GET', '/auth/api/clientes/?' + urlencode({'busqueda': azar.choice(self.terminos)}), None, None
+        if nombre == 'permisos_usuario':
+            return 'GET', f'/api/usuarios/{azar.choice(self.usuarios)}/permisos/', None, None
+        if nombre == 'matriz_permisos':
+            return 'GET', '/api/roles/permisos/', None, None
+        return 'GET', '/auth/api/clientes/exportar-excel/', None, None
+
+    # ============ EJECUCIÓN ============
+
+    def _ejecutar(self, crear_ejecutor, options):
+        nombres = list(self.mezcla)
+        pesos = [self.mezcla[nombre] for nombre in nombres]
+        inicio = time.perf_counter()
+        inicio_medicion = inicio + options['calentamiento']
+        fin = inicio_medicion + options['duracion']
+        resultados = []
+
+        def trabajar(indice):
+            azar = random.Random(options['semilla'] + indice)
+            ejecutor = crear_ejecutor()
+            # Cada hilo acumula en sus propias estructuras; se unen al final
+            latencias = defaultdict(list)
+            errores = defaultdict(int)
+            try:
+                while True:
+                    ahora = time.perf_counter()
+                    if ahora >= fin:
+                        break
+                    nombre = azar.choices(nombres, pesos)[0]
+                    metodo, url, datos, token = self._operacion(nombre, azar)
+                    try:
+                        estado, _ = ejecutor.peticion(metodo, url, datos, token)
+                    except Exception:
+                        estado = None
+                    terminado = time.perf_counter()
+                    # Solo cuentan las peticiones que terminan dentro de la ventana
+                    if inicio_medicion <= ahora and terminado <= fin:
+                        latencias[nombre].append((terminado - ahora) * 1000)
+                        if estado is None or estado >= 400:
+                            errores[nombre] += 1
+            finally:
+                ejecutor.cerrar()
+                resultados.append((latencias, errores))
+
+        hilos = [threading.Thread(target=trabajar, args=(i,)) for i in range(options['hilos'])]
+        self.stdout.write(
+            f'{len(hilos)} hilos, {options["duracion"]:.0f}s (+{options["calentamiento"]:.0f}s de calentamiento), '
+            f'modo {options["modo"]}'
+        )
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        return self._reporte(resultados, options)
+
+    def _reporte(self, resultados, options):
+        latencias = defaultdict(list)
+        errores = defaultdict(int)
+        for latencias_hilo, errores_hilo in resultados:
+            for nombre, valores in latencias_hilo.items():
+                latencias[nombre].extend(valores)
+            for nombre, cantidad in errores_hilo.items():
+                errores[nombre] += cantidad
+
+        duracion = options['duracion']
+        endpoints = {}
+        for nombre in self.mezcla:
+            valores = sorted(latencias.get(nombre, []))
+            endpoints[nombre] = {
+                'peticiones': len(valores),
+                'errores': errores.get(nombre, 0),
+                'rps': round(len(valores) / duracion, 2),
+                'p50_ms': round(percentil(valores, 50), 2),
+                'p95_ms': round(percentil(valores, 95), 2),
+                'p99_ms': round(percentil(valores, 99), 2),
+                'max_ms': round(valores[-1], 2) if valores else 0.0,
+            }
+        todas = sorted(valor for valores in latencias.values() for valor in valores)
+        return {
+            'modo': options['modo'],
+            'hilos': options['hilos'],
+            'duracion_s': duracion,
+            'mezcla': self.mezcla,
+            'total': {
+                'peticiones': len(todas),
+                'errores': sum(errores.values()),
+                'rps': round(len(todas) / duracion, 2),
+                'p50_ms': round(percentil(todas, 50), 2),
+                'p95_ms': round(percentil(todas, 95), 2),
+                'p99_ms': round(percentil(todas, 99), 2),
+            },
+            'endpoints': endpoints,
+        }
+
+    def _mostrar(self, reporte):
+        self.stdout.write(
+            f'{"endpoint":<26} {"peticiones":>10} {"errores":>8} {"rps":>8} '
+            f'{"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9}'
+        )
+        filas = list(reporte['endpoints'].items()) + [('TOTAL', reporte['total'])]
+        for nombre, datos in filas:
+            linea = (
+                f'{nombre:<26} {datos["peticiones"]:>10} {datos["errores"]:>8} {datos["rps"]:>8.1f} '
+                f'{datos["p50_ms"]:>9.1f} {datos["p95_ms"]:>9.1f} {datos["p99_ms"]:>9.1f}'
+            )
+            self.stdout.write(self.style.ERROR(linea) if datos['errores'] else linea)
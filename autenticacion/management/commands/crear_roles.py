@@ -3,6 +3,7 @@ Management command para crear roles del sistema
 """
 from django.core.management.base import BaseCommand
 from autenticacion.models import Rol
+from autenticacion.semillas import ROLES
 
 class Command(BaseCommand):
     help = 'Crear roles predefinidos del sistema Roy Representaciones'
@@ -10,40 +11,21 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         self.stdout.write('Creando roles del sistema...')
         
-        roles_data = [
-            {
-                'nombre_rol': 'ADMINISTRADOR',
-                'descripcion': 'Administrador con acceso completo al sistema'
-            },
-            {
-                'nombre_rol': 'VENDEDOR_ROYDENT',
-                'descripcion': 'Vendedor de la sucursal RoyDent'
-            },
-            {
-                'nombre_rol': 'VENDEDOR_MUNDO_MEDICO',
-                'descripcion': 'Vendedor de la sucursal Mundo Médico'
-            },
-            {
-                'nombre_rol': 'CLIENTE',
-                'descripcion': 'Cliente con acceso limitado al catálogo'
-            },
-        ]
-        
         roles_creados = 0
-        for rol_data in roles_data:
+        for nombre_rol, descripcion in ROLES:
             rol, created = Rol.objects.get_or_create(
-                nombre_rol=rol_data['nombre_rol'],
-                defaults={'descripcion': rol_data['descripcion']}
+                nombre_rol=nombre_rol,
+                defaults={'descripcion': descripcion}
             )
             
             if created:
                 roles_creados += 1
                 self.stdout.write(
-                    self.style.SUCCESS(f'✓ Creado: {rol_data["nombre_rol"]}')
+                    self.style.SUCCESS(f'✓ Creado: {nombre_rol}')
                 )
             else:
                 self.stdout.write(
-                    self.style.WARNING(f'⚠ Ya existe: {rol_data["nombre_rol"]}')
+                    self.style.WARNING(f'⚠ Ya existe: {nombre_rol}')
                 )
         
         self.stdout.write(
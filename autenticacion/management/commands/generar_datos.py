@@ -0,0 +1,211 @@
+"""
+Management command para generar datos sintéticos con volumen de producción
+
+Genera personas, usuarios, clientes y proveedores y los inserta con
+bulk_create por lotes. Los nombres y razones sociales salen de una muestra
+generada con las factories (Faker); cada fila combina valores de la muestra
+y toma cédula, correo, usuario y NIT de los generadores de factories.py.
+Pasar cada una de 100.000 filas por factory-boy costaría más que insertarlas.
+
+Con la misma semilla y la misma BD de partida los datos son idénticos, lo
+que permite comparar benchmarks entre ramas.
+
+    python manage.py generar_datos --clientes 100000 --semilla 2024
+
+Todos los usuarios, administradores incluidos, reciben la contraseña
+conocida PASSWORD_GENERADA: con DEBUG=False el comando se niega a correr
+salvo con --forzar.
+"""
+import time
+
+import factory.random
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+
+from autenticacion import referencias
+from autenticacion.caches import ESTADISTICAS
+from autenticacion.disponibilidad import registro as filtros_disponibilidad
+from autenticacion.factories import (
+    PASSWORD_GENERADA, PersonaFactory, ProveedorFactory, generar_cedula, generar_celular,
+    generar_correo, generar_nit_cliente, generar_nit_proveedor, generar_nombre_usuario,
+    password_hash,
+)
+from autenticacion.models import Cliente, Persona, Proveedor, Rol, TipoCliente, Usuario, UsuarioRol
+
+# Proporción de clientes que son empresas (con NIT y razón social)
+PROPORCION_EMPRESAS = 0.2
+
+# Tamaño de la muestra de nombres y de razones sociales
+TAMANO_MUESTRA = 1000
+
+ROLES_PERSONAL = ['ADMINISTRADOR', 'VENDEDOR_ROYDENT', 'VENDEDOR_MUNDO_MEDICO']
+
+
+class Command(BaseCommand):
+    help = 'Generar datos sintéticos (personas, usuarios, clientes y proveedores) para pruebas de rendimiento'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clientes', type=int, default=1000, help='Cantidad de clientes')
+        parser.add_argument('--proveedores', type=int, default=None,
+                            help='Cantidad de proveedores (por defecto 5%% de los clientes)')
+        parser.add_argument('--personal', type=int, default=10,
+                            help='Usuarios administradores y vendedores')
+        parser.add_argument('--semilla', type=int, default=2024, help='Semilla aleatoria')
+        parser.add_argument('--lote', type=int, default=5000, help='Filas por bulk_create')
+        parser.add_argument('--forzar', action='store_true',
+                            help='Ejecutar aunque DEBUG sea False (los usuarios tienen una contraseña conocida)')
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['forzar']:
+            raise CommandError(
+                'generar_datos crea administradores con una contraseña conocida; '
+                'con DEBUG=False use --forzar solo en una BD de pruebas'
+            )
+
+        inicio = time.perf_counter()
+        lote = options['lote']
+        proveedores = options['proveedores']
+        if proveedores is None:
+            proveedores = max(1, options['clientes'] // 20)
+
+        factory.random.reseed_random(options['semilla'])
+        self.azar = factory.random.randgen
+        self._preparar_referencias()
+        self._reiniciar_secuencias()
+        self._preparar_muestras()
+        self.password = password_hash()
+
+        self.tipos_cliente = list(referencias.tipos_cliente())
+        self.rol_cliente = referencias.obtener_rol('CLIENTE')
+        self.roles_personal = [referencias.obtener_rol(nombre) for nombre in ROLES_PERSONAL]
+
+        self._generar('clientes', options['clientes'], lote, self._lote_clientes)
+        self._generar('proveedores', proveedores, lote, self._lote_proveedores)
+        self._generar('personal', options['personal'], lote, self._lote_personal)
+
+        # bulk_create no emite señales
+        filtros_disponibilidad.invalidar()
+        ESTADISTICAS.invalidar()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Datos generados en {time.perf_counter() - inicio:.1f}s '
+            f'(contraseña de los usuarios: {PASSWORD_GENERADA})'
+        ))
+
+    # ============ PREPARACIÓN ============
+
+    def _preparar_referencias(self):
+        if not Rol.objects.filter(nombre_rol__in=ROLES_PERSONAL + ['CLIENTE']).count() == 4:
+            call_command('crear_roles', stdout=self.stdout)
+        if not TipoCliente.objects.exists():
+            call_command('crear_tipos_cliente', stdout=self.stdout)
+        referencias.limpiar()
+
+    def _reiniciar_secuencias(self):
+        """
+        Las secuencias empiezan después del mayor id existente: cada fila
+        generada consume un número de secuencia y un id, así que una nueva
+        corrida no repite cédulas, NIT ni usuarios.
+        """
+        self.secuencias = {
+            modelo: (modelo.objects.aggregate(ultimo=Max('id'))['ultimo'] or 0) + 1
+            for modelo in (Persona, Usuario, Cliente, Proveedor)
+        }
+
+    def _siguiente(self, modelo):
+        n = self.secuencias[modelo]
+        self.secuencias[modelo] = n + 1
+        return n
+
+    def _preparar_muestras(self):
+        personas = PersonaFactory.build_batch(TAMANO_MUESTRA)
+        self.nombres = [p.nombre for p in personas]
+        self.apellidos = [p.apellido_paterno for p in personas] + [p.apellido_materno for p in personas]
+        self.empresas = [p.razon_social for p in ProveedorFactory.build_batch(TAMANO_MUESTRA, persona=None)]
+
+    def _generar(self, nombre, total, lote, generar_lote):
+        if total <= 0:
+            return
+        inicio = time.perf_counter()
+        creados = 0
+        while creados < total:
+            cantidad = min(lote, total - creados)
+            with transaction.atomic():
+                generar_lote(cantidad)
+            creados += cantidad
+            self.stdout.write(f'  {nombre}: {creados}/{total}', ending='\r')
+        self.stdout.write(f'  {nombre}: {creados} en {time.perf_counter() - inicio:.1f}s')
+
+    # ============ LOTES ============
+
+    def _persona(self):
+        n = self._siguiente(Persona)
+        nombre = self.azar.choice(self.nombres)
+        apellido_paterno = self.azar.choice(self.apellidos)
+        return Persona(
+            nombre=nombre,
+            apellido_paterno=apellido_paterno,
+            apellido_materno=self.azar.choice(self.apellidos),
+            cedula_identidad=generar_cedula(n),
+            numero_celular=generar_celular(),
+            correo=generar_correo(nombre, apellido_paterno, n),
+        )
+
+    def _usuario(self, persona):
+        n = self._siguiente(Usuario)
+        return Usuario(
+            persona=persona,
+            nombre_usuario=generar_nombre_usuario(persona.nombre, persona.apellido_paterno, n),
+            password=self.password,
+            is_active=True,
+        )
+
+    def _lote_clientes(self, cantidad):
+        personas = [self._persona() for _ in range(cantidad)]
+        usuarios = [self._usuario(persona) for persona in personas]
+        self._insertar_usuarios(personas, usuarios, [self.rol_cliente] * cantidad)
+
+        clientes = []
+        for usuario in usuarios:
+            n = self._siguiente(Cliente)
+            empresa = self.azar.random() < PROPORCION_EMPRESAS
+            clientes.append(Cliente(
+                usuario=usuario,
+                tipo_cliente=self.azar.choice(self.tipos_cliente),
+                razon_social=self.azar.choice(self.empresas) if empresa else None,
+                nit=generar_nit_cliente(n) if empresa else None,
+                estado='ACTIVO',
+            ))
+        Cliente.objects.bulk_create(clientes)
+
+    def _lote_proveedores(self, cantidad):
+        personas = [self._persona() for _ in range(cantidad)]
+        Persona.objects.bulk_create(personas)
+        tipos = [codigo for codigo, _ in Proveedor.TIPO_PROVEEDOR]
+        Proveedor.objects.bulk_create([
+            Proveedor(
+                persona=persona,
+                tipo_proveedor=self.azar.choice(tipos),
+                nit=generar_nit_proveedor(self._siguiente(Proveedor)),
+                razon_social=self.azar.choice(self.empresas),
+                estado='ACTIVO',
+            )
+            for persona in personas
+        ])
+
+    def _lote_personal(self, cantidad):
+        personas = [self._persona() for _ in range(cantidad)]
+        usuarios = [self._usuario(persona) for persona in personas]
+        roles = [self.roles_personal[i % len(self.roles_personal)] for i in range(cantidad)]
+        self._insertar_usuarios(personas, usuarios, roles)
+
+    def _insertar_usuarios(self, personas, usuarios, roles):
+        Persona.objects.bulk_create(personas)
+        Usuario.objects.bulk_create(usuarios)
+        UsuarioRol.objects.bulk_create([
+            UsuarioRol(usuario=usuario, rol=rol, estado='ACTIVO')
+            for usuario, rol in zip(usuarios, roles)
+        ])
@@ -0,0 +1,81 @@
+"""
+Índices para la búsqueda del admin y de las APIs (ver busqueda.py)
+
+Las búsquedas usan `icontains`/`istartswith`, que en PostgreSQL se traducen
+a UPPER(columna) LIKE '%...%'. Un índice GIN con gin_trgm_ops sobre
+UPPER(columna) resuelve ese patrón sin recorrer la tabla completa.
+
+Solo aplica en PostgreSQL; en otros motores la migración no hace nada.
+Los índices se crean con CONCURRENTLY para no bloquear las tablas.
+"""
+from django.db import migrations
+
+# (tabla, columna) con búsqueda por texto
+COLUMNAS_TEXTO = [
+    ('persona', 'nombre'),
+    ('persona', 'apellido_paterno'),
+    ('persona', 'apellido_materno'),
+    ('persona', 'cedula_identidad'),
+    ('persona', 'numero_celular'),
+    ('persona', 'correo'),
+    ('usuario', 'nombre_usuario'),
+    ('cliente', 'razon_social'),
+    ('cliente', 'nit'),
+    ('proveedor', 'razon_social'),
+    ('proveedor', 'nit'),
+]
+
+# (tabla, columna, dirección) usadas en el ordering de los changelists
+COLUMNAS_ORDEN = [
+    ('persona', 'fecha_creacion', 'DESC'),
+    ('usuario', 'fecha_creacion', 'DESC'),
+    ('cliente', 'fecha_registro', 'DESC'),
+    ('proveedor', 'razon_social', 'ASC'),
+]
+
+
+def _nombre_trgm(tabla, columna):
+    return f'{tabla}_{columna}_trgm_idx'
+
+
+def _nombre_orden(tabla, columna):
+    return f'{tabla}_{columna}_orden_idx'
+
+
+def crear_indices(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for tabla, columna in COLUMNAS_TEXTO:
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {_nombre_trgm(tabla, columna)} '
+            f'ON {tabla} USING gin (UPPER({columna}::text) gin_trgm_ops)'
+        )
+    for tabla, columna, direccion in COLUMNAS_ORDEN:
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {_nombre_orden(tabla, columna)} '
+            f'ON {tabla} ({columna} {direccion})'
+        )
+
+
+def eliminar_indices(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for tabla, columna in COLUMNAS_TEXTO:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {_nombre_trgm(tabla, columna)}')
+    for tabla, columna, _ in COLUMNAS_ORDEN:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {_nombre_orden(tabla, columna)}')
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY no se puede ejecutar dentro de una transacción
+    atomic = False
+
+    dependencies = [
+        ('autenticacion', '0005_alter_proveedor_persona'),
+    ]
+
+    operations = [
+        migrations.RunPython(crear_indices, eliminar_indices),
+    ]
@@ -0,0 +1,49 @@
+"""
+Índices sobre LOWER(columna) para buscar duplicados sin distinguir
+mayúsculas (importacion.py compara LOWER(correo) y LOWER(nombre_usuario)
+con un `__in` por bloque)
+
+Solo aplica en PostgreSQL; en otros motores la migración no hace nada.
+Los índices se crean con CONCURRENTLY para no bloquear las tablas.
+"""
+from django.db import migrations
+
+COLUMNAS = [
+    ('persona', 'correo'),
+    ('usuario', 'nombre_usuario'),
+]
+
+
+def _nombre(tabla, columna):
+    return f'{tabla}_{columna}_lower_idx'
+
+
+def crear_indices(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for tabla, columna in COLUMNAS:
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {_nombre(tabla, columna)} '
+            f'ON {tabla} (LOWER({columna}))'
+        )
+
+
+def eliminar_indices(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for tabla, columna in COLUMNAS:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {_nombre(tabla, columna)}')
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY no se puede ejecutar dentro de una transacción
+    atomic = False
+
+    dependencies = [
+        ('autenticacion', '0006_indices_busqueda'),
+    ]
+
+    operations = [
+        migrations.RunPython(crear_indices, eliminar_indices),
+    ]
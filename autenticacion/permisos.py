@@ -0,0 +1,68 @@
+"""
+Permisos de DRF según los roles activos del usuario y la matriz de permisos
+por rol (RolPermiso)
+
+    @api_view(['POST'])
+    @permission_classes([IsAuthenticated, requiere_permiso('IMPORTAR_CLIENTES')])
+    def importar_clientes(request):
+        ...
+
+El rol ADMINISTRADOR tiene todos los permisos. La matriz se lee del
+registro de referencias (referencias.py), así que comprobar un permiso
+cuesta una consulta por petición (los roles del usuario).
+"""
+from rest_framework.permissions import BasePermission
+
+from . import referencias
+
+ROL_ADMINISTRADOR = 'ADMINISTRADOR'
+
+
+def roles_activos(usuario):
+    """Nombres de los roles activos del usuario; se consultan una vez por instancia"""
+    if usuario is None or not usuario.is_authenticated:
+        return set()
+    roles = getattr(usuario, '_roles_activos', None)
+    if roles is None:
+        roles = set(
+            usuario.usuario_roles.filter(estado='ACTIVO').values_list('rol__nombre_rol', flat=True)
+        )
+        usuario._roles_activos = roles
+    return roles
+
+
+def es_administrador(usuario):
+    return ROL_ADMINISTRADOR in roles_activos(usuario)
+
+
+def tiene_permiso(usuario, codigo_permiso):
+    """True si alguno de los roles activos del usuario tiene el permiso"""
+    roles = roles_activos(usuario)
+    if ROL_ADMINISTRADOR in roles:
+        return True
+    permiso_id = next(
+        (p.id for p in referencias.permisos() if p.codigo_permiso == codigo_permiso), None
+    )
+    if permiso_id is None:
+        return False
+    matriz = referencias.matriz_permisos()
+    return any(permiso_id in matriz.get(rol, ()) for rol in roles)
+
+
+class EsAdministrador(BasePermission):
+    message = 'Solo un administrador puede realizar esta acción'
+
+    def has_permission(self, request, view):
+        return es_administrador(request.user)
+
+
+def requiere_permiso(codigo_permiso):
+    """Clase de permiso que exige `codigo_permiso` (o el rol ADMINISTRADOR)"""
+
+    class TienePermiso(BasePermission):
+        message = f'No tiene el permiso {codigo_permiso}'
+
+        def has_permission(self, request, view):
+            return tiene_permiso(request.user, codigo_permiso)
+
+    return TienePermiso
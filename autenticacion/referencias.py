@@ -0,0 +1,147 @@
+"""
+Registro en proceso de datos de referencia (Rol, TipoCliente, Permiso y la
+matriz de permisos por rol de RolPermiso)
+
+Son tablas de pocas filas que casi nunca cambian, pero se consultaban en
+casi cada petición. Cada worker las carga una vez y las reutiliza.
+
+Para que un cambio hecho en un worker se vea en todos, la caché compartida
+guarda un número de versión. Cualquier alta, edición o baja en estas tablas
+(ver signals.py) incrementa la versión; los workers la comparan como máximo
+cada VERIFICAR_CADA segundos y recargan si cambió. La misma versión sirve
+como ETag de los endpoints que exponen estos datos.
+"""
+import threading
+import time
+
+from django.core.cache import cache
+
+from .models import Permiso, Rol, RolPermiso, TipoCliente
+
+CLAVE_VERSION = 'referencias:version'
+
+# Segundos entre comprobaciones de la versión compartida
+VERIFICAR_CADA = 2
+
+TIPO_CLIENTE_DEFECTO = {
+    'codigo': 'PARTICULAR',
+    'nombre_tipo': 'Particular',
+    'descripcion': 'Cliente particular',
+}
+
+
+class _Instantanea:
+    """Datos cargados para una versión concreta; nunca se modifica"""
+
+    def __init__(self, version):
+        self.version = version
+        self.roles = list(Rol.objects.order_by('nombre_rol'))
+        self.roles_por_nombre = {rol.nombre_rol: rol for rol in self.roles}
+        self.tipos_cliente = list(TipoCliente.objects.order_by('nombre_tipo'))
+        self.tipos_por_id = {tipo.id: tipo for tipo in self.tipos_cliente}
+        self.tipos_por_codigo = {tipo.codigo: tipo for tipo in self.tipos_cliente}
+        self.permisos = list(Permiso.objects.order_by('modulo', 'tipo_permiso'))
+        self.matriz_permisos = {rol.nombre_rol: [] for rol in self.roles}
+        for nombre_rol, permiso_id in RolPermiso.objects.values_list('rol__nombre_rol', 'permiso_id'):
+            self.matriz_permisos.setdefault(nombre_rol, []).append(permiso_id)
+
+
+class RegistroReferencias:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._datos = None
+        self._verificado = 0.0
+
+    def _version_compartida(self):
+        version = cache.get(CLAVE_VERSION)
+        if version is None:
+            cache.add(CLAVE_VERSION, 1, None)
+            version = cache.get(CLAVE_VERSION, 1)
+        return version
+
+    def datos(self):
+        ahora = time.monotonic()
+        datos = self._datos
+        if datos is not None and ahora - self._verificado < VERIFICAR_CADA:
+            return datos
+
+        version = self._version_compartida()
+        if datos is None or datos.version != version:
+            with self._lock:
+                if self._datos is None or self._datos.version != version:
+                    self._datos = _Instantanea(version)
+                datos = self._datos
+        self._verificado = ahora
+        return datos
+
+    def version(self):
+        return self.datos().version
+
+    def invalidar(self):
+        """Incrementa la versión compartida y descarta la copia local"""
+        try:
+            cache.incr(CLAVE_VERSION)
+        except ValueError:
+            cache.add(CLAVE_VERSION, 2, None)
+        self._datos = None
+
+
+registro = RegistroReferencias()
+
+
+def roles():
+    return registro.datos().roles
+
+
+def tipos_cliente():
+    return registro.datos().tipos_cliente
+
+
+def permisos():
+    return registro.datos().permisos
+
+
+def matriz_permisos():
+    """{nombre_rol: [permiso_id]} de todos los roles; no se debe modificar"""
+    return registro.datos().matriz_permisos
+
+
+def etag(nombre):
+    """ETag de un conjunto de referencia; cambia con cualquier modificación"""
+    return f'"{nombre}-v{registro.version()}"'
+
+
+def obtener_rol(nombre_rol):
+    """Retorna el Rol por nombre o lanza Rol.DoesNotExist"""
+    try:
+        return registro.datos().roles_por_nombre[nombre_rol]
+    except KeyError:
+        raise Rol.DoesNotExist(f'El rol {nombre_rol} no existe')
+
+
+def obtener_tipo_cliente(tipo_cliente_id):
+    """Retorna el TipoCliente por id o lanza TipoCliente.DoesNotExist"""
+    try:
+        return registro.datos().tipos_por_id[int(tipo_cliente_id)]
+    except (KeyError, TypeError, ValueError):
+        raise TipoCliente.DoesNotExist('Tipo de cliente no válido')
+
+
+def tipo_cliente_por_defecto():
+    """Tipo PARTICULAR, creado la primera vez que se necesita"""
+    tipo = registro.datos().tipos_por_codigo.get(TIPO_CLIENTE_DEFECTO['codigo'])
+    if tipo is None:
+        tipo, _ = TipoCliente.objects.get_or_create(
+            codigo=TIPO_CLIENTE_DEFECTO['codigo'],
+            defaults={
+                'nombre_tipo': TIPO_CLIENTE_DEFECTO['nombre_tipo'],
+                'descripcion': TIPO_CLIENTE_DEFECTO['descripcion'],
+            }
+        )
+    return tipo
+
+
+def limpiar():
+    """Invalida los datos de referencia en todos los workers"""
+    registro.invalidar()
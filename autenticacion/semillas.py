@@ -0,0 +1,160 @@
+"""
+Datos iniciales del sistema: roles, permisos, permisos por rol y tipos de
+cliente
+
+Las listas son la única definición de estos datos; las usan los comandos
+crear_roles, crear_permisos y crear_tipos_cliente, y sembrar() (comando
+bootstrap) los carga todos juntos en una transacción con un INSERT por
+tabla. Se insertan con ignore_conflicts, como el get_or_create de los
+comandos individuales: lo que ya existe no se toca (un administrador pudo
+editar descripciones) y lo que falta se crea, incluidas las asignaciones
+por defecto de PERMISOS_POR_ROL que se hayan quitado.
+"""
+from django.db import transaction
+
+from . import referencias
+from .models import Permiso, Rol, RolPermiso, TipoCliente
+
+ROLES = [
+    ('ADMINISTRADOR', 'Administrador con acceso completo al sistema'),
+    ('VENDEDOR_ROYDENT', 'Vendedor de la sucursal RoyDent'),
+    ('VENDEDOR_MUNDO_MEDICO', 'Vendedor de la sucursal Mundo Médico'),
+    ('CLIENTE', 'Cliente con acceso limitado al catálogo'),
+]
+
+# (código, módulo, tipo, descripción)
+PERMISOS = [
+    # PRODUCTOS
+    ('VER_PRODUCTOS', 'PRODUCTOS', 'VER', 'Ver listado de productos'),
+    ('CREAR_PRODUCTOS', 'PRODUCTOS', 'CREAR', 'Crear nuevos productos'),
+    ('EDITAR_PRODUCTOS', 'PRODUCTOS', 'EDITAR', 'Editar productos existentes'),
+    ('ELIMINAR_PRODUCTOS', 'PRODUCTOS', 'ELIMINAR', 'Eliminar productos'),
+
+    # INVENTARIO
+    ('VER_INVENTARIO', 'INVENTARIO', 'VER', 'Ver inventario'),
+    ('EDITAR_INVENTARIO', 'INVENTARIO', 'EDITAR', 'Ajustar inventario'),
+    ('EXPORTAR_INVENTARIO', 'INVENTARIO', 'EXPORTAR', 'Exportar reportes de inventario'),
+
+    # VENTAS
+    ('VER_VENTAS', 'VENTAS', 'VER', 'Ver historial de ventas'),
+    ('CREAR_VENTAS', 'VENTAS', 'CREAR', 'Realizar ventas'),
+    ('ELIMINAR_VENTAS', 'VENTAS', 'ELIMINAR', 'Anular ventas'),
+
+    # TRANSFERENCIAS
+    ('VER_TRANSFERENCIAS', 'TRANSFERENCIAS', 'VER', 'Ver transferencias'),
+    ('CREAR_TRANSFERENCIAS', 'TRANSFERENCIAS', 'CREAR', 'Crear transferencias'),
+    ('EDITAR_TRANSFERENCIAS', 'TRANSFERENCIAS', 'EDITAR', 'Modificar transferencias'),
+
+    # CLIENTES
+    ('VER_CLIENTES', 'CLIENTES', 'VER', 'Ver clientes'),
+    ('CREAR_CLIENTES', 'CLIENTES', 'CREAR', 'Registrar clientes'),
+    ('EDITAR_CLIENTES', 'CLIENTES', 'EDITAR', 'Editar clientes'),
+    ('IMPORTAR_CLIENTES', 'CLIENTES', 'IMPORTAR', 'Importar clientes y proveedores'),
+
+    # REPORTES
+    ('VER_REPORTES', 'REPORTES', 'VER', 'Ver reportes'),
+    ('EXPORTAR_REPORTES', 'REPORTES', 'EXPORTAR', 'Exportar reportes'),
+
+    # USUARIOS
+    ('VER_USUARIOS', 'USUARIOS', 'VER', 'Ver usuarios'),
+    ('CREAR_USUARIOS', 'USUARIOS', 'CREAR', 'Crear usuarios'),
+    ('EDITAR_USUARIOS', 'USUARIOS', 'EDITAR', 'Editar usuarios'),
+    ('ELIMINAR_USUARIOS', 'USUARIOS', 'ELIMINAR', 'Eliminar usuarios'),
+
+    # CONFIGURACIÓN
+    ('VER_CONFIGURACION', 'CONFIGURACION', 'VER', 'Ver configuración'),
+    ('EDITAR_CONFIGURACION', 'CONFIGURACION', 'EDITAR', 'Modificar configuración'),
+]
+
+PERMISOS_VENDEDOR = [
+    'VER_PRODUCTOS', 'VER_INVENTARIO', 'VER_VENTAS', 'CREAR_VENTAS',
+    'VER_CLIENTES', 'CREAR_CLIENTES', 'EDITAR_CLIENTES',
+    'VER_TRANSFERENCIAS', 'CREAR_TRANSFERENCIAS',
+    'VER_REPORTES',
+]
+
+# Rol -> códigos de permiso; None son todos los permisos
+PERMISOS_POR_ROL = {
+    'ADMINISTRADOR': None,
+    'VENDEDOR_ROYDENT': PERMISOS_VENDEDOR,
+    'VENDEDOR_MUNDO_MEDICO': PERMISOS_VENDEDOR,
+}
+
+# (código, nombre, descripción)
+TIPOS_CLIENTE = [
+    ('ODONTOLOGO', 'Odontólogo', 'Profesional en odontología'),
+    ('MEDICO', 'Médico', 'Profesional en medicina general o especializada'),
+    ('EST_ODONTOLOGIA', 'Estudiante Odontología', 'Estudiante de la carrera de odontología'),
+    ('EST_MEDICINA', 'Estudiante Medicina', 'Estudiante de la carrera de medicina'),
+    ('EST_ENFERMERIA', 'Estudiante Enfermería', 'Estudiante de la carrera de enfermería'),
+    ('EST_VETERINARIA', 'Estudiante Veterinaria', 'Estudiante de la carrera de veterinaria'),
+    ('ENFERMERO', 'Enfermero/a', 'Profesional en enfermería'),
+    ('VETERINARIO', 'Veterinario/a', 'Profesional en veterinaria'),
+    ('LAB_DENTAL', 'Laboratorio Dental', 'Laboratorio técnico dental'),
+    (
+        referencias.TIPO_CLIENTE_DEFECTO['codigo'],
+        referencias.TIPO_CLIENTE_DEFECTO['nombre_tipo'],
+        referencias.TIPO_CLIENTE_DEFECTO['descripcion'],
+    ),
+]
+
+
+def _insertar(modelo, objetos, contar):
+    """INSERT de las filas que faltan; retorna cuántas se crearon"""
+    antes = contar()
+    modelo.objects.bulk_create(objetos, ignore_conflicts=True)
+    return contar() - antes
+
+
+def sembrar():
+    """
+    Carga todos los datos iniciales en una transacción. Retorna
+    {tabla: filas creadas}; en una base ya sembrada todo es 0.
+    """
+    with transaction.atomic():
+        creados = {
+            'roles': _insertar(
+                Rol,
+                [Rol(nombre_rol=nombre, descripcion=descripcion) for nombre, descripcion in ROLES],
+                Rol.objects.count,
+            ),
+            'permisos': _insertar(
+                Permiso,
+                [
+                    Permiso(
+                        codigo_permiso=codigo,
+                        nombre_permiso=descripcion,
+                        modulo=modulo,
+                        tipo_permiso=tipo,
+                        descripcion=descripcion,
+                    )
+                    for codigo, modulo, tipo, descripcion in PERMISOS
+                ],
+                Permiso.objects.count,
+            ),
+            'tipos_cliente': _insertar(
+                TipoCliente,
+                [
+                    TipoCliente(codigo=codigo, nombre_tipo=nombre, descripcion=descripcion)
+                    for codigo, nombre, descripcion in TIPOS_CLIENTE
+                ],
+                TipoCliente.objects.count,
+            ),
+        }
+
+        # ignore_conflicts no devuelve los ids: se leen de una vez
+        roles = dict(Rol.objects.filter(nombre_rol__in=list(PERMISOS_POR_ROL)).values_list('nombre_rol', 'id'))
+        permisos = dict(Permiso.objects.values_list('codigo_permiso', 'id'))
+        asignaciones = [
+            RolPermiso(rol_id=roles[nombre_rol], permiso_id=permisos[codigo])
+            for nombre_rol, codigos in PERMISOS_POR_ROL.items()
+            if nombre_rol in roles
+            for codigo in (permisos if codigos is None else codigos)
+            if codigo in permisos
+        ]
+        creados['roles_permisos'] = _insertar(RolPermiso, asignaciones, RolPermiso.objects.count)
+
+        # bulk_create no emite post_save (signals.py)
+        if any(creados.values()):
+            transaction.on_commit(referencias.limpiar)
+    return creados
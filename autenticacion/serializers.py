@@ -6,6 +6,7 @@ from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 from .models import Cliente, Proveedor, TipoCliente, Usuario, Persona, Rol, UsuarioRol
+from . import referencias
 import re
 
 class PersonaSerializer(serializers.ModelSerializer):
@@ -278,10 +279,7 @@ class RegistroSerializer(serializers.Serializer):
                 "Formato de cédula inválido. Ejemplos: 1234567, 1234567-LP, 12345678-SC"
             )
         
-        # Verificar que no exista
-        if Persona.objects.filter(cedula_identidad=cedula_clean).exists():
-            raise serializers.ValidationError("Ya existe una persona registrada con esta cédula")
-            
+        # La unicidad se verifica en validate() junto con usuario y correo
         return cedula_clean
 
     def validate_numero_celular(self, value):
@@ -320,10 +318,6 @@ class RegistroSerializer(serializers.Serializer):
         if not re.match(r'^[a-zA-Z0-9._-]+$', username_clean):
             raise serializers.ValidationError("El nombre de usuario solo puede contener letras, números, puntos, guiones y guiones bajos")
         
-        # Verificar unicidad
-        if Usuario.objects.filter(nombre_usuario__iexact=username_clean).exists():
-            raise serializers.ValidationError("Este nombre de usuario ya está en uso")
-            
         return username_clean
 
     def validate_correo(self, value):
@@ -336,13 +330,7 @@ class RegistroSerializer(serializers.Serializer):
         if not re.match(email_pattern, value.strip().lower()):
             raise serializers.ValidationError("Formato de correo electrónico inválido")
             
-        email_clean = value.strip().lower()
-        
-        # Verificar unicidad
-        if Persona.objects.filter(correo__iexact=email_clean).exists():
-            raise serializers.ValidationError("Este correo electrónico ya está registrado")
-            
-        return email_clean
+        return value.strip().lower()
 
     def validate_password(self, value):
         """Validar fortaleza de contraseña"""
@@ -381,61 +369,81 @@ class RegistroSerializer(serializers.Serializer):
                 'confirmar_password': 'Las contraseñas no coinciden'
             })
 
-        # Validar que el rol exista
+        # Validar que el rol exista (desde la caché de referencias)
         rol_nombre = data.get('rol', 'CLIENTE')
-        if not Rol.objects.filter(nombre_rol=rol_nombre).exists():
+        try:
+            data['rol'] = referencias.obtener_rol(rol_nombre)
+        except Rol.DoesNotExist:
             raise serializers.ValidationError({
                 'rol': f'El rol {rol_nombre} no existe'
             })
 
+        # Tipo de cliente indicado o PARTICULAR por defecto
+        tipo_cliente_id = data.pop('tipo_cliente_id', None)
+        try:
+            if tipo_cliente_id:
+                data['tipo_cliente'] = referencias.obtener_tipo_cliente(tipo_cliente_id)
+            else:
+                data['tipo_cliente'] = referencias.tipo_cliente_por_defecto()
+        except TipoCliente.DoesNotExist:
+            raise serializers.ValidationError({
+                'tipo_cliente_id': 'Tipo de cliente no válido'
+            })
+
+        # Unicidad de usuario, cédula y correo en una sola consulta
+        from .disponibilidad import registrados
+        errores = {}
+        ya_registrados = registrados({
+            'nombre_usuario': data['nombre_usuario'],
+            'cedula_identidad': data['cedula_identidad'],
+            'correo': data['correo'],
+        })
+        if 'nombre_usuario' in ya_registrados:
+            errores['nombre_usuario'] = 'Este nombre de usuario ya está en uso'
+        if 'cedula_identidad' in ya_registrados:
+            errores['cedula_identidad'] = 'Ya existe una persona registrada con esta cédula'
+        if 'correo' in ya_registrados:
+            errores['correo'] = 'Este correo electrónico ya está registrado'
+        if errores:
+            raise serializers.ValidationError(errores)
+
         return data
 
     def create(self, validated_data):
-        """Crear usuario y persona"""
+        """Crear Persona, Usuario, UsuarioRol y Cliente en una sola transacción"""
         from django.db import transaction
         
-        # Extraer datos
-        confirmar_password = validated_data.pop('confirmar_password')
-        password = validated_data.pop('password')
-        rol_nombre = validated_data.pop('rol', 'CLIENTE')
-        
-        # Datos de persona
-        datos_persona = {
-            'nombre': validated_data['nombre'],
-            'apellido_paterno': validated_data['apellido_paterno'],
-            'apellido_materno': validated_data.get('apellido_materno', ''),
-            'cedula_identidad': validated_data['cedula_identidad'],
-            'numero_celular': validated_data['numero_celular'],
-            'correo': validated_data['correo'],
-        }
+        rol = validated_data['rol']
         
-        # Datos de usuario
-        nombre_usuario = validated_data['nombre_usuario']
-
-        try:
-            with transaction.atomic():
-                # Crear persona
-                persona = Persona.objects.create(**datos_persona)
-                
-                # Crear usuario
-                usuario = Usuario.objects.create_user(
-                    nombre_usuario=nombre_usuario,
-                    password=password,
-                    persona=persona
-                )
-                
-                # Asignar rol
-                rol = Rol.objects.get(nombre_rol=rol_nombre)
-                UsuarioRol.objects.create(
-                    usuario=usuario,
-                    rol=rol,
-                    estado='ACTIVO'
-                )
-                
-                return usuario
-                
-        except Exception as e:
-            raise serializers.ValidationError(f"Error al crear usuario: {str(e)}")
+        with transaction.atomic():
+            persona = Persona.objects.create(
+                nombre=validated_data['nombre'],
+                apellido_paterno=validated_data['apellido_paterno'],
+                apellido_materno=validated_data.get('apellido_materno', ''),
+                cedula_identidad=validated_data['cedula_identidad'],
+                numero_celular=validated_data['numero_celular'],
+                correo=validated_data['correo'],
+            )
+            
+            usuario = Usuario.objects.create_user(
+                nombre_usuario=validated_data['nombre_usuario'],
+                password=validated_data['password'],
+                persona=persona
+            )
+            
+            self.usuario_rol = UsuarioRol.objects.create(
+                usuario=usuario,
+                rol=rol,
+                estado='ACTIVO'
+            )
+            
+            self.cliente = Cliente.objects.create(
+                usuario=usuario,
+                tipo_cliente=validated_data['tipo_cliente'],
+                estado='ACTIVO'
+            )
+        
+        return usuario
 
 class CambiarPasswordSerializer(serializers.Serializer):
     """Serializer para cambiar contraseña"""
@@ -593,7 +601,9 @@ class ClienteCreateSerializer(serializers.Serializer):
         return value
     
     def validate_tipo_cliente_id(self, value):
-        if not TipoCliente.objects.filter(id=value).exists():
+        try:
+            referencias.obtener_tipo_cliente(value)
+        except TipoCliente.DoesNotExist:
             raise serializers.ValidationError("Tipo de cliente no válido")
         return value
     
@@ -628,7 +638,7 @@ class ClienteCreateSerializer(serializers.Serializer):
             )
             
             # 3. Asignar rol CLIENTE
-            rol_cliente = Rol.objects.get(nombre_rol='CLIENTE')
+            rol_cliente = referencias.obtener_rol('CLIENTE')
             UsuarioRol.objects.create(
                 usuario=usuario,
                 rol=rol_cliente,
@@ -636,7 +646,7 @@ class ClienteCreateSerializer(serializers.Serializer):
             )
             
             # 4. Crear Cliente
-            tipo_cliente = TipoCliente.objects.get(id=validated_data['tipo_cliente_id'])
+            tipo_cliente = referencias.obtener_tipo_cliente(validated_data['tipo_cliente_id'])
             
             cliente = Cliente.objects.create(
                 usuario=usuario,
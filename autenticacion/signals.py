@@ -0,0 +1,90 @@
+"""
+Señales de la aplicación de autenticación
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from . import referencias
+from .disponibilidad import registro as filtros_disponibilidad
+from .caches import ESTADISTICAS
+from .models import Cliente, Permiso, Persona, Proveedor, Rol, RolPermiso, TipoCliente, Usuario, UsuarioRol
+
+
+# ============ FILTROS DE DISPONIBILIDAD ============
+
+# Modelo -> campos que alimentan los filtros de disponibilidad.py
+CAMPOS_DISPONIBILIDAD = {
+    Usuario: ('nombre_usuario',),
+    Persona: ('cedula_identidad', 'correo'),
+    Cliente: ('nit',),
+    Proveedor: ('nit',),
+}
+
+
+def _valores_disponibilidad(sender, instance):
+    # __dict__: un campo diferido (only/defer) no se carga con otra consulta
+    return {campo: instance.__dict__.get(campo) for campo in CAMPOS_DISPONIBILIDAD[sender]}
+
+
+@receiver(post_init, sender=Usuario)
+@receiver(post_init, sender=Persona)
+@receiver(post_init, sender=Cliente)
+@receiver(post_init, sender=Proveedor)
+def recordar_valores_disponibilidad(sender, instance, **kwargs):
+    instance._valores_disponibilidad = _valores_disponibilidad(sender, instance)
+
+
+@receiver(post_save, sender=Usuario)
+@receiver(post_save, sender=Persona)
+@receiver(post_save, sender=Cliente)
+@receiver(post_save, sender=Proveedor)
+def registrar_valores_disponibilidad(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Solo las altas y los valores que cambian respecto de los cargados se
+    registran: cada registro hace que los demás workers reconstruyan sus
+    filtros, y un save() completo (editar el celular) no agrega nada nuevo
+    """
+    anteriores = instance._valores_disponibilidad
+    guardados = {
+        campo: valor for campo, valor in _valores_disponibilidad(sender, instance).items()
+        if not update_fields or campo in update_fields
+    }
+    for campo, valor in guardados.items():
+        if created or valor != anteriores.get(campo):
+            filtros_disponibilidad.agregar(campo, valor)
+    anteriores.update(guardados)
+
+
+# ============ DATOS DE REFERENCIA ============
+
+@receiver(post_save, sender=Rol)
+@receiver(post_delete, sender=Rol)
+@receiver(post_save, sender=TipoCliente)
+@receiver(post_delete, sender=TipoCliente)
+@receiver(post_save, sender=Permiso)
+@receiver(post_delete, sender=Permiso)
+@receiver(post_save, sender=RolPermiso)
+@receiver(post_delete, sender=RolPermiso)
+def limpiar_referencias(sender, **kwargs):
+    # Al confirmar: si la versión cambia antes, otro worker puede recargar
+    # los datos anteriores y quedarse con ellos hasta el próximo cambio
+    transaction.on_commit(referencias.limpiar)
+
+
+# ============ ESTADÍSTICAS ============
+
+@receiver(post_save, sender=Usuario)
+@receiver(post_delete, sender=Usuario)
+@receiver(post_save, sender=UsuarioRol)
+@receiver(post_delete, sender=UsuarioRol)
+@receiver(post_save, sender=Cliente)
+@receiver(post_delete, sender=Cliente)
+@receiver(post_save, sender=Proveedor)
+@receiver(post_delete, sender=Proveedor)
+def limpiar_estadisticas(sender, update_fields=None, **kwargs):
+    # Guardados parciales que no tocan el estado (p. ej. ultimo_login en
+    # LoginAPIView) no cambian los conteos
+    if update_fields and not {'is_active', 'estado'} & set(update_fields):
+        return
+    ESTADISTICAS.invalidar()
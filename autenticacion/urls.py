@@ -2,16 +2,18 @@
 URLs para la aplicación de autenticación - Con CRUD de usuarios
 """
 from django.urls import path
-from django.views.generic import TemplateView
 from rest_framework_simplejwt.views import TokenRefreshView
-from . import views
+
+from roy_representaciones.paginas import PaginaPublicaView
+
+from . import views, views_async
 
 app_name = 'autenticacion'
 
 urlpatterns = [
     # Páginas web de autenticación
-    path('login/', TemplateView.as_view(template_name='login.html'), name='login'),
-    path('registro/', TemplateView.as_view(template_name='registro.html'), name='registro'),
+    path('login/', PaginaPublicaView.as_view(template_name='login.html'), name='login'),
+    path('registro/', PaginaPublicaView.as_view(template_name='registro.html'), name='registro'),
     path('logout/', views.logout_view, name='logout'),
     
     # APIs REST para autenticación con JWT
@@ -24,6 +26,7 @@ urlpatterns = [
     path('api/validar-usuario/', views.ValidarUsuarioAPIView.as_view(), name='api_validar_usuario'),
     path('api/validar-cedula/', views.ValidarCedulaAPIView.as_view(), name='api_validar_cedula'),
     path('api/validar-correo/', views.ValidarCorreoAPIView.as_view(), name='api_validar_correo'),
+    path('api/validar-disponibilidad/', views.ValidarDisponibilidadAPIView.as_view(), name='api_validar_disponibilidad'),
     
     # JWT token refresh
     path('api/refresh/', TokenRefreshView.as_view(), name='api_token_refresh'),
@@ -36,13 +39,18 @@ urlpatterns = [
     path('api/usuarios/<int:usuario_id>/actualizar/', views.actualizar_usuario, name='api_actualizar_usuario'),
     path('api/usuarios/<int:usuario_id>/eliminar/', views.eliminar_usuario, name='api_eliminar_usuario'),
     path('api/usuarios/<int:usuario_id>/activar/', views.activar_usuario, name='api_activar_usuario'),
+    path('api/usuarios/activar-lote/', views.activar_usuarios_lote, name='api_activar_usuarios_lote'),
+    path('api/usuarios/desactivar-lote/', views.desactivar_usuarios_lote, name='api_desactivar_usuarios_lote'),
     path('api/usuarios/estadisticas/', views.estadisticas_usuarios, name='api_estadisticas_usuarios'),
+    path('api/usuarios/exportar-csv/', views.exportar_usuarios_csv, name='api_exportar_usuarios_csv'),
+    path('api/usuarios/crear-lote/', views.crear_usuarios_lote, name='api_crear_usuarios_lote'),
     
     # ============ PERMISOS ============
     path('api/permisos/', views.listar_permisos, name='api_listar_permisos'),
     path('api/usuarios/<int:usuario_id>/permisos/', views.obtener_permisos_usuario, name='api_permisos_usuario'),
     path('api/usuarios/<int:usuario_id>/permisos/actualizar/', views.actualizar_permisos_usuario, name='api_actualizar_permisos_usuario'),
     path('api/roles/permisos/', views.matriz_permisos_roles, name='api_matriz_permisos'),
+    path('api/permisos/exportar-csv/', views.exportar_permisos_csv, name='api_exportar_permisos_csv'),
     
     # Utilidades
     path('api/roles/', views.RolesUsuarioAPIView.as_view(), name='api_roles'),
@@ -60,8 +68,12 @@ urlpatterns = [
     path('api/clientes/<int:cliente_id>/actualizar/', views.actualizar_cliente, name='api_actualizar_cliente'),
     path('api/clientes/<int:cliente_id>/eliminar/', views.eliminar_cliente, name='api_eliminar_cliente'),
     path('api/clientes/<int:cliente_id>/activar/', views.activar_cliente, name='api_activar_cliente'),
+    path('api/clientes/activar-lote/', views.activar_clientes_lote, name='api_activar_clientes_lote'),
+    path('api/clientes/desactivar-lote/', views.desactivar_clientes_lote, name='api_desactivar_clientes_lote'),
     path('api/clientes/estadisticas/', views.estadisticas_clientes, name='api_estadisticas_clientes'),
     path('api/clientes/exportar-excel/', views.exportar_clientes_excel, name='api_exportar_clientes_excel'),
+    path('api/clientes/exportar-csv/', views.exportar_clientes_csv, name='api_exportar_clientes_csv'),
+    path('api/clientes/importar/', views.importar_clientes, name='api_importar_clientes'),
 
     # ============ PROVEEDORES ============
     path('api/proveedores/', views.listar_proveedores, name='api_listar_proveedores'),
@@ -70,6 +82,23 @@ urlpatterns = [
     path('api/proveedores/<int:proveedor_id>/actualizar/', views.actualizar_proveedor, name='api_actualizar_proveedor'),
     path('api/proveedores/<int:proveedor_id>/eliminar/', views.eliminar_proveedor, name='api_eliminar_proveedor'),
     path('api/proveedores/<int:proveedor_id>/activar/', views.activar_proveedor, name='api_activar_proveedor'),
+    path('api/proveedores/activar-lote/', views.activar_proveedores_lote, name='api_activar_proveedores_lote'),
+    path('api/proveedores/desactivar-lote/', views.desactivar_proveedores_lote, name='api_desactivar_proveedores_lote'),
     path('api/proveedores/estadisticas/', views.estadisticas_proveedores, name='api_estadisticas_proveedores'),
     path('api/proveedores/exportar-excel/', views.exportar_proveedores_excel, name='api_exportar_proveedores_excel'),
-]
\ No newline at end of file
+    path('api/proveedores/exportar-csv/', views.exportar_proveedores_csv, name='api_exportar_proveedores_csv'),
+    path('api/proveedores/importar/', views.importar_proveedores, name='api_importar_proveedores'),
+
+    # ============ APIs ASYNC (ASGI) ============
+    path('api/async/usuarios/', views_async.listar_usuarios, name='api_async_listar_usuarios'),
+    path('api/async/usuarios/<int:usuario_id>/', views_async.obtener_usuario, name='api_async_obtener_usuario'),
+    path('api/async/usuarios/estadisticas/', views_async.estadisticas_usuarios, name='api_async_estadisticas_usuarios'),
+    path('api/async/clientes/', views_async.listar_clientes, name='api_async_listar_clientes'),
+    path('api/async/clientes/<int:cliente_id>/', views_async.obtener_cliente, name='api_async_obtener_cliente'),
+    path('api/async/clientes/estadisticas/', views_async.estadisticas_clientes, name='api_async_estadisticas_clientes'),
+    path('api/async/proveedores/', views_async.listar_proveedores, name='api_async_listar_proveedores'),
+    path('api/async/proveedores/<int:proveedor_id>/', views_async.obtener_proveedor, name='api_async_obtener_proveedor'),
+    path('api/async/proveedores/estadisticas/', views_async.estadisticas_proveedores, name='api_async_estadisticas_proveedores'),
+    path('api/async/verificar-token/', views_async.verificar_token, name='api_async_verificar_token'),
+    path('api/async/estadisticas/', views_async.estadisticas, name='api_async_estadisticas'),
+]
@@ -19,10 +19,20 @@ from .serializers import (
 import re
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_http_methods
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, permission_classes
+from django.db import transaction
 from django.db.models import Q
 
 from autenticacion import models
+from . import disponibilidad, listados, referencias
+from .permisos import EsAdministrador, requiere_permiso
+from .caches import ESTADISTICAS
+from core.cache import cachear_respuesta
+from core.metricas import LOGIN, medir_exportacion, medir_flujo
+from django.utils.http import parse_etags
+import hashlib
+import json
+from django.core.cache import cache
 
 # Vistas web tradicionales
 def logout_view(request):
@@ -31,6 +41,22 @@ def logout_view(request):
     messages.success(request, 'Has cerrado sesión exitosamente')
     return redirect('index')
 
+def _respuesta_referencia(request, nombre, construir):
+    """
+    Respuesta para datos de referencia con ETag: si el cliente ya tiene la
+    versión vigente se responde 304 sin construir el cuerpo
+    """
+    etag = referencias.etag(nombre)
+    
+    if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(construir())
+    
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, max-age=60'
+    return response
+
 from django.contrib.auth import login as django_login
 
 class LoginAPIView(APIView):
@@ -45,10 +71,12 @@ class LoginAPIView(APIView):
             
             # *** CRÍTICO: Crear sesión de Django ***
             django_login(request, usuario)
+            LOGIN.labels('exitoso').inc()
             
-            # Actualizar último login
+            # Actualizar último login (guardado parcial: no invalida estadísticas
+            # ni filtros de disponibilidad, ver signals.py)
             usuario.ultimo_login = timezone.now()
-            usuario.save()
+            usuario.save(update_fields=['ultimo_login'])
             
             # Generar tokens JWT
             refresh = RefreshToken.for_user(usuario)
@@ -81,6 +109,7 @@ class LoginAPIView(APIView):
                 }
             }, status=status.HTTP_200_OK)
         
+        LOGIN.labels('fallido').inc()
         return Response({
             'error': 'Credenciales inválidas',
             'detalles': serializer.errors
@@ -95,47 +124,19 @@ class RegistroAPIView(APIView):
         
         if serializer.is_valid():
             try:
-                # Crear usuario
+                # Persona, Usuario, UsuarioRol y Cliente en una sola transacción
                 usuario = serializer.save()
                 
-                # NUEVO: Crear automáticamente el cliente asociado
-                from .models import TipoCliente, Cliente
-                
-                # Obtener tipo de cliente o usar uno por defecto
-                tipo_cliente_id = request.data.get('tipo_cliente_id')
-                
-                if tipo_cliente_id:
-                    tipo_cliente = TipoCliente.objects.get(id=tipo_cliente_id)
-                else:
-                    # Buscar tipo "Particular" o crear uno por defecto
-                    tipo_cliente, _ = TipoCliente.objects.get_or_create(
-                        codigo='PARTICULAR',
-                        defaults={
-                            'nombre_tipo': 'Particular',
-                            'descripcion': 'Cliente particular'
-                        }
-                    )
-                
-                # Crear el cliente
-                Cliente.objects.create(
-                    usuario=usuario,
-                    tipo_cliente=tipo_cliente,
-                    estado='ACTIVO'
-                )
-                
                 # Generar tokens JWT para auto-login
                 refresh = RefreshToken.for_user(usuario)
                 
-                # Obtener información del rol asignado
-                rol_usuario = usuario.usuario_roles.filter(estado='ACTIVO').first()
-                
-                rol_info = None
-                if rol_usuario:
-                    rol_info = {
-                        'nombre': rol_usuario.rol.nombre_rol,
-                        'descripcion': rol_usuario.rol.descripcion,
-                        'sucursal': rol_usuario.get_sucursal_asignada()
-                    }
+                # El rol recién asignado ya está en memoria, no hace falta consultarlo
+                rol_usuario = serializer.usuario_rol
+                rol_info = {
+                    'nombre': rol_usuario.rol.nombre_rol,
+                    'descripcion': rol_usuario.rol.descripcion,
+                    'sucursal': rol_usuario.get_sucursal_asignada()
+                }
                 
                 return Response({
                     'message': 'Usuario y cliente registrados exitosamente',
@@ -151,10 +152,6 @@ class RegistroAPIView(APIView):
                     }
                 }, status=status.HTTP_201_CREATED)
                 
-            except TipoCliente.DoesNotExist:
-                return Response({
-                    'error': 'Tipo de cliente no válido'
-                }, status=status.HTTP_400_BAD_REQUEST)
             except Exception as e:
                 return Response({
                     'error': 'Error interno del servidor',
@@ -235,21 +232,20 @@ class RolesUsuarioAPIView(APIView):
     
     def get(self, request):
         """Obtener lista de roles disponibles para registro"""
-        roles_publicos = Rol.objects.filter(
-            nombre_rol__in=['CLIENTE']  # Solo permitir registro como cliente
-        )
-        
-        roles_data = []
-        for rol in roles_publicos:
-            roles_data.append({
-                'id': rol.id,
-                'nombre': rol.nombre_rol,
-                'descripcion': rol.descripcion
-            })
+        def construir():
+            return {
+                'roles': [
+                    {
+                        'id': rol.id,
+                        'nombre': rol.nombre_rol,
+                        'descripcion': rol.descripcion
+                    }
+                    for rol in referencias.roles()
+                    if rol.nombre_rol in ['CLIENTE']  # Solo permitir registro como cliente
+                ]
+            }
         
-        return Response({
-            'roles': roles_data
-        })
+        return _respuesta_referencia(request, 'roles', construir)
 
 class ValidarUsuarioAPIView(APIView):
     """API para validar disponibilidad de nombre de usuario"""
@@ -321,6 +317,52 @@ class ValidarCorreoAPIView(APIView):
             'correo': correo
         })
 
+class ValidarDisponibilidadAPIView(APIView):
+    """
+    API para validar varios campos en una sola petición:
+    nombre_usuario, cedula_identidad, correo y nit
+    """
+    permission_classes = [AllowAny]
+    
+    # Segundos que se reutiliza una respuesta idéntica (tecleo/blur repetido)
+    CACHE_TTL = 10
+    
+    def get(self, request):
+        response = self._verificar(request.GET)
+        if response.status_code == 200:
+            response['Cache-Control'] = f'private, max-age={self.CACHE_TTL}'
+        return response
+    
+    def post(self, request):
+        return self._verificar(request.data)
+    
+    def _verificar(self, datos):
+        if not isinstance(datos, dict):
+            return Response({
+                'error': 'El cuerpo debe ser un objeto JSON con los campos a verificar'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        valores = {campo: str(datos[campo]) for campo in disponibilidad.CAMPOS if datos.get(campo)}
+        
+        if not valores:
+            return Response({
+                'error': f'Debe enviar al menos uno de: {", ".join(disponibilidad.CAMPOS)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # La versión de los filtros en la clave: un alta descarta las respuestas cacheadas
+        clave = f'disponibilidad:{disponibilidad.registro.version()}:' + hashlib.sha1(
+            json.dumps(valores, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        resultados = cache.get(clave)
+        if resultados is None:
+            resultados = disponibilidad.verificar(valores)
+            cache.set(clave, resultados, self.CACHE_TTL)
+        
+        return Response({
+            'disponible': all(r['disponible'] for r in resultados.values()),
+            'resultados': resultados
+        })
+
 class EstadisticasAPIView(APIView):
     """API para estadísticas del sistema"""
     permission_classes = [IsAuthenticated]
@@ -334,22 +376,10 @@ class EstadisticasAPIView(APIView):
         ).exists()
         
         if usuario_admin:
-            stats = {
-                'total_usuarios': Usuario.objects.filter(is_active=True).count(),
-                'total_personas': Persona.objects.count(),
-                'usuarios_por_rol': {},
-                'registros_recientes': Usuario.objects.filter(
-                    fecha_creacion__date=timezone.now().date()
-                ).count()
-            }
-            
-            # Estadísticas por rol
-            for rol in Rol.objects.all():
-                count = UsuarioRol.objects.filter(
-                    rol=rol, 
-                    estado='ACTIVO'
-                ).count()
-                stats['usuarios_por_rol'][rol.nombre_rol] = count
+            hoy = timezone.now().date()
+            stats = ESTADISTICAS.obtener_o_calcular(
+                ('sistema', hoy), lambda: self._estadisticas_sistema(hoy)
+            )
                 
         else:
             # Solo estadísticas básicas para usuarios normales
@@ -362,6 +392,25 @@ class EstadisticasAPIView(APIView):
             }
         
         return Response(stats)
+    
+    def _estadisticas_sistema(self, hoy):
+        stats = {
+            'total_usuarios': Usuario.objects.filter(is_active=True).count(),
+            'total_personas': Persona.objects.count(),
+            'usuarios_por_rol': {},
+            'registros_recientes': Usuario.objects.filter(
+                fecha_creacion__date=hoy
+            ).count()
+        }
+        
+        # Estadísticas por rol
+        for rol in referencias.roles():
+            count = UsuarioRol.objects.filter(
+                rol=rol, 
+                estado='ACTIVO'
+            ).count()
+            stats['usuarios_por_rol'][rol.nombre_rol] = count
+        return stats
 
 class VerificarTokenAPIView(APIView):
     """API para verificar si un token JWT es válido"""
@@ -372,16 +421,10 @@ class VerificarTokenAPIView(APIView):
         usuario = request.user
         
         # Obtener roles activos
-        roles_activos = usuario.usuario_roles.filter(estado='ACTIVO')
-        roles_info = []
-        
-        for ur in roles_activos:
-            roles_info.append({
-                'id': ur.rol.id,
-                'nombre': ur.rol.nombre_rol,
-                'descripcion': ur.rol.descripcion,
-                'sucursal': ur.get_sucursal_asignada()
-            })
+        roles_info = [
+            listados.info_rol(ur)
+            for ur in usuario.usuario_roles.filter(estado='ACTIVO').select_related('rol')
+        ]
         
         return Response({
             'valido': True,
@@ -445,86 +488,7 @@ from django.db.models import Q
 @api_view(['GET'])
 def listar_usuarios(request):
     """API para listar usuarios con filtros mejorados"""
-    busqueda = request.GET.get('busqueda', '').strip()
-    rol = request.GET.get('rol', '').strip()
-    estado = request.GET.get('estado', '').strip()
-    sucursal = request.GET.get('sucursal', '').strip()
-
-    # Iniciar con todos los usuarios
-    usuarios = Usuario.objects.select_related('persona').prefetch_related('usuario_roles__rol')
-    
-    # Filtro por búsqueda de texto (nombre, usuario, email)
-    if busqueda:
-        usuarios = usuarios.filter(
-            Q(nombre_usuario__icontains=busqueda) |
-            Q(persona__nombre__icontains=busqueda) |
-            Q(persona__apellido_paterno__icontains=busqueda) |
-            Q(persona__apellido_materno__icontains=busqueda) |
-            Q(persona__correo__icontains=busqueda)
-        )
-    
-    # Filtro por estado (activo/inactivo)
-    if estado and estado != 'todos':
-        if estado == 'activo':
-            usuarios = usuarios.filter(is_active=True)
-        elif estado == 'inactivo':
-            usuarios = usuarios.filter(is_active=False)
-    
-    # Filtro por rol
-    if rol and rol != 'todos':
-        usuarios = usuarios.filter(
-            usuario_roles__rol__nombre_rol=rol,
-            usuario_roles__estado='ACTIVO'
-        ).distinct()
-    
-    # Filtro por sucursal
-    if sucursal and sucursal != 'todas':
-        # Mapeo de sucursales a roles
-        if sucursal == 'roydent':
-            usuarios = usuarios.filter(
-                usuario_roles__rol__nombre_rol='VENDEDOR_ROYDENT',
-                usuario_roles__estado='ACTIVO'
-            ).distinct()
-        elif sucursal == 'mundo_medico':
-            usuarios = usuarios.filter(
-                usuario_roles__rol__nombre_rol='VENDEDOR_MUNDO_MEDICO',
-                usuario_roles__estado='ACTIVO'
-            ).distinct()
-        elif sucursal == 'deposito':
-            usuarios = usuarios.filter(
-                usuario_roles__rol__nombre_rol='ADMINISTRADOR',
-                usuario_roles__estado='ACTIVO'
-            ).distinct()
-    
-    # Ordenar por fecha de creación descendente
-    usuarios = usuarios.order_by('-fecha_creacion')
-    
-    # Construir respuesta
-    usuarios_data = []
-    for usuario in usuarios:
-        roles = usuario.usuario_roles.filter(estado='ACTIVO')
-        roles_info = [
-            {
-                'id': ur.rol.id,
-                'nombre': ur.rol.nombre_rol,
-                'descripcion': ur.rol.descripcion,
-                'sucursal': ur.get_sucursal_asignada()
-            }
-            for ur in roles
-        ]
-        
-        usuarios_data.append({
-            'id': usuario.id,
-            'nombre_usuario': usuario.nombre_usuario,
-            'nombre_completo': usuario.get_nombre_completo(),
-            'email': usuario.persona.correo,
-            'cedula': usuario.persona.cedula_identidad,
-            'celular': usuario.persona.numero_celular,
-            'roles': roles_info,
-            'is_active': usuario.is_active,
-            'fecha_creacion': usuario.fecha_creacion,
-            'ultimo_login': usuario.ultimo_login,
-        })
+    usuarios_data = [listados.datos_usuario(usuario) for usuario in listados.filtrar_usuarios(request.GET)]
 
     return Response({
         'success': True,
@@ -536,30 +500,10 @@ def listar_usuarios(request):
 def obtener_usuario(request, usuario_id):
     """API para obtener usuario - SIN AUTENTICACIÓN"""
     try:
-        usuario = Usuario.objects.select_related('persona').get(id=usuario_id)
-        
-        roles = usuario.usuario_roles.filter(estado='ACTIVO')
-        roles_info = [
-            {
-                'id': ur.rol.id,
-                'nombre': ur.rol.nombre_rol,
-                'sucursal': ur.get_sucursal_asignada()
-            }
-            for ur in roles
-        ]
-        
-        data = {
-            'id': usuario.id,
-            'nombre_usuario': usuario.nombre_usuario,
-            'nombre': usuario.persona.nombre,
-            'apellido_paterno': usuario.persona.apellido_paterno,
-            'apellido_materno': usuario.persona.apellido_materno,
-            'cedula_identidad': usuario.persona.cedula_identidad,
-            'numero_celular': usuario.persona.numero_celular,
-            'correo': usuario.persona.correo,
-            'roles': roles_info,
-            'is_active': usuario.is_active,
-        }
+        usuario = Usuario.objects.select_related('persona').prefetch_related(
+            listados.roles_activos()
+        ).get(id=usuario_id)
+        data = listados.detalle_usuario(usuario)
         
         return Response({
             'success': True,
@@ -611,7 +555,7 @@ def crear_usuario(request):
         
         # Buscar el rol
         try:
-            rol = Rol.objects.get(nombre_rol=data['rol'])
+            rol = referencias.obtener_rol(data['rol'])
         except Rol.DoesNotExist:
             return Response({
                 'success': False,
@@ -696,7 +640,7 @@ def actualizar_usuario(request, usuario_id):
         # Actualizar rol si se proporciona
         if 'rol' in data:
             try:
-                rol = Rol.objects.get(nombre_rol=data['rol'])
+                rol = referencias.obtener_rol(data['rol'])
                 # Desactivar roles anteriores
                 UsuarioRol.objects.filter(usuario=usuario).update(estado='INACTIVO')
                 # Crear o actualizar el nuevo rol
@@ -765,6 +709,7 @@ def activar_usuario(request, usuario_id):
         }, status=status.HTTP_404_NOT_FOUND)
 
 @api_view(['GET'])
+@cachear_respuesta(ESTADISTICAS)
 def estadisticas_usuarios(request):
     """API para estadísticas - SIN AUTENTICACIÓN"""
     stats = {
@@ -794,25 +739,25 @@ from .models import Permiso, RolPermiso
 def listar_permisos(request):
     """Listar todos los permisos del sistema"""
     try:
-        permisos = Permiso.objects.all().order_by('modulo', 'tipo_permiso')
-        
-        permisos_data = [
-            {
-                'id': p.id,
-                'nombre_permiso': p.nombre_permiso,
-                'codigo_permiso': p.codigo_permiso,
-                'modulo': p.modulo,
-                'tipo_permiso': p.tipo_permiso,
-                'descripcion': p.descripcion
+        def construir():
+            permisos_data = [
+                {
+                    'id': p.id,
+                    'nombre_permiso': p.nombre_permiso,
+                    'codigo_permiso': p.codigo_permiso,
+                    'modulo': p.modulo,
+                    'tipo_permiso': p.tipo_permiso,
+                    'descripcion': p.descripcion
+                }
+                for p in referencias.permisos()
+            ]
+            return {
+                'success': True,
+                'count': len(permisos_data),
+                'permisos': permisos_data
             }
-            for p in permisos
-        ]
         
-        return Response({
-            'success': True,
-            'count': len(permisos_data),
-            'permisos': permisos_data
-        })
+        return _respuesta_referencia(request, 'permisos', construir)
     except Exception as e:
         return Response({
             'success': False,
@@ -828,13 +773,14 @@ def obtener_permisos_usuario(request, usuario_id):
         # Obtener roles del usuario
         roles_usuario = usuario.usuario_roles.filter(estado='ACTIVO')
         
-        # Obtener todos los permisos de esos roles
-        permisos_ids = set()
-        for ur in roles_usuario:
-            rol_permisos = RolPermiso.objects.filter(rol=ur.rol).values_list('permiso_id', flat=True)
-            permisos_ids.update(rol_permisos)
+        # Obtener todos los permisos de esos roles en una sola consulta
+        permisos_ids = set(
+            RolPermiso.objects.filter(
+                rol_id__in=roles_usuario.values('rol_id')
+            ).values_list('permiso_id', flat=True)
+        )
         
-        permisos = Permiso.objects.filter(id__in=permisos_ids)
+        permisos = [p for p in referencias.permisos() if p.id in permisos_ids]
         
         permisos_data = [
             {
@@ -863,6 +809,7 @@ def obtener_permisos_usuario(request, usuario_id):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 @api_view(['POST'])
+@permission_classes([IsAuthenticated, EsAdministrador])
 def actualizar_permisos_usuario(request, usuario_id):
     """Actualizar permisos de un usuario"""
     try:
@@ -878,22 +825,26 @@ def actualizar_permisos_usuario(request, usuario_id):
                 'error': 'Usuario sin rol asignado'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Eliminar permisos actuales del rol
-        RolPermiso.objects.filter(rol=rol_usuario.rol).delete()
+        # Agregar nuevos permisos (los ids desconocidos se ignoran)
+        permisos_por_id = {p.id: p for p in referencias.permisos()}
+        nuevos = [
+            RolPermiso(
+                rol=rol_usuario.rol,
+                permiso=permisos_por_id[int(permiso_id)],
+                asignado_por=request.user if request.user.is_authenticated else None
+            )
+            for permiso_id in dict.fromkeys(permisos_ids)
+            if str(permiso_id).isdigit() and int(permiso_id) in permisos_por_id
+        ]
         
-        # Agregar nuevos permisos
-        contador = 0
-        for permiso_id in permisos_ids:
-            try:
-                permiso = Permiso.objects.get(id=permiso_id)
-                RolPermiso.objects.create(
-                    rol=rol_usuario.rol,
-                    permiso=permiso,
-                    asignado_por=request.user if request.user.is_authenticated else None
-                )
-                contador += 1
-            except Permiso.DoesNotExist:
-                continue
+        # Reemplazar los permisos actuales del rol en una sola transacción
+        with transaction.atomic():
+            RolPermiso.objects.filter(rol=rol_usuario.rol).delete()
+            RolPermiso.objects.bulk_create(nuevos)
+            # bulk_create no emite post_save: la matriz de permisos se invalida
+            # aquí, al confirmar, para que otro worker no recargue la anterior
+            transaction.on_commit(referencias.limpiar)
+        contador = len(nuevos)
         
         return Response({
             'success': True,
@@ -915,16 +866,9 @@ def actualizar_permisos_usuario(request, usuario_id):
 def matriz_permisos_roles(request):
     """Obtener matriz de permisos por rol"""
     try:
-        roles = Rol.objects.all()
-        roles_permisos = {}
-        
-        for rol in roles:
-            permisos_ids = RolPermiso.objects.filter(rol=rol).values_list('permiso_id', flat=True)
-            roles_permisos[rol.nombre_rol] = list(permisos_ids)
-        
         return Response({
             'success': True,
-            'roles_permisos': roles_permisos
+            'roles_permisos': referencias.matriz_permisos()
         })
     except Exception as e:
         return Response({
@@ -938,51 +882,22 @@ def matriz_permisos_roles(request):
 @api_view(['GET'])
 def listar_tipos_cliente(request):
     """API para listar tipos de cliente"""
-    tipos = TipoCliente.objects.all().order_by('nombre_tipo')
-    serializer = TipoClienteSerializer(tipos, many=True)
+    def construir():
+        serializer = TipoClienteSerializer(referencias.tipos_cliente(), many=True)
+        return {
+            'success': True,
+            'count': len(serializer.data),
+            'tipos': serializer.data
+        }
     
-    return Response({
-        'success': True,
-        'count': len(serializer.data),
-        'tipos': serializer.data
-    })
+    return _respuesta_referencia(request, 'tipos-cliente', construir)
 
 # ============ CLIENTES - CRUD ============
 
 @api_view(['GET'])
 def listar_clientes(request):
     """API para listar clientes con filtros"""
-    tipo_cliente = request.GET.get('tipo_cliente', '').strip()
-    estado = request.GET.get('estado', '').strip()
-    busqueda = request.GET.get('busqueda', '').strip()
-    
-    # Base query
-    clientes = Cliente.objects.select_related(
-        'usuario__persona',
-        'tipo_cliente'
-    ).all()
-    
-    # Aplicar filtros
-    if tipo_cliente and tipo_cliente != 'todos':
-        clientes = clientes.filter(tipo_cliente__codigo=tipo_cliente)
-    
-    if estado and estado != 'todos':
-        clientes = clientes.filter(estado=estado.upper())
-    
-    # Búsqueda por texto
-    if busqueda:
-        clientes = clientes.filter(
-            Q(usuario__persona__nombre__icontains=busqueda) |
-            Q(usuario__persona__apellido_paterno__icontains=busqueda) |
-            Q(usuario__persona__apellido_materno__icontains=busqueda) |
-            Q(usuario__persona__cedula_identidad__icontains=busqueda) |
-            Q(usuario__persona__correo__icontains=busqueda) |
-            Q(razon_social__icontains=busqueda) |
-            Q(nit__icontains=busqueda)
-        )
-    
-    # Ordenar
-    clientes = clientes.order_by('-fecha_registro')
+    clientes = listados.filtrar_clientes(request.GET)
     
     serializer = ClienteSerializer(clientes, many=True)
     
@@ -1110,7 +1025,7 @@ def actualizar_cliente(request, cliente_id):
         # Actualizar tipo_cliente
         if 'tipo_cliente_id' in data:
             try:
-                tipo_cliente = TipoCliente.objects.get(id=data['tipo_cliente_id'])
+                tipo_cliente = referencias.obtener_tipo_cliente(data['tipo_cliente_id'])
                 cliente.tipo_cliente = tipo_cliente
             except TipoCliente.DoesNotExist:
                 return Response({
@@ -1212,6 +1127,7 @@ def activar_cliente(request, cliente_id):
 
 
 @api_view(['GET'])
+@cachear_respuesta(ESTADISTICAS)
 def estadisticas_clientes(request):
     """API para estadísticas de clientes - CORREGIDA"""
     stats = {
@@ -1222,7 +1138,7 @@ def estadisticas_clientes(request):
     }
     
     # Estadísticas por tipo de cliente
-    for tipo in TipoCliente.objects.all():
+    for tipo in referencias.tipos_cliente():
         count = Cliente.objects.filter(tipo_cliente=tipo).count()
         stats['por_tipo'][tipo.nombre_tipo] = count
     
@@ -1233,10 +1149,49 @@ def estadisticas_clientes(request):
  
 
 from django.http import HttpResponse
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
 from datetime import datetime
 
+
+def _respuesta_excel(nombre, titulo, encabezados, filas):
+    """Respuesta .xlsx con encabezados resaltados; `filas` es un iterable de tuplas"""
+    # openpyxl tarda en importarse y ocupa memoria en cada worker: se carga
+    # recién en la primera exportación
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Font, PatternFill
+
+    with medir_exportacion(f'{nombre}_excel'):
+        wb = Workbook()
+        ws = wb.active
+        ws.title = titulo
+    
+        # Estilos
+        header_fill = PatternFill(start_color="FFD700", end_color="FFD700", fill_type="solid")
+        header_font = Font(bold=True, size=12, color="000000")
+    
+        for col, header in enumerate(encabezados, start=1):
+            cell = ws.cell(row=1, column=col, value=header)
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.alignment = Alignment(horizontal='center', vertical='center')
+    
+        for row, valores in enumerate(filas, start=2):
+            for col, valor in enumerate(valores, start=1):
+                ws.cell(row=row, column=col, value=valor)
+    
+        # Ajustar anchos
+        for col in range(1, len(encabezados) + 1):
+            ws.column_dimensions[chr(64 + col)].width = 20
+    
+        response = HttpResponse(
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        )
+        fecha = datetime.now().strftime('%Y-%m-%d')
+        response['Content-Disposition'] = f'attachment; filename={nombre}_{fecha}.xlsx'
+    
+        wb.save(response)
+    return response
+
+
 @api_view(['GET'])
 def exportar_clientes_excel(request):
     """Exportar clientes a Excel real (.xlsx)"""
@@ -1267,54 +1222,28 @@ def exportar_clientes_excel(request):
                 Q(nit__icontains=busqueda)
             )
         
-        # Crear workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Clientes"
-        
-        # Estilos
-        header_fill = PatternFill(start_color="FFD700", end_color="FFD700", fill_type="solid")
-        header_font = Font(bold=True, size=12, color="000000")
-        
-        # Headers
         headers = [
             'Nombre Completo', 'Tipo Cliente', 'Cédula', 'NIT',
             'Teléfono', 'Email', 'Razón Social', 'Usuario',
             'Estado', 'Fecha Registro'
         ]
-        
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        # Datos
-        for row, cliente in enumerate(clientes, start=2):
-            ws.cell(row=row, column=1, value=cliente.get_nombre_completo())
-            ws.cell(row=row, column=2, value=cliente.tipo_cliente.nombre_tipo if cliente.tipo_cliente else '')
-            ws.cell(row=row, column=3, value=cliente.usuario.persona.cedula_identidad)
-            ws.cell(row=row, column=4, value=cliente.nit or '')
-            ws.cell(row=row, column=5, value=cliente.usuario.persona.numero_celular or '')
-            ws.cell(row=row, column=6, value=cliente.usuario.persona.correo or '')
-            ws.cell(row=row, column=7, value=cliente.razon_social or '')
-            ws.cell(row=row, column=8, value=cliente.usuario.nombre_usuario)
-            ws.cell(row=row, column=9, value=cliente.estado)
-            ws.cell(row=row, column=10, value=cliente.fecha_registro.strftime('%d/%m/%Y'))
-        
-        # Ajustar anchos
-        for col in range(1, len(headers) + 1):
-            ws.column_dimensions[chr(64 + col)].width = 20
-        
-        # Preparar respuesta
-        response = HttpResponse(
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        filas = (
+            (
+                cliente.get_nombre_completo(),
+                cliente.tipo_cliente.nombre_tipo if cliente.tipo_cliente else '',
+                cliente.usuario.persona.cedula_identidad,
+                cliente.nit or '',
+                cliente.usuario.persona.numero_celular or '',
+                cliente.usuario.persona.correo or '',
+                cliente.razon_social or '',
+                cliente.usuario.nombre_usuario,
+                cliente.estado,
+                cliente.fecha_registro.strftime('%d/%m/%Y'),
+            )
+            for cliente in clientes
         )
-        fecha = datetime.now().strftime('%Y-%m-%d')
-        response['Content-Disposition'] = f'attachment; filename=clientes_{fecha}.xlsx'
         
-        wb.save(response)
-        return response
+        return _respuesta_excel('clientes', 'Clientes', headers, filas)
         
     except Exception as e:
         return Response({
@@ -1328,34 +1257,7 @@ def exportar_clientes_excel(request):
 @api_view(['GET'])
 def listar_proveedores(request):
     """API para listar proveedores con filtros"""
-    tipo_proveedor = request.GET.get('tipo', '').strip()
-    estado = request.GET.get('estado', '').strip()
-    busqueda = request.GET.get('busqueda', '').strip()
-    
-    # Base query
-    proveedores = Proveedor.objects.select_related('persona').all()
-    
-    # Aplicar filtros
-    if tipo_proveedor and tipo_proveedor != 'todos':
-        proveedores = proveedores.filter(tipo_proveedor=tipo_proveedor.upper())
-    
-    if estado and estado != 'todos':
-        proveedores = proveedores.filter(estado=estado.upper())
-    
-    # Búsqueda por texto
-    if busqueda:
-        proveedores = proveedores.filter(
-            Q(persona__nombre__icontains=busqueda) |
-            Q(persona__apellido_paterno__icontains=busqueda) |
-            Q(persona__apellido_materno__icontains=busqueda) |
-            Q(persona__cedula_identidad__icontains=busqueda) |
-            Q(persona__correo__icontains=busqueda) |
-            Q(razon_social__icontains=busqueda) |
-            Q(nit__icontains=busqueda)
-        )
-    
-    # Ordenar
-    proveedores = proveedores.order_by('persona__nombre')
+    proveedores = listados.filtrar_proveedores(request.GET)
     
     serializer = ProveedorSerializer(proveedores, many=True)
     
@@ -1535,6 +1437,7 @@ def activar_proveedor(request, proveedor_id):
 
 
 @api_view(['GET'])
+@cachear_respuesta(ESTADISTICAS)
 def estadisticas_proveedores(request):
     """API para estadísticas de proveedores - CORREGIDA"""
     stats = {
@@ -1584,56 +1487,490 @@ def exportar_proveedores_excel(request):
                 Q(nit__icontains=busqueda)
             )
         
-        # Crear workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Proveedores"
-        
-        # Estilos
-        header_fill = PatternFill(start_color="FFD700", end_color="FFD700", fill_type="solid")
-        header_font = Font(bold=True, size=12, color="000000")
-        
-        # Headers
         headers = [
             'Nombre Completo', 'Tipo Proveedor', 'Cédula', 'NIT',
             'Teléfono', 'Email', 'Razón Social',
             'Estado', 'Fecha Registro'
         ]
-        
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        # Datos
-        for row, proveedor in enumerate(proveedores, start=2):
-            ws.cell(row=row, column=1, value=proveedor.get_nombre_completo())
-            ws.cell(row=row, column=2, value=proveedor.tipo_proveedor)
-            ws.cell(row=row, column=3, value=proveedor.persona.cedula_identidad)
-            ws.cell(row=row, column=4, value=proveedor.nit)
-            ws.cell(row=row, column=5, value=proveedor.persona.numero_celular or '')
-            ws.cell(row=row, column=6, value=proveedor.persona.correo or '')
-            ws.cell(row=row, column=7, value=proveedor.razon_social or '')
-            ws.cell(row=row, column=8, value=proveedor.estado)
-            ws.cell(row=row, column=9, value=proveedor.fecha_registro.strftime('%d/%m/%Y'))
-        
-        # Ajustar anchos
-        for col in range(1, len(headers) + 1):
-            ws.column_dimensions[chr(64 + col)].width = 20
-        
-        # Preparar respuesta
-        response = HttpResponse(
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        filas = (
+            (
+                proveedor.get_nombre_completo(),
+                proveedor.tipo_proveedor,
+                proveedor.persona.cedula_identidad,
+                proveedor.nit,
+                proveedor.persona.numero_celular or '',
+                proveedor.persona.correo or '',
+                proveedor.razon_social or '',
+                proveedor.estado,
+                proveedor.fecha_registro.strftime('%d/%m/%Y'),
+            )
+            for proveedor in proveedores
         )
-        fecha = datetime.now().strftime('%Y-%m-%d')
-        response['Content-Disposition'] = f'attachment; filename=proveedores_{fecha}.xlsx'
         
-        wb.save(response)
-        return response
+        return _respuesta_excel('proveedores', 'Proveedores', headers, filas)
         
     except Exception as e:
         return Response({
             'success': False,
             'error': f'Error al exportar: {str(e)}'
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+# ============ EXPORTACIÓN CSV EN STREAMING ============
+
+import csv
+import zlib
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
+
+# Filas leídas por vuelta del cursor del lado del servidor
+CSV_CHUNK_SIZE = 2000
+
+
+class _Eco:
+    """Pseudo-buffer para csv.writer: devuelve la línea en lugar de guardarla"""
+    def write(self, value):
+        return value
+
+
+def _filas_csv(encabezados, filas):
+    """Generador que produce el CSV línea por línea"""
+    writer = csv.writer(_Eco())
+    yield writer.writerow(encabezados)
+    for fila in filas:
+        yield writer.writerow(fila)
+
+
+def _comprimir_gzip(lineas):
+    """Comprime en gzip sobre la marcha, emitiendo bloques de ~64KB"""
+    compresor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    pendiente = []
+    tamano = 0
+    for linea in lineas:
+        pendiente.append(linea.encode('utf-8'))
+        tamano += len(pendiente[-1])
+        if tamano >= 65536:
+            bloque = compresor.compress(b''.join(pendiente))
+            pendiente, tamano = [], 0
+            if bloque:
+                yield bloque
+    yield compresor.compress(b''.join(pendiente)) + compresor.flush()
+
+
+def _respuesta_csv(request, nombre, encabezados, filas):
+    """Construye la StreamingHttpResponse, comprimida si se pide ?gzip=1"""
+    lineas = medir_flujo(f'{nombre}_csv', _filas_csv(encabezados, filas))
+    fecha = datetime.now().strftime('%Y-%m-%d')
+    
+    if request.GET.get('gzip') in ('1', 'true'):
+        response = StreamingHttpResponse(_comprimir_gzip(lineas), content_type='application/gzip')
+        response['Content-Disposition'] = f'attachment; filename={nombre}_{fecha}.csv.gz'
+    else:
+        response = StreamingHttpResponse(
+            (linea.encode('utf-8') for linea in lineas),
+            content_type='text/csv; charset=utf-8'
+        )
+        response['Content-Disposition'] = f'attachment; filename={nombre}_{fecha}.csv'
+    
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, requiere_permiso('EXPORTAR_REPORTES')])
+def exportar_usuarios_csv(request):
+    """Exportar usuarios a CSV (opcionalmente gzip) sin cargar todo en memoria"""
+    busqueda = request.GET.get('busqueda', '').strip()
+    estado = request.GET.get('estado', '').strip()
+    
+    usuarios = Usuario.objects.select_related('persona').prefetch_related(
+        Prefetch(
+            'usuario_roles',
+            queryset=UsuarioRol.objects.filter(estado='ACTIVO').select_related('rol'),
+            to_attr='roles_activos'
+        )
+    )
+    
+    if busqueda:
+        usuarios = usuarios.filter(
+            Q(nombre_usuario__icontains=busqueda) |
+            Q(persona__nombre__icontains=busqueda) |
+            Q(persona__apellido_paterno__icontains=busqueda) |
+            Q(persona__apellido_materno__icontains=busqueda) |
+            Q(persona__correo__icontains=busqueda)
+        )
+    
+    if estado == 'activo':
+        usuarios = usuarios.filter(is_active=True)
+    elif estado == 'inactivo':
+        usuarios = usuarios.filter(is_active=False)
+    
+    usuarios = usuarios.order_by('-fecha_creacion')
+    
+    encabezados = [
+        'id', 'nombre_usuario', 'nombre_completo', 'cedula', 'celular',
+        'correo', 'roles', 'activo', 'fecha_creacion', 'ultimo_login'
+    ]
+    filas = (
+        [
+            u.id,
+            u.nombre_usuario,
+            u.persona.get_nombre_completo(),
+            u.persona.cedula_identidad,
+            u.persona.numero_celular or '',
+            u.persona.correo or '',
+            '|'.join(ur.rol.nombre_rol for ur in u.roles_activos),
+            'SI' if u.is_active else 'NO',
+            u.fecha_creacion.isoformat(),
+            u.ultimo_login.isoformat() if u.ultimo_login else '',
+        ]
+        for u in usuarios.iterator(chunk_size=CSV_CHUNK_SIZE)
+    )
+    
+    return _respuesta_csv(request, 'usuarios', encabezados, filas)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, requiere_permiso('EXPORTAR_REPORTES')])
+def exportar_clientes_csv(request):
+    """Exportar clientes a CSV (opcionalmente gzip) sin cargar todo en memoria"""
+    tipo_cliente = request.GET.get('tipo_cliente', '').strip()
+    estado = request.GET.get('estado', '').strip()
+    busqueda = request.GET.get('busqueda', '').strip()
+    
+    clientes = Cliente.objects.select_related('usuario__persona', 'tipo_cliente')
+    
+    if tipo_cliente and tipo_cliente != 'todos':
+        clientes = clientes.filter(tipo_cliente__codigo=tipo_cliente)
+    
+    if estado and estado != 'todos':
+        clientes = clientes.filter(estado=estado.upper())
+    
+    if busqueda:
+        clientes = clientes.filter(
+            Q(usuario__persona__nombre__icontains=busqueda) |
+            Q(usuario__persona__apellido_paterno__icontains=busqueda) |
+            Q(usuario__persona__apellido_materno__icontains=busqueda) |
+            Q(usuario__persona__cedula_identidad__icontains=busqueda) |
+            Q(usuario__persona__correo__icontains=busqueda) |
+            Q(razon_social__icontains=busqueda) |
+            Q(nit__icontains=busqueda)
+        )
+    
+    clientes = clientes.order_by('-fecha_registro')
+    
+    encabezados = [
+        'id', 'nombre_completo', 'tipo_cliente', 'cedula', 'nit', 'telefono',
+        'correo', 'razon_social', 'nombre_usuario', 'estado', 'fecha_registro'
+    ]
+    filas = (
+        [
+            c.id,
+            c.usuario.persona.get_nombre_completo(),
+            c.tipo_cliente.codigo,
+            c.usuario.persona.cedula_identidad,
+            c.nit or '',
+            c.usuario.persona.numero_celular or '',
+            c.usuario.persona.correo or '',
+            c.razon_social or '',
+            c.usuario.nombre_usuario,
+            c.estado,
+            c.fecha_registro.isoformat(),
+        ]
+        for c in clientes.iterator(chunk_size=CSV_CHUNK_SIZE)
+    )
+    
+    return _respuesta_csv(request, 'clientes', encabezados, filas)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, requiere_permiso('EXPORTAR_REPORTES')])
+def exportar_proveedores_csv(request):
+    """Exportar proveedores a CSV (opcionalmente gzip) sin cargar todo en memoria"""
+    tipo_proveedor = request.GET.get('tipo', '').strip()
+    estado = request.GET.get('estado', '').strip()
+    busqueda = request.GET.get('busqueda', '').strip()
+    
+    proveedores = Proveedor.objects.select_related('persona')
+    
+    if tipo_proveedor and tipo_proveedor != 'todos':
+        proveedores = proveedores.filter(tipo_proveedor=tipo_proveedor.upper())
+    
+    if estado and estado != 'todos':
+        proveedores = proveedores.filter(estado=estado.upper())
+    
+    if busqueda:
+        proveedores = proveedores.filter(
+            Q(persona__nombre__icontains=busqueda) |
+            Q(persona__apellido_paterno__icontains=busqueda) |
+            Q(persona__apellido_materno__icontains=busqueda) |
+            Q(persona__cedula_identidad__icontains=busqueda) |
+            Q(persona__correo__icontains=busqueda) |
+            Q(razon_social__icontains=busqueda) |
+            Q(nit__icontains=busqueda)
+        )
+    
+    proveedores = proveedores.order_by('persona__nombre')
+    
+    encabezados = [
+        'id', 'nombre_completo', 'tipo_proveedor', 'cedula', 'nit', 'telefono',
+        'correo', 'razon_social', 'estado', 'fecha_registro'
+    ]
+    filas = (
+        [
+            p.id,
+            p.persona.get_nombre_completo(),
+            p.tipo_proveedor,
+            p.persona.cedula_identidad,
+            p.nit,
+            p.persona.numero_celular or '',
+            p.persona.correo or '',
+            p.razon_social or '',
+            p.estado,
+            p.fecha_registro.isoformat(),
+        ]
+        for p in proveedores.iterator(chunk_size=CSV_CHUNK_SIZE)
+    )
+    
+    return _respuesta_csv(request, 'proveedores', encabezados, filas)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, requiere_permiso('EXPORTAR_REPORTES')])
+def exportar_permisos_csv(request):
+    """Exportar permisos con los roles que los tienen asignados a CSV"""
+    permisos = Permiso.objects.prefetch_related(
+        Prefetch('permiso_roles', queryset=RolPermiso.objects.select_related('rol'))
+    ).order_by('modulo', 'tipo_permiso')
+    
+    encabezados = ['id', 'codigo_permiso', 'nombre_permiso', 'modulo', 'tipo_permiso', 'descripcion', 'roles']
+    filas = (
+        [
+            p.id,
+            p.codigo_permiso,
+            p.nombre_permiso,
+            p.modulo,
+            p.tipo_permiso,
+            p.descripcion or '',
+            '|'.join(rp.rol.nombre_rol for rp in p.permiso_roles.all()),
+        ]
+        for p in permisos.iterator(chunk_size=CSV_CHUNK_SIZE)
+    )
+    
+    return _respuesta_csv(request, 'permisos', encabezados, filas)
+
+
+# ============ IMPORTACIÓN MASIVA ============
+
+from .importacion import (
+    ArchivoInvalido, ImportadorClientes, ImportadorProveedores, ImportadorUsuarios, leer_items
+)
+
+
+def _importar(request, importador_cls):
+    """Ejecuta un importador sobre el archivo subido en el campo 'archivo'"""
+    archivo = request.FILES.get('archivo')
+    if not archivo:
+        return Response({
+            'success': False,
+            'error': 'Debe adjuntar un archivo .xlsx o .csv en el campo "archivo"'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    solo_validar = str(request.data.get('solo_validar', '')).lower() in ('1', 'true')
+    
+    try:
+        reporte = importador_cls(solo_validar=solo_validar).importar(archivo)
+    except ArchivoInvalido as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': f'Error al importar: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    return Response({
+        'success': True,
+        'message': f'{reporte["creados"]} de {reporte["total_filas"]} filas importadas',
+        'reporte': reporte
+    })
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, requiere_permiso('IMPORTAR_CLIENTES')])
+def importar_clientes(request):
+    """Importar clientes masivamente desde XLSX/CSV con reporte de errores por fila"""
+    return _importar(request, ImportadorClientes)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, requiere_permiso('IMPORTAR_CLIENTES')])
+def importar_proveedores(request):
+    """Importar proveedores masivamente desde XLSX/CSV con reporte de errores por fila"""
+    return _importar(request, ImportadorProveedores)
+
+
+# ============ ALTA MASIVA DE USUARIOS ============
+
+# Máximo de usuarios por petición: cada contraseña cuesta un PBKDF2 completo,
+# así que el lote se mantiene en unos cientos para no agotar el timeout
+LOTE_USUARIOS_MAXIMO = 200
+
+
+def _leer_lote_usuarios(request):
+    """Acepta un arreglo JSON (o {"usuarios": [...]}) o JSON Lines"""
+    tipo = request.content_type or ''
+    if 'ndjson' in tipo or 'jsonl' in tipo:
+        items = []
+        for numero, linea in enumerate(request.body.decode('utf-8').splitlines(), start=1):
+            if not linea.strip():
+                continue
+            try:
+                items.append(json.loads(linea))
+            except ValueError:
+                raise ArchivoInvalido(f'Línea {numero}: JSON inválido')
+        return items
+
+    datos = request.data
+    if isinstance(datos, dict):
+        datos = datos.get('usuarios')
+    if not isinstance(datos, list):
+        raise ArchivoInvalido('Se esperaba un arreglo de usuarios')
+    return datos
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, EsAdministrador])
+def crear_usuarios_lote(request):
+    """
+    Alta masiva de usuarios (apertura de sucursales).
+    Valida todo el lote contra la BD con pocas consultas, hashea las
+    contraseñas en paralelo y crea los registros con bulk_create.
+    Retorna el resultado de cada elemento en el orden recibido.
+    """
+    try:
+        items = _leer_lote_usuarios(request)
+    except ArchivoInvalido as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    if not items:
+        return Response({
+            'success': False,
+            'error': 'El lote está vacío'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    if len(items) > LOTE_USUARIOS_MAXIMO:
+        return Response({
+            'success': False,
+            'error': f'El lote excede el máximo de {LOTE_USUARIOS_MAXIMO} usuarios'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    solo_validar = str(request.query_params.get('solo_validar', '')).lower() in ('1', 'true')
+    
+    try:
+        reporte = ImportadorUsuarios(solo_validar=solo_validar).procesar(leer_items(items))
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': f'Error al crear usuarios: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    exito = reporte['creados'] > 0 or (solo_validar and not reporte['con_errores'])
+    return Response({
+        'success': exito,
+        'message': f'{reporte["creados"]} de {reporte["total_filas"]} usuarios creados',
+        'reporte': reporte
+    }, status=status.HTTP_201_CREATED if reporte['creados'] else (
+        status.HTTP_200_OK if exito else status.HTTP_400_BAD_REQUEST
+    ))
+
+
+# ============ ACTIVACIÓN / DESACTIVACIÓN MASIVA ============
+
+from . import estados
+
+
+def _cambiar_estado_lote(request, modelo, cambiar_estado, activo, entidad):
+    """Aplica `cambiar_estado` a los ids de request.data['ids'] en una sola operación"""
+    ids = request.data.get('ids')
+    if not isinstance(ids, list) or not ids:
+        return Response({
+            'success': False,
+            'error': 'Debe enviar una lista de ids en el campo "ids"'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    if len(ids) > estados.MAXIMO_IDS:
+        return Response({
+            'success': False,
+            'error': f'Se permiten como máximo {estados.MAXIMO_IDS} ids por petición'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        ids = {int(i) for i in ids}
+    except (TypeError, ValueError):
+        return Response({
+            'success': False,
+            'error': 'Los ids deben ser números enteros'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        total = cambiar_estado(modelo.objects.filter(id__in=ids), activo)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': f'Error: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    accion = 'activados' if activo else 'desactivados'
+    return Response({
+        'success': True,
+        'message': f'{total} {entidad} {accion} exitosamente',
+        'actualizados': total,
+        'no_encontrados': len(ids) - total
+    })
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, EsAdministrador])
+def activar_usuarios_lote(request):
+    """API para activar varios usuarios en una sola operación"""
+    return _cambiar_estado_lote(request, Usuario, estados.cambiar_estado_usuarios, True, 'usuarios')
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, EsAdministrador])
+def desactivar_usuarios_lote(request):
+    """API para desactivar varios usuarios y sus roles en una sola transacción"""
+    return _cambiar_estado_lote(request, Usuario, estados.cambiar_estado_usuarios, False, 'usuarios')
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, EsAdministrador])
+def activar_clientes_lote(request):
+    """API para activar varios clientes (y sus usuarios) en una sola operación"""
+    return _cambiar_estado_lote(request, Cliente, estados.cambiar_estado_clientes, True, 'clientes')
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, EsAdministrador])
+def desactivar_clientes_lote(request):
+    """API para desactivar varios clientes (y sus usuarios) en una sola operación"""
+    return _cambiar_estado_lote(request, Cliente, estados.cambiar_estado_clientes, False, 'clientes')
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, EsAdministrador])
+def activar_proveedores_lote(request):
+    """API para activar varios proveedores en una sola operación"""
+    return _cambiar_estado_lote(request, Proveedor, estados.cambiar_estado_proveedores, True, 'proveedores')
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, EsAdministrador])
+def desactivar_proveedores_lote(request):
+    """API para desactivar varios proveedores en una sola operación"""
+    return _cambiar_estado_lote(request, Proveedor, estados.cambiar_estado_proveedores, False, 'proveedores')
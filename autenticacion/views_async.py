@@ -0,0 +1,309 @@
+"""
+Vistas async (ASGI) de los endpoints de solo lectura
+
+Versiones async de los listados, los detalles, las estadísticas y la
+verificación del token, bajo /auth/api/async/. Responden lo mismo que las
+vistas de views.py (comparten listados.py) pero usan el ORM async, así que
+un worker de uvicorn atiende muchas peticiones lentas sin un hilo por cada
+una:
+
+    DB_POOL=True uvicorn roy_representaciones.asgi:application --workers 2
+
+Bajo ASGI las conexiones persistentes (CONN_MAX_AGE > 0) no sirven: cada
+petición usa un hilo de BD distinto y la conexión del anterior queda
+abierta. asgi.py fija CONN_MAX_AGE=0 por defecto; con DB_POOL=True se
+reutilizan las conexiones del pool (ver settings.py).
+
+DRF 3.14 no soporta vistas async, por eso son vistas de Django que arman
+la respuesta JSON con el renderer del proyecto (core/renderers.py) y
+autentican el JWT con simplejwt.
+
+Con Django 4.2 cada consulta del ORM async corre en el hilo de BD de la
+petición: asyncio.gather libera el event loop mientras esperan, pero las
+consultas de una misma petición se ejecutan una tras otra. Con un driver
+async (Django 5 + psycopg 3) se solapan sin cambiar estas vistas.
+"""
+import asyncio
+import functools
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse, HttpResponseNotAllowed
+from django.utils import timezone
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from core.renderers import ORJSONRenderer
+
+from . import listados, referencias
+from .caches import ESTADISTICAS
+from .models import Cliente, Persona, Proveedor, Usuario, UsuarioRol
+from .serializers import ClienteSerializer, ProveedorSerializer
+
+
+def _respuesta(datos, status=200):
+    """JSON con el mismo renderer que las vistas de DRF"""
+    return HttpResponse(
+        ORJSONRenderer().render(datos),
+        content_type='application/json',
+        status=status,
+    )
+
+
+async def _respuesta_en_hilo(construir):
+    """
+    Arma y codifica la respuesta en un hilo aparte: con miles de filas la
+    serialización tarda y bloquearía el event loop. `construir` solo usa
+    objetos ya cargados, sin consultas.
+    """
+    return await sync_to_async(lambda: _respuesta(construir()), thread_sensitive=False)()
+
+
+def solo_get(vista):
+    """require_GET de Django 4.2 no acepta vistas async"""
+    @functools.wraps(vista)
+    async def envoltura(request, *args, **kwargs):
+        if request.method != 'GET':
+            return HttpResponseNotAllowed(['GET'])
+        return await vista(request, *args, **kwargs)
+    return envoltura
+
+
+async def _usuario_jwt(request):
+    """Usuario del token Bearer, o None si falta o no es válido"""
+    partes = request.headers.get('Authorization', '').split()
+    if len(partes) != 2 or partes[0] not in jwt_settings.AUTH_HEADER_TYPES:
+        return None
+    try:
+        token = JWTAuthentication().get_validated_token(partes[1])
+    except InvalidToken:
+        return None
+    try:
+        usuario = await Usuario.objects.select_related('persona').aget(
+            **{jwt_settings.USER_ID_FIELD: token.get(jwt_settings.USER_ID_CLAIM)}
+        )
+    except Usuario.DoesNotExist:
+        return None
+    return usuario if usuario.is_active else None
+
+
+def _no_autenticado():
+    return _respuesta({'detail': 'Token inválido o ausente'}, status=401)
+
+
+# ============ USUARIOS ============
+
+@solo_get
+async def listar_usuarios(request):
+    """API async para listar usuarios con filtros"""
+    usuarios = [usuario async for usuario in listados.filtrar_usuarios(request.GET)]
+
+    def construir():
+        usuarios_data = [listados.datos_usuario(usuario) for usuario in usuarios]
+        return {'success': True, 'count': len(usuarios_data), 'usuarios': usuarios_data}
+
+    return await _respuesta_en_hilo(construir)
+
+
+@solo_get
+async def obtener_usuario(request, usuario_id):
+    """API async para obtener un usuario"""
+    try:
+        usuario = await Usuario.objects.select_related('persona').prefetch_related(
+            listados.roles_activos()
+        ).aget(id=usuario_id)
+    except Usuario.DoesNotExist:
+        return _respuesta({'success': False, 'error': 'Usuario no encontrado'}, status=404)
+
+    return _respuesta({'success': True, 'usuario': listados.detalle_usuario(usuario)})
+
+
+@solo_get
+async def estadisticas_usuarios(request):
+    """API async para estadísticas de usuarios"""
+    async def calcular():
+        total, activos, inactivos, administradores, vendedores = await asyncio.gather(
+            Usuario.objects.acount(),
+            Usuario.objects.filter(is_active=True).acount(),
+            Usuario.objects.filter(is_active=False).acount(),
+            UsuarioRol.objects.filter(rol__nombre_rol='ADMINISTRADOR', estado='ACTIVO').acount(),
+            UsuarioRol.objects.filter(
+                rol__nombre_rol__in=['VENDEDOR_ROYDENT', 'VENDEDOR_MUNDO_MEDICO'],
+                estado='ACTIVO'
+            ).acount(),
+        )
+        return {
+            'total': total,
+            'activos': activos,
+            'inactivos': inactivos,
+            'administradores': administradores,
+            'vendedores': vendedores,
+        }
+
+    stats = await ESTADISTICAS.aobtener_o_calcular(('async', 'usuarios'), calcular)
+    return _respuesta({'success': True, 'estadisticas': stats})
+
+
+# ============ CLIENTES ============
+
+@solo_get
+async def listar_clientes(request):
+    """API async para listar clientes con filtros"""
+    clientes = [cliente async for cliente in listados.filtrar_clientes(request.GET)]
+
+    def construir():
+        datos = ClienteSerializer(clientes, many=True).data
+        return {'success': True, 'count': len(datos), 'clientes': datos}
+
+    return await _respuesta_en_hilo(construir)
+
+
+@solo_get
+async def obtener_cliente(request, cliente_id):
+    """API async para obtener un cliente"""
+    try:
+        cliente = await Cliente.objects.select_related(
+            'usuario__persona', 'tipo_cliente'
+        ).aget(id=cliente_id)
+    except Cliente.DoesNotExist:
+        return _respuesta({'success': False, 'error': 'Cliente no encontrado'}, status=404)
+
+    return _respuesta({'success': True, 'cliente': ClienteSerializer(cliente).data})
+
+
+@solo_get
+async def estadisticas_clientes(request):
+    """API async para estadísticas de clientes"""
+    async def calcular():
+        tipos = await sync_to_async(referencias.tipos_cliente)()
+        total, activos, inactivos, *por_tipo = await asyncio.gather(
+            Cliente.objects.acount(),
+            Cliente.objects.filter(estado='ACTIVO').acount(),
+            Cliente.objects.filter(estado='INACTIVO').acount(),
+            *(Cliente.objects.filter(tipo_cliente=tipo).acount() for tipo in tipos),
+        )
+        return {
+            'total': total,
+            'activos': activos,
+            'inactivos': inactivos,
+            'por_tipo': {tipo.nombre_tipo: cantidad for tipo, cantidad in zip(tipos, por_tipo)},
+        }
+
+    stats = await ESTADISTICAS.aobtener_o_calcular(('async', 'clientes'), calcular)
+    return _respuesta({'success': True, 'estadisticas': stats})
+
+
+# ============ PROVEEDORES ============
+
+@solo_get
+async def listar_proveedores(request):
+    """API async para listar proveedores con filtros"""
+    proveedores = [proveedor async for proveedor in listados.filtrar_proveedores(request.GET)]
+
+    def construir():
+        datos = ProveedorSerializer(proveedores, many=True).data
+        return {'success': True, 'count': len(datos), 'proveedores': datos}
+
+    return await _respuesta_en_hilo(construir)
+
+
+@solo_get
+async def obtener_proveedor(request, proveedor_id):
+    """API async para obtener un proveedor"""
+    try:
+        proveedor = await Proveedor.objects.select_related('persona').aget(id=proveedor_id)
+    except Proveedor.DoesNotExist:
+        return _respuesta({'success': False, 'error': 'Proveedor no encontrado'}, status=404)
+
+    return _respuesta({'success': True, 'proveedor': ProveedorSerializer(proveedor).data})
+
+
+@solo_get
+async def estadisticas_proveedores(request):
+    """API async para estadísticas de proveedores"""
+    async def calcular():
+        total, activos, inactivos, *por_tipo = await asyncio.gather(
+            Proveedor.objects.acount(),
+            Proveedor.objects.filter(estado='ACTIVO').acount(),
+            Proveedor.objects.filter(estado='INACTIVO').acount(),
+            *(Proveedor.objects.filter(tipo_proveedor=codigo).acount() for codigo, _ in Proveedor.TIPO_PROVEEDOR),
+        )
+        return {
+            'total': total,
+            'activos': activos,
+            'inactivos': inactivos,
+            'por_tipo': {
+                nombre: cantidad for (_, nombre), cantidad in zip(Proveedor.TIPO_PROVEEDOR, por_tipo)
+            },
+        }
+
+    stats = await ESTADISTICAS.aobtener_o_calcular(('async', 'proveedores'), calcular)
+    return _respuesta({'success': True, 'estadisticas': stats})
+
+
+# ============ SESIÓN Y PANEL ============
+
+@solo_get
+async def verificar_token(request):
+    """API async para verificar el token JWT y retornar el usuario"""
+    usuario = await _usuario_jwt(request)
+    if usuario is None:
+        return _no_autenticado()
+
+    roles_info = [
+        listados.info_rol(ur)
+        async for ur in usuario.usuario_roles.filter(estado='ACTIVO').select_related('rol')
+    ]
+    return _respuesta({
+        'valido': True,
+        'usuario': {
+            'id': usuario.id,
+            'nombre_usuario': usuario.nombre_usuario,
+            'nombre_completo': usuario.get_nombre_completo(),
+            'correo': usuario.persona.correo,
+            'roles': roles_info
+        }
+    })
+
+
+async def _estadisticas_sistema(hoy):
+    roles = await sync_to_async(referencias.roles)()
+    total_usuarios, total_personas, registros_recientes, *por_rol = await asyncio.gather(
+        Usuario.objects.filter(is_active=True).acount(),
+        Persona.objects.acount(),
+        Usuario.objects.filter(fecha_creacion__date=hoy).acount(),
+        *(UsuarioRol.objects.filter(rol=rol, estado='ACTIVO').acount() for rol in roles),
+    )
+    return {
+        'total_usuarios': total_usuarios,
+        'total_personas': total_personas,
+        'usuarios_por_rol': {rol.nombre_rol: cantidad for rol, cantidad in zip(roles, por_rol)},
+        'registros_recientes': registros_recientes,
+    }
+
+
+@solo_get
+async def estadisticas(request):
+    """API async del resumen del panel; mismas claves de caché que EstadisticasAPIView"""
+    usuario = await _usuario_jwt(request)
+    if usuario is None:
+        return _no_autenticado()
+
+    usuario_admin = await usuario.usuario_roles.filter(
+        rol__nombre_rol='ADMINISTRADOR',
+        estado='ACTIVO'
+    ).aexists()
+
+    if usuario_admin:
+        hoy = timezone.now().date()
+        stats = await ESTADISTICAS.aobtener_o_calcular(('sistema', hoy), lambda: _estadisticas_sistema(hoy))
+    else:
+        stats = {
+            'mi_perfil': {
+                'nombre_completo': usuario.get_nombre_completo(),
+                'fecha_registro': usuario.fecha_creacion,
+                'ultimo_login': usuario.ultimo_login
+            }
+        }
+
+    return _respuesta(stats)
@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from core import consultas, consultas_lentas
+
+        connection_created.connect(consultas.instalar, dispatch_uid='core.consultas')
+        connection_created.connect(consultas_lentas.instalar, dispatch_uid='core.consultas_lentas')
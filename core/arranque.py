@@ -0,0 +1,142 @@
+"""
+Medición del arranque de un worker: tiempo de importación, memoria y
+módulos cargados
+
+Se lanza un intérprete nuevo con `python -X importtime` que hace lo mismo
+que un worker de gunicorn antes de su primera petición: configura Django,
+arma la aplicación WSGI (middlewares) y carga el URLconf con todas las
+vistas. Del informe de -X importtime se obtiene el tiempo acumulado por
+paquete; el proceso hijo informa su RSS máximo y los módulos importados.
+
+    medicion = medir_arranque()
+    medicion['tiempo_ms'], medicion['rss_kb'], medicion['paquetes'][:10]
+
+El tiempo depende de la máquina, así que se compara con medir_base(): el
+arranque de un proyecto mínimo con Django, el admin y DRF en el mismo
+intérprete. La razón entre ambos es lo que agrega el proyecto.
+
+Lo usan el comando perfil_arranque y tests/test_arranque.py.
+"""
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+# Librerías pesadas que ningún worker debe cargar al arrancar; las vistas
+# que las usan las importan dentro de la función
+PEREZOSOS = ['openpyxl', 'reportlab', 'twilio', 'boto3', 'botocore', 'PIL', 'xlsxwriter', 'faker', 'factory']
+
+_SCRIPT = '''
+import json, resource, sys, time
+inicio = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+from django.urls import get_resolver
+get_resolver().url_patterns
+tiempo = time.perf_counter() - inicio
+try:
+    # ru_maxrss arrastra el máximo del proceso padre a través de exec
+    with open('/proc/self/status') as status:
+        rss = next(int(l.split()[1]) for l in status if l.startswith('VmHWM:'))
+except OSError:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        rss //= 1024
+print(json.dumps({'tiempo_ms': tiempo * 1000, 'rss_kb': rss, 'modulos': sorted(sys.modules)}))
+'''
+
+# Proyecto mínimo: lo que cualquier worker de Django + DRF carga igualmente
+_SCRIPT_BASE = '''
+import json, time
+inicio = time.perf_counter()
+from django.conf import settings
+settings.configure(
+    SECRET_KEY='base',
+    INSTALLED_APPS=[
+        'django.contrib.admin', 'django.contrib.auth', 'django.contrib.contenttypes',
+        'django.contrib.sessions', 'django.contrib.messages', 'django.contrib.staticfiles',
+        'rest_framework',
+    ],
+    MIDDLEWARE=[
+        'django.contrib.sessions.middleware.SessionMiddleware',
+        'django.middleware.common.CommonMiddleware',
+        'django.contrib.auth.middleware.AuthenticationMiddleware',
+    ],
+    DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+)
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+from django.contrib import admin
+admin.site.urls
+import rest_framework.decorators, rest_framework.views
+print(json.dumps({'tiempo_ms': (time.perf_counter() - inicio) * 1000}))
+'''
+
+
+def _leer_importtime(salida):
+    """
+    Tiempo acumulado por paquete de primer nivel, en microsegundos. Cada
+    línea es 'import time: self | cumulative | módulo' con el módulo
+    indentado según la profundidad; solo se suman las de primer nivel para
+    no contar dos veces los submódulos.
+    """
+    por_paquete = defaultdict(int)
+    propio = defaultdict(int)
+    for linea in salida.splitlines():
+        if not linea.startswith('import time:') or 'cumulative' in linea:
+            continue
+        partes = linea[len('import time:'):].split('|')
+        if len(partes) != 3:
+            continue
+        tiempo_propio, acumulado, modulo = partes
+        paquete = modulo.strip().split('.')[0]
+        propio[paquete] += int(tiempo_propio)
+        # Primer nivel: un solo espacio antes del nombre
+        if not modulo.startswith('  '):
+            por_paquete[paquete] += int(acumulado)
+    return por_paquete, propio
+
+
+def medir_arranque(settings_module=None):
+    entorno = dict(os.environ)
+    if settings_module:
+        entorno['DJANGO_SETTINGS_MODULE'] = settings_module
+    entorno.setdefault('DJANGO_SETTINGS_MODULE', 'roy_representaciones.settings')
+    proceso = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _SCRIPT],
+        capture_output=True, text=True, env=entorno, timeout=120,
+    )
+    if proceso.returncode != 0:
+        raise RuntimeError(f'El arranque falló:\n{proceso.stderr[-2000:]}')
+
+    resultado = json.loads(proceso.stdout.strip().splitlines()[-1])
+    por_paquete, propio = _leer_importtime(proceso.stderr)
+    resultado['paquetes'] = sorted(
+        (
+            {'paquete': paquete, 'acumulado_ms': round(us / 1000, 1), 'propio_ms': round(propio[paquete] / 1000, 1)}
+            for paquete, us in por_paquete.items()
+        ),
+        key=lambda fila: fila['acumulado_ms'],
+        reverse=True,
+    )
+    modulos = set(resultado.pop('modulos'))
+    resultado['cantidad_modulos'] = len(modulos)
+    resultado['perezosos_cargados'] = [nombre for nombre in PEREZOSOS if nombre in modulos]
+    resultado['tiempo_ms'] = round(resultado['tiempo_ms'], 1)
+    return resultado
+
+
+def medir_base(repeticiones=3):
+    """Mejor tiempo (ms) de arranque del proyecto mínimo de _SCRIPT_BASE"""
+    entorno = {k: v for k, v in os.environ.items() if k != 'DJANGO_SETTINGS_MODULE'}
+    tiempos = []
+    for _ in range(repeticiones):
+        proceso = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', _SCRIPT_BASE],
+            capture_output=True, text=True, env=entorno, timeout=120,
+        )
+        if proceso.returncode != 0:
+            raise RuntimeError(f'El arranque base falló:\n{proceso.stderr[-2000:]}')
+        tiempos.append(json.loads(proceso.stdout.strip().splitlines()[-1])['tiempo_ms'])
+    return round(min(tiempos), 1)
@@ -0,0 +1,328 @@
+"""
+Caché del proyecto: Redis compartido con una capa local por proceso
+
+- RedisConRespaldo: backend de `CACHES['default']`. Si Redis no responde,
+  opera sobre una caché en memoria del proceso y vuelve a intentar Redis
+  pasados REINTENTO_REDIS segundos, en lugar de fallar la petición.
+
+- EspacioCache: resultados calculados agrupados bajo un nombre. Las claves
+  llevan el nombre y un número de versión guardado en la caché compartida;
+  invalidar() incrementa la versión y así descarta todo el espacio en todos
+  los workers sin borrar claves una por una. Delante de Redis hay un LRU en
+  memoria con TTL corto, y el recálculo de una clave vencida lo hace un solo
+  hilo/proceso a la vez (los demás esperan su resultado).
+
+Uso:
+    ESTADISTICAS = EspacioCache('estadisticas', ttl=60)
+    datos = ESTADISTICAS.obtener_o_calcular(('clientes',), calcular_estadisticas)
+"""
+import functools
+import hashlib
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+
+from core.metricas import CACHE
+
+logger = logging.getLogger(__name__)
+
+# Segundos sin intentar Redis después de un fallo
+REINTENTO_REDIS = 30
+
+# Segundos que un proceso espera el resultado que calcula otro
+ESPERA_CALCULO = 5
+
+_NO_ENCONTRADO = object()
+
+# servidor -> instante (monotonic) hasta el que no se intenta Redis. Es de
+# módulo porque Django crea una instancia del backend por hilo.
+_redis_caido_hasta = {}
+
+
+# ============ BACKEND REDIS CON RESPALDO LOCAL ============
+
+def _con_respaldo(metodo):
+    nombre = metodo.__name__
+
+    @functools.wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        if time.monotonic() < _redis_caido_hasta.get(self._servidor, 0):
+            return getattr(self._respaldo, nombre)(*args, **kwargs)
+        try:
+            return metodo(self, *args, **kwargs)
+        except self._errores_conexion as e:
+            if self._servidor not in _redis_caido_hasta:
+                logger.warning('Redis no disponible (%s); usando caché local', e)
+            _redis_caido_hasta[self._servidor] = time.monotonic() + REINTENTO_REDIS
+            return getattr(self._respaldo, nombre)(*args, **kwargs)
+    return envoltura
+
+
+class RedisConRespaldo(RedisCache):
+    """RedisCache que usa memoria local mientras Redis no está disponible"""
+
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        import redis
+
+        self._errores_conexion = (redis.ConnectionError, redis.TimeoutError)
+        self._servidor = str(server)
+        respaldo = {k: v for k, v in params.items() if k != 'OPTIONS'}
+        respaldo['OPTIONS'] = {'MAX_ENTRIES': params.get('OPTIONS', {}).get('MAX_ENTRIES_RESPALDO', 5000)}
+        self._respaldo = LocMemCache(f'respaldo-{server}', respaldo)
+        self._options = {k: v for k, v in self._options.items() if k != 'MAX_ENTRIES_RESPALDO'}
+
+    add = _con_respaldo(RedisCache.add)
+    get = _con_respaldo(RedisCache.get)
+    set = _con_respaldo(RedisCache.set)
+    touch = _con_respaldo(RedisCache.touch)
+    delete = _con_respaldo(RedisCache.delete)
+    get_many = _con_respaldo(RedisCache.get_many)
+    has_key = _con_respaldo(RedisCache.has_key)
+    incr = _con_respaldo(RedisCache.incr)
+    set_many = _con_respaldo(RedisCache.set_many)
+    delete_many = _con_respaldo(RedisCache.delete_many)
+    clear = _con_respaldo(RedisCache.clear)
+
+
+# ============ LRU LOCAL ============
+
+class CacheLRU:
+    """LRU en memoria con vencimiento por entrada; seguro entre hilos"""
+
+    def __init__(self, max_entradas=1000):
+        self.max_entradas = max_entradas
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, clave, defecto=None):
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is None:
+                return defecto
+            vence, valor = entrada
+            if vence < time.monotonic():
+                del self._datos[clave]
+                return defecto
+            self._datos.move_to_end(clave)
+            return valor
+
+    def set(self, clave, valor, ttl):
+        with self._lock:
+            self._datos[clave] = (time.monotonic() + ttl, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.max_entradas:
+                self._datos.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._datos.clear()
+
+
+class _LockCalculo:
+    """threading.Lock con referencias débiles (el Lock de C no las admite)"""
+    __slots__ = ('_lock', '__weakref__')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self._lock.release()
+
+
+# ============ ESPACIOS DE CACHÉ ============
+
+class EspacioCache:
+    """
+    Conjunto de resultados cacheados con invalidación por versión.
+
+    ttl: segundos en la caché compartida.
+    ttl_local: segundos en el LRU del proceso; acota cuánto tarda un worker
+    en ver una invalidación hecha por otro.
+    """
+
+    def __init__(self, nombre, ttl=300, ttl_local=5, max_local=1000, alias='default'):
+        self.nombre = nombre
+        self.ttl = ttl
+        self.ttl_local = ttl_local
+        self.alias = alias
+        self._local = CacheLRU(max_local)
+        # Un lock por clave mientras algún hilo lo tenga; luego se descarta solo
+        self._locks = weakref.WeakValueDictionary()
+        self._locks_lock = threading.Lock()
+        self._version = None
+        self._version_leida = 0.0
+
+    @property
+    def _compartida(self):
+        return caches[self.alias]
+
+    @property
+    def _clave_version(self):
+        return f'espacio:{self.nombre}:version'
+
+    def version(self):
+        ahora = time.monotonic()
+        if self._version is None or ahora - self._version_leida > self.ttl_local:
+            version = self._compartida.get(self._clave_version)
+            if version is None:
+                self._compartida.add(self._clave_version, 1, None)
+                version = self._compartida.get(self._clave_version, 1)
+            self._version = version
+            self._version_leida = ahora
+        return self._version
+
+    def clave(self, partes):
+        """Clave con nombre y versión; las partes pueden ser cualquier valor con repr estable"""
+        resumen = hashlib.sha1(repr(partes).encode('utf-8')).hexdigest()
+        return f'{self.nombre}:v{self.version()}:{resumen}'
+
+    def invalidar(self):
+        """Descarta todo el espacio en todos los workers"""
+        try:
+            self._compartida.incr(self._clave_version)
+        except ValueError:
+            self._compartida.add(self._clave_version, 2, None)
+        self._version = None
+        self._local.clear()
+
+    def _lock_de(self, clave):
+        with self._locks_lock:
+            lock = self._locks.get(clave)
+            if lock is None:
+                lock = self._locks[clave] = _LockCalculo()
+            return lock
+
+    def _buscar(self, clave):
+        """(valor, origen) sin registrar métricas; origen es 'local', 'compartida' o 'fallo'"""
+        valor = self._local.get(clave, _NO_ENCONTRADO)
+        if valor is not _NO_ENCONTRADO:
+            return valor, 'local'
+        valor = self._compartida.get(clave, _NO_ENCONTRADO)
+        if valor is _NO_ENCONTRADO:
+            return valor, 'fallo'
+        self._local.set(clave, valor, self.ttl_local)
+        return valor, 'compartida'
+
+    def _contar(self, origen):
+        CACHE.labels(self.nombre, origen).inc()
+
+    def obtener(self, partes, defecto=None):
+        valor, origen = self._buscar(self.clave(partes))
+        self._contar(origen)
+        return defecto if valor is _NO_ENCONTRADO else valor
+
+    def guardar(self, partes, valor, ttl=None):
+        clave = self.clave(partes)
+        self._compartida.set(clave, valor, self.ttl if ttl is None else ttl)
+        self._local.set(clave, valor, self.ttl_local)
+
+    def obtener_o_calcular(self, partes, calcular, ttl=None):
+        """
+        Retorna el valor cacheado o lo calcula. Si varios hilos o procesos
+        lo piden a la vez, solo uno ejecuta `calcular`. Cada llamada cuenta
+        una sola vez en las métricas: como acierto si el valor lo calculó
+        otro, como fallo si se calcula aquí.
+        """
+        clave = self.clave(partes)
+        valor, origen = self._buscar(clave)
+        if valor is not _NO_ENCONTRADO:
+            self._contar(origen)
+            return valor
+
+        # Un solo hilo por proceso...
+        with self._lock_de(clave):
+            valor, origen = self._buscar(clave)
+            if valor is not _NO_ENCONTRADO:
+                self._contar(origen)
+                return valor
+
+            # ...y un solo proceso entre workers
+            clave_calculo = f'{clave}:calculando'
+            if not self._compartida.add(clave_calculo, 1, ESPERA_CALCULO):
+                limite = time.monotonic() + ESPERA_CALCULO
+                while time.monotonic() < limite:
+                    time.sleep(0.05)
+                    valor = self._compartida.get(clave, _NO_ENCONTRADO)
+                    if valor is not _NO_ENCONTRADO:
+                        self._contar('compartida')
+                        self._local.set(clave, valor, self.ttl_local)
+                        return valor
+                # El otro proceso no terminó a tiempo: se calcula aquí
+
+            self._contar('fallo')
+            try:
+                valor = calcular()
+                self.guardar(partes, valor, ttl)
+            finally:
+                self._compartida.delete(clave_calculo)
+            return valor
+
+    async def aobtener_o_calcular(self, partes, calcular, ttl=None):
+        """
+        Versión para vistas async: `calcular` es una corrutina. No coordina
+        cálculos simultáneos (los locks de obtener_o_calcular bloquearían el
+        event loop); pensada para cálculos baratos como los conteos.
+        """
+        valor = await sync_to_async(self.obtener)(partes, _NO_ENCONTRADO)
+        if valor is not _NO_ENCONTRADO:
+            return valor
+        valor = await calcular()
+        await sync_to_async(self.guardar)(partes, valor, ttl)
+        return valor
+
+
+# ============ DECORADOR PARA VISTAS ============
+
+class _RespuestaNoCacheable(Exception):
+    """La vista respondió con un estado distinto de 200"""
+
+def _buscar_request(args):
+    for arg in args[:2]:
+        if hasattr(arg, 'META'):
+            return arg
+    raise TypeError('cachear_respuesta requiere una vista que reciba request')
+
+
+def cachear_respuesta(espacio, ttl=None, por_usuario=False):
+    """
+    Cachea `response.data` de una vista DRF (función o método get) por ruta
+    y parámetros GET. Solo se cachean respuestas 200.
+    """
+    def decorador(vista):
+        @functools.wraps(vista)
+        def envoltura(*args, **kwargs):
+            from rest_framework.response import Response
+
+            request = _buscar_request(args)
+            partes = (request.path, sorted(request.GET.lists()))
+            if por_usuario:
+                partes += (getattr(request.user, 'pk', None),)
+
+            calculada = []
+
+            def calcular():
+                respuesta = vista(*args, **kwargs)
+                calculada.append(respuesta)
+                if respuesta.status_code != 200:
+                    raise _RespuestaNoCacheable()
+                return respuesta.data
+
+            try:
+                datos = espacio.obtener_o_calcular(partes, calcular, ttl)
+            except _RespuestaNoCacheable:
+                return calculada[0]
+            return calculada[0] if calculada else Response(datos)
+        return envoltura
+    return decorador
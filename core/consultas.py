@@ -0,0 +1,123 @@
+"""
+Registro de las consultas SQL ejecutadas en un bloque de código
+
+Se apoya en un execute_wrapper que core/apps.py instala en cada conexión al
+crearla (connection_created), así que cuenta todo lo que pasa por el ORM o
+por cursor.execute, en todas las bases de datos configuradas. Los registros
+activos viven en una ContextVar y no en la conexión: `connections` es local
+a cada hilo, y bajo ASGI las consultas de una vista async corren en el hilo
+de sync_to_async, que recibe una copia del contexto de la petición.
+
+    with registrar_consultas() as registro:
+        ...
+    registro.total, registro.tiempo, registro.duplicadas
+
+En los tests, presupuesto_consultas falla si un bloque supera un número de
+consultas o repite consultas idénticas:
+
+    with presupuesto_consultas(4):
+        client.get('/auth/api/usuarios/')
+"""
+import functools
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# ((registro, aliases o None), ...) de los bloques registrar_consultas en curso
+_registros = ContextVar('registros_consultas', default=())
+
+
+class RegistroConsultas:
+    """Wrapper de ejecución que acumula conteo, tiempo y repeticiones"""
+
+    def __init__(self, guardar_sql=False):
+        self.total = 0
+        self.tiempo = 0.0
+        self.guardar_sql = guardar_sql
+        self.consultas = []
+        # (sql, parámetros) -> veces; mismas consultas con los mismos valores
+        self._identicas = Counter()
+        # sql -> veces; misma consulta con distintos valores (patrón N+1)
+        self._plantillas = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        inicio = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duracion = time.perf_counter() - inicio
+            self.total += 1
+            self.tiempo += duracion
+            self._identicas[(sql, repr(params))] += 1
+            self._plantillas[sql] += 1
+            if self.guardar_sql:
+                self.consultas.append({'sql': sql, 'params': params, 'tiempo': duracion})
+
+    @property
+    def duplicadas(self):
+        """Ejecuciones de más de consultas idénticas (sql y parámetros)"""
+        return sum(veces - 1 for veces in self._identicas.values() if veces > 1)
+
+    @property
+    def max_repeticiones(self):
+        """Mayor número de ejecuciones de una misma sentencia con distintos valores"""
+        return max(self._plantillas.values(), default=0)
+
+    def mas_repetidas(self, cantidad=3):
+        return [(sql, veces) for sql, veces in self._plantillas.most_common(cantidad) if veces > 1]
+
+    def resumen(self):
+        return {
+            'consultas': self.total,
+            'sql_ms': round(self.tiempo * 1000, 2),
+            'duplicadas': self.duplicadas,
+            'max_repeticiones': self.max_repeticiones,
+        }
+
+
+def _registrar(execute, sql, params, many, context):
+    """Wrapper de ejecución de cada conexión: pasa la consulta por los registros activos"""
+    alias = context['connection'].alias
+    for registro, aliases in _registros.get():
+        if aliases is None or alias in aliases:
+            execute = functools.partial(registro, execute)
+    return execute(sql, params, many, context)
+
+
+def instalar(sender, connection, **kwargs):
+    """Receptor de connection_created"""
+    if _registrar not in connection.execute_wrappers:
+        # Al principio, por lo mismo que CAPTURA en core/consultas_lentas.py
+        connection.execute_wrappers.insert(0, _registrar)
+
+
+@contextmanager
+def registrar_consultas(guardar_sql=False, aliases=None):
+    registro = RegistroConsultas(guardar_sql=guardar_sql)
+    token = _registros.set(_registros.get() + ((registro, frozenset(aliases) if aliases else None),))
+    try:
+        yield registro
+    finally:
+        _registros.reset(token)
+
+
+@contextmanager
+def presupuesto_consultas(maximo, duplicadas=0, aliases=None):
+    """
+    Falla con AssertionError si el bloque ejecuta más de `maximo` consultas
+    o más de `duplicadas` consultas idénticas repetidas.
+    """
+    with registrar_consultas(guardar_sql=True, aliases=aliases) as registro:
+        yield registro
+
+    problemas = []
+    if registro.total > maximo:
+        problemas.append(f'{registro.total} consultas (presupuesto: {maximo})')
+    if registro.duplicadas > duplicadas:
+        problemas.append(f'{registro.duplicadas} consultas duplicadas (permitidas: {duplicadas})')
+    if problemas:
+        detalle = '\n'.join(
+            f'  {i}. {c["sql"]}' for i, c in enumerate(registro.consultas, start=1)
+        )
+        raise AssertionError('; '.join(problemas) + '\n' + detalle)
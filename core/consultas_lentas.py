@@ -0,0 +1,236 @@
+"""
+Registro de consultas SQL lentas
+
+Toda sentencia que supera CONSULTAS_LENTAS['UMBRAL_MS'] se guarda como una
+línea JSON con:
+- huella: hash de la sentencia normalizada (literales, marcadores y listas
+  IN reemplazados), así las ejecuciones con distintos valores se agrupan
+- la vista (nombre de la URL) y la ruta de la petición que la originó
+- para una muestra (MUESTREO_PILA), las llamadas del proyecto que la
+  ejecutaron
+
+Los valores de los parámetros no se guardan. El wrapper se instala en cada
+conexión al abrirse (CoreConfig.ready), así también se capturan las
+consultas de comandos y las que se ejecutan al iterar una
+StreamingHttpResponse (exportaciones CSV). MetricasPeticionMiddleware
+indica la petición en curso con asignar_peticion.
+
+Cada proceso escribe en su propio archivo rotativo dentro de DIRECTORIO
+(lentas-<pid>.jsonl, hasta MAX_BYTES con COPIAS anteriores), para que los
+workers de gunicorn no roten el mismo archivo a la vez; los archivos sin
+cambios en RETENCION_DIAS se borran. El comando consultas_lentas los lee:
+
+    python manage.py consultas_lentas --top 20
+"""
+import glob
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+import traceback
+from contextvars import ContextVar
+from logging.handlers import RotatingFileHandler
+
+from django.conf import settings
+from django.utils import timezone
+
+_peticion = ContextVar('peticion_consultas_lentas', default=None)
+
+_CADENAS = re.compile(r"'(?:[^']|'')*'")
+_MARCADORES = re.compile(r'%s|\$\d+')
+_NUMEROS = re.compile(r'(?<![\w"])-?\d+(?:\.\d+)?\b')
+_LISTAS = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_FILAS = re.compile(r'\(\?\+\)(?:\s*,\s*\(\?\+\))+')
+_ESPACIOS = re.compile(r'\s+')
+
+
+_POR_DEFECTO = {
+    'ACTIVA': True,
+    'UMBRAL_MS': 100,
+    'MUESTREO_PILA': 0.2,
+    'MAX_BYTES': 5 * 1024 * 1024,
+    'COPIAS': 3,
+    'RETENCION_DIAS': 7,
+}
+
+
+def _config():
+    return {
+        **_POR_DEFECTO,
+        'DIRECTORIO': os.path.join(settings.BASE_DIR, 'logs', 'consultas_lentas'),
+        **getattr(settings, 'CONSULTAS_LENTAS', {}),
+    }
+
+
+def normalizar(sql):
+    """
+    Sentencia sin valores concretos: "WHERE id IN (1, 2, 3) AND nombre
+    LIKE '%ana%'" y "WHERE id IN (%s, %s) AND nombre LIKE %s" quedan
+    iguales, "WHERE id IN (?+) AND nombre LIKE ?"
+    """
+    sql = _CADENAS.sub('?', sql)
+    sql = _MARCADORES.sub('?', sql)
+    sql = _NUMEROS.sub('?', sql)
+    sql = _LISTAS.sub('(?+)', sql)
+    sql = _FILAS.sub('(?+)', sql)
+    return _ESPACIOS.sub(' ', sql).strip()
+
+
+def huella(sql_normalizado):
+    return hashlib.sha1(sql_normalizado.encode()).hexdigest()[:16]
+
+
+def asignar_peticion(request):
+    """La petición a la que se atribuyen las consultas de este contexto"""
+    return _peticion.set(request)
+
+
+def liberar_peticion(token):
+    _peticion.reset(token)
+
+
+def _origen():
+    request = _peticion.get()
+    if request is None:
+        return None, None
+    resolver_match = getattr(request, 'resolver_match', None)
+    return (resolver_match.view_name if resolver_match else None), request.path
+
+
+def _pila(limite=8):
+    """Llamadas del proyecto (sin Django ni librerías) que llevaron a la consulta"""
+    raiz = str(settings.BASE_DIR)
+    marcos = [
+        marco for marco in traceback.extract_stack()[:-3]
+        if marco.filename.startswith(raiz)
+        and 'site-packages' not in marco.filename
+        and not marco.filename.endswith('consultas_lentas.py')
+    ]
+    return [
+        f'{os.path.relpath(marco.filename, raiz)}:{marco.lineno} en {marco.name}'
+        for marco in marcos[-limite:]
+    ]
+
+
+class AlmacenConsultasLentas:
+    """Archivos JSON Lines rotativos, uno por proceso"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handler = None
+        self._clave = None
+
+    def _abrir(self, configuracion):
+        clave = (configuracion['DIRECTORIO'], os.getpid())
+        if self._clave == clave:
+            return self._handler
+        with self._lock:
+            if self._clave != clave:
+                # Nuevo proceso (fork de gunicorn) o directorio distinto
+                if self._handler is not None:
+                    self._handler.close()
+                directorio = configuracion['DIRECTORIO']
+                os.makedirs(directorio, exist_ok=True)
+                self._purgar(directorio, configuracion['RETENCION_DIAS'])
+                self._handler = RotatingFileHandler(
+                    os.path.join(directorio, f'lentas-{os.getpid()}.jsonl'),
+                    maxBytes=configuracion['MAX_BYTES'],
+                    backupCount=configuracion['COPIAS'],
+                    encoding='utf-8',
+                    delay=True,
+                )
+                self._clave = clave
+        return self._handler
+
+    @staticmethod
+    def _purgar(directorio, dias):
+        limite = time.time() - dias * 24 * 3600
+        for ruta in glob.glob(os.path.join(directorio, 'lentas-*.jsonl*')):
+            try:
+                if os.path.getmtime(ruta) < limite:
+                    os.remove(ruta)
+            except OSError:
+                pass
+
+    def guardar(self, registro, configuracion):
+        linea = json.dumps(registro, ensure_ascii=False)
+        self._abrir(configuracion).handle(logging.makeLogRecord({'msg': linea}))
+
+    def cerrar(self):
+        with self._lock:
+            if self._handler is not None:
+                self._handler.close()
+            self._handler = None
+            self._clave = None
+
+
+ALMACEN = AlmacenConsultasLentas()
+
+
+def leer_registros(directorio=None):
+    """Registros guardados por todos los procesos, incluidas las copias rotadas"""
+    directorio = directorio or _config()['DIRECTORIO']
+    for ruta in sorted(glob.glob(os.path.join(directorio, 'lentas-*.jsonl*'))):
+        with open(ruta, encoding='utf-8') as archivo:
+            for linea in archivo:
+                try:
+                    yield json.loads(linea)
+                except ValueError:
+                    # Línea cortada si el proceso murió escribiendo
+                    continue
+
+
+class CapturaConsultasLentas:
+    """Wrapper de ejecución (connection.execute_wrapper) que guarda las lentas"""
+
+    def __call__(self, execute, sql, params, many, context):
+        inicio = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duracion_ms = (time.perf_counter() - inicio) * 1000
+            # Se evalúa en cada consulta: solo el umbral, la configuración
+            # completa recién al capturar
+            parcial = getattr(settings, 'CONSULTAS_LENTAS', {})
+            if (
+                parcial.get('ACTIVA', _POR_DEFECTO['ACTIVA'])
+                and duracion_ms >= parcial.get('UMBRAL_MS', _POR_DEFECTO['UMBRAL_MS'])
+            ):
+                self._capturar(sql, many, duracion_ms, context)
+
+    def _capturar(self, sql, many, duracion_ms, context):
+        configuracion = _config()
+        normalizado = normalizar(sql)
+        vista, ruta = _origen()
+        registro = {
+            'momento': timezone.now().isoformat(),
+            'huella': huella(normalizado),
+            'sql': normalizado[:4000],
+            'ms': round(duracion_ms, 2),
+            'vista': vista,
+            'ruta': ruta,
+            'alias': context['connection'].alias,
+            'many': many,
+        }
+        if random.random() < configuracion['MUESTREO_PILA']:
+            registro['pila'] = _pila()
+        try:
+            ALMACEN.guardar(registro, configuracion)
+        except OSError:
+            # El registro es diagnóstico: sin disco la consulta sigue igual
+            logging.getLogger(__name__).exception('No se pudo guardar la consulta lenta')
+
+
+CAPTURA = CapturaConsultasLentas()
+
+
+def instalar(sender, connection, **kwargs):
+    """Receptor de connection_created"""
+    if CAPTURA not in connection.execute_wrappers:
+        # Al principio: connection.execute_wrapper() quita con pop() el último
+        # wrapper, y la conexión puede abrirse dentro de uno de esos bloques
+        connection.execute_wrappers.insert(0, CAPTURA)
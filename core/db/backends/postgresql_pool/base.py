@@ -0,0 +1,31 @@
+"""
+Backend PostgreSQL que toma las conexiones de un pool por proceso
+
+Se activa con DB_POOL=True (ver settings.py). Las opciones del pool van en
+DATABASES[alias]['POOL']: MAX, TIMEOUT, VERIFICAR_TRAS y VIDA_MAXIMA.
+Con este backend CONN_MAX_AGE debe ser 0: cerrar la conexión al terminar
+la petición es lo que la devuelve al pool.
+"""
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgresDatabaseWrapper
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+from core.db.pool import obtener_pool
+
+
+class DatabaseWrapper(PostgresDatabaseWrapper):
+
+    @property
+    def pool(self):
+        return obtener_pool(self.alias, self.settings_dict.get('POOL'))
+
+    def get_new_connection(self, conn_params):
+        conexion = self.pool.obtener(lambda: super(DatabaseWrapper, self).get_new_connection(conn_params))
+        # Al reutilizar una conexión no pasa por el padre, que fija el nivel de aislamiento
+        nivel = self.settings_dict['OPTIONS'].get('isolation_level')
+        self.isolation_level = IsolationLevel.READ_COMMITTED if nivel is None else IsolationLevel(nivel)
+        return conexion
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self.pool.devolver(self.connection)
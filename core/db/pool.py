@@ -0,0 +1,230 @@
+"""
+Pool de conexiones a PostgreSQL por proceso
+
+Django abre una conexión por hilo y, con CONN_MAX_AGE=0, la cierra al final
+de cada petición. Con el backend core.db.backends.postgresql_pool la
+conexión se toma de este pool al conectar y se devuelve al cerrar, así que
+la petición siguiente (de cualquier hilo del worker) la reutiliza sin
+pagar el costo de conectar.
+
+- Un máximo de conexiones por proceso; si están todas en uso, el hilo
+  espera hasta `espera` segundos y luego falla con PoolAgotado.
+- Al devolver, una conexión con transacción abierta se revierte y una
+  conexión rota se descarta.
+- Al entregar, una conexión inactiva más de `verificar_tras` segundos se
+  prueba con SELECT 1, y una más antigua que `vida_maxima` se reemplaza.
+
+El pool no conoce psycopg2 más allá de la interfaz de conexión (closed,
+info.transaction_status, rollback, cursor, close), por lo que en los tests
+se usa con conexiones de prueba.
+"""
+import threading
+import time
+from collections import deque
+
+# Valores de psycopg2.extensions.TRANSACTION_STATUS_*
+_TRANSACCION_INACTIVA = 0
+_TRANSACCION_DESCONOCIDA = 4
+
+
+class PoolAgotado(Exception):
+    """No se liberó ninguna conexión dentro del tiempo de espera"""
+
+
+class _Entrada:
+    __slots__ = ('conexion', 'creada', 'devuelta')
+
+    def __init__(self, conexion):
+        self.conexion = conexion
+        self.creada = time.monotonic()
+        self.devuelta = self.creada
+
+
+class PoolConexiones:
+
+    def __init__(self, maximo=10, espera=10.0, verificar_tras=30.0, vida_maxima=1800.0):
+        self.maximo = maximo
+        self.espera = espera
+        self.verificar_tras = verificar_tras
+        self.vida_maxima = vida_maxima
+        self._libres = deque()
+        self._en_uso = {}
+        self._condicion = threading.Condition()
+        self._cerrado = False
+        self._contadores = {
+            'creadas': 0,
+            'reutilizadas': 0,
+            'descartadas': 0,
+            'esperas': 0,
+            'agotado': 0,
+        }
+
+    # ============ ENTREGA Y DEVOLUCIÓN ============
+
+    def obtener(self, crear):
+        """
+        Entrega una conexión libre o crea una con `crear()` si hay cupo.
+        Bloquea hasta `espera` segundos si el pool está lleno.
+        """
+        limite = time.monotonic() + self.espera
+        with self._condicion:
+            while True:
+                while self._libres:
+                    entrada = self._libres.pop()
+                    if self._sana(entrada):
+                        self._en_uso[id(entrada.conexion)] = entrada
+                        self._contadores['reutilizadas'] += 1
+                        return entrada.conexion
+                    self._descartar(entrada)
+
+                if len(self._en_uso) < self.maximo:
+                    # Se reserva el cupo antes de conectar fuera del lock
+                    reserva = object()
+                    self._en_uso[id(reserva)] = None
+                    break
+
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    self._contadores['agotado'] += 1
+                    raise PoolAgotado(
+                        f'Las {self.maximo} conexiones del pool están en uso '
+                        f'(espera de {self.espera}s agotada)'
+                    )
+                self._contadores['esperas'] += 1
+                self._condicion.wait(restante)
+
+        try:
+            conexion = crear()
+        except BaseException:
+            with self._condicion:
+                del self._en_uso[id(reserva)]
+                self._condicion.notify()
+            raise
+
+        with self._condicion:
+            del self._en_uso[id(reserva)]
+            self._en_uso[id(conexion)] = _Entrada(conexion)
+            self._contadores['creadas'] += 1
+        return conexion
+
+    def devolver(self, conexion):
+        """Devuelve la conexión al pool, o la cierra si quedó inutilizable"""
+        with self._condicion:
+            entrada = self._en_uso.pop(id(conexion), None)
+            self._condicion.notify()
+        if entrada is None:
+            # No salió de este pool (o ya se devolvió)
+            _cerrar(conexion)
+            return
+
+        if not self._limpiar(conexion) or self._cerrado:
+            with self._condicion:
+                self._descartar(entrada)
+            return
+
+        entrada.devuelta = time.monotonic()
+        with self._condicion:
+            self._libres.append(entrada)
+            self._condicion.notify()
+
+    # ============ ESTADO DE LAS CONEXIONES ============
+
+    def _limpiar(self, conexion):
+        """Deja la conexión sin transacción pendiente; False si está rota"""
+        if getattr(conexion, 'closed', 1):
+            return False
+        estado = conexion.info.transaction_status
+        if estado == _TRANSACCION_DESCONOCIDA:
+            return False
+        if estado != _TRANSACCION_INACTIVA:
+            try:
+                conexion.rollback()
+            except Exception:
+                return False
+        return True
+
+    def _sana(self, entrada):
+        ahora = time.monotonic()
+        conexion = entrada.conexion
+        if getattr(conexion, 'closed', 1):
+            return False
+        if self.vida_maxima and ahora - entrada.creada > self.vida_maxima:
+            return False
+        if ahora - entrada.devuelta > self.verificar_tras:
+            try:
+                with conexion.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+                conexion.rollback()
+            except Exception:
+                return False
+        return True
+
+    def _descartar(self, entrada):
+        self._contadores['descartadas'] += 1
+        _cerrar(entrada.conexion)
+
+    # ============ ADMINISTRACIÓN ============
+
+    def cerrar(self):
+        """Cierra las conexiones libres; las que están en uso se cierran al devolverse"""
+        with self._condicion:
+            self._cerrado = True
+            libres, self._libres = list(self._libres), deque()
+        for entrada in libres:
+            _cerrar(entrada.conexion)
+
+    def estadisticas(self):
+        with self._condicion:
+            return {
+                'maximo': self.maximo,
+                'en_uso': len(self._en_uso),
+                'libres': len(self._libres),
+                **self._contadores,
+            }
+
+
+def _cerrar(conexion):
+    try:
+        conexion.close()
+    except Exception:
+        pass
+
+
+# ============ POOLS DEL PROCESO ============
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def obtener_pool(alias, configuracion=None):
+    """Pool del alias de BD; se crea la primera vez con `configuracion`"""
+    pool = _pools.get(alias)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(alias)
+            if pool is None:
+                configuracion = configuracion or {}
+                pool = _pools[alias] = PoolConexiones(
+                    maximo=configuracion.get('MAX', 10),
+                    espera=configuracion.get('TIMEOUT', 10.0),
+                    verificar_tras=configuracion.get('VERIFICAR_TRAS', 30.0),
+                    vida_maxima=configuracion.get('VIDA_MAXIMA', 1800.0),
+                )
+    return pool
+
+
+def estadisticas_pools():
+    """{alias: estadísticas} de los pools creados en este proceso"""
+    return {alias: pool.estadisticas() for alias, pool in list(_pools.items())}
+
+
+def cerrar_pools():
+    """
+    Cierra y olvida todos los pools. Se llama después de un fork (las
+    conexiones heredadas del proceso padre no se deben compartir).
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.cerrar()
@@ -0,0 +1,13 @@
+"""
+Estadísticas de latencias compartidas por los comandos de medición
+(benchmark, carga)
+"""
+import math
+
+
+def percentil(valores_ordenados, p):
+    """Percentil por rango más cercano (el valor en la posición ⌈p·n/100⌉) de una lista ya ordenada"""
+    if not valores_ordenados:
+        return 0.0
+    indice = max(0, min(len(valores_ordenados) - 1, math.ceil(p / 100 * len(valores_ordenados)) - 1))
+    return valores_ordenados[indice]
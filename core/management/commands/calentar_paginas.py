@@ -0,0 +1,27 @@
+"""
+Management command que renderiza y cachea las páginas HTML al desplegar
+
+Descarta las páginas cacheadas del despliegue anterior y genera las
+públicas y los paneles (ver roy_representaciones/paginas.py). Se ejecuta
+después de collectstatic: la clave de cada página lleva el hash del
+manifiesto nuevo, así las páginas ya apuntan a los estáticos nuevos:
+
+    python manage.py collectstatic --noinput
+    python manage.py calentar_paginas
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from roy_representaciones.paginas import calentar_paginas
+
+
+class Command(BaseCommand):
+    help = 'Renderiza y cachea las páginas públicas y los paneles'
+
+    def handle(self, *args, **options):
+        inicio = time.perf_counter()
+        generadas = calentar_paginas()
+        self.stdout.write(self.style.SUCCESS(
+            f'{generadas} páginas cacheadas en {(time.perf_counter() - inicio) * 1000:.0f} ms'
+        ))
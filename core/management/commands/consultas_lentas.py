@@ -0,0 +1,77 @@
+"""
+Management command que resume el registro de consultas lentas
+
+Agrupa por huella (sentencia normalizada) los registros de todos los
+procesos (core/consultas_lentas.py) y muestra las que más tiempo suman y
+las que más veces superaron el umbral, con las vistas que las originan:
+
+    python manage.py consultas_lentas --top 20 --desde 24
+    python manage.py consultas_lentas --vista autenticacion:api_listar_clientes --pilas
+"""
+import datetime
+from collections import Counter, defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.consultas_lentas import leer_registros
+
+
+class Command(BaseCommand):
+    help = 'Top de consultas SQL lentas por tiempo total y por cantidad'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=10, help='Huellas a mostrar en cada lista')
+        parser.add_argument('--desde', type=float, default=0, help='Solo las últimas N horas (0: todo)')
+        parser.add_argument('--vista', help='Solo las consultas de esta vista (nombre de la URL)')
+        parser.add_argument('--directorio', help='Directorio de los registros (por defecto CONSULTAS_LENTAS)')
+        parser.add_argument('--pilas', action='store_true', help='Mostrar una pila de llamadas por huella')
+
+    def handle(self, *args, **options):
+        if options['top'] < 1:
+            raise CommandError('--top debe ser positivo')
+
+        desde = None
+        if options['desde']:
+            desde = timezone.now() - datetime.timedelta(hours=options['desde'])
+
+        huellas = defaultdict(lambda: {'cantidad': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'vistas': Counter()})
+        for registro in leer_registros(options['directorio']):
+            if options['vista'] and registro.get('vista') != options['vista']:
+                continue
+            if desde and datetime.datetime.fromisoformat(registro['momento']) < desde:
+                continue
+            grupo = huellas[registro['huella']]
+            grupo['sql'] = registro['sql']
+            grupo['cantidad'] += 1
+            grupo['total_ms'] += registro['ms']
+            grupo['max_ms'] = max(grupo['max_ms'], registro['ms'])
+            grupo['vistas'][registro.get('vista') or registro.get('ruta') or 'sin petición'] += 1
+            if registro.get('pila'):
+                grupo['pila'] = registro['pila']
+
+        if not huellas:
+            self.stdout.write('No hay consultas lentas registradas')
+            return
+
+        total = sum(grupo['cantidad'] for grupo in huellas.values())
+        self.stdout.write(f'{total} consultas lentas, {len(huellas)} huellas distintas')
+        for titulo, clave in (('Por tiempo total', 'total_ms'), ('Por cantidad', 'cantidad')):
+            self.stdout.write(self.style.MIGRATE_HEADING(titulo))
+            ordenadas = sorted(huellas.items(), key=lambda item: item[1][clave], reverse=True)
+            for posicion, (huella, grupo) in enumerate(ordenadas[:options['top']], start=1):
+                self._huella(posicion, huella, grupo, options['pilas'])
+
+    def _huella(self, posicion, huella, grupo, pilas):
+        promedio = grupo['total_ms'] / grupo['cantidad']
+        self.stdout.write(
+            f'{posicion:>3}. {huella}  {grupo["cantidad"]:>6} veces  {grupo["total_ms"]:>11.1f} ms total  '
+            f'{promedio:>8.1f} ms prom  {grupo["max_ms"]:>8.1f} ms máx'
+        )
+        vistas = ', '.join(f'{vista} ({veces})' for vista, veces in grupo['vistas'].most_common(3))
+        self.stdout.write(f'     {vistas}')
+        sql = grupo['sql']
+        self.stdout.write(f'     {sql[:300]}{"…" if len(sql) > 300 else ""}')
+        if pilas and grupo.get('pila'):
+            for marco in grupo['pila']:
+                self.stdout.write(f'       {marco}')
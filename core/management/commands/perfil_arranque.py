@@ -0,0 +1,51 @@
+"""
+Management command con el perfil de arranque de un worker
+
+Resume `python -X importtime` de un proceso que arranca como un worker
+(aplicación WSGI y URLconf cargados): tiempo total y su razón respecto de
+un proyecto mínimo, RSS máximo, cantidad de módulos y los paquetes que más tardan en importarse. Avisa si se carga
+alguna de las librerías que deben importarse recién en su primer uso.
+
+    python manage.py perfil_arranque --top 15
+    python manage.py perfil_arranque --json > arranque.json
+"""
+import json
+
+from django.core.management.base import BaseCommand
+
+from core.arranque import PEREZOSOS, medir_arranque, medir_base
+
+
+class Command(BaseCommand):
+    help = 'Perfil de importación y memoria al arrancar un worker (-X importtime)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=20, help='Paquetes a mostrar')
+        parser.add_argument('--json', action='store_true', help='Imprimir el resultado completo en JSON')
+
+    def handle(self, *args, **options):
+        medicion = medir_arranque()
+        medicion['base_ms'] = medir_base()
+
+        if options['json']:
+            self.stdout.write(json.dumps(medicion, ensure_ascii=False, indent=2))
+            return
+
+        self.stdout.write(
+            f'Arranque: {medicion["tiempo_ms"]:.0f} ms ({medicion["tiempo_ms"] / medicion["base_ms"]:.1f}x '
+            f'un proyecto mínimo de Django + DRF, {medicion["base_ms"]:.0f} ms), '
+            f'RSS {medicion["rss_kb"] / 1024:.1f} MB, {medicion["cantidad_modulos"]} módulos'
+        )
+        self.stdout.write(f'{"paquete":<32} {"acumulado ms":>13} {"propio ms":>10}')
+        for fila in medicion['paquetes'][:options['top']]:
+            self.stdout.write(f'{fila["paquete"]:<32} {fila["acumulado_ms"]:>13.1f} {fila["propio_ms"]:>10.1f}')
+
+        if medicion['perezosos_cargados']:
+            self.stdout.write(self.style.WARNING(
+                'Se cargan al arrancar (deberían importarse en su primer uso): '
+                + ', '.join(medicion['perezosos_cargados'])
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'Ninguna librería pesada se carga al arrancar ({", ".join(PEREZOSOS)})'
+            ))
@@ -0,0 +1,35 @@
+"""
+Management command que calienta el proceso: conexiones, datos de
+referencia, plantillas compiladas y páginas cacheadas (ver
+roy_representaciones/calentamiento.py)
+
+Al desplegar, después de collectstatic, renueva también las páginas
+cacheadas; cada worker de gunicorn hace lo mismo sin --renovar-paginas en
+post_fork (gunicorn.conf.py):
+
+    python manage.py collectstatic --noinput
+    python manage.py warmup --renovar-paginas
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from roy_representaciones.calentamiento import calentar
+
+
+class Command(BaseCommand):
+    help = 'Abre conexiones, carga referencias, compila plantillas y carga las páginas cacheadas'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--renovar-paginas',
+            action='store_true',
+            help='Descartar las páginas cacheadas y volver a renderizarlas (como calentar_paginas)',
+        )
+
+    def handle(self, *args, **options):
+        pasos, errores = calentar(renovar_paginas=options['renovar_paginas'])
+        for nombre, ms, detalle in pasos:
+            self.stdout.write(f'  {nombre:<12} {ms:>8.1f} ms  {detalle}')
+        total = sum(ms for _, ms, _ in pasos)
+        if errores:
+            raise CommandError('Calentamiento incompleto:\n' + '\n'.join(f'  {error}' for error in errores))
+        self.stdout.write(self.style.SUCCESS(f'Proceso caliente en {total:.0f} ms'))
@@ -0,0 +1,112 @@
+"""
+Métricas del proceso en formato Prometheus
+
+Registro de métricas de prometheus_client que alimentan:
+- MetricasPeticionMiddleware: latencia, consultas SQL y tiempo en SQL por
+  nombre de URL
+- EspacioCache (core/cache.py): lecturas por espacio y dónde se resolvieron
+  (LRU local, caché compartida o fallo); la tasa de aciertos es
+  sum(rate(roy_cache_lecturas_total{resultado!="fallo"}[5m]))
+  / sum(rate(roy_cache_lecturas_total[5m]))
+- las exportaciones a Excel y los intentos de login
+
+Se publican en /metrics (vista `metricas`). Con varios workers de gunicorn
+cada proceso tiene sus propios contadores: si PROMETHEUS_MULTIPROC_DIR está
+definida (la define gunicorn.conf.py antes de cargar la aplicación), cada
+worker escribe sus valores en archivos de ese directorio y /metrics suma
+los de todos los procesos, así que da lo mismo qué worker atienda el scrape.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+LATENCIA = Histogram(
+    'roy_peticion_segundos',
+    'Duración de las peticiones HTTP',
+    ['vista', 'metodo', 'estado'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+CONSULTAS = Histogram(
+    'roy_peticion_consultas',
+    'Consultas SQL por petición',
+    ['vista'],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250),
+)
+TIEMPO_SQL = Counter(
+    'roy_peticion_sql_segundos',
+    'Tiempo acumulado en SQL por vista',
+    ['vista'],
+)
+CACHE = Counter(
+    'roy_cache_lecturas',
+    'Lecturas de EspacioCache por espacio y resultado (local, compartida, fallo)',
+    ['espacio', 'resultado'],
+)
+EXPORTACIONES = Histogram(
+    'roy_exportacion_segundos',
+    'Duración de las exportaciones',
+    ['exportacion'],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+LOGIN = Counter(
+    'roy_login_intentos',
+    'Intentos de login por resultado',
+    ['resultado'],
+)
+
+
+def observar_peticion(metricas):
+    """Registra una petición con el resumen armado por MetricasPeticionMiddleware"""
+    vista = metricas['vista'] or 'sin_vista'
+    LATENCIA.labels(vista, metricas['metodo'], str(metricas['estado'])).observe(metricas['total_ms'] / 1000)
+    CONSULTAS.labels(vista).observe(metricas['consultas'])
+    TIEMPO_SQL.labels(vista).inc(metricas['sql_ms'] / 1000)
+
+
+@contextmanager
+def medir_exportacion(nombre):
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        EXPORTACIONES.labels(nombre).observe(time.perf_counter() - inicio)
+
+
+def medir_flujo(nombre, partes):
+    """Generador para StreamingHttpResponse que mide la exportación hasta el último bloque"""
+    with medir_exportacion(nombre):
+        yield from partes
+
+
+def _registro():
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registro = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registro)
+        return registro
+    return REGISTRY
+
+
+def metricas(request):
+    """
+    Vista de /metrics. Si METRICAS_TOKEN está configurado, exige
+    'Authorization: Bearer <token>' (bearer_token en el scrape_config).
+    """
+    token = getattr(settings, 'METRICAS_TOKEN', '')
+    if token:
+        enviado = request.headers.get('Authorization', '').removeprefix('Bearer ').strip()
+        if not constant_time_compare(enviado, token):
+            return HttpResponseForbidden()
+    return HttpResponse(generate_latest(_registro()), content_type=CONTENT_TYPE_LATEST)
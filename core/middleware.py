@@ -0,0 +1,237 @@
+"""
+Métricas por petición: consultas SQL, tiempo en BD y tiempo total
+
+Para cada petición se registra, junto con el nombre de la URL resuelta:
+- número de consultas y tiempo total en SQL
+- consultas idénticas repetidas y la sentencia más repetida (patrón N+1)
+- tiempo total de la vista
+
+Con DEBUG se agregan como encabezados de la respuesta (X-Consultas-*,
+Server-Timing). En producción se escribe un registro JSON en el logger
+'core.metricas' para una muestra de las peticiones (METRICAS_PETICIONES
+['MUESTREO']) y siempre para las lentas o con duplicadas. Todas las
+peticiones se suman a las métricas de Prometheus (core/metricas.py).
+
+Las consultas que se ejecutan al iterar una StreamingHttpResponse ocurren
+después de que el middleware termina y no se cuentan.
+
+También indica la petición en curso al registro de consultas lentas
+(core/consultas_lentas.py), que guarda la vista de cada consulta lenta.
+
+CompresionMiddleware comprime con Brotli o gzip las respuestas JSON grandes.
+
+Los middlewares de este módulo funcionan en modo síncrono y async: bajo
+ASGI un middleware solo síncrono obliga a Django a ejecutar el resto de la
+cadena en un hilo por petición, y las vistas async pierden su ventaja.
+"""
+import gzip
+import json
+import logging
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from core.consultas import registrar_consultas
+from core.consultas_lentas import asignar_peticion, liberar_peticion
+from core.metricas import observar_peticion
+
+try:
+    import brotli
+except ImportError:  # sin Brotli se comprime solo con gzip
+    brotli = None
+
+logger = logging.getLogger('core.metricas')
+
+
+class MetricasPeticionMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        configuracion = getattr(settings, 'METRICAS_PETICIONES', {})
+        self.encabezados = configuracion.get('ENCABEZADOS', settings.DEBUG)
+        self.muestreo = configuracion.get('MUESTREO', 0.01)
+        self.lenta_ms = configuracion.get('LENTA_MS', 1000)
+        self.max_duplicadas = configuracion.get('MAX_DUPLICADAS', 5)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        inicio = time.perf_counter()
+        token = asignar_peticion(request)
+        try:
+            with registrar_consultas() as registro:
+                response = self.get_response(request)
+        except BaseException:
+            liberar_peticion(token)
+            raise
+        return self._procesar(request, response, registro, inicio, token)
+
+    async def __acall__(self, request):
+        # El registro vive en el contexto de la petición, que sync_to_async
+        # copia a su hilo: cuenta las consultas de la vista aunque usen la
+        # conexión de otro hilo (core/consultas.py)
+        inicio = time.perf_counter()
+        token = asignar_peticion(request)
+        try:
+            with registrar_consultas() as registro:
+                response = await self.get_response(request)
+        except BaseException:
+            liberar_peticion(token)
+            raise
+        return self._procesar(request, response, registro, inicio, token)
+
+    def _procesar(self, request, response, registro, inicio, token):
+        total_ms = round((time.perf_counter() - inicio) * 1000, 2)
+        # Las consultas de una StreamingHttpResponse se ejecutan al enviarla:
+        # la petición sigue asignada para que el registro de consultas lentas
+        # las atribuya a su vista (la siguiente petición la reemplaza)
+        if not response.streaming:
+            liberar_peticion(token)
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        metricas = {
+            'vista': resolver_match.view_name if resolver_match else None,
+            'metodo': request.method,
+            'estado': response.status_code,
+            'total_ms': total_ms,
+            **registro.resumen(),
+        }
+        observar_peticion(metricas)
+
+        if self.encabezados:
+            response['X-Consultas'] = metricas['consultas']
+            response['X-Consultas-Duplicadas'] = metricas['duplicadas']
+            response['X-Consultas-Tiempo-Ms'] = metricas['sql_ms']
+            response['Server-Timing'] = (
+                f'sql;dur={metricas["sql_ms"]};desc="{metricas["consultas"]} consultas", '
+                f'total;dur={total_ms}'
+            )
+
+        if self._registrar(metricas):
+            repetidas = registro.mas_repetidas(1)
+            if repetidas:
+                metricas['mas_repetida'] = repetidas[0][0][:300]
+            logger.info(json.dumps(metricas, ensure_ascii=False))
+
+        return response
+
+    def _registrar(self, metricas):
+        if metricas['total_ms'] >= self.lenta_ms or metricas['duplicadas'] > self.max_duplicadas:
+            return True
+        return random.random() < self.muestreo
+
+
+class WhiteNoiseAsyncMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoiseMiddleware que también funciona en modo async (la versión
+    instalada solo es síncrona). Sirve los estáticos igual; el resto de las
+    peticiones sigue por la cadena sin cambiar de modo.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            # Con autorefresh la búsqueda lee el disco
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
+
+class CompresionMiddleware:
+    """
+    Comprime con Brotli o gzip las respuestas JSON grandes, según el
+    Accept-Encoding del cliente. Las pequeñas (< COMPRESION['MINIMO_BYTES'])
+    no ganan lo que cuesta comprimirlas; los estáticos ya los sirve
+    WhiteNoise comprimidos de antemano.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        configuracion = getattr(settings, 'COMPRESION', {})
+        self.minimo_bytes = configuracion.get('MINIMO_BYTES', 1024)
+        self.tipos = tuple(configuracion.get('TIPOS', ('application/json',)))
+        self.nivel_brotli = configuracion.get('NIVEL_BROTLI', 4)
+        self.nivel_gzip = configuracion.get('NIVEL_GZIP', 6)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self._comprimir(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if not self._comprimible(response):
+            return response
+        # Comprimir un JSON grande toma milisegundos de CPU: en un hilo, para
+        # no detener el event loop mientras tanto
+        return await sync_to_async(self._comprimir, thread_sensitive=False)(request, response)
+
+    def _codificacion(self, request):
+        aceptadas = {
+            parte.split(';')[0].strip().lower()
+            for parte in request.META.get('HTTP_ACCEPT_ENCODING', '').split(',')
+        }
+        if brotli is not None and 'br' in aceptadas:
+            return 'br'
+        if 'gzip' in aceptadas:
+            return 'gzip'
+        return None
+
+    def _comprimible(self, response):
+        return not (
+            response.streaming
+            or response.has_header('Content-Encoding')
+            or not response.get('Content-Type', '').startswith(self.tipos)
+            or len(response.content) < self.minimo_bytes
+        )
+
+    def _comprimir(self, request, response):
+        if not self._comprimible(response):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        codificacion = self._codificacion(request)
+        if codificacion is None:
+            return response
+
+        if codificacion == 'br':
+            comprimido = brotli.compress(response.content, quality=self.nivel_brotli)
+        else:
+            comprimido = gzip.compress(response.content, compresslevel=self.nivel_gzip, mtime=0)
+        if len(comprimido) >= len(response.content):
+            return response
+
+        response.content = comprimido
+        response['Content-Length'] = str(len(comprimido))
+        response['Content-Encoding'] = codificacion
+        # Como GZipMiddleware: el cuerpo ya no es idéntico byte a byte
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('conexiones/', views.estado_conexiones, name='sistema_conexiones'),
+]
@@ -1,3 +1,25 @@
-from django.shortcuts import render
+import os
 
-# Create your views here.
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db import connections
+from django.http import JsonResponse
+
+from core.db.pool import estadisticas_pools
+
+
+@staff_member_required
+def estado_conexiones(request):
+    """Estadísticas de los pools de conexiones de este proceso"""
+    return JsonResponse({
+        'success': True,
+        'pid': os.getpid(),
+        'pools': estadisticas_pools(),
+        'conexiones': {
+            alias: {
+                'engine': connections[alias].settings_dict['ENGINE'],
+                'conn_max_age': connections[alias].settings_dict['CONN_MAX_AGE'],
+                'health_checks': connections[alias].settings_dict['CONN_HEALTH_CHECKS'],
+            }
+            for alias in connections
+        },
+    })
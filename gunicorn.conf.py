@@ -0,0 +1,53 @@
+"""
+Configuración de gunicorn
+
+    gunicorn roy_representaciones.wsgi -c gunicorn.conf.py --workers 4
+
+Métricas de Prometheus con varios workers (core/metricas.py): cada worker
+escribe sus valores en archivos de PROMETHEUS_MULTIPROC_DIR y /metrics los
+suma. La variable se define aquí, antes de que se importe la aplicación;
+el master vacía el directorio al arrancar para no sumar valores de una
+ejecución anterior.
+
+Cada worker se calienta en post_fork (roy_representaciones/calentamiento.py)
+antes de aceptar peticiones.
+"""
+import os
+import shutil
+import tempfile
+
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'roy_prometheus'))
+
+
+def on_starting(server):
+    directorio = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(directorio, ignore_errors=True)
+    os.makedirs(directorio, exist_ok=True)
+
+
+def post_fork(server, worker):
+    import django
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'roy_representaciones.settings')
+    django.setup()
+
+    from core.db.pool import cerrar_pools
+    from roy_representaciones.calentamiento import calentar
+
+    # Con preload_app el worker hereda los pools del master: no se comparten
+    cerrar_pools()
+    pasos, errores = calentar()
+    server.log.info(
+        'Worker %s caliente en %.0f ms (%s)',
+        worker.pid,
+        sum(ms for _, ms, _ in pasos),
+        ', '.join(f'{nombre} {ms:.0f} ms' for nombre, ms, _ in pasos),
+    )
+    for error in errores:
+        server.log.warning('Calentamiento del worker %s: %s', worker.pid, error)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
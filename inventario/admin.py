@@ -1,3 +1,64 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Lote, MovimientoStock, SaldoStock
+
+
+class SaldoStockInline(admin.StackedInline):
+    model = SaldoStock
+    fields = ('cantidad', 'fecha_actualizacion')
+    readonly_fields = fields
+    can_delete = False
+
+
+class MovimientoStockInline(admin.TabularInline):
+    model = MovimientoStock
+    fields = ('fecha', 'tipo', 'cantidad', 'usuario', 'referencia')
+    readonly_fields = fields
+    ordering = ('-fecha',)
+    extra = 0
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Lote)
+class LoteAdmin(admin.ModelAdmin):
+    list_display = ('producto', 'codigo_lote', 'sucursal', 'fecha_ingreso', 'fecha_vencimiento',
+                    'cantidad_inicial', 'stock')
+    list_filter = ('sucursal', 'fecha_vencimiento')
+    list_select_related = ('producto', 'saldo')
+    search_fields = ('producto__codigo', 'producto__nombre', 'codigo_lote')
+    autocomplete_fields = ('producto',)
+    ordering = ('-fecha_ingreso',)
+    inlines = [SaldoStockInline, MovimientoStockInline]
+
+    # Las existencias se crean y se mueven solo por el kardex (kardex.py)
+    def has_add_permission(self, request):
+        return False
+
+    def get_readonly_fields(self, request, obj=None):
+        return ('producto', 'sucursal', 'cantidad_inicial') if obj else ()
+
+    @admin.display(description='Stock', ordering='saldo__cantidad')
+    def stock(self, obj):
+        return obj.saldo.cantidad if hasattr(obj, 'saldo') else 0
+
+
+@admin.register(MovimientoStock)
+class MovimientoStockAdmin(admin.ModelAdmin):
+    list_display = ('fecha', 'tipo', 'producto', 'sucursal', 'lote', 'cantidad', 'usuario', 'referencia')
+    list_filter = ('tipo', 'sucursal')
+    list_select_related = ('producto', 'lote__producto', 'usuario')
+    search_fields = ('producto__codigo', 'producto__nombre', 'referencia')
+    date_hierarchy = 'fecha'
+    ordering = ('-fecha',)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
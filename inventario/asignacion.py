@@ -0,0 +1,100 @@
+"""
+Asignación de salidas de stock a lotes
+
+Una salida de N unidades de un producto en una sucursal se reparte entre
+los lotes con existencias, en orden:
+- FIFO: primero el lote que ingresó antes
+- FEFO: primero el que vence antes; los lotes sin vencimiento van al
+  final y, entre lotes con la misma fecha, se sigue el orden FIFO
+
+El método por defecto es ROY_REPRESENTACIONES_CONFIG['METODO_ASIGNACION'].
+
+Los saldos de los lotes se leen con SELECT ... FOR UPDATE en tandas
+pequeñas siguiendo los índices parciales de SaldoStock (saldo_fefo_idx /
+saldo_fifo_idx): cada tanda trae los siguientes lotes con existencias en el
+orden de salida y, si todavía falta, se pide la siguiente. Así una salida
+bloquea y lee solo los lotes que consume (más los pocos de la última
+tanda), sin recorrer el historial del producto, y dos salidas simultáneas
+del mismo producto no pueden tomar las mismas unidades. Lo tomado de cada
+lote se registra en el kardex (kardex.registrar).
+
+    for saldo, cantidad in asignar(producto, 'roydent', 12, referencia='Venta 1520'):
+        ...
+"""
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Sum
+
+from . import kardex
+from .kardex import StockInsuficiente
+from .models import SaldoStock
+
+FIFO = 'FIFO'
+FEFO = 'FEFO'
+
+ORDEN = {
+    FIFO: ('fecha_ingreso', 'pk'),
+    FEFO: (F('fecha_vencimiento').asc(nulls_last=True), 'fecha_ingreso', 'pk'),
+}
+
+# Lotes de la primera tanda; cada tanda siguiente trae el doble
+TANDA_INICIAL = 4
+TANDA_MAXIMA = 256
+
+
+def metodo_por_defecto():
+    return getattr(settings, 'ROY_REPRESENTACIONES_CONFIG', {}).get('METODO_ASIGNACION', FEFO)
+
+
+def lotes_con_stock(producto, sucursal, metodo=None):
+    """Saldos de los lotes con existencias del producto en la sucursal, en orden de salida"""
+    metodo = metodo or metodo_por_defecto()
+    if metodo not in ORDEN:
+        raise ValueError(f'Método de asignación no válido: {metodo}')
+    return SaldoStock.objects.filter(
+        producto=producto, sucursal=sucursal, cantidad__gt=0
+    ).order_by(*ORDEN[metodo])
+
+
+def stock_disponible(producto, sucursal):
+    return SaldoStock.objects.filter(
+        producto=producto, sucursal=sucursal, cantidad__gt=0
+    ).aggregate(total=Sum('cantidad'))['total'] or 0
+
+
+def asignar(producto, sucursal, cantidad, metodo=None, tipo=kardex.VENTA, usuario=None, referencia=''):
+    """
+    Descuenta `cantidad` unidades de los lotes en orden de salida,
+    registrando un movimiento `tipo` por lote, y retorna [(saldo del lote,
+    unidades tomadas)]. Si no alcanza lanza StockInsuficiente y no
+    descuenta nada. Se ejecuta en una transacción (o dentro de la del
+    llamador, p. ej. la venta que origina la salida).
+    """
+    if cantidad <= 0:
+        raise ValueError('La cantidad a asignar debe ser positiva')
+
+    consulta = lotes_con_stock(producto, sucursal, metodo).select_for_update()
+    asignaciones = []
+    pendiente = cantidad
+    tanda = TANDA_INICIAL
+    with transaction.atomic():
+        while pendiente:
+            # Los saldos agotados en la tanda anterior ya no cumplen el filtro
+            saldos = list(consulta[:tanda])
+            if not saldos:
+                raise StockInsuficiente(
+                    getattr(producto, 'pk', producto), sucursal, cantidad, cantidad - pendiente
+                )
+            tomados = []
+            for saldo in saldos:
+                unidades = min(saldo.cantidad, pendiente)
+                pendiente -= unidades
+                tomados.append((saldo, -unidades))
+                asignaciones.append((saldo, unidades))
+                if not pendiente:
+                    break
+            kardex.registrar(tomados, tipo, usuario, referencia)
+            for saldo, unidades in tomados:
+                saldo.cantidad += unidades
+            tanda = min(tanda * 2, TANDA_MAXIMA)
+    return asignaciones
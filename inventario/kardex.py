@@ -0,0 +1,234 @@
+"""
+Kardex de inventario: movimientos de stock y saldos por lote
+
+Todo cambio de existencias pasa por este módulo. Cada movimiento
+(MovimientoStock) se inserta en la misma transacción que actualiza el saldo
+de su lote (SaldoStock) con F(), así que:
+- el stock de un lote ("Stock Base" de inventario.html) se lee por clave
+  primaria, sin sumar el historial (stock_base)
+- el kardex sigue siendo el registro de auditoría: la suma de los
+  movimientos de un lote es su saldo, y verificar_saldos (comando
+  verificar_kardex) lo comprueba
+- una salida no puede dejar un saldo en negativo aunque haya otras
+  concurrentes: el UPDATE solo descuenta si alcanza
+
+Las salidas de venta en orden FIFO/FEFO están en asignacion.py; aquí están
+los movimientos sobre un lote concreto:
+
+    lote = ingresar(producto, 'deposito', 100, fecha_vencimiento=vence)
+    transferir(lote, 'roydent', 20, usuario=request.user)
+    registrar_merma(lote, 2, observaciones='Frascos rotos')
+"""
+from django.db import transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import Lote, MovimientoStock, SaldoStock
+
+INGRESO = MovimientoStock.INGRESO
+VENTA = MovimientoStock.VENTA
+AJUSTE = MovimientoStock.AJUSTE
+TRANSFERENCIA = MovimientoStock.TRANSFERENCIA
+MERMA = MovimientoStock.MERMA
+
+# Signo obligatorio de la cantidad por tipo; ajustes y transferencias
+# pueden entrar o salir
+SIGNO = {INGRESO: 1, VENTA: -1, MERMA: -1}
+
+
+class StockInsuficiente(Exception):
+    """La sucursal no tiene existencias suficientes del producto"""
+
+    def __init__(self, producto_id, sucursal, solicitado, disponible):
+        self.producto_id = producto_id
+        self.sucursal = sucursal
+        self.solicitado = solicitado
+        self.disponible = disponible
+        super().__init__(
+            f'Stock insuficiente del producto {producto_id} en {sucursal}: '
+            f'se pidieron {solicitado} y hay {disponible}'
+        )
+
+
+def stock_base(lote):
+    """Existencias actuales de un lote (por clave primaria)"""
+    lote_id = getattr(lote, 'pk', lote)
+    return SaldoStock.objects.filter(pk=lote_id).values_list('cantidad', flat=True).first() or 0
+
+
+def registrar(partidas, tipo, usuario=None, referencia='', observaciones=''):
+    """
+    Registra movimientos de un mismo tipo. `partidas` son pares (lote,
+    cantidad con signo); el lote puede ser un Lote o su SaldoStock (la
+    clave primaria es la misma). Actualiza cada saldo y retorna los
+    movimientos creados; si un saldo no alcanza lanza StockInsuficiente y
+    no registra nada.
+    """
+    if tipo not in dict(MovimientoStock.TIPO_CHOICES):
+        raise ValueError(f'Tipo de movimiento no válido: {tipo}')
+    signo = SIGNO.get(tipo)
+    for _, cantidad in partidas:
+        if not cantidad or (signo and cantidad * signo < 0):
+            raise ValueError(f'Cantidad no válida para un movimiento de {tipo}: {cantidad}')
+
+    ahora = timezone.now()
+    with transaction.atomic():
+        for lote, cantidad in partidas:
+            actualizados = SaldoStock.objects.filter(pk=lote.pk, cantidad__gte=-cantidad).update(
+                cantidad=F('cantidad') + cantidad, fecha_actualizacion=ahora
+            )
+            if not actualizados:
+                raise StockInsuficiente(lote.producto_id, lote.sucursal, -cantidad, stock_base(lote))
+        return MovimientoStock.objects.bulk_create([
+            MovimientoStock(
+                lote_id=lote.pk,
+                producto_id=lote.producto_id,
+                sucursal=lote.sucursal,
+                tipo=tipo,
+                cantidad=cantidad,
+                fecha=ahora,
+                usuario=usuario,
+                referencia=referencia,
+                observaciones=observaciones,
+            )
+            for lote, cantidad in partidas
+        ])
+
+
+def _nuevo_lote(tipo, cantidad, usuario, referencia, observaciones, **datos):
+    """Crea un lote con su saldo y el movimiento que lo origina"""
+    if cantidad <= 0:
+        raise ValueError('La cantidad de un ingreso debe ser positiva')
+    lote = Lote.objects.create(cantidad_inicial=cantidad, **datos)
+    SaldoStock.objects.create(
+        lote=lote,
+        producto_id=lote.producto_id,
+        sucursal=lote.sucursal,
+        fecha_ingreso=lote.fecha_ingreso,
+        fecha_vencimiento=lote.fecha_vencimiento,
+        cantidad=cantidad,
+    )
+    MovimientoStock.objects.create(
+        lote=lote,
+        producto_id=lote.producto_id,
+        sucursal=lote.sucursal,
+        tipo=tipo,
+        cantidad=cantidad,
+        usuario=usuario,
+        referencia=referencia,
+        observaciones=observaciones,
+    )
+    return lote
+
+
+def ingresar(producto, sucursal, cantidad, fecha_vencimiento=None, codigo_lote=None, costo_unitario=0,
+             fecha_ingreso=None, usuario=None, referencia='', observaciones=''):
+    """Ingreso de mercadería: crea el lote, su saldo y el movimiento"""
+    with transaction.atomic():
+        return _nuevo_lote(
+            INGRESO, cantidad, usuario, referencia, observaciones,
+            producto=producto,
+            sucursal=sucursal,
+            codigo_lote=codigo_lote,
+            fecha_ingreso=fecha_ingreso or timezone.now(),
+            fecha_vencimiento=fecha_vencimiento,
+            costo_unitario=costo_unitario,
+        )
+
+
+def ajustar(lote, cantidad, usuario=None, observaciones=''):
+    """Ajuste de inventario (conteo físico); la cantidad lleva signo"""
+    return registrar([(lote, cantidad)], AJUSTE, usuario, observaciones=observaciones)[0]
+
+
+def registrar_merma(lote, cantidad, usuario=None, observaciones=''):
+    """Baja de `cantidad` unidades vencidas, dañadas o extraviadas"""
+    return registrar([(lote, -cantidad)], MERMA, usuario, observaciones=observaciones)[0]
+
+
+def transferir(lote, sucursal_destino, cantidad, usuario=None, referencia=''):
+    """
+    Envía `cantidad` unidades del lote a otra sucursal. En el destino se
+    crea un lote con las mismas fechas y costo, para que conserve su
+    lugar en el orden FIFO/FEFO. Retorna el lote de destino.
+    """
+    if sucursal_destino == lote.sucursal:
+        raise ValueError('La sucursal de destino es la misma del lote')
+    if sucursal_destino not in dict(Lote.SUCURSAL_CHOICES):
+        raise ValueError(f'Sucursal no válida: {sucursal_destino}')
+    referencia = referencia or f'Transferencia del lote {lote.pk}'
+    with transaction.atomic():
+        registrar([(lote, -cantidad)], TRANSFERENCIA, usuario, referencia)
+        return _nuevo_lote(
+            TRANSFERENCIA, cantidad, usuario, referencia, '',
+            producto_id=lote.producto_id,
+            sucursal=sucursal_destino,
+            codigo_lote=lote.codigo_lote,
+            fecha_ingreso=lote.fecha_ingreso,
+            fecha_vencimiento=lote.fecha_vencimiento,
+            costo_unitario=lote.costo_unitario,
+        )
+
+
+def verificar_saldos(tamano=1000, corregir=False):
+    """
+    Recalcula el saldo de cada lote sumando su kardex, por tandas de
+    `tamano` lotes, y lo compara con SaldoStock. Retorna (lotes revisados,
+    [(lote_id, saldo, kardex)]) con las diferencias; saldo es None si el
+    lote no tiene fila de saldo. Con corregir=True el saldo se reemplaza
+    por la suma del kardex, que es la fuente de verdad.
+
+    Cada tanda bloquea sus saldos antes de sumar el kardex: como todo
+    movimiento actualiza el saldo en su misma transacción, las salidas en
+    curso terminan antes (o esperan) y no aparecen como diferencias.
+    """
+    revisados = 0
+    diferencias = []
+    ultimo = 0
+    while True:
+        ids = list(Lote.objects.filter(pk__gt=ultimo).order_by('pk').values_list('pk', flat=True)[:tamano])
+        if not ids:
+            break
+        with transaction.atomic():
+            saldos = dict(
+                SaldoStock.objects.filter(pk__gte=ids[0], pk__lte=ids[-1]).select_for_update().values_list('pk', 'cantidad')
+            )
+            kardex = dict(
+                MovimientoStock.objects.filter(lote_id__gte=ids[0], lote_id__lte=ids[-1])
+                .values('lote_id').annotate(total=Sum('cantidad')).values_list('lote_id', 'total')
+            )
+            tanda = [
+                (lote_id, saldos.get(lote_id), kardex.get(lote_id, 0))
+                for lote_id in ids
+                if saldos.get(lote_id) != kardex.get(lote_id, 0)
+            ]
+            if corregir and tanda:
+                _corregir(tanda)
+        revisados += len(ids)
+        diferencias.extend(tanda)
+        ultimo = ids[-1]
+    return revisados, diferencias
+
+
+def _corregir(diferencias):
+    faltantes = []
+    for lote_id, saldo, total in diferencias:
+        if total < 0:
+            # Un kardex negativo no es un saldo posible: queda para revisión manual
+            continue
+        if saldo is None:
+            faltantes.append(lote_id)
+        else:
+            SaldoStock.objects.filter(pk=lote_id).update(cantidad=total, fecha_actualizacion=timezone.now())
+    totales = {lote_id: total for lote_id, _, total in diferencias}
+    SaldoStock.objects.bulk_create([
+        SaldoStock(
+            lote=lote,
+            producto_id=lote.producto_id,
+            sucursal=lote.sucursal,
+            fecha_ingreso=lote.fecha_ingreso,
+            fecha_vencimiento=lote.fecha_vencimiento,
+            cantidad=totales[lote.pk],
+        )
+        for lote in Lote.objects.filter(pk__in=faltantes)
+    ])
@@ -0,0 +1,46 @@
+"""
+Management command que verifica los saldos de stock contra el kardex
+
+Recalcula el saldo de cada lote sumando sus movimientos, por tandas de
+lotes, y lista los que no coinciden con SaldoStock (ver
+inventario/kardex.py). Sin --corregir termina con error si hay diferencias,
+para usarlo en una tarea programada:
+
+    python manage.py verificar_kardex
+    python manage.py verificar_kardex --tamano 5000 --corregir
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from inventario.kardex import verificar_saldos
+
+
+class Command(BaseCommand):
+    help = 'Recalcula los saldos de stock desde el kardex y reporta las diferencias'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tamano', type=int, default=1000, help='Lotes por tanda')
+        parser.add_argument(
+            '--corregir',
+            action='store_true',
+            help='Reemplazar los saldos con diferencias por la suma del kardex',
+        )
+
+    def handle(self, *args, **options):
+        if options['tamano'] < 1:
+            raise CommandError('--tamano debe ser positivo')
+
+        revisados, diferencias = verificar_saldos(options['tamano'], options['corregir'])
+        for lote_id, saldo, total in diferencias:
+            detalle = 'sin saldo' if saldo is None else f'saldo {saldo}'
+            self.stdout.write(f'  lote {lote_id:<10} {detalle:<16} kardex {total:<10} diferencia {(saldo or 0) - total:+d}')
+
+        if not diferencias:
+            self.stdout.write(self.style.SUCCESS(f'{revisados} lotes revisados, sin diferencias'))
+        elif options['corregir']:
+            negativos = sum(1 for _, _, total in diferencias if total < 0)
+            self.stdout.write(self.style.WARNING(
+                f'{revisados} lotes revisados, {len(diferencias) - negativos} saldos corregidos'
+                + (f', {negativos} con kardex negativo para revisar' if negativos else '')
+            ))
+        else:
+            raise CommandError(f'{len(diferencias)} de {revisados} lotes con saldo distinto del kardex')
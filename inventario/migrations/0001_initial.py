@@ -0,0 +1,45 @@
+# Generated by Django 4.2 on 2026-10-19 15:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('productos', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Lote',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sucursal', models.CharField(choices=[('deposito', 'Depósito Principal'), ('roydent', 'Roydent - Tienda Central'), ('mundo_medico', 'Mundo Médico - Sucursal')], max_length=20, verbose_name='Sucursal')),
+                ('codigo_lote', models.CharField(blank=True, max_length=50, null=True, verbose_name='Código de Lote')),
+                ('fecha_ingreso', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Fecha de Ingreso')),
+                ('fecha_vencimiento', models.DateField(blank=True, null=True, verbose_name='Fecha de Vencimiento')),
+                ('cantidad_inicial', models.PositiveIntegerField(verbose_name='Cantidad Inicial')),
+                ('cantidad_disponible', models.PositiveIntegerField(verbose_name='Cantidad Disponible')),
+                ('costo_unitario', models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Costo Unitario')),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Creación')),
+                ('producto', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='lotes', to='productos.producto', verbose_name='Producto')),
+            ],
+            options={
+                'verbose_name': 'Lote',
+                'verbose_name_plural': 'Lotes',
+                'db_table': 'lote',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='lote',
+            index=models.Index(condition=models.Q(('cantidad_disponible__gt', 0)), fields=['producto', 'sucursal', 'fecha_vencimiento', 'fecha_ingreso'], include=('cantidad_disponible',), name='lote_fefo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lote',
+            index=models.Index(condition=models.Q(('cantidad_disponible__gt', 0)), fields=['producto', 'sucursal', 'fecha_ingreso'], include=('cantidad_disponible',), name='lote_fifo_idx'),
+        ),
+    ]
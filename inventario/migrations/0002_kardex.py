@@ -0,0 +1,132 @@
+# Generated by Django 4.2 on 2026-10-19 15:54
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def saldos_iniciales(apps, schema_editor):
+    """
+    Pasa la cantidad disponible de cada lote a su saldo y abre su kardex
+    con el ingreso y, si ya tuvo salidas, un ajuste por la diferencia
+    """
+    Lote = apps.get_model('inventario', 'Lote')
+    SaldoStock = apps.get_model('inventario', 'SaldoStock')
+    MovimientoStock = apps.get_model('inventario', 'MovimientoStock')
+
+    saldos, movimientos = [], []
+    for lote in Lote.objects.iterator(chunk_size=2000):
+        comunes = {'lote_id': lote.pk, 'producto_id': lote.producto_id, 'sucursal': lote.sucursal}
+        saldos.append(SaldoStock(
+            fecha_ingreso=lote.fecha_ingreso,
+            fecha_vencimiento=lote.fecha_vencimiento,
+            cantidad=lote.cantidad_disponible,
+            **comunes,
+        ))
+        movimientos.append(MovimientoStock(
+            tipo='ingreso', cantidad=lote.cantidad_inicial, fecha=lote.fecha_ingreso, **comunes
+        ))
+        if lote.cantidad_disponible != lote.cantidad_inicial:
+            movimientos.append(MovimientoStock(
+                tipo='ajuste',
+                cantidad=lote.cantidad_disponible - lote.cantidad_inicial,
+                observaciones='Saldo anterior al kardex',
+                **comunes,
+            ))
+    SaldoStock.objects.bulk_create(saldos, batch_size=2000)
+    MovimientoStock.objects.bulk_create(movimientos, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('productos', '0001_initial'),
+        ('inventario', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MovimientoStock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sucursal', models.CharField(choices=[('deposito', 'Depósito Principal'), ('roydent', 'Roydent - Tienda Central'), ('mundo_medico', 'Mundo Médico - Sucursal')], max_length=20, verbose_name='Sucursal')),
+                ('tipo', models.CharField(choices=[('ingreso', 'Ingreso'), ('venta', 'Venta'), ('ajuste', 'Ajuste'), ('transferencia', 'Transferencia'), ('merma', 'Merma')], max_length=15, verbose_name='Tipo')),
+                ('cantidad', models.IntegerField(verbose_name='Cantidad')),
+                ('fecha', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Fecha')),
+                ('referencia', models.CharField(blank=True, default='', max_length=100, verbose_name='Referencia')),
+                ('observaciones', models.TextField(blank=True, default='', verbose_name='Observaciones')),
+            ],
+            options={
+                'verbose_name': 'Movimiento de Stock',
+                'verbose_name_plural': 'Movimientos de Stock',
+                'db_table': 'movimiento_stock',
+            },
+        ),
+        migrations.CreateModel(
+            name='SaldoStock',
+            fields=[
+                ('lote', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='saldo', serialize=False, to='inventario.lote', verbose_name='Lote')),
+                ('sucursal', models.CharField(choices=[('deposito', 'Depósito Principal'), ('roydent', 'Roydent - Tienda Central'), ('mundo_medico', 'Mundo Médico - Sucursal')], max_length=20, verbose_name='Sucursal')),
+                ('fecha_ingreso', models.DateTimeField(verbose_name='Fecha de Ingreso')),
+                ('fecha_vencimiento', models.DateField(blank=True, null=True, verbose_name='Fecha de Vencimiento')),
+                ('cantidad', models.PositiveIntegerField(default=0, verbose_name='Cantidad')),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización')),
+            ],
+            options={
+                'verbose_name': 'Saldo de Stock',
+                'verbose_name_plural': 'Saldos de Stock',
+                'db_table': 'saldo_stock',
+            },
+        ),
+        migrations.AddField(
+            model_name='saldostock',
+            name='producto',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='saldos', to='productos.producto', verbose_name='Producto'),
+        ),
+        migrations.AddField(
+            model_name='movimientostock',
+            name='lote',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='movimientos', to='inventario.lote', verbose_name='Lote'),
+        ),
+        migrations.AddField(
+            model_name='movimientostock',
+            name='producto',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='movimientos', to='productos.producto', verbose_name='Producto'),
+        ),
+        migrations.AddField(
+            model_name='movimientostock',
+            name='usuario',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='movimientos_stock', to=settings.AUTH_USER_MODEL, verbose_name='Usuario'),
+        ),
+        migrations.AddIndex(
+            model_name='saldostock',
+            index=models.Index(condition=models.Q(('cantidad__gt', 0)), fields=['producto', 'sucursal', 'fecha_vencimiento', 'fecha_ingreso'], include=('cantidad',), name='saldo_fefo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='saldostock',
+            index=models.Index(condition=models.Q(('cantidad__gt', 0)), fields=['producto', 'sucursal', 'fecha_ingreso'], include=('cantidad',), name='saldo_fifo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movimientostock',
+            index=models.Index(fields=['lote', 'fecha'], name='movimiento_lote_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movimientostock',
+            index=models.Index(fields=['producto', 'sucursal', 'fecha'], name='movimiento_producto_idx'),
+        ),
+        migrations.RunPython(saldos_iniciales, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='lote',
+            name='lote_fefo_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='lote',
+            name='lote_fifo_idx',
+        ),
+        migrations.RemoveField(
+            model_name='lote',
+            name='cantidad_disponible',
+        ),
+    ]
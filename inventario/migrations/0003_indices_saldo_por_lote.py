@@ -0,0 +1,29 @@
+# Generated by Django 4.2 on 2026-10-19 16:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventario', '0002_kardex'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='saldostock',
+            name='saldo_fefo_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='saldostock',
+            name='saldo_fifo_idx',
+        ),
+        migrations.AddIndex(
+            model_name='saldostock',
+            index=models.Index(condition=models.Q(('cantidad__gt', 0)), fields=['producto', 'sucursal', 'fecha_vencimiento', 'fecha_ingreso', 'lote'], include=('cantidad',), name='saldo_fefo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='saldostock',
+            index=models.Index(condition=models.Q(('cantidad__gt', 0)), fields=['producto', 'sucursal', 'fecha_ingreso', 'lote'], include=('cantidad',), name='saldo_fifo_idx'),
+        ),
+    ]
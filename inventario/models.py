@@ -1,3 +1,200 @@
+"""
+Modelos de inventario: lotes de producto por sucursal, su saldo y el
+kardex de movimientos (ver kardex.py)
+"""
+from django.conf import settings
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
 
-# Create your models here.
+from productos.models import Producto
+
+
+class Lote(models.Model):
+    """
+    Ingreso de un producto a una sucursal. Sus existencias se llevan en
+    SaldoStock y cada cambio queda en MovimientoStock (kardex.py); las
+    salidas se asignan a los lotes con existencias en orden FIFO o FEFO
+    (asignacion.py)
+    """
+    SUCURSAL_CHOICES = [
+        ('deposito', 'Depósito Principal'),
+        ('roydent', 'Roydent - Tienda Central'),
+        ('mundo_medico', 'Mundo Médico - Sucursal'),
+    ]
+
+    producto = models.ForeignKey(
+        Producto,
+        on_delete=models.PROTECT,
+        related_name='lotes',
+        verbose_name="Producto"
+    )
+    sucursal = models.CharField(max_length=20, choices=SUCURSAL_CHOICES, verbose_name="Sucursal")
+    codigo_lote = models.CharField(max_length=50, blank=True, null=True, verbose_name="Código de Lote")
+    fecha_ingreso = models.DateTimeField(default=timezone.now, verbose_name="Fecha de Ingreso")
+    fecha_vencimiento = models.DateField(blank=True, null=True, verbose_name="Fecha de Vencimiento")
+    cantidad_inicial = models.PositiveIntegerField(verbose_name="Cantidad Inicial")
+    costo_unitario = models.DecimalField(max_digits=10, decimal_places=2, default=0, verbose_name="Costo Unitario")
+    fecha_creacion = models.DateTimeField(auto_now_add=True, verbose_name="Fecha de Creación")
+
+    class Meta:
+        verbose_name = "Lote"
+        verbose_name_plural = "Lotes"
+        db_table = "lote"
+
+    def __str__(self):
+        return f"{self.producto.codigo} - {self.codigo_lote or self.pk} ({self.get_sucursal_display()})"
+
+    def dias_para_vencer(self):
+        """Días hasta el vencimiento; None si el lote no vence"""
+        if self.fecha_vencimiento is None:
+            return None
+        return (self.fecha_vencimiento - timezone.localdate()).days
+
+    def save(self, *args, **kwargs):
+        nuevo = self._state.adding
+        super().save(*args, **kwargs)
+        if nuevo:
+            return
+        # El saldo copia las fechas para ordenar la asignación por índice
+        SaldoStock.objects.filter(lote=self).update(
+            fecha_ingreso=self.fecha_ingreso, fecha_vencimiento=self.fecha_vencimiento
+        )
+
+
+class SaldoStock(models.Model):
+    """
+    Existencias actuales de un lote: una fila por (producto, sucursal,
+    lote), con el lote como clave primaria. Solo la modifica kardex.py, con
+    F() en la misma transacción que el movimiento que la origina, de modo
+    que el stock de un lote se lee por clave primaria y siempre es la suma
+    de su kardex (comando verificar_kardex)
+    """
+    lote = models.OneToOneField(
+        Lote,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='saldo',
+        verbose_name="Lote"
+    )
+    # Copias del lote, para que la asignación recorra un solo índice
+    producto = models.ForeignKey(
+        Producto,
+        on_delete=models.PROTECT,
+        related_name='saldos',
+        verbose_name="Producto"
+    )
+    sucursal = models.CharField(max_length=20, choices=Lote.SUCURSAL_CHOICES, verbose_name="Sucursal")
+    fecha_ingreso = models.DateTimeField(verbose_name="Fecha de Ingreso")
+    fecha_vencimiento = models.DateField(blank=True, null=True, verbose_name="Fecha de Vencimiento")
+    cantidad = models.PositiveIntegerField(default=0, verbose_name="Cantidad")
+    fecha_actualizacion = models.DateTimeField(auto_now=True, verbose_name="Fecha de Actualización")
+
+    class Meta:
+        verbose_name = "Saldo de Stock"
+        verbose_name_plural = "Saldos de Stock"
+        db_table = "saldo_stock"
+        indexes = [
+            # Índices de la asignación, uno por orden de salida. Son parciales
+            # (solo lotes con existencias): no crecen con el historial de lotes
+            # agotados y la asignación recorre solo los lotes que consume.
+            # Terminan en el lote (la clave primaria), el desempate de ORDEN en
+            # asignacion.py, así el ORDER BY sale del índice sin ordenar aparte.
+            # Incluyen la cantidad (INCLUDE, solo PostgreSQL) para que el stock
+            # disponible se sume leyendo únicamente el índice
+            models.Index(
+                fields=['producto', 'sucursal', 'fecha_vencimiento', 'fecha_ingreso', 'lote'],
+                name='saldo_fefo_idx',
+                include=['cantidad'],
+                condition=Q(cantidad__gt=0),
+            ),
+            models.Index(
+                fields=['producto', 'sucursal', 'fecha_ingreso', 'lote'],
+                name='saldo_fifo_idx',
+                include=['cantidad'],
+                condition=Q(cantidad__gt=0),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.lote_id}: {self.cantidad}"
+
+
+class MovimientoStockQuerySet(models.QuerySet):
+    """update() y delete() en masa no pasan por save()/delete() del modelo"""
+
+    def update(self, **kwargs):
+        raise ValueError('Los movimientos de stock no se modifican: registre un ajuste')
+
+    def delete(self):
+        raise ValueError('Los movimientos de stock no se eliminan: registre un ajuste')
+
+
+class MovimientoStock(models.Model):
+    """
+    Kardex: cada ingreso, venta, ajuste, transferencia o merma de un lote.
+    La cantidad lleva signo (positiva entra, negativa sale). Los movimientos
+    no se modifican ni se eliminan; un error se corrige con un ajuste
+    """
+    INGRESO = 'ingreso'
+    VENTA = 'venta'
+    AJUSTE = 'ajuste'
+    TRANSFERENCIA = 'transferencia'
+    MERMA = 'merma'
+    TIPO_CHOICES = [
+        (INGRESO, 'Ingreso'),
+        (VENTA, 'Venta'),
+        (AJUSTE, 'Ajuste'),
+        (TRANSFERENCIA, 'Transferencia'),
+        (MERMA, 'Merma'),
+    ]
+
+    lote = models.ForeignKey(
+        Lote,
+        on_delete=models.PROTECT,
+        related_name='movimientos',
+        verbose_name="Lote"
+    )
+    producto = models.ForeignKey(
+        Producto,
+        on_delete=models.PROTECT,
+        related_name='movimientos',
+        verbose_name="Producto"
+    )
+    sucursal = models.CharField(max_length=20, choices=Lote.SUCURSAL_CHOICES, verbose_name="Sucursal")
+    tipo = models.CharField(max_length=15, choices=TIPO_CHOICES, verbose_name="Tipo")
+    cantidad = models.IntegerField(verbose_name="Cantidad")
+    fecha = models.DateTimeField(default=timezone.now, verbose_name="Fecha")
+    usuario = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='movimientos_stock',
+        verbose_name="Usuario"
+    )
+    referencia = models.CharField(max_length=100, blank=True, default='', verbose_name="Referencia")
+    observaciones = models.TextField(blank=True, default='', verbose_name="Observaciones")
+
+    objects = MovimientoStockQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Movimiento de Stock"
+        verbose_name_plural = "Movimientos de Stock"
+        db_table = "movimiento_stock"
+        indexes = [
+            # Kardex de un lote en orden y recálculo de saldos por rango de lotes
+            models.Index(fields=['lote', 'fecha'], name='movimiento_lote_idx'),
+            models.Index(fields=['producto', 'sucursal', 'fecha'], name='movimiento_producto_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_tipo_display()} {self.cantidad:+d} - lote {self.lote_id}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError('Los movimientos de stock no se modifican: registre un ajuste')
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError('Los movimientos de stock no se eliminan: registre un ajuste')
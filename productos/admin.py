@@ -1,3 +1,11 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Producto
+
+
+@admin.register(Producto)
+class ProductoAdmin(admin.ModelAdmin):
+    list_display = ('codigo', 'nombre', 'marca', 'categoria', 'precio_venta', 'stock_minimo', 'estado')
+    list_filter = ('estado', 'categoria')
+    search_fields = ('codigo', 'nombre', 'marca')
+    ordering = ('nombre',)
@@ -0,0 +1,36 @@
+# Generated by Django 4.2 on 2026-10-19 15:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Producto',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('codigo', models.CharField(max_length=30, unique=True, verbose_name='Código')),
+                ('nombre', models.CharField(max_length=200, verbose_name='Nombre')),
+                ('marca', models.CharField(blank=True, max_length=100, null=True, verbose_name='Marca')),
+                ('categoria', models.CharField(blank=True, max_length=100, null=True, verbose_name='Categoría')),
+                ('unidad_medida', models.CharField(default='unidades', max_length=30, verbose_name='Unidad de Medida')),
+                ('precio_venta', models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Precio de Venta')),
+                ('stock_minimo', models.PositiveIntegerField(default=10, verbose_name='Stock Mínimo')),
+                ('estado', models.CharField(choices=[('ACTIVO', 'Activo'), ('INACTIVO', 'Inactivo')], default='ACTIVO', max_length=10, verbose_name='Estado')),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Creación')),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización')),
+            ],
+            options={
+                'verbose_name': 'Producto',
+                'verbose_name_plural': 'Productos',
+                'db_table': 'producto',
+                'ordering': ['nombre'],
+            },
+        ),
+    ]
@@ -1,3 +1,35 @@
+"""
+Catálogo de productos de Roy Representaciones
+"""
 from django.db import models
 
-# Create your models here.
+
+class Producto(models.Model):
+    """
+    Producto del catálogo. El stock se lleva por lote y sucursal en
+    inventario.SaldoStock, con sus movimientos en inventario.MovimientoStock
+    """
+    ESTADO_CHOICES = [
+        ('ACTIVO', 'Activo'),
+        ('INACTIVO', 'Inactivo'),
+    ]
+
+    codigo = models.CharField(max_length=30, unique=True, verbose_name="Código")
+    nombre = models.CharField(max_length=200, verbose_name="Nombre")
+    marca = models.CharField(max_length=100, blank=True, null=True, verbose_name="Marca")
+    categoria = models.CharField(max_length=100, blank=True, null=True, verbose_name="Categoría")
+    unidad_medida = models.CharField(max_length=30, default='unidades', verbose_name="Unidad de Medida")
+    precio_venta = models.DecimalField(max_digits=10, decimal_places=2, default=0, verbose_name="Precio de Venta")
+    stock_minimo = models.PositiveIntegerField(default=10, verbose_name="Stock Mínimo")
+    estado = models.CharField(max_length=10, choices=ESTADO_CHOICES, default='ACTIVO', verbose_name="Estado")
+    fecha_creacion = models.DateTimeField(auto_now_add=True, verbose_name="Fecha de Creación")
+    fecha_actualizacion = models.DateTimeField(auto_now=True, verbose_name="Fecha de Actualización")
+
+    class Meta:
+        verbose_name = "Producto"
+        verbose_name_plural = "Productos"
+        db_table = "producto"
+        ordering = ['nombre']
+
+    def __str__(self):
+        return f"{self.codigo} - {self.nombre}"
@@ -13,4 +13,9 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'roy_representaciones.settings')
 
+# Bajo ASGI las consultas corren en hilos que cambian entre peticiones: con
+# CONN_MAX_AGE > 0 cada hilo dejaría su conexión abierta hasta agotar las de
+# PostgreSQL. Sin pool (DB_POOL) se cierran al terminar cada petición.
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
+
 application = get_asgi_application()
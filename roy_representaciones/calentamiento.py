@@ -0,0 +1,106 @@
+"""
+Calentamiento de un worker antes de recibir tráfico
+
+Lo que pagan las primeras peticiones de cada worker después de un
+despliegue, hecho de antemano:
+- conexiones: abre la conexión de cada base de datos
+- referencias: carga Rol, TipoCliente, Permiso y la matriz de permisos por
+  rol (autenticacion/referencias.py)
+- plantillas: compila todas las plantillas de templates/; el loader
+  cacheado de Django las conserva compiladas
+- páginas: trae al LRU del proceso las páginas y el sidebar cacheados
+  (paginas.py); con renovar_paginas descarta los del despliegue anterior y
+  los vuelve a renderizar
+
+Se ejecuta con manage.py warmup y desde el hook post_fork de
+gunicorn.conf.py, en cada worker.
+"""
+import logging
+import os
+import time
+
+from django.db import connections
+from django.template import TemplateSyntaxError, engines
+from django.template.backends.django import DjangoTemplates
+
+logger = logging.getLogger(__name__)
+
+
+def _conexiones():
+    for alias in connections:
+        connections[alias].ensure_connection()
+    return 'conectado a ' + ', '.join(connections)
+
+
+def _referencias():
+    from autenticacion import referencias
+
+    datos = referencias.registro.datos()
+    asignaciones = sum(len(ids) for ids in datos.matriz_permisos.values())
+    return (
+        f'{len(datos.roles)} roles, {len(datos.tipos_cliente)} tipos de cliente, '
+        f'{len(datos.permisos)} permisos, {asignaciones} asignaciones rol-permiso'
+    )
+
+
+def plantillas_del_proyecto():
+    """(motor, nombre) de cada plantilla en los DIRS de los motores de Django"""
+    for motor in engines.all():
+        if not isinstance(motor, DjangoTemplates):
+            continue
+        for directorio in motor.engine.dirs:
+            for raiz, _, archivos in os.walk(directorio):
+                for archivo in sorted(archivos):
+                    if archivo.endswith(('.html', '.txt')):
+                        ruta = os.path.join(raiz, archivo)
+                        yield motor, os.path.relpath(ruta, directorio).replace(os.sep, '/')
+
+
+def _plantillas(errores):
+    compiladas = 0
+    for motor, nombre in plantillas_del_proyecto():
+        try:
+            motor.get_template(nombre)
+        except TemplateSyntaxError as e:
+            errores.append(f'{nombre}: {e}')
+        else:
+            compiladas += 1
+    return f'{compiladas} plantillas compiladas'
+
+
+def _paginas(renovar):
+    from roy_representaciones.paginas import calentar_paginas, precargar_paginas
+
+    if renovar:
+        return f'{calentar_paginas()} páginas renderizadas'
+    return f'{precargar_paginas()} páginas cargadas'
+
+
+def calentar(renovar_paginas=False):
+    """
+    Ejecuta los pasos en orden y retorna (pasos, errores): pasos es una lista
+    de (paso, ms, detalle). Un paso que falla se registra en errores y no
+    detiene los siguientes: un worker a medio calentar sigue sirviendo.
+    """
+    errores = []
+    pasos = []
+    for nombre, paso in (
+        ('conexiones', _conexiones),
+        ('referencias', _referencias),
+        ('plantillas', lambda: _plantillas(errores)),
+        ('páginas', lambda: _paginas(renovar_paginas)),
+    ):
+        inicio = time.perf_counter()
+        try:
+            detalle = paso()
+        except Exception as e:
+            logger.exception('Falló el calentamiento: %s', nombre)
+            errores.append(f'{nombre}: {e}')
+            detalle = 'error'
+        pasos.append((nombre, round((time.perf_counter() - inicio) * 1000, 1), detalle))
+
+    # Como al terminar una petición: sin CONN_MAX_AGE (o con el pool de
+    # core/db/pool.py) la conexión se cierra o vuelve al pool
+    for conexion in connections.all(initialized_only=True):
+        conexion.close_if_unusable_or_obsolete()
+    return pasos, errores
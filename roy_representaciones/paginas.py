@@ -0,0 +1,159 @@
+"""
+Caché de las páginas HTML (index, login, registro, sidebar y paneles)
+
+Las plantillas no dependen de la petición ni del usuario: los datos llegan
+por las APIs. Por eso el HTML se renderiza una vez por plantilla y se sirve
+desde el espacio PAGINAS (LRU del proceso delante de la caché compartida):
+
+- PaginaPublicaView: la página completa, con ETag y Cache-Control público.
+- PanelCacheadoView: la misma página para todos los usuarios. Lo propio del
+  usuario (id, nombre de usuario, roles) se agrega después, en un
+  <script type="application/json" id="usuario-actual"> antes de </head>.
+  Se responde con Cache-Control private para que ningún proxy la comparta.
+
+Las claves llevan la versión del despliegue (version_despliegue(): el
+PAGINAS_CACHE['VERSION'] configurado o un hash del manifiesto de
+estáticos), así un worker con estáticos nuevos nunca sirve HTML que apunta
+a los archivos del despliegue anterior, aunque compartan Redis.
+
+Las plantillas cacheadas se renderizan sin request: no deben usar
+{% csrf_token %}, {{ user }} ni nada propio del usuario. calentar_paginas()
+las renderiza al desplegar (manage.py calentar_paginas) para que la primera
+visita ya sea una lectura de memoria, y precargar_paginas() las trae al LRU
+de cada worker al arrancar. Con DEBUG se renderizan en cada petición.
+"""
+import hashlib
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.html import json_script
+from django.utils.http import quote_etag
+from django.views.generic import TemplateView
+
+from core.cache import EspacioCache
+
+# Cambian solo al desplegar; calentar_paginas() invalida el espacio
+PAGINAS = EspacioCache('paginas', ttl=24 * 3600, ttl_local=60)
+
+# Versión del despliegue de este proceso; se calcula una vez
+_version = None
+
+
+def _config():
+    return {
+        'ACTIVA': not settings.DEBUG,
+        'MAX_AGE_PUBLICAS': 300,
+        **getattr(settings, 'PAGINAS_CACHE', {}),
+    }
+
+
+def version_despliegue():
+    """PAGINAS_CACHE['VERSION'] o un hash del manifiesto de estáticos ('' sin manifiesto)"""
+    global _version
+    if _version is None:
+        version = _config().get('VERSION', '')
+        if not version and hasattr(staticfiles_storage, 'read_manifest'):
+            manifiesto = staticfiles_storage.read_manifest() or ''
+            version = hashlib.md5(manifiesto.encode('utf-8')).hexdigest()[:12] if manifiesto else ''
+        _version = version
+    return _version
+
+
+@receiver(setting_changed)
+def _descartar_version(setting, **kwargs):
+    global _version
+    if setting in ('PAGINAS_CACHE', 'STORAGES', 'STATIC_ROOT'):
+        _version = None
+
+
+def _clave(template_name):
+    return ('pagina', version_despliegue(), template_name)
+
+
+def _renderizar(template_name):
+    html = render_to_string(template_name)
+    return {'html': html, 'etag': quote_etag(hashlib.md5(html.encode('utf-8')).hexdigest())}
+
+
+def obtener_pagina(template_name):
+    """HTML y ETag de la plantilla"""
+    if not _config()['ACTIVA']:
+        return _renderizar(template_name)
+    return PAGINAS.obtener_o_calcular(_clave(template_name), lambda: _renderizar(template_name))
+
+
+class PaginaPublicaView(TemplateView):
+    """Página pública servida completa desde la caché"""
+
+    def get(self, request, *args, **kwargs):
+        pagina = obtener_pagina(self.template_name)
+        response = get_conditional_response(request, etag=pagina['etag'])
+        if response is None:
+            response = HttpResponse(pagina['html'])
+        response['ETag'] = pagina['etag']
+        patch_cache_control(response, public=True, max_age=_config()['MAX_AGE_PUBLICAS'])
+        return response
+
+
+class PanelCacheadoView(TemplateView):
+    """Panel cacheado por plantilla, con los datos del usuario agregados al servirlo"""
+
+    def get(self, request, *args, **kwargs):
+        usuario = request.user
+        roles = sorted(
+            usuario.usuario_roles.filter(estado='ACTIVO').values_list('rol__nombre_rol', flat=True)
+        )
+        pagina = obtener_pagina(self.template_name)
+        datos_usuario = json_script(
+            {'id': usuario.pk, 'nombre_usuario': usuario.nombre_usuario, 'roles': roles},
+            'usuario-actual',
+        )
+        response = HttpResponse(pagina['html'].replace('</head>', f'{datos_usuario}\n</head>', 1))
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ['Cookie'])
+        return response
+
+
+# ============ CALENTAMIENTO ============
+
+def _plantillas_cacheadas(patrones=None):
+    """template_name de las rutas servidas por estas vistas"""
+    if patrones is None:
+        patrones = get_resolver().url_patterns
+    for patron in patrones:
+        if isinstance(patron, URLResolver):
+            yield from _plantillas_cacheadas(patron.url_patterns)
+        elif isinstance(patron, URLPattern):
+            clase = getattr(patron.callback, 'view_class', None)
+            if clase is not None and issubclass(clase, (PaginaPublicaView, PanelCacheadoView)):
+                yield patron.callback.view_initkwargs.get('template_name', clase.template_name)
+
+
+def calentar_paginas():
+    """
+    Descarta las páginas cacheadas y renderiza cada página pública y cada
+    panel. Retorna las páginas generadas.
+    """
+    PAGINAS.invalidar()
+    plantillas = sorted(set(_plantillas_cacheadas()))
+    for template_name in plantillas:
+        PAGINAS.guardar(_clave(template_name), _renderizar(template_name))
+    return len(plantillas)
+
+
+def precargar_paginas():
+    """
+    Trae al LRU del proceso las páginas ya cacheadas, sin invalidar; las
+    que falten se renderizan y se guardan. Lo usa el calentamiento de cada
+    worker (calentamiento.py). Retorna las páginas cargadas.
+    """
+    plantillas = sorted(set(_plantillas_cacheadas()))
+    for template_name in plantillas:
+        obtener_pagina(template_name)
+    return len(plantillas)
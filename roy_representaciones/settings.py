@@ -41,15 +41,18 @@ INSTALLED_APPS = [
     'corsheaders',
     'rest_framework',
     'rest_framework_simplejwt',
-    'django_filters',
     'core',
     'autenticacion',
+    'productos',
+    'inventario',
 ]
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'core.middleware.WhiteNoiseAsyncMiddleware',
+    'core.middleware.CompresionMiddleware',
+    'core.middleware.MetricasPeticionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     #'django.middleware.csrf.CsrfViewMiddleware',
@@ -82,14 +85,31 @@ WSGI_APPLICATION = 'roy_representaciones.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# Conexiones a la BD:
+# - Por defecto cada hilo mantiene su conexión abierta DB_CONN_MAX_AGE segundos
+#   y la verifica antes de reutilizarla (CONN_HEALTH_CHECKS).
+# - Con DB_POOL=True las conexiones se toman de un pool por proceso compartido
+#   entre los hilos del worker (core/db/pool.py); CONN_MAX_AGE queda en 0
+#   porque cerrar la conexión es lo que la devuelve al pool.
+# - Bajo ASGI (uvicorn) asgi.py fija DB_CONN_MAX_AGE=0 si no se indicó otro
+#   valor: los hilos del ORM async no se reutilizan entre peticiones y las
+#   conexiones persistentes quedarían abiertas. Ahí conviene DB_POOL=True.
+DB_POOL = config('DB_POOL', default=False, cast=bool)
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'core.db.backends.postgresql_pool' if DB_POOL else 'django.db.backends.postgresql',
         'NAME': config('DB_NAME', default='roy_Dent'),
         'USER': config('DB_USER', default='postgres'),
         'PASSWORD': config('DB_PASSWORD', default='2458'),
         'HOST': config('DB_HOST', default='localhost'),
         'PORT': config('DB_PORT', default='5432'),
+        'CONN_MAX_AGE': 0 if DB_POOL else config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+        'POOL': {
+            'MAX': config('DB_POOL_MAX', default=10, cast=int),
+            'TIMEOUT': config('DB_POOL_TIMEOUT', default=10.0, cast=float),
+        },
     }
 }
 
@@ -123,8 +143,21 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
+    # JSON con orjson (core/renderers.py): misma salida que JSONRenderer
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    # django-filter no se carga por defecto: al importarse trae django.test
+    # (~60 ms en cada worker) y ninguna vista lo usa. Una vista genérica que
+    # lo necesite agrega 'django_filters' a INSTALLED_APPS y declara
+    # DjangoFilterBackend en filter_backends.
     'DEFAULT_FILTER_BACKENDS': [
-        'django_filters.rest_framework.DjangoFilterBackend',
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
@@ -161,6 +194,19 @@ STATICFILES_DIRS = [
     BASE_DIR / 'static',
 ]
 
+# collectstatic agrega el hash del contenido al nombre de cada archivo y
+# genera sus versiones .br y .gz. WhiteNoise sirve los archivos con hash con
+# caché de un año (immutable): al cambiar un CSS/JS cambia su URL, y una
+# página ya visitada solo vuelve a descargar el HTML
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
 # Configuración de archivos media
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -171,6 +217,28 @@ CORS_ALLOWED_ORIGINS = [
     "http://127.0.0.1:3000",
 ]
 
+# Caché: Redis compartido entre workers, con respaldo en memoria si Redis cae
+# (ver core/cache.py). 'local' es una caché en memoria solo del proceso.
+CACHES = {
+    'default': {
+        'BACKEND': 'core.cache.RedisConRespaldo',
+        'LOCATION': config('CACHE_URL', default='redis://localhost:6379/1'),
+        'KEY_PREFIX': 'roy',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'socket_connect_timeout': 0.5,
+            'socket_timeout': 0.5,
+        },
+    },
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'roy-local',
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000,
+        },
+    },
+}
+
 # Configuración de Celery para tareas asíncronas
 CELERY_BROKER_URL = config('REDIS_URL', default='redis://localhost:6379')
 CELERY_RESULT_BACKEND = config('REDIS_URL', default='redis://localhost:6379')
@@ -195,7 +263,56 @@ ROY_REPRESENTACIONES_CONFIG = {
     'STOCK_MINIMO_DEFAULT': 10,
     'ENABLE_WHATSAPP_NOTIFICATIONS': True,
     'ENABLE_EMAIL_NOTIFICATIONS': True,
-    'FIFO_ENABLED': True,
+    # Orden en que las salidas consumen los lotes (inventario/asignacion.py):
+    # 'FEFO' primero lo que vence antes (sin vencimiento equivale a FIFO), o 'FIFO'
+    'METODO_ASIGNACION': 'FEFO',
+}
+
+# Métricas por petición (core/middleware.py): encabezados con DEBUG y
+# registro JSON de una muestra de peticiones en el logger 'core.metricas'
+METRICAS_PETICIONES = {
+    'ENCABEZADOS': DEBUG,
+    'MUESTREO': config('METRICAS_MUESTREO', default=0.01, cast=float),
+    'LENTA_MS': 1000,
+    'MAX_DUPLICADAS': 5,
+}
+
+# Consultas SQL lentas (core/consultas_lentas.py): las que superan UMBRAL_MS
+# se guardan con su huella, la vista y, para una muestra (MUESTREO_PILA), la
+# pila de llamadas, en archivos rotativos por proceso. Resumen con
+# python manage.py consultas_lentas
+CONSULTAS_LENTAS = {
+    'ACTIVA': config('CONSULTAS_LENTAS', default=True, cast=bool),
+    'UMBRAL_MS': config('CONSULTAS_LENTAS_UMBRAL_MS', default=100, cast=int),
+    'MUESTREO_PILA': 0.2,
+    'DIRECTORIO': config('CONSULTAS_LENTAS_DIRECTORIO', default=str(BASE_DIR / 'logs' / 'consultas_lentas')),
+    'MAX_BYTES': 5 * 1024 * 1024,
+    'COPIAS': 3,
+    'RETENCION_DIAS': 7,
+}
+
+# Token que Prometheus envía como 'Authorization: Bearer' al leer /metrics
+# (core/metricas.py); vacío deja el endpoint abierto, p. ej. si solo es
+# accesible desde la red interna
+METRICAS_TOKEN = config('METRICAS_TOKEN', default='')
+
+# Compresión de respuestas JSON (core/middleware.py). Debajo de MINIMO_BYTES
+# comprimir cuesta más de lo que ahorra
+COMPRESION = {
+    'MINIMO_BYTES': 1024,
+    'TIPOS': ('application/json',),
+    'NIVEL_BROTLI': 4,
+    'NIVEL_GZIP': 6,
+}
+
+# Caché de las páginas HTML (roy_representaciones/paginas.py). Con DEBUG se
+# renderizan en cada petición para ver los cambios en las plantillas.
+# VERSION va en las claves (p. ej. el commit desplegado); vacía, se usa un
+# hash del manifiesto de estáticos
+PAGINAS_CACHE = {
+    'ACTIVA': not DEBUG,
+    'MAX_AGE_PUBLICAS': 300,
+    'VERSION': config('DEPLOY_ID', default=''),
 }
 
 # Configuración de logging simplificada para desarrollo
@@ -5,12 +5,14 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from django.views.generic import TemplateView
 from django.contrib.auth.decorators import login_required
 
 from autenticacion import views
+from core.metricas import metricas
 
-class ProtectedTemplateView(TemplateView):
+from .paginas import PaginaPublicaView, PanelCacheadoView
+
+class ProtectedTemplateView(PanelCacheadoView):
     """Vista que requiere autenticación"""
     @classmethod
     def as_view(cls, **kwargs):
@@ -22,13 +24,19 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     
     # ============ PÁGINAS PÚBLICAS ============
-    path('', TemplateView.as_view(template_name='index.html'), name='index'),
-    path('login/', TemplateView.as_view(template_name='login.html'), name='login'),
-    path('registro/', TemplateView.as_view(template_name='registro.html'), name='registro'),
+    path('', PaginaPublicaView.as_view(template_name='index.html'), name='index'),
+    path('login/', PaginaPublicaView.as_view(template_name='login.html'), name='login'),
+    path('registro/', PaginaPublicaView.as_view(template_name='registro.html'), name='registro'),
 
     # ============ SISTEMA DE AUTENTICACIÓN ============
     path('auth/', include('autenticacion.urls')),
 
+    # ============ ESTADO DEL SISTEMA (STAFF) ============
+    path('sistema/', include('core.urls')),
+
+    # ============ MÉTRICAS (PROMETHEUS) ============
+    path('metrics', metricas, name='metricas'),
+
     # ============ PANELES PROTEGIDOS - REQUIEREN LOGIN ============
     path('panel-admin/', ProtectedTemplateView.as_view(template_name='panel-admin.html'), name='panel-admin'),
     path('panel-mundomedico/', ProtectedTemplateView.as_view(template_name='panel-mundomedico.html'), name='panel-mundomedico'),
@@ -48,7 +56,7 @@ urlpatterns = [
     path('gestionproveedores/', ProtectedTemplateView.as_view(template_name='gestionproveedores.html'), name='gestionproveedores'),
     
     # ============ COMPONENTES ============
-    path('components/sidebar/', TemplateView.as_view(template_name='components/sidebar.html'), name='sidebar-component'),
+    path('components/sidebar/', PaginaPublicaView.as_view(template_name='components/sidebar.html'), name='sidebar-component'),
 
     # ============ APIs DE PERMISOS ============
     path('api/permisos/', views.listar_permisos, name='api_listar_permisos'),
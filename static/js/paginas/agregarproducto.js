@@ -0,0 +1,367 @@
+// static/js/paginas/agregarproducto.js
+let pasoActual = 1;
+const totalPasos = 4;
+
+// ============ MANEJO DE LOGOS ============
+function handleLogoError() {
+    document.getElementById('sidebarLogo').style.display = 'none';
+    document.getElementById('defaultLogo').style.display = 'flex';
+}
+
+function handleMobileLogoError() {
+    const mobileLogo = document.getElementById('mobileLogo');
+    mobileLogo.src = '';
+    mobileLogo.alt = 'Sistema Roy';
+    mobileLogo.style.fontFamily = 'Inter, sans-serif';
+    mobileLogo.style.fontWeight = '700';
+    mobileLogo.style.fontSize = '1.2rem';
+    mobileLogo.style.color = 'var(--color-green-dark)';
+}
+
+// Configuración inicial
+document.addEventListener('DOMContentLoaded', function() {
+    const sidebarLogo = document.getElementById('sidebarLogo');
+    const mobileLogo = document.getElementById('mobileLogo');
+
+    if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+        handleLogoError();
+    }
+
+    if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+        handleMobileLogoError();
+    }
+
+    setTimeout(function() {
+        if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+            handleLogoError();
+        }
+        if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+            handleMobileLogoError();
+        }
+    }, 1000);
+
+    configurarSubidaImagen();
+    configurarCalculos();
+    configurarValidacion();
+});
+
+// ============ FUNCIONES DEL SIDEBAR ============
+function toggleSidebar() {
+    const sidebar = document.getElementById('sidebar');
+    const overlay = document.getElementById('sidebar-overlay');
+
+    sidebar.classList.toggle('active');
+    overlay.classList.toggle('active');
+}
+
+// ============ FUNCIONES DE NAVEGACIÓN DE PASOS ============
+function siguientePaso() {
+    if (validarPasoActual()) {
+        if (pasoActual < totalPasos) {
+            cambiarPaso(pasoActual + 1);
+        }
+    }
+}
+
+function anteriorPaso() {
+    if (pasoActual > 1) {
+        cambiarPaso(pasoActual - 1);
+    }
+}
+
+function cambiarPaso(nuevoPaso) {
+    document.getElementById(`section-${pasoActual}`).classList.remove('active');
+    document.getElementById(`step-${pasoActual}`).classList.remove('active');
+
+    if (nuevoPaso > pasoActual) {
+        document.getElementById(`step-${pasoActual}`).classList.add('completed');
+    } else {
+        document.getElementById(`step-${pasoActual}`).classList.remove('completed');
+    }
+
+    pasoActual = nuevoPaso;
+    document.getElementById(`section-${pasoActual}`).classList.add('active');
+    document.getElementById(`step-${pasoActual}`).classList.add('active');
+
+    document.getElementById('btn-anterior').style.display = pasoActual > 1 ? 'inline-flex' : 'none';
+    document.getElementById('btn-siguiente').style.display = pasoActual < totalPasos ? 'inline-flex' : 'none';
+    document.getElementById('btn-guardar').style.display = pasoActual === totalPasos ? 'inline-flex' : 'none';
+
+    const progreso = (pasoActual / totalPasos) * 100;
+    document.getElementById('progress-bar').style.width = `${progreso}%`;
+    document.getElementById('progress-text').textContent = `Paso ${pasoActual} de ${totalPasos} - ${progreso}% completado`;
+
+    window.scrollTo(0, 0);
+}
+
+// ============ FUNCIONES DE VALIDACIÓN ============
+function validarPasoActual() {
+    const campos = {
+        1: ['codigo', 'nombre', 'categoria', 'marca', 'proveedor'],
+        2: ['precio-costo', 'precio-con-factura', 'precio-sin-factura'],
+        3: ['stock-inicial', 'stock-minimo', 'unidad-medida', 'ubicacion'],
+        4: []
+    };
+
+    const camposRequeridos = campos[pasoActual] || [];
+
+    for (let campo of camposRequeridos) {
+        const elemento = document.getElementById(campo);
+        if (!elemento.value.trim()) {
+            elemento.focus();
+            elemento.style.borderColor = '#e53e3e';
+            mostrarAlerta(`Por favor completa el campo: ${elemento.previousElementSibling.textContent}`, 'warning');
+            setTimeout(() => {
+                elemento.style.borderColor = '';
+            }, 3000);
+            return false;
+        }
+    }
+
+    if (pasoActual === 2) {
+        const costo = parseFloat(document.getElementById('precio-costo').value);
+        const conFactura = parseFloat(document.getElementById('precio-con-factura').value);
+        const sinFactura = parseFloat(document.getElementById('precio-sin-factura').value);
+
+        if (conFactura <= costo || sinFactura <= costo) {
+            mostrarAlerta('Los precios de venta deben ser mayores al precio de costo', 'warning');
+            return false;
+        }
+
+        if (sinFactura >= conFactura) {
+            mostrarAlerta('El precio sin factura debe ser menor al precio con factura', 'warning');
+            return false;
+        }
+    }
+
+    return true;
+}
+
+// ============ FUNCIONES DE CÁLCULOS ============
+function configurarCalculos() {
+    document.getElementById('precio-costo').addEventListener('input', calcularMargenes);
+    document.getElementById('precio-con-factura').addEventListener('input', calcularMargenes);
+    document.getElementById('precio-sin-factura').addEventListener('input', calcularMargenes);
+    document.getElementById('categoria').addEventListener('change', generarCodigoAutomatico);
+}
+
+function calcularMargenes() {
+    const costo = parseFloat(document.getElementById('precio-costo').value) || 0;
+    const conFactura = parseFloat(document.getElementById('precio-con-factura').value) || 0;
+    const sinFactura = parseFloat(document.getElementById('precio-sin-factura').value) || 0;
+
+    if (costo > 0) {
+        if (conFactura > 0) {
+            const margenConFactura = ((conFactura - costo) / costo) * 100;
+            document.getElementById('margen-con-factura').value = `${margenConFactura.toFixed(2)}%`;
+        }
+
+        if (sinFactura > 0) {
+            const margenSinFactura = ((sinFactura - costo) / costo) * 100;
+            document.getElementById('margen-sin-factura').value = `${margenSinFactura.toFixed(2)}%`;
+        }
+
+        if (conFactura > 0 && sinFactura > 0) {
+            const diferencia = conFactura - sinFactura;
+            const porcentajeDiferencia = ((diferencia / conFactura) * 100).toFixed(2);
+            document.getElementById('diferencia-precios').value = `Bs. ${diferencia.toFixed(2)} (${porcentajeDiferencia}%)`;
+        }
+    } else {
+        document.getElementById('margen-con-factura').value = '';
+        document.getElementById('margen-sin-factura').value = '';
+        document.getElementById('diferencia-precios').value = '';
+    }
+}
+
+function generarCodigoAutomatico() {
+    const categoria = document.getElementById('categoria').value;
+    const prefijos = {
+        'anestesicos': 'ANE',
+        'proteccion': 'PRO',
+        'odontologia': 'ODO',
+        'higiene': 'HIG',
+        'instrumental': 'INS',
+        'material-medico': 'MED'
+    };
+
+    if (categoria && prefijos[categoria] && !document.getElementById('codigo').value) {
+        const numero = Math.floor(Math.random() * 900) + 100;
+        document.getElementById('codigo').value = `${prefijos[categoria]}${numero}`;
+    }
+}
+
+// ============ FUNCIONES DE SUBIDA DE IMAGEN ============
+function configurarSubidaImagen() {
+    const uploadArea = document.getElementById('upload-area');
+    const inputImagen = document.getElementById('imagen-input');
+    const previewImagen = document.getElementById('preview-imagen');
+
+    uploadArea.addEventListener('click', () => inputImagen.click());
+
+    uploadArea.addEventListener('dragover', (e) => {
+        e.preventDefault();
+        uploadArea.classList.add('dragover');
+    });
+
+    uploadArea.addEventListener('dragleave', () => {
+        uploadArea.classList.remove('dragover');
+    });
+
+    uploadArea.addEventListener('drop', (e) => {
+        e.preventDefault();
+        uploadArea.classList.remove('dragover');
+        const archivos = e.dataTransfer.files;
+        if (archivos.length > 0) {
+            procesarImagen(archivos[0]);
+        }
+    });
+
+    inputImagen.addEventListener('change', (e) => {
+        if (e.target.files.length > 0) {
+            procesarImagen(e.target.files[0]);
+        }
+    });
+
+    function procesarImagen(archivo) {
+        if (archivo.type.startsWith('image/') && archivo.size <= 5 * 1024 * 1024) {
+            const reader = new FileReader();
+            reader.onload = (e) => {
+                previewImagen.src = e.target.result;
+                previewImagen.style.display = 'block';
+                uploadArea.style.display = 'none';
+            };
+            reader.readAsDataURL(archivo);
+        } else {
+            mostrarAlerta('Selecciona una imagen válida (máx. 5MB)', 'warning');
+        }
+    }
+}
+
+// ============ FUNCIONES DE IMAGEN ============
+function toggleImageSource(tipo) {
+    const btnFile = document.getElementById('btn-file');
+    const btnUrl = document.getElementById('btn-url');
+    const fileArea = document.getElementById('file-upload-area');
+    const urlArea = document.getElementById('url-input-area');
+    const previewImagen = document.getElementById('preview-imagen');
+
+    if (tipo === 'file') {
+        btnFile.classList.add('active');
+        btnUrl.classList.remove('active');
+        fileArea.style.display = 'block';
+        urlArea.style.display = 'none';
+    } else {
+        btnFile.classList.remove('active');
+        btnUrl.classList.add('active');
+        fileArea.style.display = 'none';
+        urlArea.style.display = 'block';
+    }
+
+    // Ocultar preview al cambiar de modo
+    previewImagen.style.display = 'none';
+    document.getElementById('upload-area').style.display = 'block';
+}
+
+function previewUrl() {
+    const url = document.getElementById('imagen-url').value;
+    const previewImagen = document.getElementById('preview-imagen');
+
+    if (url) {
+        previewImagen.src = url;
+        previewImagen.style.display = 'block';
+        previewImagen.onerror = () => {
+            mostrarAlerta('Error al cargar la imagen desde la URL', 'warning');
+            previewImagen.style.display = 'none';
+        };
+    } else {
+        mostrarAlerta('Por favor ingresa una URL válida', 'warning');
+    }
+}
+
+// ============ FUNCIONES DE VALIDACIÓN EN TIEMPO REAL ============
+function configurarValidacion() {
+    const campos = document.querySelectorAll('.form-input[required]');
+    campos.forEach(campo => {
+        campo.addEventListener('blur', function() {
+            if (this.value.trim()) {
+                this.style.borderColor = '';
+            }
+        });
+    });
+}
+
+// ============ GUARDAR PRODUCTO ============
+document.getElementById('producto-form').addEventListener('submit', function(e) {
+    e.preventDefault();
+
+    if (validarPasoActual()) {
+        const btnGuardar = document.getElementById('btn-guardar');
+        const textoOriginal = btnGuardar.innerHTML;
+
+        btnGuardar.innerHTML = 'Guardando...';
+        btnGuardar.disabled = true;
+
+        setTimeout(() => {
+            btnGuardar.innerHTML = textoOriginal;
+            btnGuardar.disabled = false;
+
+            const codigo = document.getElementById('codigo').value;
+            const nombre = document.getElementById('nombre').value;
+
+            mostrarAlerta(`Producto "${nombre}" (${codigo}) guardado exitosamente!`, 'success');
+
+            if (confirm('¿Deseas agregar otro producto?')) {
+                limpiarFormulario();
+            }
+        }, 2000);
+    }
+});
+
+// ============ LIMPIAR FORMULARIO ============
+function limpiarFormulario() {
+    document.getElementById('producto-form').reset();
+    cambiarPaso(1);
+    document.getElementById('preview-imagen').style.display = 'none';
+    document.getElementById('upload-area').style.display = 'block';
+    document.getElementById('margen-con-factura').value = '';
+    document.getElementById('margen-sin-factura').value = '';
+    document.getElementById('diferencia-precios').value = '';
+
+    // Resetear el selector de imagen
+    toggleImageSource('file');
+}
+
+// ============ MOSTRAR ALERTAS ============
+function mostrarAlerta(mensaje, tipo) {
+    const alerta = document.createElement('div');
+    alerta.className = `alert alert-${tipo}`;
+    alerta.innerHTML = `<strong>${tipo === 'success' ? 'Éxito!' : tipo === 'warning' ? 'Advertencia:' : 'Info:'}</strong> ${mensaje}`;
+    alerta.style.position = 'fixed';
+    alerta.style.top = '20px';
+    alerta.style.right = '20px';
+    alerta.style.zIndex = '1000';
+    alerta.style.minWidth = '300px';
+    alerta.style.boxShadow = '0 8px 25px rgba(255, 215, 0, 0.2)';
+
+    document.body.appendChild(alerta);
+
+    setTimeout(() => {
+        alerta.remove();
+    }, 5000);
+}
+
+// ============ ANIMACIONES DE ENTRADA ============
+const elements = document.querySelectorAll('.card, .alert');
+elements.forEach((element, index) => {
+    element.style.opacity = '0';
+    element.style.transform = 'translateY(20px)';
+
+    setTimeout(() => {
+        element.style.transition = 'all 0.6s cubic-bezier(0.4, 0, 0.2, 1)';
+        element.style.opacity = '1';
+        element.style.transform = 'translateY(0)';
+    }, index * 100);
+});
+
+console.log('Sistema de Agregar Producto Roy Representaciones iniciado');
+console.log('Funcionalidades: Formulario multi-paso, cálculo automático de márgenes, subida de imagen por archivo o URL');
@@ -0,0 +1,238 @@
+// static/js/paginas/backups.js
+// ============ MANEJO DE LOGOS ============
+function handleLogoError() {
+    // Ocultar imagen y mostrar logo por defecto en el sidebar
+    document.getElementById('sidebarLogo').style.display = 'none';
+    document.getElementById('defaultLogo').style.display = 'flex';
+}
+
+function handleMobileLogoError() {
+    // Reemplazar logo móvil con texto si falla la carga
+    const mobileLogo = document.getElementById('mobileLogo');
+    mobileLogo.src = '';
+    mobileLogo.alt = 'Sistema Roy';
+    mobileLogo.style.fontFamily = 'Inter, sans-serif';
+    mobileLogo.style.fontWeight = '700';
+    mobileLogo.style.fontSize = '1.2rem';
+    mobileLogo.style.color = 'var(--color-green-dark)';
+}
+
+// Verificar si las imágenes se cargaron correctamente al cargar la página
+document.addEventListener('DOMContentLoaded', function() {
+    const sidebarLogo = document.getElementById('sidebarLogo');
+    const mobileLogo = document.getElementById('mobileLogo');
+
+    // Si la imagen del sidebar no se cargó correctamente
+    if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+        handleLogoError();
+    }
+
+    // Si la imagen móvil no se cargó correctamente
+    if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+        handleMobileLogoError();
+    }
+
+    // También verificar después de un tiempo por si la carga es lenta
+    setTimeout(function() {
+        if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+            handleLogoError();
+        }
+        if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+            handleMobileLogoError();
+        }
+    }, 1000);
+});
+
+// ============ FUNCIONES DEL SIDEBAR ============
+function toggleSidebar() {
+    const sidebar = document.getElementById('sidebar');
+    const overlay = document.getElementById('sidebar-overlay');
+
+    sidebar.classList.toggle('active');
+    overlay.classList.toggle('active');
+}
+
+// ============ FUNCIONES DE BACKUP ============
+function iniciarBackupCompleto() {
+    if (confirm('¿Iniciar backup completo del sistema? Este proceso puede tomar 15-20 minutos.')) {
+        alert('Iniciando backup completo...\nRecibirás una notificación cuando termine.');
+        // Aquí simularías el progreso del backup
+        mostrarProgreso('Backup Completo');
+    }
+}
+
+function iniciarBackupDatos() {
+    if (confirm('¿Iniciar backup de datos críticos? Este proceso puede tomar 5-8 minutos.')) {
+        alert('Iniciando backup de datos...');
+        mostrarProgreso('Backup de Datos');
+    }
+}
+
+function iniciarBackupConfig() {
+    if (confirm('¿Iniciar backup de configuración? Este proceso puede tomar 1-2 minutos.')) {
+        alert('Iniciando backup de configuración...');
+        mostrarProgreso('Backup de Configuración');
+    }
+}
+
+function descargarBackup(backupId) {
+    alert('Descargando backup: ' + backupId + '\nEl archivo se guardará en tu carpeta de descargas.');
+}
+
+function restaurarBackup(backupId) {
+    if (confirm('¿Restaurar el backup ' + backupId + '?\n\nADVERTENCIA: Esto reemplazará todos los datos actuales.')) {
+        if (confirm('CONFIRMACIÓN FINAL: ¿Estás seguro de restaurar este backup?')) {
+            alert('Iniciando restauración...\nEl sistema se reiniciará automáticamente.');
+        }
+    }
+}
+
+function subirBackup() {
+    alert('Abriendo selector de archivos para subir backup...');
+}
+
+function verificarIntegridad() {
+    alert('Verificando integridad de todos los backups...\nEsto puede tomar unos minutos.');
+}
+
+function exportarLogs() {
+    alert('Exportando logs del sistema de backup...');
+}
+
+function limpiarBackupsAntiguos() {
+    if (confirm('¿Eliminar backups de más de 30 días?')) {
+        alert('Limpiando backups antiguos...\nSe liberaron 2.1 GB de espacio.');
+    }
+}
+
+function optimizarBaseDatos() {
+    if (confirm('¿Optimizar la base de datos? Este proceso puede tomar varios minutos.')) {
+        alert('Optimizando base de datos...\nEl sistema puede estar lento durante este proceso.');
+    }
+}
+
+function verificarSistema() {
+    alert('Verificando integridad del sistema...\nRevisando archivos y configuraciones.');
+}
+
+function exportarDatosCSV() {
+    alert('Exportando todos los datos en formato CSV...');
+}
+
+function exportarDatosJSON() {
+    alert('Exportando todos los datos en formato JSON...');
+}
+
+function exportarConfiguracion() {
+    alert('Exportando configuración del sistema...');
+}
+
+function backupEmergencia() {
+    if (confirm('¿Realizar backup de emergencia?\nEste proceso es prioritario y puede afectar el rendimiento del sistema.')) {
+        alert('Iniciando backup de emergencia...\nEste proceso tiene máxima prioridad.');
+    }
+}
+
+function restauracionCompleta() {
+    if (confirm('¿Realizar restauración completa del sistema?\nEsta acción revertirá TODO el sistema al estado del último backup.')) {
+        if (confirm('ÚLTIMA CONFIRMACIÓN: ¿Restaurar completamente el sistema?')) {
+            alert('Iniciando restauración completa...\nEl sistema se reiniciará automáticamente.');
+        }
+    }
+}
+
+function resetearSistema() {
+    if (confirm('¿RESETEAR COMPLETAMENTE EL SISTEMA?\nEsta acción eliminará TODOS los datos y configuraciones.')) {
+        if (confirm('CONFIRMACIÓN FINAL: ¿Eliminar TODO y resetear el sistema?')) {
+            alert('Reseteando sistema...\nTodos los datos serán eliminados.');
+        }
+    }
+}
+
+function mostrarProgreso(tipo) {
+    // Simulación de progreso del backup
+    console.log('Iniciando ' + tipo + '...');
+}
+
+// Funciones de estadísticas
+function verBackupsTotales() {
+    alert('Mostrando detalles de backups totales...');
+}
+
+function verEspacioUtilizado() {
+    alert('Mostrando análisis de espacio utilizado...');
+}
+
+function verUltimoBackup() {
+    alert('Mostrando información del último backup...');
+}
+
+function verExitoBackups() {
+    alert('Mostrando tasa de éxito de backups...');
+}
+
+function verRetencion() {
+    alert('Mostrando política de retención...');
+}
+
+// Animaciones de entrada
+document.addEventListener('DOMContentLoaded', function() {
+    const cards = document.querySelectorAll('.card, .stat-card, .backup-item');
+    cards.forEach((card, index) {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(20px)';
+
+        setTimeout(() => {
+            card.style.transition = 'all 0.6s cubic-bezier(0.4, 0, 0.2, 1)';
+            card.style.opacity = '1';
+            card.style.transform = 'translateY(0)';
+        }, index * 100);
+    });
+});
+
+// Función de utilidad para mostrar notificaciones
+function mostrarNotificacion(mensaje, tipo = 'info') {
+    const colores = {
+        'info': '#3B82F6',
+        'success': '#28C76F',
+        'warning': '#F59E0B',
+        'error': '#e53e3e'
+    };
+
+    const notificacion = document.createElement('div');
+    notificacion.innerHTML = `
+        <div style="
+            position: fixed;
+            top: 90px;
+            right: 20px;
+            background: white;
+            padding: 1rem 1.5rem;
+            border-radius: var(--radius-lg);
+            box-shadow: var(--shadow-xl);
+            border-left: 4px solid ${colores[tipo]};
+            max-width: 300px;
+            z-index: 9999;
+            animation: slideIn 0.3s ease;
+        ">
+            ${mensaje}
+        </div>
+        <style>
+            @keyframes slideIn {
+                from { transform: translateX(100%); opacity: 0; }
+                to { transform: translateX(0); opacity: 1; }
+            }
+        </style>
+    `;
+
+    document.body.appendChild(notificacion);
+
+    setTimeout(() => {
+        notificacion.style.opacity = '0';
+        notificacion.style.transform = 'translateX(100%)';
+        setTimeout(() => notificacion.remove(), 300);
+    }, 5000);
+}
+
+// Inicialización del sistema
+console.log('💾 Sistema de Backup Roy Representaciones iniciado');
+console.log('Módulos cargados: Backup completo, datos, configuración, restauración');
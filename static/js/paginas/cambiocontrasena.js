@@ -0,0 +1,50 @@
+// static/js/paginas/cambiocontrasena.js
+document.getElementById('recovery-form').addEventListener('submit', function(e) {
+    e.preventDefault();
+
+    const input = document.getElementById('email_or_phone');
+    const value = input.value.trim();
+    const successMessage = document.getElementById('success-message');
+    const errorMessage = document.getElementById('error-message');
+
+    // Ocultar mensajes previos
+    successMessage.style.display = 'none';
+    errorMessage.style.display = 'none';
+
+    // Validación básica
+    if (!value) {
+        errorMessage.textContent = 'Por favor ingresa tu correo o número de celular';
+        errorMessage.style.display = 'block';
+        return;
+    }
+
+    // Simular envío
+    const submitBtn = this.querySelector('button[type="submit"]');
+    const originalText = submitBtn.textContent;
+
+    submitBtn.textContent = 'Enviando...';
+    submitBtn.disabled = true;
+
+    setTimeout(() => {
+        submitBtn.textContent = originalText;
+        submitBtn.disabled = false;
+
+        // Simular éxito (en producción aquí harías la llamada real a la API)
+        if (Math.random() > 0.2) { // 80% de éxito simulado
+            successMessage.textContent = `Código enviado a ${value}`;
+            successMessage.style.display = 'block';
+            input.value = '';
+        } else {
+            errorMessage.textContent = 'Error al enviar el código. Intenta nuevamente.';
+            errorMessage.style.display = 'block';
+        }
+    }, 2000);
+});
+
+// Validación en tiempo real
+document.getElementById('email_or_phone').addEventListener('input', function() {
+    const errorMessage = document.getElementById('error-message');
+    if (errorMessage.style.display === 'block') {
+        errorMessage.style.display = 'none';
+    }
+});
@@ -0,0 +1,298 @@
+// static/js/paginas/catalogo.js
+document.addEventListener('DOMContentLoaded', function() {
+    const searchInput = document.getElementById('searchInput');
+    const categoryFilter = document.getElementById('categoryFilter');
+    const sortSelect = document.getElementById('sortSelect');
+    const productsGrid = document.getElementById('productsGrid');
+    const resultCount = document.getElementById('resultCount');
+    const noResults = document.getElementById('noResults');
+    const viewButtons = document.querySelectorAll('.view-btn');
+    const modal = document.getElementById('productModal');
+    const closeModal = document.querySelector('.close-modal');
+    const viewDetailsButtons = document.querySelectorAll('.view-details');
+
+    let currentView = 'grid';
+    let allProducts = Array.from(document.querySelectorAll('.product-card'));
+
+    // Datos de productos para el modal
+    const productDetails = {
+        1: {
+            image: "https://images.unsplash.com/photo-1588776814546-1ffcf47267a5?ixlib=rb-4.0.3&auto=format&fit=crop&w=1000&q=80",
+            category: "Equipos Dentales",
+            title: "Unidad Dental Premium Elite",
+            description: "Sistema dental completo con tecnología alemana, aspiración dual, luz LED de 50,000 lux y bandeja instrumental motorizada.",
+            specs: "Voltaje: 220V, Potencia: 1500W, Dimensiones: 150x80x120 cm",
+            features: "Tecnología alemana, Aspiración dual, Luz LED de 50,000 lux, Bandeja instrumental motorizada",
+            dimensions: "150x80x120 cm, Peso: 250 kg",
+            warranty: "2 años de garantía, Soporte técnico 24/7"
+        },
+        2: {
+            image: "https://images.unsplash.com/photo-1550572017-edd951b55104?ixlib=rb-4.0.3&auto=format&fit=crop&w=1000&q=80",
+            category: "Equipos Médicos",
+            title: "Estetoscopio Digital Avanzado",
+            description: "Estetoscopio cardiológico con amplificación x40, cancelación de ruido y conectividad Bluetooth para grabación.",
+            specs: "Amplificación: x40, Conectividad: Bluetooth 5.0, Batería: 8 horas",
+            features: "Amplificación x40, Cancelación de ruido, Conectividad Bluetooth, Grabación de audio",
+            dimensions: "30 cm de largo, Peso: 200 g",
+            warranty: "1 año de garantía, Soporte técnico especializado"
+        },
+        3: {
+            image: "https://images.unsplash.com/photo-1532187863486-abf9dbad1b69?ixlib=rb-4.0.3&auto=format&fit=crop&w=1000&q=80",
+            category: "Laboratorio",
+            title: "Microscopio Binocular HD",
+            description: "Microscopio profesional con objetivos Plan-Acromáticos, iluminación LED y cámara digital integrada de 5MP.",
+            specs: "Aumentos: 40x-1000x, Cámara: 5MP, Iluminación: LED",
+            features: "Objetivos Plan-Acromáticos, Iluminación LED, Cámara digital integrada 5MP",
+            dimensions: "30x20x40 cm, Peso: 5 kg",
+            warranty: "3 años de garantía, Mantenimiento incluido"
+        },
+        4: {
+            image: "https://images.unsplash.com/photo-1559757148-5c350d0d3c56?ixlib=rb-4.0.3&auto=format&fit=crop&w=1000&q=80",
+            category: "Instrumental Quirúrgico",
+            title: "Set Instrumental Titanio",
+            description: "Kit completo de 45 piezas en titanio grado médico. Incluye pinzas, tijeras, porta-agujas y separadores.",
+            specs: "Material: Titanio grado médico, Piezas: 45, Esterilización: Autoclavable",
+            features: "Titanio grado médico, 45 piezas, Autoclavable, Diseño ergonómico",
+            dimensions: "Estuche: 40x30x10 cm, Peso: 3 kg",
+            warranty: "Garantía de por vida, Reemplazo de piezas"
+        },
+        5: {
+            image: "https://images.unsplash.com/photo-1582719471384-894fbb16e074?ixlib=rb-4.0.3&auto=format&fit=crop&w=1000&q=80",
+            category: "Radiología",
+            title: "Sistema Rayos X Digital",
+            description: "Equipo de radiología digital portátil con panel detector plano y software de procesamiento avanzado.",
+            specs: "Resolución: 5MP, Portátil: Sí, Software: Incluido",
+            features: "Panel detector plano, Software avanzado, Portátil, Alta resolución",
+            dimensions: "60x40x80 cm, Peso: 25 kg",
+            warranty: "2 años de garantía, Actualizaciones de software"
+        },
+        6: {
+            image: "https://images.unsplash.com/photo-1551601651-2a8555f1a136?ixlib=rb-4.0.3&auto=format&fit=crop&w=1000&q=80",
+            category: "Consumibles",
+            title: "Sutura Biodegradable Premium",
+            description: "Hilos de sutura absorbibles multifilamento con aguja atraumática. Diversos calibres disponibles.",
+            specs: "Material: Poliglactina, Absorción: 60-90 días, Calibres: 2-0 a 5-0",
+            features: "Biodegradable, Multifilamento, Aguja atraumática, Diversos calibres",
+            dimensions: "Paquete individual estéril",
+            warranty: "Garantía de esterilidad, Lote trazable"
+        },
+        7: {
+            image: "https://images.unsplash.com/photo-1588776814546-1ffcf47267a5?ixlib=rb-4.0.3&auto=format&fit=crop&w=1000&q=80",
+            category: "Equipos Dentales",
+            title: "Turbina Alta Velocidad",
+            description: "Turbina dental de alta precisión con rodamientos cerámicos y sistema de refrigeración dual.",
+            specs: "Velocidad: 400,000 RPM, Refrigeración: Air/Water, Conexión: Estándar",
+            features: "Rodamientos cerámicos, Refrigeración dual, Alta precisión, Luz LED",
+            dimensions: "15 cm de largo, Peso: 80 g",
+            warranty: "1 año de garantía, Mantenimiento incluido"
+        },
+        8: {
+            image: "https://images.unsplash.com/photo-1582719471384-894fbb16e074?ixlib=rb-4.0.3&auto=format&fit=crop&w=1000&q=80",
+            category: "Laboratorio",
+            title: "Centrífuga de Mesa",
+            description: "Centrífuga digital con rotor basculante, velocidad variable hasta 4000 rpm y timer programable.",
+            specs: "Velocidad: 0-4000 RPM, Timer: 0-60 min, Capacidad: 6 tubos de 15ml",
+            features: "Digital, Rotor basculante, Velocidad variable, Timer programable",
+            dimensions: "30x30x20 cm, Peso: 8 kg",
+            warranty: "2 años de garantía, Servicio técnico"
+        }
+    };
+
+    // Función de búsqueda
+    function filterProducts() {
+        const searchTerm = searchInput.value.toLowerCase();
+        const selectedCategory = categoryFilter.value;
+        let visibleCount = 0;
+
+        allProducts.forEach(product => {
+            const name = product.dataset.name.toLowerCase();
+            const category = product.dataset.category;
+
+            const matchesSearch = name.includes(searchTerm);
+            const matchesCategory = !selectedCategory || category === selectedCategory;
+
+            if (matchesSearch && matchesCategory) {
+                product.style.display = 'flex';
+                visibleCount++;
+            } else {
+                product.style.display = 'none';
+            }
+        });
+
+        resultCount.textContent = visibleCount;
+
+        if (visibleCount === 0) {
+            noResults.style.display = 'block';
+            productsGrid.style.display = 'none';
+        } else {
+            noResults.style.display = 'none';
+            productsGrid.style.display = 'grid';
+
+            // Aplicar la vista actual después de filtrar
+            if (currentView === 'list') {
+                productsGrid.classList.add('list-view');
+            } else {
+                productsGrid.classList.remove('list-view');
+            }
+        }
+    }
+
+    // Función de ordenamiento
+    function sortProducts() {
+        const sortValue = sortSelect.value;
+        const visibleProducts = allProducts.filter(product =>
+            product.style.display !== 'none'
+        );
+
+        visibleProducts.sort((a, b) => {
+            switch(sortValue) {
+                case 'name':
+                    return a.dataset.name.localeCompare(b.dataset.name);
+                case 'name-desc':
+                    return b.dataset.name.localeCompare(a.dataset.name);
+                case 'category':
+                    return a.dataset.category.localeCompare(b.dataset.category);
+                default:
+                    return 0;
+            }
+        });
+
+        // Reordenar en el DOM
+        visibleProducts.forEach(product => {
+            productsGrid.appendChild(product);
+        });
+    }
+
+    // Cambio de vista - CORREGIDO
+    function toggleView(viewType) {
+        currentView = viewType;
+
+        viewButtons.forEach(btn => {
+            btn.classList.remove('active');
+            if (btn.dataset.view === viewType) {
+                btn.classList.add('active');
+            }
+        });
+
+        if (viewType === 'list') {
+            productsGrid.classList.add('list-view');
+        } else {
+            productsGrid.classList.remove('list-view');
+        }
+    }
+
+    // Abrir modal con detalles del producto
+    function openProductModal(productId) {
+        const product = productDetails[productId];
+        if (product) {
+            document.getElementById('modalImage').src = product.image;
+            document.getElementById('modalCategory').textContent = product.category;
+            document.getElementById('modalTitle').textContent = product.title;
+            document.getElementById('modalDescription').textContent = product.description;
+            document.getElementById('modalSpecs').textContent = product.specs;
+            document.getElementById('modalFeatures').textContent = product.features;
+            document.getElementById('modalDimensions').textContent = product.dimensions;
+            document.getElementById('modalWarranty').textContent = product.warranty;
+
+            modal.style.display = 'block';
+            document.body.style.overflow = 'hidden';
+        }
+    }
+
+    // Cerrar modal
+    function closeProductModal() {
+        modal.style.display = 'none';
+        document.body.style.overflow = 'auto';
+    }
+
+    // Event listeners
+    searchInput.addEventListener('input', filterProducts);
+    categoryFilter.addEventListener('change', filterProducts);
+    sortSelect.addEventListener('change', sortProducts);
+
+    viewButtons.forEach(btn => {
+        btn.addEventListener('click', () => {
+            toggleView(btn.dataset.view);
+        });
+    });
+
+    viewDetailsButtons.forEach(btn => {
+        btn.addEventListener('click', function(e) {
+            e.preventDefault();
+            const productId = this.getAttribute('data-product');
+            openProductModal(productId);
+        });
+    });
+
+    closeModal.addEventListener('click', closeProductModal);
+
+    // Cerrar modal al hacer clic fuera del contenido
+    window.addEventListener('click', function(e) {
+        if (e.target === modal) {
+            closeProductModal();
+        }
+    });
+
+    // Efectos de animación al cargar
+    function animateCardsOnLoad() {
+        allProducts.forEach((card, index) => {
+            card.style.opacity = '0';
+            card.style.transform = 'translateY(30px)';
+            card.style.transition = 'all 0.6s ease-out';
+
+            setTimeout(() => {
+                card.style.opacity = '1';
+                card.style.transform = 'translateY(0)';
+            }, index * 100);
+        });
+    }
+
+    // Efectos de hover mejorados
+    allProducts.forEach(card => {
+        card.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateY(-15px) scale(1.02)';
+        });
+
+        card.addEventListener('mouseleave', function() {
+            this.style.transform = 'translateY(0) scale(1)';
+        });
+    });
+
+    // Efecto de búsqueda en tiempo real con debounce
+    let searchTimeout;
+    searchInput.addEventListener('input', function() {
+        clearTimeout(searchTimeout);
+        searchTimeout = setTimeout(() => {
+            filterProducts();
+
+            // Efecto visual de búsqueda
+            this.style.borderColor = 'var(--color-gold)';
+            this.style.boxShadow = '0 5px 25px var(--shadow-gold)';
+
+            setTimeout(() => {
+                this.style.borderColor = 'transparent';
+                this.style.boxShadow = '0 5px 15px var(--shadow-gold)';
+            }, 300);
+        }, 300);
+    });
+
+    // Animación inicial
+    animateCardsOnLoad();
+
+    // Scroll suave para navegación
+    document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+        anchor.addEventListener('click', function (e) {
+            e.preventDefault();
+            const target = document.querySelector(this.getAttribute('href'));
+            if (target) {
+                target.scrollIntoView({
+                    behavior: 'smooth',
+                    block: 'start'
+                });
+            }
+        });
+    });
+
+    // Inicializar contador
+    resultCount.textContent = document.querySelectorAll('.product-card').length;
+});
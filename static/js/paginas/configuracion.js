@@ -0,0 +1,161 @@
+// static/js/paginas/configuracion.js
+// ============ MANEJO DE LOGOS ============
+function handleLogoError() {
+    // Ocultar imagen y mostrar logo por defecto en el sidebar
+    document.getElementById('sidebarLogo').style.display = 'none';
+    document.getElementById('defaultLogo').style.display = 'flex';
+}
+
+function handleMobileLogoError() {
+    // Reemplazar logo móvil con texto si falla la carga
+    const mobileLogo = document.getElementById('mobileLogo');
+    mobileLogo.src = '';
+    mobileLogo.alt = 'Sistema Roy';
+    mobileLogo.style.fontFamily = 'Inter, sans-serif';
+    mobileLogo.style.fontWeight = '700';
+    mobileLogo.style.fontSize = '1.2rem';
+    mobileLogo.style.color = 'var(--color-purple)';
+}
+
+// Verificar si las imágenes se cargaron correctamente al cargar la página
+document.addEventListener('DOMContentLoaded', function() {
+    const sidebarLogo = document.getElementById('sidebarLogo');
+    const mobileLogo = document.getElementById('mobileLogo');
+
+    // Si la imagen del sidebar no se cargó correctamente
+    if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+        handleLogoError();
+    }
+
+    // Si la imagen móvil no se cargó correctamente
+    if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+        handleMobileLogoError();
+    }
+
+    // También verificar después de un tiempo por si la carga es lenta
+    setTimeout(function() {
+        if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+            handleLogoError();
+        }
+        if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+            handleMobileLogoError();
+        }
+    }, 1000);
+});
+
+// ============ FUNCIONES DEL SIDEBAR ============
+function toggleSidebar() {
+    const sidebar = document.getElementById('sidebar');
+    const overlay = document.getElementById('sidebar-overlay');
+
+    sidebar.classList.toggle('active');
+    overlay.classList.toggle('active');
+}
+
+// ============ FUNCIONES DE CONFIGURACIÓN ============
+function guardarConfiguracion() {
+    mostrarAlerta('Configuración general guardada exitosamente', 'success');
+}
+
+function guardarInventario() {
+    const criticalDays = document.getElementById('critical-days').value;
+    const mediumDays = document.getElementById('medium-days').value;
+    const defaultStock = document.getElementById('default-stock').value;
+
+    if (parseInt(criticalDays) >= parseInt(mediumDays)) {
+        mostrarAlerta('Los días de alerta crítica deben ser menores que los de alerta media', 'warning');
+        return;
+    }
+
+    mostrarAlerta('Configuración de inventario actualizada', 'success');
+}
+
+function guardarFacturacion() {
+    mostrarAlerta('Datos de facturación guardados correctamente', 'success');
+}
+
+function toggleConfig(tipo) {
+    const mensajes = {
+        'notifications': 'Notificaciones por email',
+        'expiration': 'Alertas de vencimiento',
+        'fifo': 'Control FIFO automático',
+        'backup': 'Backup automático'
+    };
+
+    mostrarAlerta(`${mensajes[tipo]} actualizado`, 'info');
+}
+
+function toggleDarkMode() {
+    mostrarAlerta('Modo oscuro será implementado en próxima actualización', 'info');
+}
+
+// ============ FUNCIONES DE SEGURIDAD ============
+function configurar2FA() {
+    mostrarAlerta('Redirigiendo a configuración de autenticación de dos factores...', 'info');
+}
+
+function modificarSesion() {
+    const nuevoTiempo = prompt('Ingrese el nuevo tiempo de sesión en minutos:', '30');
+    if (nuevoTiempo && !isNaN(nuevoTiempo)) {
+        mostrarAlerta(`Tiempo de sesión actualizado a ${nuevoTiempo} minutos`, 'success');
+    }
+}
+
+function verLogs() {
+    mostrarAlerta('Abriendo registro de actividades...', 'info');
+}
+
+// ============ FUNCIONES PELIGROSAS ============
+function resetearSistema() {
+    if (confirm('¿Estás seguro de que deseas resetear el sistema? Esta acción NO se puede deshacer.')) {
+        if (confirm('CONFIRMACIÓN FINAL: ¿Realmente deseas resetear TODO el sistema?')) {
+            mostrarAlerta('Sistema reseteado. Redirigiendo a configuración inicial...', 'warning');
+        }
+    }
+}
+
+function eliminarDatos() {
+    if (confirm('¿Estás seguro de que deseas eliminar TODOS los datos? Esta acción es IRREVERSIBLE.')) {
+        if (confirm('ÚLTIMA CONFIRMACIÓN: ¿Eliminar todos los productos, ventas, clientes y configuraciones?')) {
+            mostrarAlerta('Todos los datos han sido eliminados del sistema.', 'danger');
+        }
+    }
+}
+
+function exportarDatos() {
+    mostrarAlerta('Exportando todos los datos del sistema... El archivo se descargará automáticamente.', 'info');
+}
+
+// ============ FUNCIÓN PARA MOSTRAR ALERTAS ============
+function mostrarAlerta(mensaje, tipo) {
+    const alerta = document.createElement('div');
+    alerta.className = `alert alert-${tipo}`;
+    alerta.innerHTML = `<strong>${tipo === 'success' ? 'Éxito!' : tipo === 'warning' ? 'Advertencia:' : tipo === 'danger' ? 'Crítico:' : 'Info:'}</strong> ${mensaje}`;
+    alerta.style.position = 'fixed';
+    alerta.style.top = '20px';
+    alerta.style.right = '20px';
+    alerta.style.zIndex = '1000';
+    alerta.style.minWidth = '300px';
+    alerta.style.boxShadow = 'var(--shadow-lg)';
+
+    document.body.appendChild(alerta);
+
+    setTimeout(() => {
+        alerta.remove();
+    }, 5000);
+}
+
+// ============ ANIMACIONES DE ENTRADA ============
+const cards = document.querySelectorAll('.card, .config-item');
+cards.forEach((card, index) => {
+    card.style.opacity = '0';
+    card.style.transform = 'translateY(20px)';
+
+    setTimeout(() => {
+        card.style.transition = 'all 0.6s cubic-bezier(0.4, 0, 0.2, 1)';
+        card.style.opacity = '1';
+        card.style.transform = 'translateY(0)';
+    }, index * 100);
+});
+
+console.log('Sistema de Configuración Roy Representaciones iniciado');
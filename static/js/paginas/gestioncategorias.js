@@ -0,0 +1,238 @@
+// static/js/paginas/gestioncategorias.js
+let colorSeleccionado = 'blue';
+
+// ============ MANEJO DE LOGOS ============
+function handleLogoError() {
+    // Ocultar imagen y mostrar logo por defecto en el sidebar
+    document.getElementById('sidebarLogo').style.display = 'none';
+    document.getElementById('defaultLogo').style.display = 'flex';
+}
+
+function handleMobileLogoError() {
+    // Reemplazar logo móvil con texto si falla la carga
+    const mobileLogo = document.getElementById('mobileLogo');
+    mobileLogo.src = '';
+    mobileLogo.alt = 'Sistema Roy';
+    mobileLogo.style.fontFamily = 'Inter, sans-serif';
+    mobileLogo.style.fontWeight = '700';
+    mobileLogo.style.fontSize = '1.2rem';
+    mobileLogo.style.color = 'var(--color-purple)';
+}
+
+// Verificar si las imágenes se cargaron correctamente al cargar la página
+document.addEventListener('DOMContentLoaded', function() {
+    const sidebarLogo = document.getElementById('sidebarLogo');
+    const mobileLogo = document.getElementById('mobileLogo');
+
+    // Si la imagen del sidebar no se cargó correctamente
+    if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+        handleLogoError();
+    }
+
+    // Si la imagen móvil no se cargó correctamente
+    if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+        handleMobileLogoError();
+    }
+
+    // También verificar después de un tiempo por si la carga es lenta
+    setTimeout(function() {
+        if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+            handleLogoError();
+        }
+        if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+            handleMobileLogoError();
+        }
+    }, 1000);
+});
+
+// ============ FUNCIONES DEL SIDEBAR ============
+function toggleSidebar() {
+    const sidebar = document.getElementById('sidebar');
+    const overlay = document.getElementById('sidebar-overlay');
+
+    sidebar.classList.toggle('active');
+    overlay.classList.toggle('active');
+}
+
+// Función para abrir modal
+function abrirModal(categoriaId = null) {
+    const modal = document.getElementById('modalCategoria');
+    const titulo = document.getElementById('tituloModal');
+
+    if (categoriaId) {
+        titulo.textContent = 'Editar Categoría';
+        cargarDatosCategoria(categoriaId);
+    } else {
+        titulo.textContent = 'Nueva Categoría';
+        document.getElementById('formCategoria').reset();
+        seleccionarColor('blue');
+    }
+
+    modal.style.display = 'block';
+}
+
+// Función para cerrar modal
+function cerrarModal() {
+    document.getElementById('modalCategoria').style.display = 'none';
+}
+
+// Función para seleccionar color
+function seleccionarColor(color) {
+    document.querySelectorAll('.color-option').forEach(option => {
+        option.classList.remove('selected');
+    });
+
+    document.querySelector(`[data-color="${color}"]`).classList.add('selected');
+    document.getElementById('modal-color').value = color;
+    colorSeleccionado = color;
+}
+
+// Función para cargar datos de categoría
+function cargarDatosCategoria(categoriaId) {
+    const categorias = {
+        'anestesicos': {
+            nombre: 'Anestésicos',
+            codigo: 'ANE',
+            descripcion: 'Productos para anestesia local y general',
+            icono: '💉',
+            color: 'red',
+            estado: 'activa',
+            orden: 1
+        },
+        'proteccion': {
+            nombre: 'Protección',
+            codigo: 'PRO',
+            descripcion: 'Equipos de protección personal médica',
+            icono: '🧤',
+            color: 'green',
+            estado: 'activa',
+            orden: 2
+        }
+    };
+
+    const categoria = categorias[categoriaId];
+    if (categoria) {
+        document.getElementById('modal-nombre').value = categoria.nombre;
+        document.getElementById('modal-codigo').value = categoria.codigo;
+        document.getElementById('modal-descripcion').value = categoria.descripcion;
+        document.getElementById('modal-icono').value = categoria.icono;
+        document.getElementById('modal-estado').value = categoria.estado;
+        document.getElementById('modal-orden').value = categoria.orden;
+        seleccionarColor(categoria.color);
+    }
+}
+
+// Función para ver categoría
+function verCategoria(categoriaId) {
+    mostrarNotificacion('Viendo detalles de la categoría: ' + categoriaId, 'info');
+}
+
+// Función para editar categoría
+function editarCategoria(categoriaId, event) {
+    event.stopPropagation();
+    abrirModal(categoriaId);
+}
+
+// Función para ver productos de categoría
+function verProductos(categoriaId, event) {
+    event.stopPropagation();
+    mostrarNotificacion('Mostrando productos de la categoría: ' + categoriaId, 'info');
+}
+
+// Función para mostrar notificaciones
+function mostrarNotificacion(mensaje, tipo) {
+    const notificacion = document.createElement('div');
+    notificacion.className = `alert alert-${tipo}`;
+    notificacion.innerHTML = `<strong>${tipo === 'success' ? 'Éxito!' : tipo === 'warning' ? 'Advertencia:' : tipo === 'danger' ? 'Crítico:' : 'Info:'}</strong> ${mensaje}`;
+    notificacion.style.position = 'fixed';
+    notificacion.style.top = '20px';
+    notificacion.style.right = '20px';
+    notificacion.style.zIndex = '1000';
+    notificacion.style.minWidth = '300px';
+    notificacion.style.boxShadow = 'var(--shadow-lg)';
+
+    document.body.appendChild(notificacion);
+
+    setTimeout(() => {
+        notificacion.remove();
+    }, 4000);
+}
+
+// Manejar envío del formulario
+document.getElementById('formCategoria').addEventListener('submit', function(e) {
+    e.preventDefault();
+
+    const nombre = document.getElementById('modal-nombre').value;
+    const codigo = document.getElementById('modal-codigo').value;
+
+    if (nombre && codigo) {
+        mostrarNotificacion(`Categoría "${nombre}" (${codigo}) guardada exitosamente`, 'success');
+        cerrarModal();
+    }
+});
+
+// Búsqueda en tiempo real
+document.getElementById('busqueda').addEventListener('input', function() {
+    const busqueda = this.value.toLowerCase();
+    const cards = document.querySelectorAll('.category-card');
+
+    cards.forEach(card => {
+        const texto = card.textContent.toLowerCase();
+        const mostrar = texto.includes(busqueda);
+        card.style.display = mostrar ? 'block' : 'none';
+    });
+});
+
+// Cerrar modal al hacer clic fuera
+window.onclick = function(event) {
+    const modal = document.getElementById('modalCategoria');
+    if (event.target === modal) {
+        cerrarModal();
+    }
+}
+
+// Inicialización
+document.addEventListener('DOMContentLoaded', function() {
+    seleccionarColor('blue');
+
+    // Animaciones de entrada
+    const cards = document.querySelectorAll('.card, .category-card, .stat-card');
+    cards.forEach((card, index) => {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(20px)';
+
+        setTimeout(() => {
+            card.style.transition = 'all 0.6s cubic-bezier(0.4, 0, 0.2, 1)';
+            card.style.opacity = '1';
+            card.style.transform = 'translateY(0)';
+        }, index * 100);
+    });
+});
+
+// Navegación por teclado
+document.addEventListener('keydown', function(e) {
+    // Atajos globales
+    if (e.ctrlKey || e.metaKey) {
+        switch(e.key) {
+            case 'n':
+                e.preventDefault();
+                abrirModal();
+                break;
+            case 'f':
+                e.preventDefault();
+                document.getElementById('busqueda').focus();
+                break;
+        }
+    }
+
+    // Cerrar modal con Escape
+    if (e.key === 'Escape') {
+        const modal = document.getElementById('modalCategoria');
+        if (modal.style.display === 'block') {
+            cerrarModal();
+        }
+    }
+});
+
+console.log('Sistema de Gestión de Categorías Roy Representaciones iniciado');
+console.log('Atajos: Ctrl+N (Nueva categoría), Ctrl+F (Buscar), Escape (Cerrar modal)');
@@ -0,0 +1,613 @@
+// static/js/paginas/gestionclientes.js
+// ============ VARIABLES GLOBALES ============
+let clientes = [];
+let tiposCliente = [];
+let clienteEditando = null;
+
+// ============ CARGAR SIDEBAR ============
+document.addEventListener('DOMContentLoaded', function() {
+    fetch('/components/sidebar/')
+        .then(response => response.text())
+        .then(data => {
+            document.getElementById('sidebar-container').innerHTML = data;
+            setTimeout(() => {
+                if (window.initSidebar) window.initSidebar();
+            }, 100);
+        })
+        .catch(error => console.error('Error al cargar sidebar:', error));
+
+    cargarTiposCliente();
+    cargarClientes();
+    cargarEstadisticas();
+
+    // Animaciones de entrada
+    const cards = document.querySelectorAll('.card, .stat-card');
+    cards.forEach((card, index) => {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(20px)';
+        setTimeout(() => {
+            card.style.transition = 'all 0.6s cubic-bezier(0.4, 0, 0.2, 1)';
+            card.style.opacity = '1';
+            card.style.transform = 'translateY(0)';
+        }, index * 100);
+    });
+});
+
+// ============ TOGGLE PASSWORD VISIBILITY ============
+function togglePassword() {
+    const passwordInput = document.getElementById('modal-password');
+    const toggleIcon = document.getElementById('toggle-password');
+
+    if (passwordInput.type === 'password') {
+        passwordInput.type = 'text';
+        toggleIcon.classList.remove('fa-eye');
+        toggleIcon.classList.add('fa-eye-slash');
+    } else {
+        passwordInput.type = 'password';
+        toggleIcon.classList.remove('fa-eye-slash');
+        toggleIcon.classList.add('fa-eye');
+    }
+}
+
+// ============ HEADERS ============
+function getHeaders() {
+    return {
+        'Content-Type': 'application/json',
+        'X-Requested-With': 'XMLHttpRequest'
+    };
+}
+
+// ============ CARGAR TIPOS DE CLIENTE ============
+async function cargarTiposCliente() {
+    try {
+        const response = await fetch('/auth/api/tipos-cliente/', {
+            headers: getHeaders(),
+            credentials: 'include'
+        });
+
+        if (!response.ok) throw new Error('Error al cargar tipos');
+
+        const data = await response.json();
+        if (data.success) {
+            tiposCliente = data.tipos || [];
+
+            // Llenar select del filtro
+            const filtroTipo = document.getElementById('filtro-tipo');
+            tiposCliente.forEach(tipo => {
+                const option = document.createElement('option');
+                option.value = tipo.codigo;
+                option.textContent = tipo.nombre_tipo;
+                filtroTipo.appendChild(option);
+            });
+
+            // Llenar select del modal
+            const modalTipo = document.getElementById('modal-tipo-cliente');
+            tiposCliente.forEach(tipo => {
+                const option = document.createElement('option');
+                option.value = tipo.id;
+                option.textContent = tipo.nombre_tipo;
+                modalTipo.appendChild(option);
+            });
+        }
+    } catch (error) {
+        console.error('Error al cargar tipos:', error);
+    }
+}
+
+// ============ CARGAR CLIENTES ============
+async function cargarClientes(filtros = {}) {
+    try {
+        const params = new URLSearchParams();
+
+        if (filtros.busqueda && filtros.busqueda.trim()) {
+            params.append('busqueda', filtros.busqueda.trim());
+        }
+        if (filtros.tipo && filtros.tipo !== 'todos') {
+            params.append('tipo_cliente', filtros.tipo);
+        }
+        if (filtros.estado && filtros.estado !== 'todos') {
+            params.append('estado', filtros.estado);
+        }
+
+        const response = await fetch(`/auth/api/clientes/?${params}`, {
+            headers: getHeaders(),
+            credentials: 'include'
+        });
+
+        if (!response.ok) throw new Error('Error al cargar clientes');
+
+        const data = await response.json();
+        if (data.success) {
+            clientes = data.clientes || [];
+            renderizarClientes();
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error al cargar clientes', 'danger');
+    }
+}
+
+// ============ RENDERIZAR CLIENTES ============
+function renderizarClientes() {
+    const tbody = document.getElementById('clientes-table');
+    tbody.innerHTML = '';
+
+    if (clientes.length === 0) {
+        tbody.innerHTML = `
+            <tr>
+                <td colspan="6" style="text-align: center; padding: 2rem;">
+                    <div style="color: var(--text-gray);">
+                        <i class="fas fa-search" style="font-size: 3rem; margin-bottom: 1rem; opacity: 0.3;"></i>
+                        <p>No se encontraron clientes</p>
+                    </div>
+                </td>
+            </tr>
+        `;
+        return;
+    }
+
+    clientes.forEach(cliente => {
+        const iniciales = obtenerIniciales(cliente.nombre_completo);
+        const tr = document.createElement('tr');
+        tr.innerHTML = `
+            <td>
+                <div style="display: flex; align-items: center; gap: var(--space-md);">
+                    <div class="cliente-avatar">${iniciales}</div>
+                    <div>
+                        <div style="font-weight: 600;">${cliente.nombre_completo}</div>
+                        ${cliente.razon_social ? `<div style="font-size: 0.875rem; color: var(--text-gray);">Empresa: ${cliente.razon_social}</div>` : `<div style="font-size: 0.875rem; color: var(--text-gray);">${cliente.tipo_cliente_nombre || '-'}</div>`}
+                    </div>
+                </div>
+            </td>
+            <td>${cliente.tipo_cliente_nombre || '-'}</td>
+            <td>
+                <div><strong>CI:</strong> ${cliente.cedula || '-'}</div>
+                ${cliente.nit ? `<div style="font-size: 0.875rem; color: var(--text-gray);"><strong>NIT:</strong> ${cliente.nit}</div>` : ''}
+            </td>
+            <td>
+                <div>📞 ${cliente.telefono || '-'}</div>
+                <div style="font-size: 0.875rem; color: var(--text-gray);">${cliente.email || '-'}</div>
+            </td>
+            <td>
+                <span class="badge badge-${getBadgeClass(cliente.estado)}">${cliente.estado}</span>
+            </td>
+            <td>
+                <div style="display: flex; gap: 0.3rem; flex-wrap: wrap;">
+                    <button class="btn btn-info btn-sm" onclick="verCliente(${cliente.id})" title="Ver">
+                        <i class="fas fa-eye"></i>
+                    </button>
+                    ${cliente.estado === 'ACTIVO' ? `
+                        <button class="btn btn-secondary btn-sm" onclick="editarCliente(${cliente.id})" title="Editar">
+                            <i class="fas fa-edit"></i>
+                        </button>
+                        <button class="btn btn-danger btn-sm" onclick="eliminarCliente(${cliente.id})" title="Desactivar">
+                            <i class="fas fa-trash"></i>
+                        </button>
+                    ` : `
+                        <button class="btn btn-primary btn-sm" onclick="activarCliente(${cliente.id})" title="Activar">
+                            <i class="fas fa-check"></i> Activar
+                        </button>
+                    `}
+                </div>
+            </td>
+        `;
+        tbody.appendChild(tr);
+    });
+}
+
+// ============ CARGAR ESTADÍSTICAS ============
+async function cargarEstadisticas() {
+    try {
+        const response = await fetch('/auth/api/clientes/estadisticas/', {
+            headers: getHeaders(),
+            credentials: 'include'
+        });
+
+        if (!response.ok) return;
+
+        const data = await response.json();
+        if (data.success) {
+            const stats = data.estadisticas;
+            document.getElementById('stat-total').textContent = stats.total || 0;
+            document.getElementById('stat-activos').textContent = stats.activos || 0;
+            document.getElementById('stat-inactivos').textContent = stats.inactivos || 0;
+
+            // Contar tipos diferentes
+            const tiposDiferentes = Object.keys(stats.por_tipo || {}).length;
+            document.getElementById('stat-por-tipo').textContent = tiposDiferentes;
+        }
+    } catch (error) {
+        console.error('Error al cargar estadísticas:', error);
+    }
+}
+
+// ============ FILTROS ============
+function aplicarFiltros() {
+    const filtros = {
+        busqueda: document.getElementById('busqueda').value,
+        tipo: document.getElementById('filtro-tipo').value,
+        estado: document.getElementById('filtro-estado').value
+    };
+    cargarClientes(filtros);
+}
+
+function limpiarFiltros() {
+    document.getElementById('busqueda').value = '';
+    document.getElementById('filtro-tipo').value = 'todos';
+    document.getElementById('filtro-estado').value = 'todos';
+    cargarClientes();
+}
+
+// Event listeners
+document.getElementById('busqueda')?.addEventListener('input', debounce(aplicarFiltros, 500));
+document.getElementById('filtro-tipo')?.addEventListener('change', aplicarFiltros);
+document.getElementById('filtro-estado')?.addEventListener('change', aplicarFiltros);
+
+// ============ MODAL ============
+function abrirModalCliente(clienteId = null) {
+    const modal = document.getElementById('modalCliente');
+    const titulo = document.getElementById('tituloModal');
+    const form = document.getElementById('formCliente');
+    const passwordInput = document.getElementById('modal-password');
+    const passwordLabel = document.getElementById('password-required-label');
+    const passwordHint = document.getElementById('password-hint');
+    const usuarioInput = document.getElementById('modal-usuario');
+
+    form.reset();
+    clienteEditando = clienteId;
+
+    // Reset password toggle
+    passwordInput.type = 'password';
+    document.getElementById('toggle-password').classList.remove('fa-eye-slash');
+    document.getElementById('toggle-password').classList.add('fa-eye');
+
+    if (clienteId) {
+        titulo.textContent = 'Editar Cliente';
+        cargarDatosCliente(clienteId);
+        passwordInput.required = false;
+        passwordLabel.style.display = 'none';
+        passwordHint.style.display = 'block';
+        usuarioInput.disabled = true;
+        usuarioInput.style.opacity = '0.6';
+        usuarioInput.style.cursor = 'not-allowed';
+    } else {
+        titulo.textContent = 'Nuevo Cliente';
+        passwordInput.required = true;
+        passwordLabel.style.display = 'inline';
+        passwordHint.style.display = 'none';
+        usuarioInput.disabled = false;
+        usuarioInput.style.opacity = '1';
+        usuarioInput.style.cursor = 'text';
+    }
+
+    modal.style.display = 'block';
+}
+
+function cerrarModalCliente() {
+    document.getElementById('modalCliente').style.display = 'none';
+    clienteEditando = null;
+}
+
+// ============ CARGAR DATOS CLIENTE ============
+async function cargarDatosCliente(clienteId) {
+    try {
+        const response = await fetch(`/auth/api/clientes/${clienteId}/`, {
+            headers: getHeaders(),
+            credentials: 'include'
+        });
+
+        if (!response.ok) throw new Error('Error al cargar cliente');
+
+        const data = await response.json();
+        const cliente = data.cliente;
+
+        // Llenar formulario con datos de Persona
+        document.getElementById('modal-nombre').value = cliente.nombre || '';
+        document.getElementById('modal-apellido-paterno').value = cliente.apellido_paterno || '';
+        document.getElementById('modal-apellido-materno').value = cliente.apellido_materno || '';
+        document.getElementById('modal-cedula').value = cliente.cedula || '';
+        document.getElementById('modal-celular').value = cliente.telefono || '';
+        document.getElementById('modal-email').value = cliente.email || '';
+
+        // Datos de Usuario
+        document.getElementById('modal-usuario').value = cliente.nombre_usuario || '';
+
+        // Datos de Cliente
+        document.getElementById('modal-tipo-cliente').value = cliente.tipo_cliente || '';
+        document.getElementById('modal-razon-social').value = cliente.razon_social || '';
+        document.getElementById('modal-nit').value = cliente.nit || '';
+        document.getElementById('modal-estado').value = cliente.estado || 'ACTIVO';
+
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error al cargar datos', 'danger');
+    }
+}
+
+// ============ GUARDAR CLIENTE ============
+document.getElementById('formCliente').addEventListener('submit', async function(e) {
+    e.preventDefault();
+
+    const formData = {
+        // Datos de Persona
+        nombre: document.getElementById('modal-nombre').value.trim(),
+        apellido_paterno: document.getElementById('modal-apellido-paterno').value.trim(),
+        apellido_materno: document.getElementById('modal-apellido-materno').value.trim(),
+        cedula_identidad: document.getElementById('modal-cedula').value.trim(),
+        numero_celular: document.getElementById('modal-celular').value.trim(),
+        correo: document.getElementById('modal-email').value.trim(),
+
+        // Datos de Cliente
+        tipo_cliente_id: parseInt(document.getElementById('modal-tipo-cliente').value),
+        estado: document.getElementById('modal-estado').value,  // ← ESTE CAMPO
+        razon_social: document.getElementById('modal-razon-social').value.trim(),
+        nit: document.getElementById('modal-nit').value.trim()
+    };
+
+    // Agregar password solo si se ingresó
+    const password = document.getElementById('modal-password').value;
+    if (password) {
+        formData.password = password;
+    }
+
+    if (clienteEditando) {
+        await actualizarCliente(clienteEditando, formData);
+    } else {
+        formData.nombre_usuario = document.getElementById('modal-usuario').value.trim();
+        if (!formData.password) {
+            mostrarAlerta('La contraseña es obligatoria para nuevos clientes', 'danger');
+            return;
+        }
+        await crearCliente(formData);
+    }
+});
+
+// ============ CREAR CLIENTE ============
+async function crearCliente(formData) {
+    try {
+        const response = await fetch('/auth/api/clientes/crear/', {
+            method: 'POST',
+            headers: getHeaders(),
+            credentials: 'include',
+            body: JSON.stringify(formData)
+        });
+
+        const data = await response.json();
+
+        if (response.ok && data.success) {
+            mostrarAlerta('Cliente creado exitosamente', 'success');
+            cerrarModalCliente();
+            await cargarClientes();
+            cargarEstadisticas();
+        } else {
+            mostrarErroresFormulario(data.detalles || {});
+            mostrarAlerta(data.error || 'Error al crear cliente', 'danger');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error de conexión', 'danger');
+    }
+}
+
+// ============ ACTUALIZAR CLIENTE ============
+async function actualizarCliente(clienteId, formData) {
+    try {
+        const response = await fetch(`/auth/api/clientes/${clienteId}/actualizar/`, {
+            method: 'PUT',
+            headers: getHeaders(),
+            credentials: 'include',
+            body: JSON.stringify(formData)
+        });
+
+        const data = await response.json();
+
+        if (response.ok && data.success) {
+            mostrarAlerta('Cliente actualizado exitosamente', 'success');
+            cerrarModalCliente();
+            await cargarClientes();
+            cargarEstadisticas();
+        } else {
+            mostrarErroresFormulario(data.detalles || {});
+            mostrarAlerta(data.error || 'Error al actualizar', 'danger');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error de conexión', 'danger');
+    }
+}
+
+// ============ ACCIONES ============
+function editarCliente(id) {
+    abrirModalCliente(id);
+}
+
+async function eliminarCliente(id) {
+    const cliente = clientes.find(c => c.id === id);
+    if (!cliente) return;
+
+    const confirmacion = confirm(
+        `¿ELIMINAR PERMANENTEMENTE a ${cliente.nombre_completo}?\n\n` +
+        `⚠️ ADVERTENCIA: Esto eliminará:\n` +
+        `• El cliente\n` +
+        `• El usuario asociado\n` +
+        `• Los datos personales\n\n` +
+        `Esta acción NO se puede deshacer.`
+    );
+
+    if (!confirmacion) return;
+
+    try {
+        const response = await fetch(`/auth/api/clientes/${id}/eliminar/`, {
+            method: 'DELETE',
+            headers: getHeaders(),
+            credentials: 'include'
+        });
+
+        const data = await response.json();
+
+        if (response.ok && data.success) {
+            mostrarAlerta(data.message || 'Cliente eliminado completamente', 'success');
+            await cargarClientes();
+            cargarEstadisticas();
+        } else {
+            mostrarAlerta(data.error || 'Error al eliminar', 'danger');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error de conexión', 'danger');
+    }
+}
+
+async function activarCliente(id) {
+    if (!confirm('¿Activar este cliente?')) return;
+
+    try {
+        const response = await fetch(`/auth/api/clientes/${id}/activar/`, {
+            method: 'POST',
+            headers: getHeaders(),
+            credentials: 'include'
+        });
+
+        const data = await response.json();
+
+        if (response.ok && data.success) {
+            mostrarAlerta('Cliente activado', 'success');
+            cargarClientes();
+            cargarEstadisticas();
+        } else {
+            mostrarAlerta(data.error || 'Error', 'danger');
+        }
+    } catch (error) {
+        mostrarAlerta('Error de conexión', 'danger');
+    }
+}
+
+function verCliente(id) {
+    const cliente = clientes.find(c => c.id === id);
+    if (!cliente) return;
+
+    const detalles = `
+        <div style="line-height: 2; padding: 1rem;">
+            <h4 style="color: var(--color-gold-dark); margin-bottom: 1rem;">📋 Datos Personales</h4>
+            <p><strong>👤 Nombre Completo:</strong> ${cliente.nombre_completo}</p>
+            <p><strong>🆔 Cédula de Identidad:</strong> ${cliente.cedula || '-'}</p>
+            <p><strong>📞 Teléfono:</strong> ${cliente.telefono || '-'}</p>
+            <p><strong>📧 Email:</strong> ${cliente.email || '-'}</p>
+
+            <h4 style="color: var(--color-green-dark); margin: 1.5rem 0 1rem;">🏢 Información del Cliente</h4>
+            <p><strong>📋 Tipo:</strong> ${cliente.tipo_cliente_nombre || '-'}</p>
+            ${cliente.razon_social ? `<p><strong>🏢 Razón Social:</strong> ${cliente.razon_social}</p>` : ''}
+            ${cliente.nit ? `<p><strong>🏢 NIT:</strong> ${cliente.nit}</p>` : ''}
+            <p><strong>📊 Estado:</strong> <span class="badge badge-${getBadgeClass(cliente.estado)}">${cliente.estado}</span></p>
+
+            <h4 style="color: var(--color-gold-dark); margin: 1.5rem 0 1rem;">📅 Registro</h4>
+            <p><strong>Fecha de Registro:</strong> ${new Date(cliente.fecha_registro).toLocaleDateString('es-BO')}</p>
+        </div>
+    `;
+
+    mostrarModalDetalles('Detalles del Cliente', detalles);
+}
+
+async function exportarClientes() {
+    if (clientes.length === 0) {
+        mostrarAlerta('No hay clientes para exportar', 'danger');
+        return;
+    }
+
+    try {
+        // Obtener filtros actuales
+        const params = new URLSearchParams();
+
+        const tipo = document.getElementById('filtro-tipo').value;
+        const estado = document.getElementById('filtro-estado').value;
+        const busqueda = document.getElementById('busqueda').value;
+
+        if (tipo && tipo !== 'todos') params.append('tipo_cliente', tipo);
+        if (estado && estado !== 'todos') params.append('estado', estado);
+        if (busqueda) params.append('busqueda', busqueda);
+
+        // Mostrar loading
+        mostrarAlerta('Generando archivo Excel...', 'info');
+
+        // Descargar archivo
+        const url = `/auth/api/clientes/exportar-excel/?${params}`;
+        const link = document.createElement('a');
+        link.href = url;
+        link.download = `clientes_${new Date().toISOString().split('T')[0]}.xlsx`;
+        document.body.appendChild(link);
+        link.click();
+        document.body.removeChild(link);
+
+        setTimeout(() => {
+            mostrarAlerta(`${clientes.length} clientes exportados a Excel exitosamente`, 'success');
+        }, 500);
+
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error al exportar', 'danger');
+    }
+}
+
+// ============ UTILIDADES ============
+function debounce(func, wait) {
+    let timeout;
+    return function(...args) {
+        clearTimeout(timeout);
+        timeout = setTimeout(() => func(...args), wait);
+    };
+}
+
+function obtenerIniciales(nombre) {
+    const partes = nombre.trim().split(' ');
+    return partes.length >= 2
+        ? (partes[0][0] + partes[1][0]).toUpperCase()
+        : nombre.substring(0, 2).toUpperCase();
+}
+
+function getBadgeClass(estado) {
+    const map = {
+        'ACTIVO': 'activo',
+        'INACTIVO': 'inactivo'
+    };
+    return map[estado] || 'activo';
+}
+
+function mostrarAlerta(mensaje, tipo) {
+    const color = tipo === 'success' ? '#00C851' : tipo === 'danger' ? '#EF4444' : '#FFD700';
+    const alerta = document.createElement('div');
+    alerta.innerHTML = `<strong>${tipo === 'success' ? '✓ Éxito' : tipo === 'danger' ? '✗ Error' : 'ℹ Info'}:</strong> ${mensaje}`;
+    alerta.style.cssText = `
+        position: fixed; top: 20px; right: 20px; z-index: 10000;
+        min-width: 300px; padding: 1rem 1.5rem; border-radius: var(--radius-lg);
+        background: rgba(255, 255, 255, 0.95); backdrop-filter: blur(10px);
+        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.15);
+        border-left: 4px solid ${color};
+        animation: slideIn 0.3s ease;
+    `;
+    document.body.appendChild(alerta);
+    setTimeout(() => {
+        alerta.style.animation = 'slideOut 0.3s ease';
+        setTimeout(() => alerta.remove(), 300);
+    }, 3000);
+}
+
+function mostrarModalDetalles(titulo, contenido) {
+    const modal = document.createElement('div');
+    modal.style.cssText = 'display: block; position: fixed; z-index: 9999; left: 0; top: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.6); backdrop-filter: blur(5px);';
+    modal.innerHTML = `
+        <div style="background: white; margin: 5% auto; padding: 2rem; border-radius: 20px; width: 90%; max-width: 600px; box-shadow: 0 20px 50px rgba(0,0,0,0.3);">
+            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1.5rem;">
+                <h2 style="color: var(--color-green-dark); margin: 0;">${titulo}</h2>
+                <span onclick="this.closest('div').parentElement.remove()" style="cursor: pointer; font-size: 28px; color: #9CA3AF; transition: color 0.3s;" onmouseover="this.style.color='#333'" onmouseout="this.style.color='#9CA3AF'">&times;</span>
+            </div>
+            ${contenido}
+            <button onclick="this.closest('div').parentElement.remove()" class="btn btn-primary" style="width: 100%; margin-top: 1rem;">Cerrar</button>
+        </div>
+    `;
+    document.body.appendChild(modal);
+}
+
+window.onclick = function(event) {
+    const modal = document.getElementById('modalCliente');
+    if (event.target === modal) cerrarModalCliente();
+}
@@ -0,0 +1,739 @@
+// static/js/paginas/gestionproveedores.js
+// ============ VARIABLES GLOBALES ============
+let proveedores = [];
+let proveedorEditando = null;
+
+document.addEventListener('DOMContentLoaded', function() {
+    // Cargar sidebar
+    fetch('/components/sidebar/')
+        .then(response => response.text())
+        .then(data => {
+            document.getElementById('sidebar-container').innerHTML = data;
+            setTimeout(() => {
+                if (window.initSidebar) window.initSidebar();
+            }, 100);
+        })
+        .catch(error => console.error('Error al cargar sidebar:', error));
+
+    // Cargar datos iniciales
+    cargarProveedores();
+    cargarEstadisticas();
+
+    // Event listeners de filtros
+    document.getElementById('busqueda')?.addEventListener('input', debounce(aplicarFiltros, 500));
+    document.getElementById('filtro-tipo')?.addEventListener('change', aplicarFiltros);
+    document.getElementById('filtro-estado')?.addEventListener('change', aplicarFiltros);
+
+    // Validaciones en tiempo real
+    setupValidacionesFormulario();
+
+    // Event listeners de formularios
+    document.getElementById('formCrearProveedor')?.addEventListener('submit', handleCrearProveedor);
+    document.getElementById('formEditarProveedor')?.addEventListener('submit', handleEditarProveedor);
+});
+
+function getHeaders() {
+    return {
+        'Content-Type': 'application/json',
+        'X-Requested-With': 'XMLHttpRequest'
+    };
+}
+
+async function cargarProveedores(filtros = {}) {
+    try {
+        const params = new URLSearchParams();
+
+        if (filtros.busqueda && filtros.busqueda.trim()) {
+            params.append('busqueda', filtros.busqueda.trim());
+        }
+        if (filtros.tipo && filtros.tipo !== 'todos') {
+            params.append('tipo', filtros.tipo);
+        }
+        if (filtros.estado && filtros.estado !== 'todos') {
+            params.append('estado', filtros.estado);
+        }
+
+        const response = await fetch(`/auth/api/proveedores/?${params}`, {
+            headers: getHeaders(),
+            credentials: 'include'
+        });
+
+        if (!response.ok) throw new Error('Error al cargar proveedores');
+
+        const data = await response.json();
+        if (data.success) {
+            proveedores = data.proveedores || [];
+            renderizarProveedores();
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error al cargar proveedores', 'danger');
+    }
+}
+
+function renderizarProveedores() {
+    const tbody = document.getElementById('proveedores-table');
+    tbody.innerHTML = '';
+
+    if (proveedores.length === 0) {
+        tbody.innerHTML = `
+            <tr>
+                <td colspan="6" style="text-align: center; padding: 2rem;">
+                    <div style="color: var(--text-gray);">
+                        <i class="fas fa-search" style="font-size: 3rem; margin-bottom: 1rem; opacity: 0.3;"></i>
+                        <p>No se encontraron proveedores</p>
+                    </div>
+                </td>
+            </tr>
+        `;
+        return;
+    }
+
+    proveedores.forEach(proveedor => {
+        const iniciales = obtenerIniciales(proveedor.nombre_completo);
+        const tr = document.createElement('tr');
+        tr.innerHTML = `
+            <td>
+                <div style="display: flex; align-items: center; gap: var(--space-md);">
+                    <div class="proveedor-avatar">${iniciales}</div>
+                    <div>
+                        <div style="font-weight: 600;">${proveedor.nombre_completo}</div>
+                        ${proveedor.razon_social ? `<div style="font-size: 0.875rem; color: var(--text-gray);">Empresa: ${proveedor.razon_social}</div>` : ''}
+                    </div>
+                </div>
+            </td>
+            <td>${proveedor.nit}</td>
+            <td>
+                <div><i class="fas fa-phone"></i> ${proveedor.telefono || '-'}</div>
+                <div style="font-size: 0.875rem; color: var(--text-gray);"><i class="fas fa-envelope"></i> ${proveedor.email || '-'}</div>
+            </td>
+            <td>
+                <span class="badge badge-${proveedor.tipo_proveedor.toLowerCase()}">${proveedor.tipo_proveedor}</span>
+            </td>
+            <td>
+                <span class="badge badge-${proveedor.estado.toLowerCase()}">${proveedor.estado}</span>
+            </td>
+            <td>
+                <div style="display: flex; gap: 0.3rem; flex-wrap: wrap;">
+                    <button class="btn btn-info btn-sm" onclick="verProveedor(${proveedor.id})" title="Ver">
+                        <i class="fas fa-eye"></i>
+                    </button>
+                    ${proveedor.estado === 'ACTIVO' ? `
+                        <button class="btn btn-secondary btn-sm" onclick="abrirModalEditar(${proveedor.id})" title="Editar">
+                            <i class="fas fa-edit"></i>
+                        </button>
+                        <button class="btn btn-danger btn-sm" onclick="eliminarProveedor(${proveedor.id})" title="Desactivar">
+                            <i class="fas fa-trash"></i>
+                        </button>
+                    ` : `
+                        <button class="btn btn-primary btn-sm" onclick="activarProveedor(${proveedor.id})" title="Activar">
+                            <i class="fas fa-check"></i> Activar
+                        </button>
+                    `}
+                </div>
+            </td>
+        `;
+        tbody.appendChild(tr);
+    });
+}
+
+async function cargarEstadisticas() {
+    try {
+        const response = await fetch('/auth/api/proveedores/estadisticas/', {
+            headers: getHeaders(),
+            credentials: 'include'
+        });
+
+        if (!response.ok) return;
+
+        const data = await response.json();
+        if (data.success) {
+            const stats = data.estadisticas;
+            document.getElementById('stat-total').textContent = stats.total || 0;
+            document.getElementById('stat-activos').textContent = stats.activos || 0;
+            document.getElementById('stat-inactivos').textContent = stats.inactivos || 0;
+        }
+    } catch (error) {
+        console.error('Error al cargar estadísticas:', error);
+    }
+}
+
+function aplicarFiltros() {
+    const filtros = {
+        busqueda: document.getElementById('busqueda').value,
+        tipo: document.getElementById('filtro-tipo').value,
+        estado: document.getElementById('filtro-estado').value
+    };
+    cargarProveedores(filtros);
+}
+
+function limpiarFiltros() {
+    document.getElementById('busqueda').value = '';
+    document.getElementById('filtro-tipo').value = 'todos';
+    document.getElementById('filtro-estado').value = 'todos';
+    cargarProveedores();
+    mostrarAlerta('Filtros limpiados', 'info');
+}
+
+function exportarProveedores() {
+    if (proveedores.length === 0) {
+        mostrarAlerta('No hay proveedores para exportar', 'danger');
+        return;
+    }
+
+    try {
+        const params = new URLSearchParams();
+
+        const tipo = document.getElementById('filtro-tipo').value;
+        const estado = document.getElementById('filtro-estado').value;
+        const busqueda = document.getElementById('busqueda').value;
+
+        if (tipo && tipo !== 'todos') params.append('tipo', tipo);
+        if (estado && estado !== 'todos') params.append('estado', estado);
+        if (busqueda) params.append('busqueda', busqueda);
+
+        mostrarAlerta('Generando archivo Excel...', 'info');
+
+        const url = `/auth/api/proveedores/exportar-excel/?${params}`;
+        const link = document.createElement('a');
+        link.href = url;
+        link.download = `proveedores_${new Date().toISOString().split('T')[0]}.xlsx`;
+        document.body.appendChild(link);
+        link.click();
+        document.body.removeChild(link);
+
+        setTimeout(() => {
+            mostrarAlerta(`${proveedores.length} proveedores exportados exitosamente`, 'success');
+        }, 500);
+
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error al exportar', 'danger');
+    }
+}
+
+// ============ MODAL CREAR ============
+function abrirModalProveedor() {
+    const modal = document.getElementById('modalCrearProveedor');
+    document.getElementById('formCrearProveedor').reset();
+    limpiarErrores('crear');
+    modal.style.display = 'block';
+}
+
+function cerrarModalCrear() {
+    document.getElementById('modalCrearProveedor').style.display = 'none';
+    limpiarErrores('crear');
+}
+
+async function handleCrearProveedor(e) {
+    e.preventDefault();
+
+    if (!validarFormulario('crear')) {
+        mostrarAlerta('Por favor corrija los errores en el formulario', 'danger');
+        return;
+    }
+
+    const formData = {
+        nombre: document.getElementById('crear-nombre').value.trim(),
+        apellido_paterno: document.getElementById('crear-apellido-paterno').value.trim(),
+        apellido_materno: document.getElementById('crear-apellido-materno').value.trim(),
+        cedula_identidad: document.getElementById('crear-cedula').value.trim(),
+        numero_celular: document.getElementById('crear-celular').value.trim(),
+        correo: document.getElementById('crear-correo').value.trim(),
+        tipo_proveedor: document.getElementById('crear-tipo-proveedor').value,
+        nit: document.getElementById('crear-nit').value.trim(),
+        razon_social: document.getElementById('crear-razon-social').value.trim(),
+        estado: 'ACTIVO' // Siempre ACTIVO al crear
+    };
+
+    await crearProveedor(formData);
+}
+
+async function crearProveedor(formData) {
+    try {
+        const response = await fetch('/auth/api/proveedores/crear/', {
+            method: 'POST',
+            headers: getHeaders(),
+            credentials: 'include',
+            body: JSON.stringify(formData)
+        });
+
+        const data = await response.json();
+
+        if (response.ok && data.success) {
+            mostrarAlerta('Proveedor creado exitosamente', 'success');
+            cerrarModalCrear();
+            await cargarProveedores();
+            cargarEstadisticas();
+        } else {
+            mostrarErroresFormulario(data.detalles || {}, 'crear');
+            mostrarAlerta(data.error || 'Error al crear proveedor', 'danger');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error de conexión al crear proveedor', 'danger');
+    }
+}
+
+// ============ MODAL EDITAR ============
+function abrirModalEditar(proveedorId) {
+    const modal = document.getElementById('modalEditarProveedor');
+    document.getElementById('formEditarProveedor').reset();
+    limpiarErrores('editar');
+    proveedorEditando = proveedorId;
+    cargarDatosProveedor(proveedorId);
+    modal.style.display = 'block';
+}
+
+function cerrarModalEditar() {
+    document.getElementById('modalEditarProveedor').style.display = 'none';
+    proveedorEditando = null;
+    limpiarErrores('editar');
+}
+
+async function cargarDatosProveedor(proveedorId) {
+    try {
+        const response = await fetch(`/auth/api/proveedores/${proveedorId}/`, {
+            headers: getHeaders(),
+            credentials: 'include'
+        });
+
+        if (!response.ok) throw new Error('Error al cargar proveedor');
+
+        const data = await response.json();
+        const proveedor = data.proveedor;
+
+        // Dividir nombre completo
+        const nombres = proveedor.nombre_completo.split(' ');
+        document.getElementById('editar-nombre').value = nombres[0] || '';
+        document.getElementById('editar-apellido-paterno').value = nombres[1] || '';
+        document.getElementById('editar-apellido-materno').value = nombres.slice(2).join(' ') || '';
+
+        document.getElementById('editar-cedula').value = proveedor.cedula || '';
+        document.getElementById('editar-celular').value = proveedor.telefono || '';
+        document.getElementById('editar-correo').value = proveedor.email || '';
+        document.getElementById('editar-tipo-proveedor').value = proveedor.tipo_proveedor || '';
+        document.getElementById('editar-nit').value = proveedor.nit || '';
+        document.getElementById('editar-razon-social').value = proveedor.razon_social || '';
+        document.getElementById('editar-estado').value = proveedor.estado || 'ACTIVO';
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error al cargar datos del proveedor', 'danger');
+    }
+}
+
+async function handleEditarProveedor(e) {
+    e.preventDefault();
+
+    if (!validarFormulario('editar')) {
+        mostrarAlerta('Por favor corrija los errores en el formulario', 'danger');
+        return;
+    }
+
+    const formData = {
+        nombre: document.getElementById('editar-nombre').value.trim(),
+        apellido_paterno: document.getElementById('editar-apellido-paterno').value.trim(),
+        apellido_materno: document.getElementById('editar-apellido-materno').value.trim(),
+        cedula_identidad: document.getElementById('editar-cedula').value.trim(),
+        numero_celular: document.getElementById('editar-celular').value.trim(),
+        correo: document.getElementById('editar-correo').value.trim(),
+        tipo_proveedor: document.getElementById('editar-tipo-proveedor').value,
+        nit: document.getElementById('editar-nit').value.trim(),
+        razon_social: document.getElementById('editar-razon-social').value.trim(),
+        estado: document.getElementById('editar-estado').value
+    };
+
+    await actualizarProveedor(proveedorEditando, formData);
+}
+
+async function actualizarProveedor(proveedorId, formData) {
+    try {
+        const response = await fetch(`/auth/api/proveedores/${proveedorId}/actualizar/`, {
+            method: 'PUT',
+            headers: getHeaders(),
+            credentials: 'include',
+            body: JSON.stringify(formData)
+        });
+
+        const data = await response.json();
+
+        if (response.ok && data.success) {
+            mostrarAlerta('Proveedor actualizado exitosamente', 'success');
+            cerrarModalEditar();
+            await cargarProveedores();
+            cargarEstadisticas();
+        } else {
+            mostrarErroresFormulario(data.detalles || {}, 'editar');
+            mostrarAlerta(data.error || 'Error al actualizar proveedor', 'danger');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error de conexión al actualizar', 'danger');
+    }
+}
+
+async function eliminarProveedor(id) {
+    if (!confirm('¿Está seguro de desactivar este proveedor?\n\nPodrá reactivarlo más tarde si lo necesita.')) return;
+
+    try {
+        const response = await fetch(`/auth/api/proveedores/${id}/eliminar/`, {
+            method: 'DELETE',
+            headers: getHeaders(),
+            credentials: 'include'
+        });
+
+        const data = await response.json();
+
+        if (response.ok && data.success) {
+            mostrarAlerta('Proveedor desactivado exitosamente', 'success');
+            cargarProveedores();
+            cargarEstadisticas();
+        } else {
+            mostrarAlerta(data.error || 'Error al desactivar proveedor', 'danger');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error de conexión', 'danger');
+    }
+}
+
+async function activarProveedor(id) {
+    if (!confirm('¿Activar este proveedor?')) return;
+
+    try {
+        const response = await fetch(`/auth/api/proveedores/${id}/activar/`, {
+            method: 'POST',
+            headers: getHeaders(),
+            credentials: 'include'
+        });
+
+        const data = await response.json();
+
+        if (response.ok && data.success) {
+            mostrarAlerta('Proveedor activado exitosamente', 'success');
+            cargarProveedores();
+            cargarEstadisticas();
+        } else {
+            mostrarAlerta(data.error || 'Error al activar', 'danger');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error de conexión', 'danger');
+    }
+}
+
+function verProveedor(id) {
+    const proveedor = proveedores.find(p => p.id === id);
+    if (!proveedor) return;
+
+    const detalles = `
+        <div style="line-height: 2; padding: 1rem;">
+            <h3 style="color: var(--color-gold-dark); margin-bottom: 1rem;">
+                <i class="fas fa-user"></i> Información Personal
+            </h3>
+            <p><strong>Nombre Completo:</strong> ${proveedor.nombre_completo}</p>
+            <p><strong>CI:</strong> ${proveedor.cedula || '-'}</p>
+            <p><strong>Teléfono:</strong> ${proveedor.telefono || '-'}</p>
+            <p><strong>Email:</strong> ${proveedor.email || '-'}</p>
+
+            <h3 style="color: var(--color-gold-dark); margin: 1.5rem 0 1rem;">
+                <i class="fas fa-building"></i> Información Comercial
+            </h3>
+            <p><strong>NIT:</strong> ${proveedor.nit}</p>
+            ${proveedor.razon_social ? `<p><strong>Razón Social:</strong> ${proveedor.razon_social}</p>` : ''}
+            <p><strong>Tipo:</strong> <span class="badge badge-${proveedor.tipo_proveedor.toLowerCase()}">${proveedor.tipo_proveedor}</span></p>
+            <p><strong>Estado:</strong> <span class="badge badge-${proveedor.estado.toLowerCase()}">${proveedor.estado}</span></p>
+            <p><strong>Fecha Registro:</strong> ${new Date(proveedor.fecha_registro).toLocaleDateString('es-BO')}</p>
+        </div>
+    `;
+
+    mostrarModalDetalles('Detalles del Proveedor', detalles);
+}
+
+// ============ VALIDACIONES ============
+function setupValidacionesFormulario() {
+    // Validaciones para CREAR
+    document.getElementById('crear-cedula')?.addEventListener('blur', function() {
+        validarCedula(this.value, 'crear');
+    });
+
+    document.getElementById('crear-celular')?.addEventListener('input', function() {
+        this.value = this.value.replace(/\D/g, '');
+        if (this.value.length > 8) this.value = this.value.slice(0, 8);
+    });
+
+    document.getElementById('crear-celular')?.addEventListener('blur', function() {
+        validarCelular(this.value, 'crear');
+    });
+
+    document.getElementById('crear-correo')?.addEventListener('blur', function() {
+        validarCorreo(this.value, 'crear');
+    });
+
+    document.getElementById('crear-nit')?.addEventListener('blur', function() {
+        validarNit(this.value, 'crear');
+    });
+
+    // Validaciones para EDITAR
+    document.getElementById('editar-cedula')?.addEventListener('blur', function() {
+        validarCedula(this.value, 'editar');
+    });
+
+    document.getElementById('editar-celular')?.addEventListener('input', function() {
+        this.value = this.value.replace(/\D/g, '');
+        if (this.value.length > 8) this.value = this.value.slice(0, 8);
+    });
+
+    document.getElementById('editar-celular')?.addEventListener('blur', function() {
+        validarCelular(this.value, 'editar');
+    });
+
+    document.getElementById('editar-correo')?.addEventListener('blur', function() {
+        validarCorreo(this.value, 'editar');
+    });
+
+    document.getElementById('editar-nit')?.addEventListener('blur', function() {
+        validarNit(this.value, 'editar');
+    });
+}
+
+function validarFormulario(prefijo) {
+    let valido = true;
+    limpiarErrores(prefijo);
+
+    const nombre = document.getElementById(`${prefijo}-nombre`).value.trim();
+    if (!nombre || nombre.length < 2) {
+        mostrarError('nombre', 'El nombre debe tener al menos 2 caracteres', prefijo);
+        valido = false;
+    }
+
+    const apellidoPaterno = document.getElementById(`${prefijo}-apellido-paterno`).value.trim();
+    if (!apellidoPaterno || apellidoPaterno.length < 2) {
+        mostrarError('apellido-paterno', 'El apellido paterno debe tener al menos 2 caracteres', prefijo);
+        valido = false;
+    }
+
+    const cedula = document.getElementById(`${prefijo}-cedula`).value.trim();
+    if (!validarCedula(cedula, prefijo)) valido = false;
+
+    const celular = document.getElementById(`${prefijo}-celular`).value.trim();
+    if (!validarCelular(celular, prefijo)) valido = false;
+
+    const correo = document.getElementById(`${prefijo}-correo`).value.trim();
+    if (!validarCorreo(correo, prefijo)) valido = false;
+
+    const nit = document.getElementById(`${prefijo}-nit`).value.trim();
+    if (!validarNit(nit, prefijo)) valido = false;
+
+    const tipoProveedor = document.getElementById(`${prefijo}-tipo-proveedor`).value;
+    if (!tipoProveedor) {
+        mostrarError('tipo-proveedor', 'Debe seleccionar un tipo de proveedor', prefijo);
+        valido = false;
+    }
+
+    return valido;
+}
+
+function validarCedula(cedula, prefijo) {
+    if (!cedula) {
+        mostrarError('cedula', 'La cédula es obligatoria', prefijo);
+        return false;
+    }
+
+    const regex = /^\d{7,8}(-[A-Z]{1,3})?$/;
+    if (!regex.test(cedula.toUpperCase())) {
+        mostrarError('cedula', 'Formato inválido. Ejemplos: 1234567, 1234567-LP', prefijo);
+        return false;
+    }
+
+    return true;
+}
+
+function validarCelular(celular, prefijo) {
+    if (!celular) {
+        mostrarError('celular', 'El celular es obligatorio', prefijo);
+        return false;
+    }
+
+    if (celular.length !== 8) {
+        mostrarError('celular', 'Debe tener 8 dígitos', prefijo);
+        return false;
+    }
+
+    if (!celular.startsWith('6') && !celular.startsWith('7')) {
+        mostrarError('celular', 'Debe empezar con 6 o 7', prefijo);
+        return false;
+    }
+
+    return true;
+}
+
+function validarCorreo(correo, prefijo) {
+    if (!correo) {
+        mostrarError('correo', 'El correo es obligatorio', prefijo);
+        return false;
+    }
+
+    const regex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+    if (!regex.test(correo)) {
+        mostrarError('correo', 'Formato de correo inválido', prefijo);
+        return false;
+    }
+
+    return true;
+}
+
+function validarNit(nit, prefijo) {
+    if (!nit) {
+        mostrarError('nit', 'El NIT es obligatorio', prefijo);
+        return false;
+    }
+
+    if (nit.length < 5) {
+        mostrarError('nit', 'El NIT debe tener al menos 5 caracteres', prefijo);
+        return false;
+    }
+
+    return true;
+}
+
+function mostrarError(campo, mensaje, prefijo) {
+    const errorElement = document.getElementById(`error-${prefijo}-${campo}`);
+    const inputElement = document.getElementById(`${prefijo}-${campo}`);
+
+    if (errorElement && inputElement) {
+        errorElement.textContent = mensaje;
+        errorElement.classList.add('show');
+        inputElement.classList.add('error');
+    }
+}
+
+function limpiarErrores(prefijo) {
+    document.querySelectorAll(`#modal${prefijo === 'crear' ? 'Crear' : 'Editar'}Proveedor .error-message`).forEach(el => {
+        el.classList.remove('show');
+        el.textContent = '';
+    });
+    document.querySelectorAll(`#modal${prefijo === 'crear' ? 'Crear' : 'Editar'}Proveedor .form-input`).forEach(el => {
+        el.classList.remove('error');
+    });
+}
+
+function mostrarErroresFormulario(errores, prefijo) {
+    Object.keys(errores).forEach(campo => {
+        const mensajes = errores[campo];
+        if (Array.isArray(mensajes) && mensajes.length > 0) {
+            mostrarError(campo.replace('_', '-'), mensajes[0], prefijo);
+        }
+    });
+}
+
+// ============ UTILIDADES ============
+function debounce(func, wait) {
+    let timeout;
+    return function(...args) {
+        clearTimeout(timeout);
+        timeout = setTimeout(() => func(...args), wait);
+    };
+}
+
+function obtenerIniciales(nombre) {
+    if (!nombre) return '??';
+    const partes = nombre.trim().split(' ');
+    return partes.length >= 2
+        ? (partes[0][0] + partes[1][0]).toUpperCase()
+        : nombre.substring(0, 2).toUpperCase();
+}
+
+function mostrarAlerta(mensaje, tipo) {
+    const colores = {
+        'success': '#00C851',
+        'danger': '#EF4444',
+        'info': '#3B82F6',
+        'warning': '#F59E0B'
+    };
+
+    const iconos = {
+        'success': '✓',
+        'danger': '✕',
+        'info': 'ℹ',
+        'warning': '⚠'
+    };
+
+    const color = colores[tipo] || colores.info;
+    const icono = iconos[tipo] || iconos.info;
+
+    const alerta = document.createElement('div');
+    alerta.innerHTML = `
+        <div style="display: flex; align-items: center; gap: 0.75rem;">
+            <span style="font-size: 1.5rem;">${icono}</span>
+            <span>${mensaje}</span>
+        </div>
+    `;
+    alerta.style.cssText = `
+        position: fixed; top: 20px; right: 20px; z-index: 10000;
+        min-width: 320px; padding: 1rem 1.5rem; border-radius: var(--radius-lg);
+        background: rgba(255, 255, 255, 0.95); backdrop-filter: blur(10px);
+        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.15);
+        border-left: 4px solid ${color};
+        animation: slideIn 0.3s ease-out;
+    `;
+
+    document.body.appendChild(alerta);
+    setTimeout(() => {
+        alerta.style.animation = 'slideOut 0.3s ease-in';
+        setTimeout(() => alerta.remove(), 300);
+    }, 3000);
+}
+
+function mostrarModalDetalles(titulo, contenido) {
+    const modal = document.createElement('div');
+    modal.style.cssText = 'display: block; position: fixed; z-index: 9999; left: 0; top: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.6); backdrop-filter: blur(5px);';
+    modal.innerHTML = `
+        <div style="background: white; margin: 5% auto; padding: 2rem; border-radius: 20px; width: 90%; max-width: 600px; box-shadow: 0 20px 50px rgba(0,0,0,0.3);">
+            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1.5rem;">
+                <h2 style="color: var(--color-green-dark); margin: 0;">${titulo}</h2>
+                <span onclick="this.closest('div').parentElement.remove()" style="cursor: pointer; font-size: 28px; color: #9CA3AF; transition: all 0.3s;">&times;</span>
+            </div>
+            ${contenido}
+            <button onclick="this.closest('div').parentElement.remove()" class="btn btn-primary" style="width: 100%; margin-top: 1rem;">
+                <i class="fas fa-times"></i> Cerrar
+            </button>
+        </div>
+    `;
+    document.body.appendChild(modal);
+}
+
+// Cerrar modales al hacer clic fuera
+window.onclick = function(event) {
+    const modalCrear = document.getElementById('modalCrearProveedor');
+    const modalEditar = document.getElementById('modalEditarProveedor');
+
+    if (event.target === modalCrear) cerrarModalCrear();
+    if (event.target === modalEditar) cerrarModalEditar();
+}
+
+// Estilos de animación
+const style = document.createElement('style');
+style.textContent = `
+    @keyframes slideIn {
+        from {
+            transform: translateX(100%);
+            opacity: 0;
+        }
+        to {
+            transform: translateX(0);
+            opacity: 1;
+        }
+    }
+    @keyframes slideOut {
+        from {
+            transform: translateX(0);
+            opacity: 1;
+        }
+        to {
+            transform: translateX(100%);
+            opacity: 0;
+        }
+    }
+`;
+document.head.appendChild(style);
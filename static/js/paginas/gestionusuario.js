@@ -0,0 +1,600 @@
+// static/js/paginas/gestionusuario.js
+document.addEventListener('DOMContentLoaded', function() {
+    fetch('/components/sidebar/')
+        .then(response => response.text())
+        .then(data => {
+            document.getElementById('sidebar-container').innerHTML = data;
+
+            // Inicializar sidebar después de insertar el HTML
+            setTimeout(function() {
+                if (window.initSidebar) {
+                    window.initSidebar();
+                }
+            }, 100);
+        })
+        .catch(error => console.error('Error al cargar sidebar:', error));
+});
+
+    // ============ VARIABLES GLOBALES ============
+    let usuarios = [];
+    let usuarioEditando = null;
+
+    // ============ CARGAR SIDEBAR ============
+    document.addEventListener('DOMContentLoaded', function() {
+        // Cargar el sidebar
+        fetch('/components/sidebar/')
+            .then(response => {
+                if (!response.ok) throw new Error('Error al cargar sidebar');
+                return response.text();
+            })
+            .then(data => {
+                document.getElementById('sidebar-container').innerHTML = data;
+                const usersLink = document.querySelector('[data-page="users"]');
+                if (usersLink) usersLink.classList.add('active');
+            })
+            .catch(error => console.error('Error al cargar sidebar:', error));
+
+        // Cargar datos iniciales
+        cargarUsuarios();
+        cargarEstadisticas();
+
+        // Animaciones de entrada
+        const cards = document.querySelectorAll('.card, .stat-card');
+        cards.forEach((card, index) => {
+            card.style.opacity = '0';
+            card.style.transform = 'translateY(20px)';
+            setTimeout(() => {
+                card.style.transition = 'all 0.6s cubic-bezier(0.4, 0, 0.2, 1)';
+                card.style.opacity = '1';
+                card.style.transform = 'translateY(0)';
+            }, index * 100);
+        });
+    });
+
+    // ============ HEADERS ============
+    function getHeaders() {
+        return {
+            'Content-Type': 'application/json',
+            'X-Requested-With': 'XMLHttpRequest'
+        };
+    }
+
+    // ============ CARGAR USUARIOS CON FILTROS ============
+    async function cargarUsuarios(filtros = {}) {
+        try {
+            const params = new URLSearchParams();
+
+            // Agregar parámetros solo si tienen valor
+            if (filtros.busqueda && filtros.busqueda.trim()) {
+                params.append('busqueda', filtros.busqueda.trim());
+            }
+            if (filtros.rol && filtros.rol !== 'todos') {
+                params.append('rol', filtros.rol);
+            }
+            if (filtros.estado && filtros.estado !== 'todos') {
+                params.append('estado', filtros.estado);
+            }
+            if (filtros.sucursal && filtros.sucursal !== 'todas') {
+                params.append('sucursal', filtros.sucursal);
+            }
+
+            console.log('Filtros enviados:', Object.fromEntries(params));
+
+            const response = await fetch(`/auth/api/usuarios/?${params}`, {
+                method: 'GET',
+                headers: getHeaders(),
+                credentials: 'include'
+            });
+
+            if (response.status === 401 || response.status === 403) {
+                mostrarAlerta('No tienes permisos. Redirigiendo al login...', 'warning');
+                setTimeout(() => {
+                    window.location.href = '/login/';
+                }, 2000);
+                return;
+            }
+
+            if (!response.ok) {
+                throw new Error(`Error ${response.status}: ${response.statusText}`);
+            }
+
+            const data = await response.json();
+            console.log('Respuesta del servidor:', data);
+
+            if (data.success) {
+                usuarios = data.usuarios || [];
+                renderizarUsuarios();
+            } else {
+                throw new Error(data.error || 'Error al cargar usuarios');
+            }
+        } catch (error) {
+            console.error('Error al cargar usuarios:', error);
+            mostrarAlerta('Error al cargar usuarios: ' + error.message, 'danger');
+        }
+    }
+
+    // ============ RENDERIZAR TABLA DE USUARIOS ============
+    function renderizarUsuarios() {
+        const tbody = document.getElementById('usuarios-table');
+        tbody.innerHTML = '';
+
+        if (usuarios.length === 0) {
+            tbody.innerHTML = `
+                <tr>
+                    <td colspan="7" style="text-align: center; padding: 2rem;">
+                        <div style="color: var(--text-gray);">
+                            <i class="fas fa-search" style="font-size: 3rem; margin-bottom: 1rem; opacity: 0.3;"></i>
+                            <p>No se encontraron usuarios con los criterios de búsqueda</p>
+                        </div>
+                    </td>
+                </tr>
+            `;
+            return;
+        }
+
+        usuarios.forEach(usuario => {
+            const rol = usuario.roles[0] || { nombre: 'Sin rol', sucursal: '-' };
+            const iniciales = obtenerIniciales(usuario.nombre_completo);
+
+            const tr = document.createElement('tr');
+            tr.innerHTML = `
+                <td>
+                    <div style="display: flex; align-items: center; gap: var(--space-md);">
+                        <div class="user-avatar">${iniciales}</div>
+                        <div>
+                            <div style="font-weight: 600;">${usuario.nombre_completo}</div>
+                            <div style="font-size: 0.875rem; color: var(--text-gray);">@${usuario.nombre_usuario}</div>
+                        </div>
+                    </div>
+                </td>
+                <td>${usuario.email || '-'}</td>
+                <td><span class="badge badge-${getBadgeClass(rol.nombre)}">${formatRol(rol.nombre)}</span></td>
+                <td>${rol.sucursal || '-'}</td>
+                <td>${formatFecha(usuario.ultimo_login) || 'Nunca'}</td>
+                <td><span class="badge badge-${usuario.is_active ? 'activo' : 'inactivo'}">${usuario.is_active ? 'Activo' : 'Inactivo'}</span></td>
+                <td>
+                    <div style="display: flex; gap: 0.3rem; flex-wrap: wrap;">
+                        <button class="btn btn-info btn-sm" onclick="verUsuario(${usuario.id})" title="Ver detalles">
+                            <i class="fas fa-eye"></i>
+                        </button>
+                        ${usuario.is_active ? `
+                            <button class="btn btn-secondary btn-sm" onclick="editarUsuario(${usuario.id})" title="Editar">
+                                <i class="fas fa-edit"></i>
+                            </button>
+                            <button class="btn btn-danger btn-sm" onclick="eliminarUsuario(${usuario.id})" title="Desactivar">
+                                <i class="fas fa-trash"></i>
+                            </button>
+                        ` : `
+                            <button class="btn btn-warning btn-sm" onclick="activarUsuario(${usuario.id})" title="Activar">
+                                <i class="fas fa-check"></i>
+                            </button>
+                        `}
+                    </div>
+                </td>
+            `;
+            tbody.appendChild(tr);
+        });
+    }
+
+    // ============ APLICAR FILTROS ============
+    function aplicarFiltros() {
+        const busqueda = document.getElementById('busqueda').value;
+        const rol = document.getElementById('filtro-rol').value;
+        const estado = document.getElementById('filtro-estado').value;
+        const sucursal = document.getElementById('filtro-sucursal').value;
+
+        const filtros = {
+            busqueda: busqueda,
+            rol: rol,
+            estado: estado,
+            sucursal: sucursal
+        };
+
+        cargarUsuarios(filtros);
+    }
+
+    // ============ EVENT LISTENERS PARA FILTROS ============
+    const busquedaInput = document.getElementById('busqueda');
+    if (busquedaInput) {
+        busquedaInput.addEventListener('input', debounce(function(e) {
+            aplicarFiltros();
+        }, 500));
+    }
+
+    const filtroRol = document.getElementById('filtro-rol');
+    if (filtroRol) {
+        filtroRol.addEventListener('change', aplicarFiltros);
+    }
+
+    const filtroEstado = document.getElementById('filtro-estado');
+    if (filtroEstado) {
+        filtroEstado.addEventListener('change', aplicarFiltros);
+    }
+
+    const filtroSucursal = document.getElementById('filtro-sucursal');
+    if (filtroSucursal) {
+        filtroSucursal.addEventListener('change', aplicarFiltros);
+    }
+
+    // ============ CARGAR ESTADÍSTICAS ============
+    async function cargarEstadisticas() {
+        try {
+            const response = await fetch('/auth/api/usuarios/estadisticas/', {
+                method: 'GET',
+                headers: getHeaders(),
+                credentials: 'include'
+            });
+
+            if (!response.ok) {
+                console.warn('No se pudieron cargar estadísticas');
+                return;
+            }
+
+            const data = await response.json();
+
+            if (data.success) {
+                const stats = data.estadisticas;
+                const statCards = document.querySelectorAll('.stat-card .stat-number');
+                if (statCards[0]) statCards[0].textContent = stats.total || 0;
+                if (statCards[1]) statCards[1].textContent = stats.activos || 0;
+                if (statCards[2]) statCards[2].textContent = stats.administradores || 0;
+                if (statCards[3]) statCards[3].textContent = stats.vendedores || 0;
+            }
+        } catch (error) {
+            console.error('Error al cargar estadísticas:', error);
+        }
+    }
+
+    // ============ MODAL - ABRIR/CERRAR ============
+    function abrirModalUsuario(userId = null) {
+        const modal = document.getElementById('modalUsuario');
+        const titulo = document.getElementById('tituloModal');
+        const form = document.getElementById('formUsuario');
+
+        form.reset();
+        usuarioEditando = userId;
+
+        if (userId) {
+            titulo.textContent = 'Editar Usuario';
+            cargarDatosUsuario(userId);
+            document.getElementById('modal-password').required = false;
+        } else {
+            titulo.textContent = 'Nuevo Usuario';
+            document.getElementById('modal-password').required = true;
+            document.getElementById('modal-usuario').disabled = false;
+        }
+
+        modal.style.display = 'block';
+    }
+
+    function cerrarModalUsuario() {
+        document.getElementById('modalUsuario').style.display = 'none';
+        usuarioEditando = null;
+    }
+
+    // ============ CARGAR DATOS DE USUARIO PARA EDITAR ============
+    async function cargarDatosUsuario(userId) {
+        try {
+            const response = await fetch(`/auth/api/usuarios/${userId}/`, {
+                headers: getHeaders(),
+                credentials: 'include'
+            });
+
+            if (!response.ok) throw new Error('Error al cargar usuario');
+
+            const data = await response.json();
+            const usuario = data.usuario;
+
+            document.getElementById('modal-nombre').value = usuario.nombre || '';
+            document.getElementById('modal-apellido-paterno').value = usuario.apellido_paterno || '';
+            document.getElementById('modal-apellido-materno').value = usuario.apellido_materno || '';
+            document.getElementById('modal-email').value = usuario.correo || '';
+            document.getElementById('modal-celular').value = usuario.numero_celular || '';
+            document.getElementById('modal-usuario').value = usuario.nombre_usuario || '';
+            document.getElementById('modal-usuario').disabled = true;
+            document.getElementById('modal-cedula').value = usuario.cedula_identidad || '';
+
+            if (usuario.roles && usuario.roles.length > 0) {
+                document.getElementById('modal-rol').value = usuario.roles[0].nombre;
+            }
+        } catch (error) {
+            console.error('Error:', error);
+            mostrarAlerta('Error al cargar datos del usuario', 'danger');
+        }
+    }
+
+    // ============ GUARDAR USUARIO (CREAR O ACTUALIZAR) ============
+    document.getElementById('formUsuario').addEventListener('submit', async function(e) {
+        e.preventDefault();
+
+        const formData = {
+            nombre: document.getElementById('modal-nombre').value,
+            apellido_paterno: document.getElementById('modal-apellido-paterno').value,
+            apellido_materno: document.getElementById('modal-apellido-materno').value,
+            correo: document.getElementById('modal-email').value,
+            numero_celular: document.getElementById('modal-celular').value,
+            rol: document.getElementById('modal-rol').value
+        };
+
+        if (usuarioEditando) {
+            const password = document.getElementById('modal-password').value;
+            if (password) formData.password = password;
+            await actualizarUsuario(usuarioEditando, formData);
+        } else {
+            formData.nombre_usuario = document.getElementById('modal-usuario').value;
+            formData.password = document.getElementById('modal-password').value;
+            formData.confirmar_password = formData.password;
+            formData.cedula_identidad = document.getElementById('modal-cedula').value;
+            await crearUsuario(formData);
+        }
+    });
+
+    // ============ CREAR USUARIO ============
+    async function crearUsuario(formData) {
+        try {
+            const response = await fetch('/auth/api/usuarios/crear/', {
+                method: 'POST',
+                headers: getHeaders(),
+                credentials: 'include',
+                body: JSON.stringify(formData)
+            });
+
+            const data = await response.json();
+
+            if (response.ok && data.success) {
+                mostrarAlerta('Usuario creado exitosamente', 'success');
+                cerrarModalUsuario();
+                cargarUsuarios();
+                cargarEstadisticas();
+            } else {
+                const errorMsg = data.error || 'Error al crear usuario';
+                mostrarAlerta(errorMsg, 'danger');
+            }
+        } catch (error) {
+            console.error('Error:', error);
+            mostrarAlerta('Error de conexión al crear usuario', 'danger');
+        }
+    }
+
+    // ============ ACTUALIZAR USUARIO ============
+    async function actualizarUsuario(userId, formData) {
+        try {
+            const response = await fetch(`/auth/api/usuarios/${userId}/actualizar/`, {
+                method: 'PUT',
+                headers: getHeaders(),
+                credentials: 'include',
+                body: JSON.stringify(formData)
+            });
+
+            const data = await response.json();
+
+            if (response.ok && data.success) {
+                mostrarAlerta('Usuario actualizado exitosamente', 'success');
+                cerrarModalUsuario();
+                cargarUsuarios();
+            } else {
+                const errorMsg = data.error || 'Error al actualizar usuario';
+                mostrarAlerta(errorMsg, 'danger');
+            }
+        } catch (error) {
+            console.error('Error:', error);
+            mostrarAlerta('Error de conexión al actualizar usuario', 'danger');
+        }
+    }
+
+    // ============ EDITAR USUARIO ============
+    function editarUsuario(userId) {
+        abrirModalUsuario(userId);
+    }
+
+    // ============ ELIMINAR (DESACTIVAR) USUARIO ============
+    async function eliminarUsuario(userId) {
+        if (!confirm('¿Estás seguro de desactivar este usuario?')) return;
+
+        try {
+            const response = await fetch(`/auth/api/usuarios/${userId}/eliminar/`, {
+                method: 'DELETE',
+                headers: getHeaders(),
+                credentials: 'include'
+            });
+
+            const data = await response.json();
+
+            if (response.ok && data.success) {
+                mostrarAlerta('Usuario desactivado exitosamente', 'success');
+                cargarUsuarios();
+                cargarEstadisticas();
+            } else {
+                mostrarAlerta(data.error || 'Error al desactivar usuario', 'danger');
+            }
+        } catch (error) {
+            console.error('Error:', error);
+            mostrarAlerta('Error de conexión', 'danger');
+        }
+    }
+
+    // ============ ACTIVAR USUARIO ============
+    async function activarUsuario(userId) {
+        if (!confirm('¿Activar este usuario?')) return;
+
+        try {
+            const response = await fetch(`/auth/api/usuarios/${userId}/activar/`, {
+                method: 'POST',
+                headers: getHeaders(),
+                credentials: 'include'
+            });
+
+            const data = await response.json();
+
+            if (response.ok && data.success) {
+                mostrarAlerta('Usuario activado exitosamente', 'success');
+                cargarUsuarios();
+                cargarEstadisticas();
+            } else {
+                mostrarAlerta(data.error || 'Error al activar usuario', 'danger');
+            }
+        } catch (error) {
+            console.error('Error:', error);
+            mostrarAlerta('Error de conexión', 'danger');
+        }
+    }
+
+    // ============ UTILIDADES ============
+    function debounce(func, wait) {
+        let timeout;
+        return function executedFunction(...args) {
+            const later = () => {
+                clearTimeout(timeout);
+                func(...args);
+            };
+            clearTimeout(timeout);
+            timeout = setTimeout(later, wait);
+        };
+    }
+
+    function obtenerIniciales(nombreCompleto) {
+        const partes = nombreCompleto.trim().split(' ');
+        if (partes.length >= 2) {
+            return (partes[0][0] + partes[1][0]).toUpperCase();
+        }
+        return nombreCompleto.substring(0, 2).toUpperCase();
+    }
+
+    function getBadgeClass(rol) {
+        const map = {
+            'ADMINISTRADOR': 'admin',
+            'VENDEDOR_ROYDENT': 'vendedor',
+            'VENDEDOR_MUNDO_MEDICO': 'vendedor',
+            'CLIENTE': 'readonly'
+        };
+        return map[rol] || 'readonly';
+    }
+
+    function formatRol(rol) {
+        const map = {
+            'ADMINISTRADOR': 'Administrador',
+            'VENDEDOR_ROYDENT': 'Vendedor RoyDent',
+            'VENDEDOR_MUNDO_MEDICO': 'Vendedor Mundo Médico',
+            'CLIENTE': 'Cliente'
+        };
+        return map[rol] || rol;
+    }
+
+    function formatFecha(fecha) {
+        if (!fecha) return null;
+        const date = new Date(fecha);
+        const ahora = new Date();
+        const diff = ahora - date;
+        const minutos = Math.floor(diff / 60000);
+        const horas = Math.floor(minutos / 60);
+        const dias = Math.floor(horas / 24);
+
+        if (minutos < 60) return `Hace ${minutos} minutos`;
+        if (horas < 24) return `Hace ${horas} horas`;
+        if (dias < 7) return `Hace ${dias} días`;
+        return date.toLocaleDateString('es-ES');
+    }
+
+    // ============ ALERTAS ============
+    function mostrarAlerta(mensaje, tipo) {
+        const alerta = document.createElement('div');
+        const tipoTexto = tipo === 'success' ? 'Éxito' : tipo === 'warning' ? 'Advertencia' : tipo === 'danger' ? 'Error' : 'Info';
+        const color = tipo === 'success' ? '#00C851' : tipo === 'warning' ? '#FFD700' : tipo === 'danger' ? '#EF4444' : '#00C851';
+
+        alerta.innerHTML = `<strong>${tipoTexto}:</strong> ${mensaje}`;
+        alerta.style.cssText = `
+            position: fixed;
+            top: 20px;
+            right: 20px;
+            z-index: 10000;
+            min-width: 300px;
+            padding: 1rem 1.5rem;
+            border-radius: var(--radius-lg);
+            background: rgba(255, 255, 255, 0.95);
+            backdrop-filter: blur(10px);
+            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.15);
+            border-left: 4px solid ${color};
+            animation: slideIn 0.3s ease;
+        `;
+
+        document.body.appendChild(alerta);
+
+        setTimeout(() => {
+            alerta.style.opacity = '0';
+            alerta.style.transform = 'translateX(100%)';
+            setTimeout(() => alerta.remove(), 300);
+        }, 3000);
+    }
+
+    // ============ CERRAR MODAL AL HACER CLIC FUERA ============
+    window.onclick = function(event) {
+        const modal = document.getElementById('modalUsuario');
+        if (event.target === modal) {
+            cerrarModalUsuario();
+        }
+    }
+
+    console.log('Sistema de Gestión de Usuarios cargado correctamente');
+
+    // ============ VER USUARIO ============
+async function verUsuario(userId) {
+    try {
+        const response = await fetch(`/auth/api/usuarios/${userId}/`, {
+            headers: getHeaders(),
+            credentials: 'include'
+        });
+
+        if (!response.ok) throw new Error('Error al cargar usuario');
+
+        const data = await response.json();
+
+        if (data.success) {
+            const usuario = data.usuario;
+            const roles = usuario.roles ? usuario.roles.map(r => formatRol(r.nombre)).join(', ') : 'Sin rol';
+
+            const detalles = `
+                <div style="line-height: 2; padding: 1rem;">
+                    <p><strong>👤 Nombre completo:</strong> ${usuario.nombre} ${usuario.apellido_paterno} ${usuario.apellido_materno || ''}</p>
+                    <p><strong>🔑 Usuario:</strong> @${usuario.nombre_usuario}</p>
+                    <p><strong>📧 Email:</strong> ${usuario.correo}</p>
+                    <p><strong>🆔 Cédula:</strong> ${usuario.cedula_identidad}</p>
+                    <p><strong>📱 Celular:</strong> ${usuario.numero_celular}</p>
+                    <p><strong>👔 Roles:</strong> ${roles}</p>
+                    <p><strong>📊 Estado:</strong> <span class="badge badge-${usuario.is_active ? 'activo' : 'inactivo'}">${usuario.is_active ? 'Activo' : 'Inactivo'}</span></p>
+                </div>
+            `;
+
+            mostrarModalDetalles('Detalles del Usuario', detalles);
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        mostrarAlerta('Error al cargar detalles', 'danger');
+    }
+}
+
+// ============ MODAL DE DETALLES ============
+function mostrarModalDetalles(titulo, contenido) {
+    const existente = document.getElementById('modalDetallesUsuario');
+    if (existente) existente.remove();
+
+    const modal = document.createElement('div');
+    modal.id = 'modalDetallesUsuario';
+    modal.style.cssText = 'display: block; position: fixed; z-index: 9999; left: 0; top: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.6); backdrop-filter: blur(5px);';
+
+    modal.innerHTML = `
+        <div style="background: white; margin: 5% auto; padding: 2rem; border-radius: 20px; width: 90%; max-width: 600px; box-shadow: 0 20px 50px rgba(0,0,0,0.3); max-height: 80vh; overflow-y: auto; position: relative;">
+            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1.5rem;">
+                <h2 style="color: var(--color-green-dark); margin: 0;">${titulo}</h2>
+                <span onclick="document.getElementById('modalDetallesUsuario').remove()" style="cursor: pointer; font-size: 28px; color: #999;">&times;</span>
+            </div>
+            ${contenido}
+            <button onclick="document.getElementById('modalDetallesUsuario').remove()" class="btn btn-primary" style="width: 100%; margin-top: 1rem;">Cerrar</button>
+        </div>
+    `;
+
+    document.body.appendChild(modal);
+
+    modal.onclick = function(e) {
+        if (e.target === modal) modal.remove();
+    };
+}
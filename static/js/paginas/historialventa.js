@@ -0,0 +1,358 @@
+// static/js/paginas/historialventa.js
+// ============ MANEJO DE LOGOS ============
+function handleLogoError() {
+    document.getElementById('sidebarLogo').style.display = 'none';
+    document.getElementById('defaultLogo').style.display = 'flex';
+}
+
+function handleMobileLogoError() {
+    const mobileLogo = document.getElementById('mobileLogo');
+    mobileLogo.src = '';
+    mobileLogo.alt = 'Sistema Roy';
+    mobileLogo.style.fontFamily = 'Inter, sans-serif';
+    mobileLogo.style.fontWeight = '700';
+    mobileLogo.style.fontSize = '1.2rem';
+    mobileLogo.style.color = 'var(--color-purple)';
+}
+
+// Verificar si las imágenes se cargaron correctamente
+document.addEventListener('DOMContentLoaded', function() {
+    const sidebarLogo = document.getElementById('sidebarLogo');
+    const mobileLogo = document.getElementById('mobileLogo');
+
+    if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+        handleLogoError();
+    }
+
+    if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+        handleMobileLogoError();
+    }
+
+    setTimeout(function() {
+        if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+            handleLogoError();
+        }
+        if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+            handleMobileLogoError();
+        }
+    }, 1000);
+
+    // ============ ANIMACIONES DE ENTRADA ============
+    const cards = document.querySelectorAll('.card, .stat-card');
+    cards.forEach((card, index) => {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(20px)';
+
+        setTimeout(() => {
+            card.style.transition = 'all 0.6s cubic-bezier(0.4, 0, 0.2, 1)';
+            card.style.opacity = '1';
+            card.style.transform = 'translateY(0)';
+        }, index * 100);
+    });
+
+    // ============ FILTROS EN TIEMPO REAL ============
+    const filtros = ['fecha-desde', 'fecha-hasta', 'estado', 'cliente', 'vendedor', 'busqueda'];
+
+    filtros.forEach(filtroId => {
+        const elemento = document.getElementById(filtroId);
+        if (elemento) {
+            elemento.addEventListener('change', filtrarVentas);
+            elemento.addEventListener('input', filtrarVentas);
+        }
+    });
+});
+
+// ============ FUNCIONES DEL SIDEBAR ============
+function toggleSidebar() {
+    const sidebar = document.getElementById('sidebar');
+    const overlay = document.getElementById('sidebar-overlay');
+
+    sidebar.classList.toggle('active');
+    overlay.classList.toggle('active');
+}
+
+// ============ FUNCIONES DE VENTAS ============
+function toggleDetalle(facturaId) {
+    const detalle = document.getElementById('detalle-' + facturaId);
+    if (detalle.style.display === 'none' || detalle.style.display === '') {
+        detalle.style.display = 'table-row';
+        mostrarAlerta('Mostrando detalle de la factura ' + facturaId, 'info');
+    } else {
+        detalle.style.display = 'none';
+    }
+}
+
+function verDetalle(facturaId) {
+    mostrarAlerta('Abriendo vista detallada de la factura ' + facturaId, 'info');
+}
+
+function imprimirFactura(facturaId) {
+    mostrarAlerta('Generando factura para impresión: ' + facturaId, 'success');
+}
+
+function gestionarCobro(facturaId) {
+    mostrarAlerta('Abriendo gestión de cobro para factura: ' + facturaId, 'warning');
+}
+
+function verCancelacion(facturaId) {
+    mostrarAlerta('Mostrando detalles de cancelación: ' + facturaId, 'danger');
+}
+
+// ============ FUNCIÓN PARA CAMBIAR PÁGINA ============
+function cambiarPagina(pagina) {
+    const botones = document.querySelectorAll('.pagination button');
+    botones.forEach(btn => btn.classList.remove('active'));
+
+    if (typeof pagina === 'number' && pagina > 0) {
+        const botonActivo = document.querySelector(`.pagination button:nth-child(${pagina + 1})`);
+        if (botonActivo) {
+            botonActivo.classList.add('active');
+        }
+    }
+
+    mostrarAlerta('Cargando página ' + pagina, 'info');
+    console.log('Cargando página:', pagina);
+}
+
+// ============ FILTROS DE VENTAS ============
+function filtrarVentas() {
+    const busqueda = document.getElementById('busqueda').value.toLowerCase();
+    const estado = document.getElementById('estado').value;
+    const cliente = document.getElementById('cliente').value;
+    const vendedor = document.getElementById('vendedor').value;
+    const fechaDesde = document.getElementById('fecha-desde').value;
+    const fechaHasta = document.getElementById('fecha-hasta').value;
+
+    const filas = document.querySelectorAll('#ventas-table tr:not(.venta-detail)');
+    let ventasMostradas = 0;
+
+    filas.forEach(fila => {
+        const texto = fila.textContent.toLowerCase();
+        let mostrar = true;
+
+        // Filtro de búsqueda
+        if (busqueda && !texto.includes(busqueda)) {
+            mostrar = false;
+        }
+
+        // Filtro de estado
+        if (estado !== 'todos') {
+            const badgeEstado = fila.querySelector('.badge');
+            if (badgeEstado && !badgeEstado.textContent.toLowerCase().includes(estado)) {
+                mostrar = false;
+            }
+        }
+
+        // Filtro de cliente
+        if (cliente !== 'todos') {
+            const clienteTexto = fila.cells[2].textContent.toLowerCase();
+            const clienteMap = {
+                'dr-mendoza': 'carlos mendoza',
+                'dra-garcia': 'ana garcía',
+                'clinica-norte': 'clínica dental norte',
+                'hospital-san-juan': 'hospital san juan'
+            };
+            if (!clienteTexto.includes(clienteMap[cliente] || cliente)) {
+                mostrar = false;
+            }
+        }
+
+        // Filtro de vendedor
+        if (vendedor !== 'todos') {
+            const vendedorTexto = fila.cells[3].textContent.toLowerCase();
+            const vendedorMap = {
+                'juan-perez': 'juan pérez',
+                'maria-lopez': 'maría lópez',
+                'carlos-ruiz': 'carlos ruiz'
+            };
+            if (!vendedorTexto.includes(vendedorMap[vendedor] || vendedor)) {
+                mostrar = false;
+            }
+        }
+
+        fila.style.display = mostrar ? '' : 'none';
+
+        if (mostrar) {
+            ventasMostradas++;
+        }
+
+        // Ocultar detalle si se oculta la fila principal
+        if (!mostrar) {
+            const facturaId = fila.cells[0].textContent.trim();
+            const detalle = document.getElementById('detalle-' + facturaId);
+            if (detalle) {
+                detalle.style.display = 'none';
+            }
+        }
+    });
+
+    // Mostrar mensaje si no hay resultados
+    if (ventasMostradas === 0 && (busqueda || estado !== 'todos' || cliente !== 'todos' || vendedor !== 'todos')) {
+        mostrarAlerta('No se encontraron ventas que coincidan con los filtros aplicados', 'warning');
+    }
+}
+
+// ============ FUNCIÓN PARA MOSTRAR ALERTAS ============
+function mostrarAlerta(mensaje, tipo) {
+    const alerta = document.createElement('div');
+    alerta.className = `alert alert-${tipo}`;
+    alerta.innerHTML = `<strong>${tipo === 'success' ? 'Éxito!' : tipo === 'warning' ? 'Advertencia:' : tipo === 'danger' ? 'Crítico:' : 'Info:'}</strong> ${mensaje}`;
+    alerta.style.position = 'fixed';
+    alerta.style.top = '20px';
+    alerta.style.right = '20px';
+    alerta.style.zIndex = '1000';
+    alerta.style.minWidth = '300px';
+    alerta.style.boxShadow = 'var(--shadow-lg)';
+    alerta.style.padding = 'var(--space-lg)';
+    alerta.style.borderRadius = 'var(--radius-lg)';
+    alerta.style.background = 'rgba(255, 255, 255, 0.95)';
+    alerta.style.backdropFilter = 'blur(10px)';
+    alerta.style.border = '1px solid rgba(255, 255, 255, 0.3)';
+
+    // Agregar colores según el tipo
+    if (tipo === 'success') {
+        alerta.style.borderLeft = '4px solid var(--success)';
+        alerta.style.color = 'var(--success)';
+    } else if (tipo === 'warning') {
+        alerta.style.borderLeft = '4px solid var(--warning)';
+        alerta.style.color = '#D97706';
+    } else if (tipo === 'danger') {
+        alerta.style.borderLeft = '4px solid var(--danger)';
+        alerta.style.color = 'var(--danger)';
+    } else {
+        alerta.style.borderLeft = '4px solid var(--info)';
+        alerta.style.color = 'var(--info)';
+    }
+
+    document.body.appendChild(alerta);
+
+    setTimeout(() => {
+        alerta.style.opacity = '0';
+        alerta.style.transform = 'translateX(100%)';
+        setTimeout(() => {
+            alerta.remove();
+        }, 300);
+    }, 3000);
+}
+
+// ============ FUNCIONES DE EXPORTACIÓN ============
+function exportarExcel() {
+    mostrarAlerta('Generando archivo Excel con el historial de ventas...', 'info');
+    setTimeout(() => {
+        mostrarAlerta('Archivo Excel generado exitosamente', 'success');
+    }, 2000);
+}
+
+function generarReporte() {
+    mostrarAlerta('Creando reporte detallado de ventas...', 'info');
+    setTimeout(() => {
+        mostrarAlerta('Reporte de ventas generado correctamente', 'success');
+    }, 3000);
+}
+
+function nuevaVenta() {
+    mostrarAlerta('Redirigiendo a nueva venta...', 'info');
+    setTimeout(() => {
+        window.location.href = 'nuevaventa.html';
+    }, 1000);
+}
+
+// ============ ACTUALIZACIÓN DE ESTADÍSTICAS ============
+function actualizarEstadisticas() {
+    const stats = [
+        { selector: '.stat-card:nth-child(1) .stat-number', min: 1200, max: 1300, prefix: '', suffix: '' },
+        { selector: '.stat-card:nth-child(2) .stat-number', min: 320000, max: 370000, prefix: 'Bs. ', suffix: '' },
+        { selector: '.stat-card:nth-child(3) .stat-number', min: 80, max: 95, prefix: '', suffix: '' },
+        { selector: '.stat-card:nth-child(4) .stat-number', min: 25000, max: 32000, prefix: 'Bs. ', suffix: '' },
+        { selector: '.stat-card:nth-child(5) .stat-number', min: 10, max: 20, prefix: '', suffix: '' }
+    ];
+
+    stats.forEach(stat => {
+        const elemento = document.querySelector(stat.selector);
+        if (elemento) {
+            const nuevoValor = Math.floor(Math.random() * (stat.max - stat.min + 1)) + stat.min;
+            const valorFormateado = stat.prefix + nuevoValor.toLocaleString() + stat.suffix;
+
+            elemento.style.transform = 'scale(1.1)';
+            elemento.style.transition = 'transform 0.3s ease';
+
+            setTimeout(() => {
+                elemento.textContent = valorFormateado;
+                elemento.style.transform = 'scale(1)';
+            }, 150);
+        }
+    });
+}
+
+// ============ NAVEGACIÓN ============
+function irADashboard() {
+    mostrarAlerta('Redirigiendo al dashboard...', 'info');
+    setTimeout(() => {
+        window.location.href = 'dashboard.html';
+    }, 1000);
+}
+
+function irAProductos() {
+    mostrarAlerta('Abriendo gestión de productos...', 'info');
+    setTimeout(() => {
+        window.location.href = 'agregarproducto.html';
+    }, 1000);
+}
+
+function irAInventario() {
+    mostrarAlerta('Accediendo al inventario...', 'info');
+    setTimeout(() => {
+        window.location.href = 'inventario.html';
+    }, 1000);
+}
+
+function irAReportes() {
+    mostrarAlerta('Abriendo módulo de reportes...', 'info');
+    setTimeout(() => {
+        window.location.href = 'reportesventa.html';
+    }, 1000);
+}
+
+// ============ EVENTOS DE BOTONES ============
+document.addEventListener('click', function(e) {
+    if (e.target.textContent.includes('Exportar Excel')) {
+        e.preventDefault();
+        exportarExcel();
+    }
+    if (e.target.textContent.includes('Generar Reporte')) {
+        e.preventDefault();
+        generarReporte();
+    }
+    if (e.target.textContent.includes('Nueva Venta')) {
+        e.preventDefault();
+        nuevaVenta();
+    }
+});
+
+// Actualizar estadísticas cada 2 minutos
+setInterval(actualizarEstadisticas, 120000);
+
+// ============ FUNCIONALIDAD AVANZADA ============
+function buscarVentaAvanzada() {
+    const busqueda = document.getElementById('busqueda').value;
+    if (busqueda.length > 2) {
+        mostrarAlerta(`Buscando ventas relacionadas con: "${busqueda}"`, 'info');
+        filtrarVentas();
+    }
+}
+
+// Buscar mientras se escribe (debounced)
+let timeoutBusqueda;
+document.getElementById('busqueda').addEventListener('input', function() {
+    clearTimeout(timeoutBusqueda);
+    timeoutBusqueda = setTimeout(buscarVentaAvanzada, 500);
+});
+
+// ============ MANEJO DE ERRORES ============
+window.addEventListener('error', function(e) {
+    console.error('Error en Historial de Ventas:', e.error);
+    mostrarAlerta('Se detectó un error. Por favor recarga la página.', 'danger');
+});
+
+console.log('Sistema de Historial de Ventas - Roy Representaciones iniciado');
+console.log('Funcionalidades: Filtros avanzados, exportación, reportes, gestión de cobros');
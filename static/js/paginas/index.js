@@ -0,0 +1,51 @@
+// static/js/paginas/index.js
+document.addEventListener('DOMContentLoaded', function() {
+    const backgrounds = document.querySelectorAll('.hero-background');
+    let currentIndex = 0;
+
+    function changeBackground() {
+        // Remover clase active de todas las imágenes
+        backgrounds.forEach(bg => bg.classList.remove('active'));
+
+        // Incrementar índice
+        currentIndex = (currentIndex + 1) % backgrounds.length;
+
+        // Agregar clase active a la siguiente imagen
+        backgrounds[currentIndex].classList.add('active');
+    }
+
+    // Cambiar imagen cada 5 segundos
+    setInterval(changeBackground, 5000);
+
+    // Efectos de parallax suave en scroll
+    window.addEventListener('scroll', function() {
+        const scrolled = window.pageYOffset;
+        const heroContent = document.querySelector('.hero-content');
+        if (heroContent) {
+            heroContent.style.transform = `translateY(${scrolled * 0.5}px)`;
+        }
+    });
+
+    // Animaciones de entrada para elementos visibles
+    const observerOptions = {
+        threshold: 0.1,
+        rootMargin: '0px 0px -50px 0px'
+    };
+
+    const observer = new IntersectionObserver(function(entries) {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                entry.target.style.opacity = '1';
+                entry.target.style.transform = 'translateY(0)';
+            }
+        });
+    }, observerOptions);
+
+    // Observar elementos para animaciones
+    document.querySelectorAll('.service-card, .product-preview, .location-main, .banner-image').forEach(el => {
+        el.style.opacity = '0';
+        el.style.transform = 'translateY(30px)';
+        el.style.transition = 'all 0.6s ease-out';
+        observer.observe(el);
+    });
+});
@@ -0,0 +1,383 @@
+// static/js/paginas/inventario.js
+// ============ MANEJO DE LOGOS ============
+function handleLogoError() {
+    document.getElementById('sidebarLogo').style.display = 'none';
+    document.getElementById('defaultLogo').style.display = 'flex';
+}
+
+function handleMobileLogoError() {
+    const mobileLogo = document.getElementById('mobileLogo');
+    mobileLogo.src = '';
+    mobileLogo.alt = 'Sistema Roy';
+    mobileLogo.style.fontFamily = 'Inter, sans-serif';
+    mobileLogo.style.fontWeight = '700';
+    mobileLogo.style.fontSize = '1.2rem';
+    mobileLogo.style.color = 'var(--color-purple)';
+}
+
+// Verificar si las imágenes se cargaron correctamente
+document.addEventListener('DOMContentLoaded', function() {
+    const sidebarLogo = document.getElementById('sidebarLogo');
+    const mobileLogo = document.getElementById('mobileLogo');
+
+    if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+        handleLogoError();
+    }
+
+    if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+        handleMobileLogoError();
+    }
+
+    setTimeout(function() {
+        if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+            handleLogoError();
+        }
+        if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+            handleMobileLogoError();
+        }
+    }, 1000);
+
+    // ============ ANIMACIONES DE ENTRADA ============
+    const cards = document.querySelectorAll('.card, .stat-card');
+    cards.forEach((card, index) => {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(20px)';
+
+        setTimeout(() => {
+            card.style.transition = 'all 0.6s cubic-bezier(0.4, 0, 0.2, 1)';
+            card.style.opacity = '1';
+            card.style.transform = 'translateY(0)';
+        }, index * 100);
+    });
+
+    // ============ CONFIGURAR FILTROS ============
+    const ubicacionSelect = document.getElementById('ubicacion');
+    const estadoSelect = document.getElementById('estado');
+    const stockSelect = document.getElementById('stock');
+    const vencimientoSelect = document.getElementById('vencimiento');
+    const busquedaInput = document.getElementById('busqueda');
+
+    // Event listeners para filtros
+    busquedaInput.addEventListener('input', filtrarTabla);
+    ubicacionSelect.addEventListener('change', filtrarTabla);
+    estadoSelect.addEventListener('change', filtrarTabla);
+    stockSelect.addEventListener('change', filtrarTabla);
+    vencimientoSelect.addEventListener('change', filtrarTabla);
+});
+
+// ============ FUNCIONES DEL SIDEBAR ============
+function toggleSidebar() {
+    const sidebar = document.getElementById('sidebar');
+    const overlay = document.getElementById('sidebar-overlay');
+
+    sidebar.classList.toggle('active');
+    overlay.classList.toggle('active');
+}
+
+// ============ FUNCIÓN PARA FILTRAR TABLA ============
+function filtrarTabla() {
+    const rows = document.querySelectorAll('#inventario-table tr');
+    const busqueda = document.getElementById('busqueda').value.toLowerCase();
+    const ubicacion = document.getElementById('ubicacion').value;
+    const estado = document.getElementById('estado').value;
+    const stock = document.getElementById('stock').value;
+    const vencimiento = document.getElementById('vencimiento').value;
+
+    let productosVisible = 0;
+
+    rows.forEach(row => {
+        const texto = row.textContent.toLowerCase();
+        let mostrar = true;
+
+        // Filtro de búsqueda
+        if (busqueda && !texto.includes(busqueda)) {
+            mostrar = false;
+        }
+
+        // Filtro de ubicación
+        if (ubicacion !== 'todas') {
+            const ubicacionTexto = row.cells[6] ? row.cells[6].textContent.toLowerCase() : '';
+            const ubicacionMap = {
+                'deposito': 'depósito',
+                'roydent': 'roydent',
+                'mundo_medico': 'mundo médico'
+            };
+            if (!ubicacionTexto.includes(ubicacionMap[ubicacion] || ubicacion)) {
+                mostrar = false;
+            }
+        }
+
+        // Filtro de estado del producto
+        if (estado !== 'todos') {
+            const estadoTexto = row.cells[12] ? row.cells[12].textContent.toLowerCase() : '';
+            if (estado === 'activo' && !estadoTexto.includes('disponible')) {
+                mostrar = false;
+            } else if (estado === 'pausa' && !estadoTexto.includes('pausado')) {
+                mostrar = false;
+            }
+        }
+
+        // Filtro de stock
+        if (stock !== 'todos') {
+            const stockTexto = row.cells[12] ? row.cells[12].textContent.toLowerCase() : '';
+            if (stock === 'disponible' && !stockTexto.includes('disponible')) {
+                mostrar = false;
+            } else if (stock === 'stock_bajo' && !stockTexto.includes('stock bajo')) {
+                mostrar = false;
+            } else if (stock === 'agotado' && !stockTexto.includes('agotado')) {
+                mostrar = false;
+            }
+        }
+
+        // Filtro de vencimiento
+        if (vencimiento !== 'todos') {
+            const diasTexto = row.cells[11] ? row.cells[11].textContent : '';
+            if (vencimiento === 'critico' && !diasTexto.includes('days-critical')) {
+                mostrar = false;
+            } else if (vencimiento === 'medio' && !diasTexto.includes('days-warning')) {
+                mostrar = false;
+            } else if (vencimiento === 'seguro' && !diasTexto.includes('days-safe')) {
+                mostrar = false;
+            }
+        }
+
+        row.style.display = mostrar ? '' : 'none';
+
+        if (mostrar) {
+            productosVisible++;
+        }
+    });
+
+    // Mostrar mensaje si no hay resultados
+    if (productosVisible === 0 && busqueda) {
+        mostrarAlerta('No se encontraron productos que coincidan con los filtros aplicados', 'warning');
+    }
+}
+
+// ============ FUNCIONES DE INVENTARIO ============
+function editarProducto(codigo) {
+    mostrarAlerta(`Abriendo editor para el producto ${codigo}`, 'info');
+}
+
+function ajustarStock(codigo) {
+    mostrarAlerta(`Ajustando stock del producto ${codigo}`, 'info');
+}
+
+function gestionarCritico(codigo) {
+    mostrarAlerta(`⚠️ Gestionando producto crítico ${codigo} - Vencimiento próximo`, 'danger');
+}
+
+function ordenarReposicion(codigo) {
+    mostrarAlerta(`Ordenando reposición automática para ${codigo}`, 'success');
+}
+
+function contactarProveedor(codigo) {
+    mostrarAlerta(`Contactando proveedor para el producto ${codigo}`, 'info');
+}
+
+function activarProducto(codigo) {
+    mostrarAlerta(`Activando producto pausado ${codigo}`, 'success');
+}
+
+// ============ FUNCIONES DE ACCIONES RÁPIDAS ============
+function verProductosCriticos() {
+    mostrarAlerta('Mostrando vista detallada de productos con vencimiento crítico', 'warning');
+}
+
+function generarPedidoAutomatico() {
+    mostrarAlerta('Generando pedido automático basado en stock mínimo...', 'info');
+    setTimeout(() => {
+        mostrarAlerta('Pedido automático generado exitosamente', 'success');
+    }, 2000);
+}
+
+function exportarExcel() {
+    mostrarAlerta('Generando archivo Excel del inventario FIFO...', 'info');
+    setTimeout(() => {
+        mostrarAlerta('Archivo Excel exportado exitosamente', 'success');
+    }, 2000);
+}
+
+function nuevoIngreso() {
+    mostrarAlerta('Abriendo formulario de nuevo ingreso de inventario...', 'info');
+}
+
+function reporteFIFO() {
+    mostrarAlerta('Generando reporte completo del sistema FIFO...', 'info');
+    setTimeout(() => {
+        mostrarAlerta('Reporte FIFO generado correctamente', 'success');
+    }, 3000);
+}
+
+function actualizarStock() {
+    mostrarAlerta('Iniciando actualización masiva de stock...', 'info');
+    setTimeout(() => {
+        mostrarAlerta('Stock actualizado exitosamente', 'success');
+    }, 2500);
+}
+
+// ============ FUNCIÓN PARA MOSTRAR ALERTAS ============
+function mostrarAlerta(mensaje, tipo) {
+    const alerta = document.createElement('div');
+    alerta.className = `alert alert-${tipo}`;
+    alerta.innerHTML = `<strong>${tipo === 'success' ? 'Éxito!' : tipo === 'warning' ? 'Advertencia:' : tipo === 'danger' ? 'Crítico:' : 'Info:'}</strong> ${mensaje}`;
+    alerta.style.position = 'fixed';
+    alerta.style.top = '20px';
+    alerta.style.right = '20px';
+    alerta.style.zIndex = '1000';
+    alerta.style.minWidth = '300px';
+    alerta.style.boxShadow = 'var(--shadow-lg)';
+    alerta.style.padding = 'var(--space-lg)';
+    alerta.style.borderRadius = 'var(--radius-lg)';
+    alerta.style.background = 'rgba(255, 255, 255, 0.95)';
+    alerta.style.backdropFilter = 'blur(10px)';
+    alerta.style.border = '1px solid rgba(255, 255, 255, 0.3)';
+
+    // Agregar colores según el tipo
+    if (tipo === 'success') {
+        alerta.style.borderLeft = '4px solid var(--success)';
+        alerta.style.color = 'var(--success)';
+    } else if (tipo === 'warning') {
+        alerta.style.borderLeft = '4px solid var(--warning)';
+        alerta.style.color = '#D97706';
+    } else if (tipo === 'danger') {
+        alerta.style.borderLeft = '4px solid var(--danger)';
+        alerta.style.color = 'var(--danger)';
+    } else {
+        alerta.style.borderLeft = '4px solid var(--info)';
+        alerta.style.color = 'var(--info)';
+    }
+
+    document.body.appendChild(alerta);
+
+    setTimeout(() => {
+        alerta.style.opacity = '0';
+        alerta.style.transform = 'translateX(100%)';
+        setTimeout(() => {
+            alerta.remove();
+        }, 300);
+    }, 3000);
+}
+
+// ============ ACTUALIZACIÓN DE ESTADÍSTICAS ============
+function actualizarEstadisticas() {
+    const stats = [
+        { selector: '.stat-card:nth-child(1) .stat-number', min: 1900, max: 2000, prefix: '', suffix: '' },
+        { selector: '.stat-card:nth-child(2) .stat-number', min: 200, max: 300, prefix: '', suffix: '' },
+        { selector: '.stat-card:nth-child(3) .stat-number', min: 30, max: 50, prefix: '', suffix: '' },
+        { selector: '.stat-card:nth-child(4) .stat-number', min: 10, max: 25, prefix: '', suffix: '' },
+        { selector: '.stat-card:nth-child(5) .stat-number', min: 3, max: 8, prefix: '', suffix: '' }
+    ];
+
+    stats.forEach(stat => {
+        const elemento = document.querySelector(stat.selector);
+        if (elemento) {
+            const nuevoValor = Math.floor(Math.random() * (stat.max - stat.min + 1)) + stat.min;
+            const valorFormateado = stat.prefix + nuevoValor.toLocaleString() + stat.suffix;
+
+            elemento.style.transform = 'scale(1.1)';
+            elemento.style.transition = 'transform 0.3s ease';
+
+            setTimeout(() => {
+                elemento.textContent = valorFormateado;
+                elemento.style.transform = 'scale(1)';
+            }, 150);
+        }
+    });
+}
+
+// ============ NAVEGACIÓN ============
+function irADashboard() {
+    mostrarAlerta('Redirigiendo al dashboard...', 'info');
+    setTimeout(() => {
+        window.location.href = 'dashboard.html';
+    }, 1000);
+}
+
+function irAProductos() {
+    mostrarAlerta('Abriendo gestión de productos...', 'info');
+    setTimeout(() => {
+        window.location.href = 'agregarproducto.html';
+    }, 1000);
+}
+
+function irAVentas() {
+    mostrarAlerta('Accediendo al módulo de ventas...', 'info');
+    setTimeout(() => {
+        window.location.href = 'nuevaventa.html';
+    }, 1000);
+}
+
+function irAReportes() {
+    mostrarAlerta('Abriendo módulo de reportes...', 'info');
+    setTimeout(() => {
+        window.location.href = 'reportesventa.html';
+    }, 1000);
+}
+
+// ============ FUNCIONALIDAD AVANZADA ============
+function buscarProductoAvanzado() {
+    const busqueda = document.getElementById('busqueda').value;
+    if (busqueda.length > 2) {
+        mostrarAlerta(`Buscando productos relacionados con: "${busqueda}"`, 'info');
+        filtrarTabla();
+    }
+}
+
+// Buscar mientras se escribe (debounced)
+let timeoutBusqueda;
+document.getElementById('busqueda').addEventListener('input', function() {
+    clearTimeout(timeoutBusqueda);
+    timeoutBusqueda = setTimeout(buscarProductoAvanzado, 500);
+});
+
+// ============ MONITOREO DE VENCIMIENTOS ============
+function verificarVencimientos() {
+    const productosVencimiento = document.querySelectorAll('.days-critical');
+    if (productosVencimiento.length > 0) {
+        mostrarAlerta(`Se detectaron ${productosVencimiento.length} productos con vencimiento crítico`, 'danger');
+    }
+}
+
+// ============ SISTEMA DE NOTIFICACIONES FIFO ============
+function iniciarMonitoreoFIFO() {
+    // Verificar productos críticos cada 5 minutos
+    setInterval(verificarVencimientos, 300000);
+
+    // Actualizar estadísticas cada 2 minutos
+    setInterval(actualizarEstadisticas, 120000);
+
+    mostrarAlerta('Sistema de monitoreo FIFO iniciado correctamente', 'success');
+}
+
+// ============ MANEJO DE ERRORES ============
+window.addEventListener('error', function(e) {
+    console.error('Error en Gestión de Inventario FIFO:', e.error);
+    mostrarAlerta('Se detectó un error. Por favor recarga la página.', 'danger');
+});
+
+// ============ EVENTOS DE BOTONES ============
+document.addEventListener('click', function(e) {
+    if (e.target.textContent.includes('Ver Productos Críticos')) {
+        e.preventDefault();
+        verProductosCriticos();
+    }
+    if (e.target.textContent.includes('Generar Pedido Automático')) {
+        e.preventDefault();
+        generarPedidoAutomatico();
+    }
+    if (e.target.textContent.includes('Exportar Excel')) {
+        e.preventDefault();
+        exportarExcel();
+    }
+    if (e.target.textContent.includes('Nuevo Ingreso')) {
+        e.preventDefault();
+        nuevoIngreso();
+    }
+});
+
+// Inicializar sistema al cargar la página
+setTimeout(iniciarMonitoreoFIFO, 2000);
+
+console.log('Sistema de Gestión de Inventario FIFO - Roy Representaciones iniciado');
+console.log('Funcionalidades: Control FIFO, alertas de vencimiento, gestión automática de stock');
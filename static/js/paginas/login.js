@@ -0,0 +1,140 @@
+// static/js/paginas/login.js
+function handleImageError() {
+    document.getElementById('customLogo').style.display = 'none';
+    document.getElementById('defaultLogo').style.display = 'flex';
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    const customImage = document.getElementById('customLogo');
+
+    if (customImage && (customImage.complete && customImage.naturalHeight === 0)) {
+        handleImageError();
+    }
+
+    // Funcionalidad para mostrar/ocultar contraseña
+    const togglePassword = document.getElementById('togglePassword');
+    const password = document.getElementById('password');
+
+    togglePassword.addEventListener('click', function() {
+        const type = password.getAttribute('type') === 'password' ? 'text' : 'password';
+        password.setAttribute('type', type);
+        this.classList.toggle('fa-eye');
+        this.classList.toggle('fa-eye-slash');
+    });
+
+    // Manejar el envío del formulario
+    const loginForm = document.getElementById('loginForm');
+
+    loginForm.addEventListener('submit', async function(e) {
+        e.preventDefault();
+
+        const username = document.getElementById('username').value.trim();
+        const password = document.getElementById('password').value;
+
+        if (!username || !password) {
+            mostrarError('Por favor completa todos los campos');
+            return;
+        }
+
+        try {
+            mostrarCargando(true);
+            ocultarMensajes();
+
+            console.log('Intentando login con:', username);
+
+            const response = await fetch('/auth/api/login/', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                credentials: 'include', // ← CRÍTICO: Incluir cookies
+                body: JSON.stringify({
+                    nombre_usuario: username,
+                    password: password
+                })
+            });
+
+            const data = await response.json();
+            console.log('Respuesta del servidor:', data);
+
+            if (response.ok && data.access && data.refresh) {
+                // Guardar tokens (para APIs futuras)
+                localStorage.setItem('access_token', data.access);
+                localStorage.setItem('refresh_token', data.refresh);
+                localStorage.setItem('usuario_info', JSON.stringify(data.usuario));
+
+                mostrarExito('✓ Login exitoso. Redirigiendo...');
+
+                // Determinar destino según rol
+                const roles = data.usuario.roles;
+                let destino = '/panel-admin/';
+
+                if (roles && roles.length > 0) {
+                    const primerRol = roles[0].nombre;
+                    console.log('Rol del usuario:', primerRol);
+
+                    switch (primerRol) {
+                        case 'ADMINISTRADOR':
+                            destino = '/panel-admin/';
+                            break;
+                        case 'VENDEDOR_ROYDENT':
+                            destino = '/panel-roydent/';
+                            break;
+                        case 'VENDEDOR_MUNDO_MEDICO':
+                            destino = '/panel-mundomedico/';
+                            break;
+                        case 'CLIENTE':
+                            destino = '/catalogo/';
+                            break;
+                    }
+                }
+
+                console.log('Redirigiendo a:', destino);
+                // Redirección inmediata
+                window.location.href = destino;
+
+            } else {
+                const errorMsg = data.error || data.detalles || 'Credenciales inválidas';
+                mostrarError(errorMsg);
+                console.error('Error de login:', data);
+            }
+        } catch (error) {
+            mostrarError('Error de conexión. Verifica tu internet.');
+            console.error('Error:', error);
+        } finally {
+            mostrarCargando(false);
+        }
+    });
+});
+
+function mostrarCargando(mostrar) {
+    const submitBtn = document.getElementById('submitBtn');
+    if (mostrar) {
+        submitBtn.disabled = true;
+        submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Ingresando...';
+    } else {
+        submitBtn.disabled = false;
+        submitBtn.textContent = 'Ingresar';
+    }
+}
+
+function mostrarError(mensaje) {
+    const errorDiv = document.getElementById('errorMessage');
+    errorDiv.innerHTML = '<i class="fas fa-exclamation-circle"></i> ' + mensaje;
+    errorDiv.style.display = 'block';
+
+    setTimeout(() => {
+        errorDiv.style.display = 'none';
+    }, 5000);
+}
+
+function mostrarExito(mensaje) {
+    const successDiv = document.getElementById('successMessage');
+    successDiv.innerHTML = '<i class="fas fa-check-circle"></i> ' + mensaje;
+    successDiv.style.display = 'block';
+}
+
+function ocultarMensajes() {
+    document.getElementById('errorMessage').style.display = 'none';
+    document.getElementById('successMessage').style.display = 'none';
+}
@@ -0,0 +1,456 @@
+// static/js/paginas/nuevaventa.js
+// ============ MANEJO DE LOGOS ============
+function handleLogoError() {
+    document.getElementById('sidebarLogo').style.display = 'none';
+    document.getElementById('defaultLogo').style.display = 'flex';
+}
+
+function handleMobileLogoError() {
+    const mobileLogo = document.getElementById('mobileLogo');
+    mobileLogo.src = '';
+    mobileLogo.alt = 'Sistema Roy';
+    mobileLogo.style.fontFamily = 'Inter, sans-serif';
+    mobileLogo.style.fontWeight = '700';
+    mobileLogo.style.fontSize = '1.2rem';
+    mobileLogo.style.color = 'var(--color-purple)';
+}
+
+// Verificar si las imágenes se cargaron correctamente
+document.addEventListener('DOMContentLoaded', function() {
+    const sidebarLogo = document.getElementById('sidebarLogo');
+    const mobileLogo = document.getElementById('mobileLogo');
+
+    if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+        handleLogoError();
+    }
+
+    if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+        handleMobileLogoError();
+    }
+
+    setTimeout(function() {
+        if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+            handleLogoError();
+        }
+        if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+            handleMobileLogoError();
+        }
+    }, 1000);
+
+    // ============ ANIMACIONES DE ENTRADA ============
+    const cards = document.querySelectorAll('.card');
+    cards.forEach((card, index) => {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(20px)';
+
+        setTimeout(() => {
+            card.style.transition = 'all 0.6s cubic-bezier(0.4, 0, 0.2, 1)';
+            card.style.opacity = '1';
+            card.style.transform = 'translateY(0)';
+        }, index * 100);
+    });
+});
+
+// ============ FUNCIONES DEL SIDEBAR ============
+function toggleSidebar() {
+    const sidebar = document.getElementById('sidebar');
+    const overlay = document.getElementById('sidebar-overlay');
+
+    sidebar.classList.toggle('active');
+    overlay.classList.toggle('active');
+}
+
+// ============ VARIABLES GLOBALES ============
+let productosVenta = [];
+let subtotalVenta = 0;
+
+// Datos de clientes de ejemplo
+const clientes = {
+    '1': {
+        nombre: 'Dr. Carlos Mendoza',
+        documento: 'CI: 12345678',
+        telefono: '+591 70123456',
+        direccion: 'Av. Arce #1234, La Paz'
+    },
+    '2': {
+        nombre: 'Dra. Ana García',
+        documento: 'CI: 87654321',
+        telefono: '+591 77789456',
+        direccion: 'Calle Murillo #567, La Paz'
+    },
+    '3': {
+        nombre: 'Clínica Dental Norte',
+        documento: 'NIT: 123456789',
+        telefono: '+591 2-2345678',
+        direccion: 'Zona Norte, Calle 15 #890'
+    },
+    '4': {
+        nombre: 'Hospital San Juan',
+        documento: 'NIT: 987654321',
+        telefono: '+591 2-2876543',
+        direccion: 'Av. 6 de Agosto #2345'
+    }
+};
+
+// ============ GESTIÓN DE CLIENTES ============
+document.getElementById('cliente').addEventListener('change', function() {
+    const clienteId = this.value;
+    const clienteInfo = document.getElementById('cliente-info');
+
+    if (clienteId && clientes[clienteId]) {
+        const cliente = clientes[clienteId];
+        document.getElementById('cliente-nombre').textContent = cliente.nombre;
+        document.getElementById('cliente-documento').textContent = cliente.documento;
+        document.getElementById('cliente-telefono').textContent = cliente.telefono;
+        document.getElementById('cliente-direccion').textContent = cliente.direccion;
+        clienteInfo.style.display = 'block';
+        mostrarAlerta(`Cliente "${cliente.nombre}" seleccionado`, 'success');
+    } else if (clienteId === 'nuevo') {
+        mostrarAlerta('Funcionalidad de nuevo cliente próximamente', 'info');
+        clienteInfo.style.display = 'none';
+    } else {
+        clienteInfo.style.display = 'none';
+    }
+});
+
+// ============ GESTIÓN DE PRODUCTOS ============
+function agregarProducto(codigo, nombre, precio, stock) {
+    const productoExistente = productosVenta.find(p => p.codigo === codigo);
+
+    if (productoExistente) {
+        if (productoExistente.cantidad < stock) {
+            productoExistente.cantidad++;
+            productoExistente.total = productoExistente.cantidad * productoExistente.precio;
+            mostrarAlerta(`Cantidad actualizada: ${productoExistente.cantidad} x ${nombre}`, 'info');
+        } else {
+            mostrarAlerta('No hay suficiente stock disponible', 'warning');
+            return;
+        }
+    } else {
+        productosVenta.push({
+            codigo: codigo,
+            nombre: nombre,
+            precio: precio,
+            cantidad: 1,
+            stock: stock,
+            total: precio
+        });
+        mostrarAlerta(`Producto agregado: ${nombre}`, 'success');
+    }
+
+    actualizarResumenVenta();
+}
+
+function removerProducto(codigo) {
+    const producto = productosVenta.find(p => p.codigo === codigo);
+    if (producto) {
+        mostrarAlerta(`Producto removido: ${producto.nombre}`, 'warning');
+        productosVenta = productosVenta.filter(p => p.codigo !== codigo);
+        actualizarResumenVenta();
+    }
+}
+
+function actualizarCantidad(codigo, nuevaCantidad) {
+    const producto = productosVenta.find(p => p.codigo === codigo);
+    if (producto) {
+        if (nuevaCantidad <= producto.stock && nuevaCantidad > 0) {
+            producto.cantidad = nuevaCantidad;
+            producto.total = producto.cantidad * producto.precio;
+            actualizarResumenVenta();
+        } else {
+            mostrarAlerta('Cantidad no válida o insuficiente stock', 'warning');
+            // Restaurar el valor anterior
+            event.target.value = producto.cantidad;
+        }
+    }
+}
+
+// ============ ACTUALIZAR RESUMEN DE VENTA ============
+function actualizarResumenVenta() {
+    const contenedor = document.getElementById('productos-venta');
+
+    if (productosVenta.length === 0) {
+        contenedor.innerHTML = `
+            <p style="color: var(--text-gray); text-align: center; padding: var(--space-lg);">
+                No hay productos seleccionados
+            </p>
+        `;
+    } else {
+        contenedor.innerHTML = productosVenta.map(producto => `
+            <div class="producto-item" style="background: rgba(111, 66, 193, 0.08); color: var(--text-dark); border: 1px solid rgba(111, 66, 193, 0.2); display: flex; justify-content: space-between; align-items: center; margin-bottom: var(--space-sm);">
+                <div>
+                    <div style="font-weight: 600; color: var(--text-dark);">${producto.nombre}</div>
+                    <div style="font-size: 0.875rem; color: var(--text-gray);">${producto.codigo}</div>
+                </div>
+                <div style="display: flex; align-items: center; gap: var(--space-sm);">
+                    <input type="number" value="${producto.cantidad}" min="1" max="${producto.stock}"
+                           class="cantidad-input" style="background: white; color: var(--text-dark); border: 1px solid rgba(111, 66, 193, 0.3);"
+                           onchange="actualizarCantidad('${producto.codigo}', parseInt(this.value))">
+                    <span style="font-weight: 600; color: var(--color-purple);">Bs. ${producto.total.toFixed(2)}</span>
+                    <button onclick="removerProducto('${producto.codigo}')" style="background: rgba(239, 68, 68, 0.1); color: var(--danger); border: 1px solid rgba(239, 68, 68, 0.3); border-radius: var(--radius-sm); padding: 0.25rem 0.5rem; cursor: pointer; transition: all 0.3s ease;">✕</button>
+                </div>
+            </div>
+        `).join('');
+    }
+
+    calcularTotal();
+}
+
+// ============ CÁLCULOS FINANCIEROS ============
+function calcularTotal() {
+    subtotalVenta = productosVenta.reduce((sum, producto) => sum + producto.total, 0);
+    const descuento = parseFloat(document.getElementById('descuento').value) || 0;
+    const total = subtotalVenta * (1 - descuento / 100);
+
+    document.getElementById('subtotal').textContent = `Bs. ${subtotalVenta.toFixed(2)}`;
+    document.getElementById('total').textContent = `Bs. ${total.toFixed(2)}`;
+}
+
+// ============ PROCESAR VENTA ============
+function procesarVenta() {
+    const clienteId = document.getElementById('cliente').value;
+    const tipoVenta = document.getElementById('tipo-venta').value;
+
+    if (!clienteId) {
+        mostrarAlerta('Por favor selecciona un cliente', 'warning');
+        return;
+    }
+
+    if (productosVenta.length === 0) {
+        mostrarAlerta('Por favor agrega al menos un producto', 'warning');
+        return;
+    }
+
+    const descuento = parseFloat(document.getElementById('descuento').value) || 0;
+    const total = subtotalVenta * (1 - descuento / 100);
+    const cliente = clientes[clienteId];
+
+    if (confirm(`¿Confirmar venta por Bs. ${total.toFixed(2)} a ${cliente ? cliente.nombre : 'cliente seleccionado'}?`)) {
+        // Simular procesamiento
+        mostrarAlerta('Procesando venta...', 'info');
+
+        setTimeout(() => {
+            const numeroFactura = 'VT-2024-' + String(Math.floor(Math.random() * 1000) + 1).padStart(3, '0');
+            mostrarAlerta(`Venta procesada exitosamente! Factura ${numeroFactura} generada`, 'success');
+            limpiarVenta();
+        }, 2000);
+    }
+}
+
+// ============ LIMPIAR VENTA ============
+function limpiarVenta() {
+    productosVenta = [];
+    document.getElementById('cliente').value = '';
+    document.getElementById('cliente-info').style.display = 'none';
+    document.getElementById('descuento').value = '0';
+    actualizarResumenVenta();
+    mostrarAlerta('Venta limpiada correctamente', 'info');
+}
+
+// ============ BÚSQUEDA DE PRODUCTOS ============
+document.getElementById('buscar-producto').addEventListener('input', function() {
+    const busqueda = this.value.toLowerCase();
+    const filas = document.querySelectorAll('#productos-disponibles tr');
+
+    filas.forEach(fila => {
+        const texto = fila.textContent.toLowerCase();
+        fila.style.display = texto.includes(busqueda) ? '' : 'none';
+    });
+});
+
+// ============ FUNCIÓN PARA MOSTRAR ALERTAS ============
+function mostrarAlerta(mensaje, tipo) {
+    const alerta = document.createElement('div');
+    alerta.className = `alert alert-${tipo}`;
+    alerta.innerHTML = `<strong>${tipo === 'success' ? 'Éxito!' : tipo === 'warning' ? 'Advertencia:' : tipo === 'danger' ? 'Error:' : 'Info:'}</strong> ${mensaje}`;
+    alerta.style.position = 'fixed';
+    alerta.style.top = '20px';
+    alerta.style.right = '20px';
+    alerta.style.zIndex = '1000';
+    alerta.style.minWidth = '300px';
+    alerta.style.boxShadow = 'var(--shadow-lg)';
+    alerta.style.padding = 'var(--space-lg)';
+    alerta.style.borderRadius = 'var(--radius-lg)';
+    alerta.style.background = 'rgba(255, 255, 255, 0.95)';
+    alerta.style.backdropFilter = 'blur(10px)';
+    alerta.style.border = '1px solid rgba(255, 255, 255, 0.3)';
+
+    // Agregar colores según el tipo
+    if (tipo === 'success') {
+        alerta.style.borderLeft = '4px solid var(--success)';
+        alerta.style.color = '#047857';
+    } else if (tipo === 'warning') {
+        alerta.style.borderLeft = '4px solid var(--warning)';
+        alerta.style.color = '#92400E';
+    } else if (tipo === 'danger') {
+        alerta.style.borderLeft = '4px solid var(--danger)';
+        alerta.style.color = '#991B1B';
+    } else {
+        alerta.style.borderLeft = '4px solid var(--info)';
+        alerta.style.color = '#1E3A8A';
+    }
+
+    document.body.appendChild(alerta);
+
+    setTimeout(() => {
+        alerta.style.opacity = '0';
+        alerta.style.transform = 'translateX(100%)';
+        setTimeout(() => {
+            alerta.remove();
+        }, 300);
+    }, 3000);
+}
+
+// ============ NAVEGACIÓN ============
+function irADashboard() {
+    mostrarAlerta('Redirigiendo al dashboard...', 'info');
+    setTimeout(() => {
+        window.location.href = 'dashboard.html';
+    }, 1000);
+}
+
+function irAHistorialVentas() {
+    mostrarAlerta('Abriendo historial de ventas...', 'info');
+    setTimeout(() => {
+        window.location.href = 'historial-ventas.html';
+    }, 1000);
+}
+
+function irAProductos() {
+    mostrarAlerta('Abriendo gestión de productos...', 'info');
+    setTimeout(() => {
+        window.location.href = 'agregarproducto.html';
+    }, 1000);
+}
+
+function irAInventario() {
+    mostrarAlerta('Accediendo al inventario...', 'info');
+    setTimeout(() => {
+        window.location.href = 'inventario-fifo.html';
+    }, 1000);
+}
+
+// ============ ATAJOS DE TECLADO ============
+document.addEventListener('keydown', function(e) {
+    // Ctrl + Enter para procesar venta
+    if (e.ctrlKey && e.key === 'Enter') {
+        e.preventDefault();
+        procesarVenta();
+    }
+
+    // Escape para limpiar venta
+    if (e.key === 'Escape') {
+        e.preventDefault();
+        if (confirm('¿Deseas limpiar la venta actual?')) {
+            limpiarVenta();
+        }
+    }
+
+    // F1 para buscar producto
+    if (e.key === 'F1') {
+        e.preventDefault();
+        document.getElementById('buscar-producto').focus();
+    }
+});
+
+// ============ VALIDACIONES ADICIONALES ============
+function validarFormulario() {
+    const cliente = document.getElementById('cliente').value;
+    const tipoVenta = document.getElementById('tipo-venta').value;
+
+    if (!cliente) {
+        mostrarAlerta('Debe seleccionar un cliente para continuar', 'warning');
+        return false;
+    }
+
+    if (productosVenta.length === 0) {
+        mostrarAlerta('Debe agregar al menos un producto', 'warning');
+        return false;
+    }
+
+    return true;
+}
+
+// ============ FORMATO DE NÚMEROS ============
+function formatearMoneda(cantidad) {
+    return new Intl.NumberFormat('es-BO', {
+        style: 'currency',
+        currency: 'BOB',
+        minimumFractionDigits: 2
+    }).format(cantidad);
+}
+
+// ============ AUTO-GUARDADO TEMPORAL ============
+function guardarTemporal() {
+    const datosVenta = {
+        cliente: document.getElementById('cliente').value,
+        tipoVenta: document.getElementById('tipo-venta').value,
+        productos: productosVenta,
+        descuento: document.getElementById('descuento').value,
+        timestamp: new Date().toISOString()
+    };
+
+    sessionStorage.setItem('ventaTemporal', JSON.stringify(datosVenta));
+}
+
+function cargarTemporal() {
+    const datos = sessionStorage.getItem('ventaTemporal');
+    if (datos) {
+        try {
+            const datosVenta = JSON.parse(datos);
+
+            // Verificar si los datos no son muy antiguos (1 hora)
+            const timestamp = new Date(datosVenta.timestamp);
+            const ahora = new Date();
+            const diferencia = ahora - timestamp;
+
+            if (diferencia < 3600000) { // 1 hora en milisegundos
+                document.getElementById('cliente').value = datosVenta.cliente || '';
+                document.getElementById('tipo-venta').value = datosVenta.tipoVenta || 'contado';
+                productosVenta = datosVenta.productos || [];
+                document.getElementById('descuento').value = datosVenta.descuento || '0';
+
+                actualizarResumenVenta();
+                mostrarAlerta('Se han restaurado los datos de la venta anterior', 'info');
+            } else {
+                sessionStorage.removeItem('ventaTemporal');
+            }
+        } catch (error) {
+            console.error('Error al cargar datos temporales:', error);
+            sessionStorage.removeItem('ventaTemporal');
+        }
+    }
+}
+
+// Guardar automáticamente cada 30 segundos
+setInterval(guardarTemporal, 30000);
+
+// Cargar datos temporales al iniciar
+setTimeout(cargarTemporal, 1000);
+
+// ============ MANEJO DE ERRORES ============
+window.addEventListener('error', function(e) {
+    console.error('Error en Nueva Venta:', e.error);
+    mostrarAlerta('Se detectó un error. Por favor recarga la página.', 'danger');
+});
+
+// ============ NOTIFICACIONES EN TIEMPO REAL ============
+function verificarStockBajo() {
+    const productosStockBajo = productosVenta.filter(p => p.stock <= 5);
+
+    if (productosStockBajo.length > 0) {
+        const productos = productosStockBajo.map(p => p.nombre).join(', ');
+        mostrarAlerta(`Alerta: Los siguientes productos tienen stock bajo: ${productos}`, 'warning');
+    }
+}
+
+// Verificar stock cada vez que se actualiza el resumen
+const originalActualizarResumen = actualizarResumenVenta;
+actualizarResumenVenta = function() {
+    originalActualizarResumen();
+    verificarStockBajo();
+};
+
+console.log('Sistema de Nueva Venta - Roy Representaciones iniciado');
+console.log('Funcionalidades: Gestión de clientes, productos, cálculos automáticos, control de stock');
+console.log('Atajos: Ctrl+Enter (procesar), Escape (limpiar), F1 (buscar)');
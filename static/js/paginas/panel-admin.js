@@ -0,0 +1,190 @@
+// static/js/paginas/panel-admin.js
+// ============ CARGAR SIDEBAR DESDE ARCHIVO EXTERNO ============
+document.addEventListener('DOMContentLoaded', function() {
+    // Cargar el sidebar
+    fetch('/components/sidebar/')
+        .then(response => response.text())
+        .then(data => {
+            document.getElementById('sidebar-container').innerHTML = data;
+
+            // Marcar la página activa
+            const dashboardLink = document.querySelector('[data-page="dashboard"]');
+            if (dashboardLink) {
+                dashboardLink.classList.add('active');
+            }
+        })
+        .catch(error => console.error('Error al cargar sidebar:', error));
+
+    // Animaciones de entrada
+    const elements = document.querySelectorAll('.card, .stat-card, .alert');
+    elements.forEach((element, index) => {
+        element.style.opacity = '0';
+        element.style.transform = 'translateY(20px)';
+
+        setTimeout(() => {
+            element.style.transition = 'all 0.6s cubic-bezier(0.4, 0, 0.2, 1)';
+            element.style.opacity = '1';
+            element.style.transform = 'translateY(0)';
+        }, index * 100);
+    });
+});
+
+// ============ FUNCIONES DE NAVEGACIÓN ============
+function nuevaVenta() {
+    mostrarAlerta('Redirigiendo a nueva venta...', 'info');
+    setTimeout(() => window.location.href = '/nueva-venta/', 1000);
+}
+
+function nuevoProducto() {
+    mostrarAlerta('Redirigiendo a agregar producto...', 'info');
+    setTimeout(() => window.location.href = '/agregar-producto/', 1000);
+}
+
+function verInventario() {
+    mostrarAlerta('Abriendo inventario general...', 'info');
+    setTimeout(() => window.location.href = '/inventario/', 1000);
+}
+
+function nuevoCliente() {
+    mostrarAlerta('Redirigiendo a registro de cliente...', 'info');
+    setTimeout(() => window.location.href = '/clientes/', 1000);
+}
+
+function generarReporte() {
+    mostrarAlerta('Generando reporte personalizado...', 'info');
+    setTimeout(() => window.location.href = '/reportes/', 1000);
+}
+
+// ============ FUNCIONES DE ESTADÍSTICAS ============
+function verVentas() {
+    mostrarAlerta('Mostrando detalles de ventas del mes...', 'info');
+}
+
+function verProductos() {
+    mostrarAlerta('Mostrando catálogo de productos activos...', 'success');
+}
+
+function verStockBajo() {
+    mostrarAlerta('Mostrando productos con stock bajo...', 'warning');
+}
+
+function verCriticos() {
+    mostrarAlerta('⚠️ Mostrando productos con vencimiento crítico...', 'danger');
+}
+
+function verClientes() {
+    mostrarAlerta('Mostrando base de datos de clientes...', 'info');
+}
+
+function verProveedores() {
+    mostrarAlerta('Mostrando directorio de proveedores...', 'info');
+}
+
+// ============ FUNCIONES DE GRÁFICOS ============
+function abrirGraficoVentas() {
+    mostrarAlerta('Abriendo análisis detallado de ventas...', 'info');
+}
+
+function abrirGraficoProductos() {
+    mostrarAlerta('Mostrando ranking de productos más vendidos...', 'info');
+}
+
+// ============ FUNCIONES DE ACTIVIDAD ============
+function verVenta(numeroVenta) {
+    mostrarAlerta(`Abriendo detalles de la venta #${numeroVenta}...`, 'info');
+}
+
+function verProducto(productoId) {
+    mostrarAlerta(`Mostrando información detallada del producto...`, 'info');
+}
+
+// ============ FUNCIÓN PARA MOSTRAR ALERTAS ============
+function mostrarAlerta(mensaje, tipo) {
+    const alerta = document.createElement('div');
+    alerta.className = `alert alert-${tipo}`;
+    alerta.innerHTML = `<strong>${tipo === 'success' ? 'Éxito!' : tipo === 'warning' ? 'Advertencia:' : tipo === 'danger' ? 'Crítico:' : 'Info:'}</strong> ${mensaje}`;
+    alerta.style.position = 'fixed';
+    alerta.style.top = '20px';
+    alerta.style.right = '20px';
+    alerta.style.zIndex = '10000';
+    alerta.style.minWidth = '300px';
+    alerta.style.boxShadow = '0 8px 25px rgba(255, 215, 0, 0.2)';
+
+    document.body.appendChild(alerta);
+
+    setTimeout(() => {
+        alerta.remove();
+    }, 3000);
+}
+
+// ============ ACTUALIZACIÓN DE DATOS ============
+function actualizarEstadisticas() {
+    const estadisticas = [
+        { selector: '.stats-grid .stat-card:nth-child(1) .stat-number', value: `Bs. ${(Math.random() * 3 + 2).toFixed(1)}M` },
+        { selector: '.stats-grid .stat-card:nth-child(2) .stat-number', value: Math.floor(Math.random() * 100 + 1800) },
+        { selector: '.stats-grid .stat-card:nth-child(3) .stat-number', value: Math.floor(Math.random() * 50 + 200) },
+        { selector: '.stats-grid .stat-card:nth-child(4) .stat-number', value: Math.floor(Math.random() * 10 + 10) },
+        { selector: '.stats-grid .stat-card:nth-child(5) .stat-number', value: Math.floor(Math.random() * 20 + 140) },
+        { selector: '.stats-grid .stat-card:nth-child(6) .stat-number', value: Math.floor(Math.random() * 5 + 22) }
+    ];
+
+    estadisticas.forEach(stat => {
+        const elemento = document.querySelector(stat.selector);
+        if (elemento) {
+            elemento.style.transform = 'scale(1.1)';
+            elemento.style.transition = 'transform 0.3s ease';
+
+            setTimeout(() => {
+                elemento.textContent = stat.value;
+                elemento.style.transform = 'scale(1)';
+            }, 150);
+        }
+    });
+}
+
+// Actualizar estadísticas cada 30 segundos
+setInterval(actualizarEstadisticas, 30000);
+
+// ============ DETECCIÓN DE INACTIVIDAD ============
+let tiempoInactivo = 0;
+const TIEMPO_LIMITE = 300000; // 5 minutos
+
+function resetearTiempo() {
+    tiempoInactivo = 0;
+}
+
+function verificarInactividad() {
+    tiempoInactivo += 1000;
+    if (tiempoInactivo >= TIEMPO_LIMITE) {
+        mostrarAlerta('Sesión inactiva detectada. Considera hacer un backup.', 'warning');
+        tiempoInactivo = 0;
+    }
+}
+
+// Eventos para detectar actividad
+['mousedown', 'mousemove', 'keypress', 'scroll', 'touchstart'].forEach(evento => {
+    document.addEventListener(evento, resetearTiempo, true);
+});
+
+// Verificar inactividad cada segundo
+setInterval(verificarInactividad, 1000);
+
+console.log('Dashboard Sistema Roy Representaciones iniciado');
+console.log('Funciones disponibles: sidebar responsivo, estadísticas en tiempo real, navegación rápida');
+
+document.addEventListener('DOMContentLoaded', function() {
+    // Cargar el sidebar
+    fetch('/components/sidebar/')
+        .then(response => {
+            if (!response.ok) throw new Error('Error al cargar sidebar');
+            return response.text();
+        })
+        .then(data => {
+            document.getElementById('sidebar-container').innerHTML = data;
+
+            // Opcional: Marcar página activa específica
+            const activeLink = document.querySelector('[data-page="TU_PAGINA"]');
+            if (activeLink) activeLink.classList.add('active');
+        })
+        .catch(error => console.error('Error al cargar sidebar:', error));
+});
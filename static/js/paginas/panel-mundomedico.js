@@ -0,0 +1,182 @@
+// static/js/paginas/panel-mundomedico.js
+// ============ MANEJO DE LOGOS ============
+function handleLogoError() {
+    // Ocultar imagen y mostrar logo por defecto en el sidebar
+    document.getElementById('sidebarLogo').style.display = 'none';
+    document.getElementById('defaultLogo').style.display = 'flex';
+}
+
+function handleMobileLogoError() {
+    // Reemplazar logo móvil con texto si falla la carga
+    const mobileLogo = document.getElementById('mobileLogo');
+    mobileLogo.src = '';
+    mobileLogo.alt = 'Mundo Médico';
+    mobileLogo.style.fontFamily = 'Inter, sans-serif';
+    mobileLogo.style.fontWeight = '700';
+    mobileLogo.style.fontSize = '1.2rem';
+    mobileLogo.style.color = 'var(--color-green-dark)';
+}
+
+// Verificar si las imágenes se cargaron correctamente al cargar la página
+document.addEventListener('DOMContentLoaded', function() {
+    const sidebarLogo = document.getElementById('sidebarLogo');
+    const mobileLogo = document.getElementById('mobileLogo');
+
+    // Si la imagen del sidebar no se cargó correctamente
+    if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+        handleLogoError();
+    }
+
+    // Si la imagen móvil no se cargó correctamente
+    if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+        handleMobileLogoError();
+    }
+
+    // También verificar después de un tiempo por si la carga es lenta
+    setTimeout(function() {
+        if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+            handleLogoError();
+        }
+        if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+            handleMobileLogoError();
+        }
+    }, 1000);
+});
+
+// ============ FUNCIONES DEL SIDEBAR ============
+function toggleSidebar() {
+    const sidebar = document.getElementById('sidebar');
+    const overlay = document.getElementById('sidebar-overlay');
+
+    sidebar.classList.toggle('active');
+    overlay.classList.toggle('active');
+}
+
+// ============ FUNCIONES DE PEDIDOS ============
+function realizarPedido() {
+    const producto = document.getElementById('producto-pedido').value;
+    const cantidad = document.getElementById('cantidad-pedido').value;
+    const notas = document.getElementById('notas-pedido').value;
+
+    if (!producto) {
+        mostrarAlerta('Por favor, selecciona un producto', 'warning');
+        return;
+    }
+
+    if (!cantidad || cantidad < 1) {
+        mostrarAlerta('Por favor, ingresa una cantidad válida', 'warning');
+        return;
+    }
+
+    const productoTexto = document.getElementById('producto-pedido').options[document.getElementById('producto-pedido').selectedIndex].text;
+
+    mostrarAlerta(`Pedido realizado: ${cantidad} unidades de ${productoTexto}`, 'success');
+    limpiarFormulario();
+}
+
+function limpiarFormulario() {
+    document.getElementById('producto-pedido').value = '';
+    document.getElementById('cantidad-pedido').value = '1';
+    document.getElementById('notas-pedido').value = '';
+}
+
+function solicitarProducto(nombreProducto) {
+    document.getElementById('producto-pedido').value = '';
+    // Buscar la opción que coincide con el nombre del producto
+    const options = document.getElementById('producto-pedido').options;
+    for (let i = 0; i < options.length; i++) {
+        if (options[i].text.includes(nombreProducto)) {
+            document.getElementById('producto-pedido').value = options[i].value;
+            break;
+        }
+    }
+
+    document.getElementById('cantidad-pedido').value = '10';
+    document.getElementById('notas-pedido').value = `Solicitud de ${nombreProducto} por stock bajo`;
+
+    // Hacer scroll al formulario de pedidos
+    document.querySelector('.section:nth-child(4)').scrollIntoView({ behavior: 'smooth' });
+
+    mostrarAlerta(`Producto ${nombreProducto} seleccionado para pedido`, 'info');
+}
+
+// ============ FUNCIONES DE NAVEGACIÓN ============
+function nuevaVenta() {
+    mostrarAlerta('Redirigiendo a nueva venta...', 'success');
+}
+
+function buscarCliente() {
+    mostrarAlerta('Abriendo búsqueda de clientes...', 'info');
+}
+
+function verCatalogo() {
+    mostrarAlerta('Abriendo catálogo de productos...', 'info');
+}
+
+// ============ FUNCIONES DE ESTADÍSTICAS ============
+function verVentasHoy() {
+    mostrarAlerta('Mostrando ventas del día...', 'info');
+}
+
+function verVentasMes() {
+    mostrarAlerta('Mostrando ventas del mes...', 'info');
+}
+
+function verClientes() {
+    mostrarAlerta('Mostrando clientes atendidos...', 'info');
+}
+
+function verPedidosPendientes() {
+    mostrarAlerta('Mostrando pedidos pendientes...', 'info');
+}
+
+function verProductosBajoStock() {
+    mostrarAlerta('Mostrando productos con stock bajo...', 'info');
+}
+
+function verProductos() {
+    mostrarAlerta('Mostrando productos vendidos...', 'info');
+}
+
+// ============ FUNCIONES DE ACTIVIDAD ============
+function verVenta(numeroVenta) {
+    mostrarAlerta(`Abriendo detalles de la venta #${numeroVenta}...`, 'info');
+}
+
+function verProducto(productoId) {
+    mostrarAlerta(`Mostrando información del producto...`, 'info');
+}
+
+// ============ FUNCIÓN PARA MOSTRAR ALERTAS ============
+function mostrarAlerta(mensaje, tipo) {
+    const alerta = document.createElement('div');
+    alerta.className = `alert alert-${tipo}`;
+    alerta.innerHTML = `<strong>${tipo === 'success' ? 'Éxito!' : tipo === 'warning' ? 'Advertencia:' : 'Info:'}</strong> ${mensaje}`;
+    alerta.style.position = 'fixed';
+    alerta.style.top = '20px';
+    alerta.style.right = '20px';
+    alerta.style.zIndex = '1000';
+    alerta.style.minWidth = '300px';
+    alerta.style.boxShadow = '0 8px 25px rgba(255, 215, 0, 0.2)';
+
+    document.body.appendChild(alerta);
+
+    setTimeout(() => {
+        alerta.remove();
+    }, 3000);
+}
+
+// ============ ANIMACIONES DE ENTRADA ============
+const elements = document.querySelectorAll('.card, .stat-card, .alert');
+elements.forEach((element, index) => {
+    element.style.opacity = '0';
+    element.style.transform = 'translateY(20px)';
+
+    setTimeout(() => {
+        element.style.transition = 'all 0.6s cubic-bezier(0.4, 0, 0.2, 1)';
+        element.style.opacity = '1';
+        element.style.transform = 'translateY(0)';
+    }, index * 100);
+});
+
+console.log('Dashboard Mundo Médico Empleados iniciado');
@@ -0,0 +1,149 @@
+// static/js/paginas/perfilusuario.js
+// ============ MANEJO DE LOGOS ============
+function handleLogoError() {
+    document.getElementById('sidebarLogo').style.display = 'none';
+    document.getElementById('defaultLogo').style.display = 'flex';
+}
+
+function handleMobileLogoError() {
+    const mobileLogo = document.getElementById('mobileLogo');
+    mobileLogo.src = '';
+    mobileLogo.alt = 'Sistema Roy';
+    mobileLogo.style.fontFamily = 'Inter, sans-serif';
+    mobileLogo.style.fontWeight = '700';
+    mobileLogo.style.fontSize = '1.2rem';
+    mobileLogo.style.color = 'var(--color-green-dark)';
+}
+
+// Verificar si las imágenes se cargaron correctamente
+document.addEventListener('DOMContentLoaded', function() {
+    const sidebarLogo = document.getElementById('sidebarLogo');
+    const mobileLogo = document.getElementById('mobileLogo');
+
+    if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+        handleLogoError();
+    }
+
+    if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+        handleMobileLogoError();
+    }
+
+    setTimeout(function() {
+        if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+            handleLogoError();
+        }
+        if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+            handleMobileLogoError();
+        }
+    }, 1000);
+
+    // ============ ANIMACIONES DE ENTRADA ============
+    const cards = document.querySelectorAll('.card, .info-card, .stat-card');
+    cards.forEach((card, index) => {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(20px)';
+
+        setTimeout(() => {
+            card.style.transition = 'all 0.6s cubic-bezier(0.4, 0, 0.2, 1)';
+            card.style.opacity = '1';
+            card.style.transform = 'translateY(0)';
+        }, index * 100);
+    });
+});
+
+// ============ FUNCIONES DEL SIDEBAR ============
+function toggleSidebar() {
+    const sidebar = document.getElementById('sidebar');
+    const overlay = document.getElementById('sidebar-overlay');
+
+    sidebar.classList.toggle('active');
+    overlay.classList.toggle('active');
+}
+
+// ============ FUNCIONES DE PERFIL ============
+function editarFoto() {
+    mostrarAlerta('Funcionalidad para editar foto de perfil próximamente', 'info');
+}
+
+function editarPerfil() {
+    mostrarAlerta('Redirigiendo a editar perfil...', 'info');
+}
+
+function cambiarContrasena() {
+    mostrarAlerta('Redirigiendo a cambiar contraseña...', 'info');
+}
+
+function configurarNotificaciones() {
+    mostrarAlerta('Configurar notificaciones próximamente', 'info');
+}
+
+function configurarPrivacidad() {
+    mostrarAlerta('Configurar privacidad próximamente', 'info');
+}
+
+function descargarDatos() {
+    mostrarAlerta('Descargando datos del usuario...', 'success');
+}
+
+function cerrarSesion() {
+    if (confirm('¿Estás seguro de que deseas cerrar sesión?')) {
+        mostrarAlerta('Cerrando sesión...', 'warning');
+        setTimeout(() => {
+            window.location.href = 'login.html';
+        }, 2000);
+    }
+}
+
+// ============ FUNCIÓN PARA MOSTRAR ALERTAS ============
+function mostrarAlerta(mensaje, tipo) {
+    const alerta = document.createElement('div');
+    alerta.className = `alert alert-${tipo}`;
+    alerta.innerHTML = `<strong>${tipo === 'success' ? 'Éxito!' : tipo === 'warning' ? 'Advertencia:' : tipo === 'danger' ? 'Error:' : 'Info:'}</strong> ${mensaje}`;
+    alerta.style.position = 'fixed';
+    alerta.style.top = '20px';
+    alerta.style.right = '20px';
+    alerta.style.zIndex = '1000';
+    alerta.style.minWidth = '300px';
+    alerta.style.boxShadow = '0 8px 25px rgba(255, 215, 0, 0.2)';
+    alerta.style.padding = 'var(--space-lg)';
+    alerta.style.borderRadius = 'var(--radius-lg)';
+    alerta.style.background = 'rgba(255, 255, 255, 0.95)';
+    alerta.style.backdropFilter = 'blur(10px)';
+    alerta.style.border = '1px solid rgba(255, 215, 0, 0.3)';
+
+    // Agregar colores según el tipo
+    if (tipo === 'success') {
+        alerta.style.borderLeft = '4px solid var(--success)';
+        alerta.style.color = var(--color-green-dark);
+    } else if (tipo === 'warning') {
+        alerta.style.borderLeft = '4px solid var(--warning)';
+        alerta.style.color = '#8B7500';
+    } else if (tipo === 'danger') {
+        alerta.style.borderLeft = '4px solid var(--danger)';
+        alerta.style.color = '#991B1B';
+    } else {
+        alerta.style.borderLeft = '4px solid var(--info)';
+        alerta.style.color = var(--color-green-dark);
+    }
+
+    document.body.appendChild(alerta);
+
+    setTimeout(() => {
+        alerta.style.opacity = '0';
+        alerta.style.transform = 'translateX(100%)';
+        setTimeout(() => {
+            alerta.remove();
+        }, 300);
+    }, 3000);
+}
+
+// ============ NAVEGACIÓN ============
+function irADashboard() {
+    mostrarAlerta('Redirigiendo al dashboard...', 'info');
+    setTimeout(() => {
+        window.location.href = 'dashboard.html';
+    }, 1000);
+}
+
+console.log('Sistema de Perfil de Usuario - Roy Representaciones iniciado');
+console.log('Funcionalidades: Gestión de perfil, estadísticas, configuraciones');
@@ -0,0 +1,558 @@
+// static/js/paginas/registro.js
+function handleImageError() {
+    document.getElementById('customLogo').style.display = 'none';
+    document.getElementById('defaultLogo').style.display = 'flex';
+}
+
+// ============ CARGAR TIPOS DE CLIENTE AL INICIAR ============
+async function cargarTiposClienteRegistro() {
+    try {
+        const response = await fetch('/auth/api/tipos-cliente/');
+
+        if (!response.ok) {
+            console.error('Error al cargar tipos de cliente');
+            return;
+        }
+
+        const data = await response.json();
+
+        if (data.success && data.tipos) {
+            const select = document.getElementById('client-type');
+            select.innerHTML = '<option value="" disabled selected>Selecciona una opción</option>';
+
+            data.tipos.forEach(tipo => {
+                const option = document.createElement('option');
+                option.value = tipo.id;
+                option.textContent = tipo.nombre_tipo;
+                select.appendChild(option);
+            });
+
+            console.log('✅ Tipos de cliente cargados en registro:', data.tipos.length);
+        }
+    } catch (error) {
+        console.error('❌ Error al cargar tipos:', error);
+        mostrarError('Error al cargar tipos de cliente');
+    }
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    const customImage = document.getElementById('customLogo');
+
+    if (customImage && (customImage.complete && customImage.naturalHeight === 0)) {
+        handleImageError();
+    }
+
+    setTimeout(function() {
+        if (customImage && (customImage.complete && customImage.naturalHeight === 0)) {
+            handleImageError();
+        }
+    }, 1000);
+
+    // *** CARGAR TIPOS DE CLIENTE PRIMERO ***
+    cargarTiposClienteRegistro();
+
+    // Funcionalidad para el ojito de contraseña
+    const togglePassword = document.getElementById('togglePassword');
+    const passwordInput = document.getElementById('password');
+    const eyeOpen = togglePassword.querySelector('.eye-open');
+    const eyeClosed = togglePassword.querySelector('.eye-closed');
+
+    togglePassword.addEventListener('click', function() {
+        const type = passwordInput.getAttribute('type') === 'password' ? 'text' : 'password';
+        passwordInput.setAttribute('type', type);
+
+        if (type === 'password') {
+            eyeOpen.style.display = 'block';
+            eyeClosed.style.display = 'none';
+        } else {
+            eyeOpen.style.display = 'none';
+            eyeClosed.style.display = 'block';
+        }
+    });
+
+    // Configurar validaciones ESTRICTAS en tiempo real
+    setupValidacionesEstrictas();
+
+    // Manejar el formulario de registro
+    const registroForm = document.querySelector('form');
+
+    registroForm.addEventListener('submit', async function(e) {
+        e.preventDefault();
+
+        if (!validarFormularioCompleto()) {
+            mostrarError('Por favor corrige todos los errores antes de continuar');
+            return;
+        }
+
+        // Validar que se seleccionó tipo de cliente
+        const tipoCliente = document.getElementById('client-type').value;
+        if (!tipoCliente) {
+            mostrarError('Por favor selecciona un tipo de cliente');
+            return;
+        }
+
+        const formData = {
+            nombre_usuario: document.getElementById('username').value.trim(),
+            password: document.getElementById('password').value,
+            confirmar_password: document.getElementById('password').value,
+            nombre: document.getElementById('first-name').value.trim(),
+            apellido_paterno: document.getElementById('last-name-p').value.trim(),
+            apellido_materno: document.getElementById('last-name-m').value.trim(),
+            cedula_identidad: document.getElementById('ci').value.trim(),
+            numero_celular: document.getElementById('phone-number').value.trim(),
+            correo: document.getElementById('email').value.trim().toLowerCase(),
+            rol: 'CLIENTE',
+            tipo_cliente_id: parseInt(tipoCliente) // *** IMPORTANTE: Enviar como número ***
+        };
+
+        console.log('📤 Enviando datos:', formData);
+
+        try {
+            mostrarCargando(true);
+
+            const response = await fetch('/auth/api/registro/', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'X-Requested-With': 'XMLHttpRequest'
+                },
+                credentials: 'include',
+                body: JSON.stringify(formData)
+            });
+
+            const data = await response.json();
+            console.log('📥 Respuesta del servidor:', data);
+
+            if (response.ok && data.refresh && data.access) {
+                // Guardar tokens
+                localStorage.setItem('access_token', data.access);
+                localStorage.setItem('refresh_token', data.refresh);
+                localStorage.setItem('user_data', JSON.stringify(data.usuario));
+
+                mostrarExito('¡Registro exitoso! Redirigiendo...');
+
+                setTimeout(() => {
+                    window.location.href = '/catalogo/';
+                }, 1500);
+            } else {
+                let errorMessage = 'Error en el registro';
+
+                if (data.detalles) {
+                    const errores = [];
+                    Object.keys(data.detalles).forEach(key => {
+                        if (Array.isArray(data.detalles[key])) {
+                            errores.push(...data.detalles[key]);
+                        } else {
+                            errores.push(data.detalles[key]);
+                        }
+                    });
+                    errorMessage = errores.join('. ');
+                } else if (data.error) {
+                    errorMessage = data.error;
+                }
+
+                mostrarError(errorMessage);
+            }
+        } catch (error) {
+            mostrarError('Error de conexión. Verifica tu internet e inténtalo de nuevo.');
+            console.error('❌ Error:', error);
+        } finally {
+            mostrarCargando(false);
+        }
+    });
+});
+
+function setupValidacionesEstrictas() {
+    // Validación ESTRICTA para nombre de usuario
+    document.getElementById('username').addEventListener('input', function(e) {
+        this.value = this.value.replace(/[^a-zA-Z0-9._-]/g, '');
+        if (this.value.length > 20) {
+            this.value = this.value.substring(0, 20);
+        }
+    });
+
+    document.getElementById('username').addEventListener('blur', function() {
+        validarNombreUsuario(this.value);
+    });
+
+    // Validación ESTRICTA para nombres
+    document.getElementById('first-name').addEventListener('input', function(e) {
+        this.value = this.value.replace(/[^a-zA-ZÀ-ÿ\s]/g, '');
+        if (this.value.length > 50) {
+            this.value = this.value.substring(0, 50);
+        }
+    });
+
+    document.getElementById('first-name').addEventListener('blur', function() {
+        validarNombre(this.value, 'nombre');
+    });
+
+    // Validación ESTRICTA para apellido paterno
+    document.getElementById('last-name-p').addEventListener('input', function(e) {
+        this.value = this.value.replace(/[^a-zA-ZÀ-ÿ\s]/g, '');
+        if (this.value.length > 50) {
+            this.value = this.value.substring(0, 50);
+        }
+    });
+
+    document.getElementById('last-name-p').addEventListener('blur', function() {
+        validarNombre(this.value, 'apellido paterno');
+    });
+
+    // Validación ESTRICTA para apellido materno
+    document.getElementById('last-name-m').addEventListener('input', function(e) {
+        this.value = this.value.replace(/[^a-zA-ZÀ-ÿ\s]/g, '');
+        if (this.value.length > 50) {
+            this.value = this.value.substring(0, 50);
+        }
+    });
+
+    document.getElementById('last-name-m').addEventListener('blur', function() {
+        if (this.value.trim()) {
+            validarNombre(this.value, 'apellido materno');
+        } else {
+            limpiarError('last-name-m');
+        }
+    });
+
+    // Validación ESTRICTA para cédula
+    document.getElementById('ci').addEventListener('input', function(e) {
+        let valor = this.value.replace(/[^0-9\-A-Z]/g, '');
+
+        if (valor.includes('-')) {
+            let partes = valor.split('-');
+            if (partes[0].length > 8) {
+                partes[0] = partes[0].substring(0, 8);
+            }
+            if (partes[1] && partes[1].length > 3) {
+                partes[1] = partes[1].substring(0, 3);
+            }
+            valor = partes[0] + '-' + (partes[1] || '');
+        } else if (valor.length > 8) {
+            valor = valor.substring(0, 8);
+        }
+
+        this.value = valor.toUpperCase();
+    });
+
+    document.getElementById('ci').addEventListener('blur', function() {
+        validarCedula(this.value);
+    });
+
+    // Validación ESTRICTA para celular
+    document.getElementById('phone-number').addEventListener('input', function(e) {
+        this.value = this.value.replace(/[^0-9]/g, '');
+
+        if (this.value.length > 8) {
+            this.value = this.value.substring(0, 8);
+        }
+    });
+
+    document.getElementById('phone-number').addEventListener('blur', function() {
+        validarCelular(this.value);
+    });
+
+    // Validación para contraseña
+    document.getElementById('password').addEventListener('input', function() {
+        validarPassword(this.value);
+    });
+
+    // Validación para correo
+    document.getElementById('email').addEventListener('blur', function() {
+        validarCorreo(this.value);
+    });
+}
+
+function validarNombreUsuario(valor) {
+    const campo = 'username';
+    limpiarError(campo);
+
+    if (!valor || !valor.trim()) {
+        mostrarErrorCampo(campo, 'El nombre de usuario es obligatorio');
+        return false;
+    }
+
+    if (valor.trim().length < 3) {
+        mostrarErrorCampo(campo, 'Debe tener al menos 3 caracteres');
+        return false;
+    }
+
+    if (valor.trim().length > 20) {
+        mostrarErrorCampo(campo, 'No puede tener más de 20 caracteres');
+        return false;
+    }
+
+    if (!/^[a-zA-Z0-9._-]+$/.test(valor.trim())) {
+        mostrarErrorCampo(campo, 'Solo letras, números, puntos, guiones y guiones bajos');
+        return false;
+    }
+
+    mostrarExitoCampo(campo);
+    return true;
+}
+
+function validarPassword(valor) {
+    const campo = 'password';
+    limpiarError(campo);
+
+    if (!valor) {
+        mostrarErrorCampo(campo, 'La contraseña es obligatoria');
+        return false;
+    }
+
+    if (valor.length < 6) {
+        mostrarErrorCampo(campo, 'Debe tener al menos 6 caracteres');
+        return false;
+    }
+
+    if (!/[A-Z]/.test(valor)) {
+        mostrarErrorCampo(campo, 'Debe contener al menos una mayúscula');
+        return false;
+    }
+
+    if (!/[a-z]/.test(valor)) {
+        mostrarErrorCampo(campo, 'Debe contener al menos una minúscula');
+        return false;
+    }
+
+    if (!/\d/.test(valor)) {
+        mostrarErrorCampo(campo, 'Debe contener al menos un número');
+        return false;
+    }
+
+    if (!/[!@#$%^&*(),.?":{}|<>]/.test(valor)) {
+        mostrarErrorCampo(campo, 'Debe contener al menos un carácter especial');
+        return false;
+    }
+
+    mostrarExitoCampo(campo);
+    return true;
+}
+
+function validarNombre(valor, tipoCampo) {
+    const campoId = tipoCampo === 'nombre' ? 'first-name' :
+                tipoCampo === 'apellido paterno' ? 'last-name-p' : 'last-name-m';
+
+    limpiarError(campoId);
+
+    if (!valor || !valor.trim()) {
+        if (tipoCampo !== 'apellido materno') {
+            mostrarErrorCampo(campoId, `El ${tipoCampo} es obligatorio`);
+            return false;
+        }
+        return true;
+    }
+
+    if (valor.trim().length < 2) {
+        mostrarErrorCampo(campoId, `Debe tener al menos 2 caracteres`);
+        return false;
+    }
+
+    if (valor.trim().length > 50) {
+        mostrarErrorCampo(campoId, `No puede tener más de 50 caracteres`);
+        return false;
+    }
+
+    if (!/^[a-zA-ZÀ-ÿ\s]+$/.test(valor.trim())) {
+        mostrarErrorCampo(campoId, `Solo puede contener letras y espacios`);
+        return false;
+    }
+
+    mostrarExitoCampo(campoId);
+    return true;
+}
+
+function validarCedula(valor) {
+    const campo = 'ci';
+    limpiarError(campo);
+
+    if (!valor || !valor.trim()) {
+        mostrarErrorCampo(campo, 'La cédula es obligatoria');
+        return false;
+    }
+
+    const cedulaClean = valor.trim().toUpperCase();
+
+    if (!/^\d{7,8}(-[A-Z]{1,3})?$/.test(cedulaClean)) {
+        mostrarErrorCampo(campo, 'Formato inválido. Ej: 1234567-LP');
+        return false;
+    }
+
+    mostrarExitoCampo(campo);
+    return true;
+}
+
+function validarCelular(valor) {
+    const campo = 'phone-number';
+    limpiarError(campo);
+
+    if (!valor || !valor.trim()) {
+        mostrarErrorCampo(campo, 'El celular es obligatorio');
+        return false;
+    }
+
+    const celularClean = valor.replace(/[^\d]/g, '');
+
+    if (celularClean.length !== 8) {
+        mostrarErrorCampo(campo, 'Debe tener 8 dígitos');
+        return false;
+    }
+
+    if (!celularClean.startsWith('6') && !celularClean.startsWith('7')) {
+        mostrarErrorCampo(campo, 'Debe empezar con 6 o 7');
+        return false;
+    }
+
+    mostrarExitoCampo(campo);
+    return true;
+}
+
+function validarCorreo(valor) {
+    const campo = 'email';
+    limpiarError(campo);
+
+    if (!valor || !valor.trim()) {
+        mostrarErrorCampo(campo, 'El correo es obligatorio');
+        return false;
+    }
+
+    const emailPattern = /^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$/;
+    if (!emailPattern.test(valor.trim())) {
+        mostrarErrorCampo(campo, 'Formato de correo inválido');
+        return false;
+    }
+
+    mostrarExitoCampo(campo);
+    return true;
+}
+
+function validarFormularioCompleto() {
+    let esValido = true;
+
+    esValido &= validarNombreUsuario(document.getElementById('username').value);
+    esValido &= validarPassword(document.getElementById('password').value);
+    esValido &= validarNombre(document.getElementById('first-name').value, 'nombre');
+    esValido &= validarNombre(document.getElementById('last-name-p').value, 'apellido paterno');
+    esValido &= validarCedula(document.getElementById('ci').value);
+    esValido &= validarCelular(document.getElementById('phone-number').value);
+    esValido &= validarCorreo(document.getElementById('email').value);
+
+    return esValido;
+}
+
+function mostrarErrorCampo(campoId, mensaje) {
+    const campo = document.getElementById(campoId);
+    campo.style.borderColor = '#e53e3e';
+    campo.style.boxShadow = '0 0 0 3px rgba(229, 62, 62, 0.3)';
+
+    let errorDiv = campo.parentNode.querySelector('.error-field');
+    if (!errorDiv) {
+        errorDiv = document.createElement('div');
+        errorDiv.className = 'error-field';
+        errorDiv.style.cssText = `
+            color: #e53e3e;
+            font-size: 0.875rem;
+            margin-top: 0.25rem;
+            font-weight: 500;
+        `;
+        campo.parentNode.appendChild(errorDiv);
+    }
+    errorDiv.textContent = mensaje;
+}
+
+function mostrarExitoCampo(campoId) {
+    const campo = document.getElementById(campoId);
+    campo.style.borderColor = '#10B981';
+    campo.style.boxShadow = '0 0 0 3px rgba(16, 185, 129, 0.3)';
+
+    const errorDiv = campo.parentNode.querySelector('.error-field');
+    if (errorDiv) {
+        errorDiv.remove();
+    }
+}
+
+function limpiarError(campoId) {
+    const campo = document.getElementById(campoId);
+    campo.style.borderColor = '';
+    campo.style.boxShadow = '';
+
+    const errorDiv = campo.parentNode.querySelector('.error-field');
+    if (errorDiv) {
+        errorDiv.remove();
+    }
+}
+
+function mostrarCargando(mostrar) {
+    const submitBtn = document.querySelector('button[type="submit"]');
+    if (mostrar) {
+        submitBtn.disabled = true;
+        submitBtn.textContent = 'Registrando...';
+        submitBtn.style.opacity = '0.7';
+    } else {
+        submitBtn.disabled = false;
+        submitBtn.textContent = 'Registrarse';
+        submitBtn.style.opacity = '1';
+    }
+}
+
+function mostrarError(mensaje) {
+    let alertDiv = document.getElementById('alertMessage');
+    if (!alertDiv) {
+        alertDiv = document.createElement('div');
+        alertDiv.id = 'alertMessage';
+        alertDiv.style.cssText = `
+            position: fixed;
+            top: 20px;
+            right: 20px;
+            background: rgba(239, 68, 68, 0.95);
+            color: white;
+            padding: 1rem 1.5rem;
+            border-radius: 10px;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.2);
+            z-index: 10000;
+            max-width: 400px;
+            backdrop-filter: blur(10px);
+            border-left: 4px solid #dc2626;
+        `;
+        document.body.appendChild(alertDiv);
+    }
+
+    alertDiv.textContent = mensaje;
+    alertDiv.style.background = 'rgba(239, 68, 68, 0.95)';
+    alertDiv.style.borderLeftColor = '#dc2626';
+
+    setTimeout(() => {
+        if (alertDiv) alertDiv.remove();
+    }, 5000);
+}
+
+function mostrarExito(mensaje) {
+    let alertDiv = document.getElementById('alertMessage');
+    if (!alertDiv) {
+        alertDiv = document.createElement('div');
+        alertDiv.id = 'alertMessage';
+        alertDiv.style.cssText = `
+            position: fixed;
+            top: 20px;
+            right: 20px;
+            background: rgba(16, 185, 129, 0.95);
+            color: white;
+            padding: 1rem 1.5rem;
+            border-radius: 10px;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.2);
+            z-index: 10000;
+            max-width: 400px;
+            backdrop-filter: blur(10px);
+            border-left: 4px solid #059669;
+        `;
+        document.body.appendChild(alertDiv);
+    }
+
+    alertDiv.textContent = mensaje;
+    alertDiv.style.background = 'rgba(16, 185, 129, 0.95)';
+    alertDiv.style.borderLeftColor = '#059669';
+
+    setTimeout(() => {
+        if (alertDiv) alertDiv.remove();
+    }, 3000);
+}
@@ -0,0 +1,636 @@
+// static/js/paginas/reportesventa.js
+// ============ MANEJO DE LOGOS ============
+function handleLogoError() {
+    // Ocultar imagen y mostrar logo por defecto en el sidebar
+    document.getElementById('sidebarLogo').style.display = 'none';
+    document.getElementById('defaultLogo').style.display = 'flex';
+}
+
+function handleMobileLogoError() {
+    // Reemplazar logo móvil con texto si falla la carga
+    const mobileLogo = document.getElementById('mobileLogo');
+    mobileLogo.src = '';
+    mobileLogo.alt = 'Sistema Roy';
+    mobileLogo.style.fontFamily = 'Inter, sans-serif';
+    mobileLogo.style.fontWeight = '700';
+    mobileLogo.style.fontSize = '1.2rem';
+    mobileLogo.style.color = 'var(--color-purple)';
+}
+
+// Verificar si las imágenes se cargaron correctamente al cargar la página
+document.addEventListener('DOMContentLoaded', function() {
+    const sidebarLogo = document.getElementById('sidebarLogo');
+    const mobileLogo = document.getElementById('mobileLogo');
+
+    // Si la imagen del sidebar no se cargó correctamente
+    if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+        handleLogoError();
+    }
+
+    // Si la imagen móvil no se cargó correctamente
+    if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+        handleMobileLogoError();
+    }
+
+    // También verificar después de un tiempo por si la carga es lenta
+    setTimeout(function() {
+        if (sidebarLogo && (sidebarLogo.complete && sidebarLogo.naturalHeight === 0)) {
+            handleLogoError();
+        }
+        if (mobileLogo && (mobileLogo.complete && mobileLogo.naturalHeight === 0)) {
+            handleMobileLogoError();
+        }
+    }, 1000);
+
+    // Inicializar datos
+    actualizarDatos('mes');
+});
+
+// ============ FUNCIONES DEL SIDEBAR ============
+function toggleSidebar() {
+    const sidebar = document.getElementById('sidebar');
+    const overlay = document.getElementById('sidebar-overlay');
+
+    sidebar.classList.toggle('active');
+    overlay.classList.toggle('active');
+}
+
+// ============ FUNCIONES DE REPORTES ============
+// Datos simulados para diferentes períodos
+const datosVentas = {
+    'hoy': {
+        ventas: 'Bs. 2,850',
+        facturas: 12,
+        ticket: 'Bs. 237',
+        cobro: '100%',
+        clientes: 8
+    },
+    'semana': {
+        ventas: 'Bs. 15,420',
+        facturas: 67,
+        ticket: 'Bs. 230',
+        cobro: '95.8%',
+        clientes: 18
+    },
+    'mes': {
+        ventas: 'Bs. 28,495',
+        facturas: 89,
+        ticket: 'Bs. 320',
+        cobro: '95.2%',
+        clientes: 24
+    },
+    'trimestre': {
+        ventas: 'Bs. 84,750',
+        facturas: 267,
+        ticket: 'Bs. 317',
+        cobro: '96.1%',
+        clientes: 42
+    },
+    'año': {
+        ventas: 'Bs. 342,580',
+        facturas: 1247,
+        ticket: 'Bs. 275',
+        cobro: '94.8%',
+        clientes: 156
+    },
+    'personalizado': {
+        ventas: 'Bs. 45,680',
+        facturas: 134,
+        ticket: 'Bs. 341',
+        cobro: '97.3%',
+        clientes: 38
+    }
+};
+
+// Función para cambiar período
+function cambiarPeriodo(periodo) {
+    // Remover clase active de todos los tabs
+    document.querySelectorAll('.filter-tab').forEach(tab => {
+        tab.classList.remove('active');
+    });
+
+    // Agregar clase active al tab seleccionado
+    event.target.classList.add('active');
+
+    // Mostrar/ocultar filtro personalizado
+    const filtroPersonalizado = document.getElementById('filtro-personalizado');
+    if (periodo === 'personalizado') {
+        filtroPersonalizado.style.display = 'block';
+    } else {
+        filtroPersonalizado.style.display = 'none';
+    }
+
+    // Actualizar datos según el período
+    actualizarDatos(periodo);
+}
+
+// Función para aplicar filtros personalizados
+function aplicarFiltrosPersonalizados() {
+    const fechaDesde = document.getElementById('fecha-desde').value;
+    const fechaHasta = document.getElementById('fecha-hasta').value;
+    const sucursal = document.getElementById('sucursal').value;
+    const vendedor = document.getElementById('vendedor').value;
+
+    if (!fechaDesde || !fechaHasta) {
+        alert('⚠️ Por favor selecciona fechas de inicio y fin');
+        return;
+    }
+
+    // Simular aplicación de filtros
+    const elementos = document.querySelectorAll('.kpi-card');
+    elementos.forEach(el => {
+        el.style.transform = 'scale(1.05)';
+        setTimeout(() => el.style.transform = 'scale(1)', 200);
+    });
+
+    // Actualizar con datos personalizados
+    actualizarDatos('personalizado');
+
+    alert(`🔍 Filtros aplicados exitosamente:\n` +
+          `📅 Período: ${fechaDesde} a ${fechaHasta}\n` +
+          `🏢 Sucursal: ${sucursal}\n` +
+          `👤 Vendedor: ${vendedor}\n\n` +
+          `📊 Datos actualizados según criterios seleccionados`);
+}
+
+// Función para resetear filtros
+function resetearFiltros() {
+    document.querySelectorAll('.form-input, .form-select').forEach(input => {
+        if (input.type === 'date') {
+            input.value = '';
+        } else if (input.tagName === 'SELECT') {
+            input.selectedIndex = 0;
+        }
+    });
+
+    // Ocultar filtro personalizado
+    document.getElementById('filtro-personalizado').style.display = 'none';
+
+    // Restaurar período a "Este Mes"
+    document.querySelectorAll('.filter-tab').forEach(tab => {
+        tab.classList.remove('active');
+    });
+    document.querySelector('.filter-tab:nth-child(3)').classList.add('active');
+
+    actualizarDatos('mes');
+    alert('🔄 Filtros reseteados\n📊 Mostrando datos del mes actual');
+}
+
+// Función para actualizar datos según período
+function actualizarDatos(periodo) {
+    if (datosVentas[periodo]) {
+        const datos = datosVentas[periodo];
+
+        // Actualizar KPIs con animación
+        animarKPI('kpi-ventas', datos.ventas);
+        animarKPI('kpi-facturas', datos.facturas);
+        animarKPI('kpi-ticket', datos.ticket);
+        animarKPI('kpi-cobro', datos.cobro);
+        animarKPI('kpi-clientes', datos.clientes);
+
+        // Actualizar timestamp
+        const ahora = new Date();
+        document.getElementById('ultima-actualizacion').textContent =
+            ahora.toLocaleDateString('es-BO') + ' - ' + ahora.toLocaleTimeString('es-BO');
+
+        console.log('Datos actualizados para período:', periodo);
+    }
+}
+
+// Función para animar cambio de KPI
+function animarKPI(elementId, nuevoValor) {
+    const elemento = document.getElementById(elementId);
+    if (elemento) {
+        elemento.style.transform = 'scale(1.1)';
+        elemento.style.color = 'var(--color-green)';
+
+        setTimeout(() => {
+            elemento.textContent = nuevoValor;
+            elemento.style.transform = 'scale(1)';
+            elemento.style.color = 'var(--color-purple)';
+        }, 300);
+    }
+}
+
+// Función para generar reportes
+function generarReporte(tipoReporte) {
+    const reportes = {
+        'ventas-detallado': 'Reporte Detallado de Ventas',
+        'productos-mas-vendidos': 'Top Productos Más Vendidos',
+        'clientes-frecuentes': 'Análisis de Clientes VIP',
+        'tendencias-mensuales': 'Tendencias y Patrones de Venta',
+        'analisis-rentabilidad': 'Análisis de Rentabilidad',
+        'performance-vendedores': 'Performance de Vendedores'
+    };
+
+    // Simular proceso de generación
+    const btnReporte = event.target;
+    const textoOriginal = btnReporte.innerHTML;
+
+    btnReporte.innerHTML = '⏳ Generando...';
+    btnReporte.disabled = true;
+    btnReporte.style.transform = 'scale(0.95)';
+
+    setTimeout(() => {
+        btnReporte.innerHTML = textoOriginal;
+        btnReporte.disabled = false;
+        btnReporte.style.transform = 'scale(1)';
+
+        // Mostrar resultado
+        mostrarReporteGenerado(tipoReporte, reportes[tipoReporte]);
+    }, 2000);
+}
+
+// Función para mostrar reporte generado
+function mostrarReporteGenerado(tipo, nombre) {
+    const fecha = new Date().toLocaleDateString('es-BO');
+    const hora = new Date().toLocaleTimeString('es-BO');
+
+    alert(`✅ ${nombre} generado exitosamente!\n\n` +
+          `📅 Fecha: ${fecha}\n` +
+          `⏰ Hora: ${hora}\n` +
+          `📄 Tipo: ${tipo}\n\n` +
+          `📊 Incluye datos actualizados y gráficos interactivos\n` +
+          `💾 El reporte está listo para descargar o visualizar`);
+}
+
+// Función para exportar reportes
+function exportarReporte(formato) {
+    const formatos = {
+        'excel': {
+            nombre: '📊 Excel (.xlsx)',
+            extension: '.xlsx',
+            mime: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        },
+        'pdf': {
+            nombre: '📄 PDF',
+            extension: '.pdf',
+            mime: 'application/pdf'
+        }
+    };
+
+    const formatoInfo = formatos[formato];
+    const fecha = new Date().toISOString().split('T')[0];
+    const nombreArchivo = `reporte-ventas-${fecha}${formatoInfo.extension}`;
+
+    // Simular descarga
+    const btnExportar = event.target;
+    const textoOriginal = btnExportar.innerHTML;
+
+    btnExportar.innerHTML = '⬇️ Descargando...';
+    btnExportar.disabled = true;
+
+    setTimeout(() => {
+        btnExportar.innerHTML = textoOriginal;
+        btnExportar.disabled = false;
+
+        alert(`💾 Exportando reporte en formato ${formatoInfo.nombre}\n` +
+              `📁 Archivo: ${nombreArchivo}\n` +
+              `📊 Incluye todas las métricas del período seleccionado\n` +
+              `📥 La descarga comenzará automáticamente...`);
+
+        // Simular descarga real
+        simularDescarga(nombreArchivo, formatoInfo.mime);
+    }, 1500);
+}
+
+// Función para simular descarga
+function simularDescarga(nombreArchivo, mimeType) {
+    // En una implementación real, aquí generarías el archivo
+    console.log(`Descargando: ${nombreArchivo} (${mimeType})`);
+
+    // Crear elemento temporal para descarga
+    const elemento = document.createElement('a');
+    elemento.href = '#';
+    elemento.download = nombreArchivo;
+    elemento.style.display = 'none';
+    document.body.appendChild(elemento);
+    elemento.click();
+    document.body.removeChild(elemento);
+}
+
+// Función para enviar reporte por email
+function enviarReporte() {
+    const email = prompt('📧 Ingresa el email de destino:');
+    if (email && validarEmail(email)) {
+        const btnEnviar = event.target;
+        const textoOriginal = btnEnviar.innerHTML;
+
+        btnEnviar.innerHTML = '📤 Enviando...';
+        btnEnviar.disabled = true;
+
+        setTimeout(() => {
+            btnEnviar.innerHTML = textoOriginal;
+            btnEnviar.disabled = false;
+
+            alert(`📤 Reporte enviado exitosamente a: ${email}\n\n` +
+                  `✅ El destinatario recibirá:\n` +
+                  `• Reporte completo en PDF\n` +
+                  `• Resumen ejecutivo\n` +
+                  `• Gráficos y métricas detalladas\n` +
+                  `• Análisis y recomendaciones`);
+        }, 2000);
+    } else if (email) {
+        alert('❌ Email inválido. Por favor ingresa un email válido.');
+    }
+}
+
+// Función para validar email
+function validarEmail(email) {
+    const regex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+    return regex.test(email);
+}
+
+// Función para programar reporte
+function programarReporte() {
+    const opciones = [
+        'Diario - 8:00 AM',
+        'Semanal - Lunes 9:00 AM',
+        'Mensual - Primer día del mes',
+        'Trimestral - Cada 3 meses',
+        'Personalizado'
+    ];
+
+    let mensaje = '⏰ Configurar reporte automático\n\n';
+    mensaje += 'Selecciona una opción:\n';
+    opciones.forEach((opcion, index) => {
+        mensaje += `${index + 1}. ${opcion}\n`;
+    });
+
+    const seleccion = prompt(mensaje + '\nIngresa el número de opción (1-5):');
+
+    if (seleccion && seleccion >= 1 && seleccion <= 5) {
+        const opcionSeleccionada = opciones[seleccion - 1];
+
+        if (seleccion == 5) {
+            const personalizado = prompt('Especifica la frecuencia personalizada\n(Ej: "Cada viernes a las 15:00"):');
+            if (personalizado) {
+                const email = prompt('Email para recibir el reporte:');
+                if (email && validarEmail(email)) {
+                    alert(`✅ Reporte programado exitosamente\n` +
+                          `📅 Frecuencia: ${personalizado}\n` +
+                          `📧 Destinatario: ${email}\n` +
+                          `🔔 Recibirás notificaciones automáticas`);
+                }
+            }
+        } else {
+            const email = prompt('Email para recibir el reporte:');
+            if (email && validarEmail(email)) {
+                alert(`✅ Reporte programado exitosamente\n` +
+                      `📅 Frecuencia: ${opcionSeleccionada}\n` +
+                      `📧 Destinatario: ${email}\n` +
+                      `🔔 Primer envío programado para mañana`);
+            }
+        }
+    }
+}
+
+// Funciones para reportes automáticos
+function editarReporteAuto(tipo) {
+    alert(`✏️ Editando configuración del reporte: ${tipo}\n\n` +
+          `Opciones disponibles:\n` +
+          `• Cambiar frecuencia de envío\n` +
+          `• Modificar lista de destinatarios\n` +
+          `• Ajustar formato de salida\n` +
+          `• Personalizar contenido incluido\n` +
+          `• Configurar filtros automáticos`);
+}
+
+function pausarReporteAuto(tipo) {
+    if (confirm(`⏸️ ¿Pausar reporte automático: ${tipo}?\n\nEl reporte dejará de enviarse automáticamente.`)) {
+        alert(`✅ Reporte ${tipo} pausado exitosamente\n` +
+              `🔔 Podrás reactivarlo cuando desees\n` +
+              `📧 Los destinatarios serán notificados`);
+    }
+}
+
+function activarReporteAuto(tipo) {
+    if (confirm(`▶️ ¿Activar reporte automático: ${tipo}?\n\nSe reanudará el envío según la programación.`)) {
+        alert(`✅ Reporte ${tipo} activado exitosamente\n` +
+              `📧 Se enviará según la programación configurada\n` +
+              `🔔 Próximo envío programado`);
+    }
+}
+
+function nuevoReporteAutomatico() {
+    alert(`➕ Crear Nuevo Reporte Automático\n\n` +
+          `Pasos de configuración:\n` +
+          `1. 📊 Seleccionar tipo de reporte\n` +
+          `2. ⏰ Configurar frecuencia de envío\n` +
+          `3. 👥 Definir lista de destinatarios\n` +
+          `4. 🎨 Personalizar formato y contenido\n` +
+          `5. 🔍 Establecer filtros automáticos\n` +
+          `6. ✅ Confirmar y activar programación`);
+}
+
+// Funciones adicionales para análisis
+function verTendenciasDetalladas() {
+    alert('📈 Análisis de Tendencias Detallado\n\n' +
+          '📊 Métricas identificadas:\n' +
+          '• Crecimiento mensual: +15.3%\n' +
+          '• Mejor día de ventas: Miércoles\n' +
+          '• Hora pico: 14:00-16:00\n' +
+          '• Producto estrella: Guantes Látex\n' +
+          '• Cliente más frecuente: Hospital San Juan\n' +
+          '• Estacionalidad: Alta demanda en Q4\n\n' +
+          '💡 Recomendaciones:\n' +
+          '• Incrementar stock de protección\n' +
+          '• Promociones los martes\n' +
+          '• Contactar clientes inactivos');
+}
+
+function configurarAlertas() {
+    alert('🔔 Configuración de Alertas Inteligentes\n\n' +
+          'Alertas Disponibles:\n' +
+          '✅ Objetivos de venta alcanzados\n' +
+          '⚠️ Caída significativa en ventas\n' +
+          '🏆 Nuevos clientes VIP identificados\n' +
+          '📦 Productos con alta rotación\n' +
+          '📉 Stock bajo en productos clave\n' +
+          '💰 Metas mensuales en riesgo\n' +
+          '📧 Reportes programados fallidos\n\n' +
+          'Canales de notificación:\n' +
+          '• Email automático\n' +
+          '• SMS de emergencia\n' +
+          '• Notificaciones push\n' +
+          '• Integración con Slack/Teams');
+}
+
+function compararPeriodos() {
+    alert('📊 Comparación Avanzada de Períodos\n\n' +
+          'Opciones de Comparación:\n' +
+          '• Mes actual vs mes anterior (+15.3%)\n' +
+          '• Trimestre actual vs anterior (+8.7%)\n' +
+          '• Año actual vs anterior (+28.2%)\n' +
+          '• Mismo período año pasado\n' +
+          '• Períodos personalizados\n\n' +
+          'Métricas comparadas:\n' +
+          '• Volumen de ventas\n' +
+          '• Número de clientes\n' +
+          '• Productos más vendidos\n' +
+          '• Rentabilidad promedio\n' +
+          '• Estacionalidad y tendencias');
+}
+
+// Funciones de navegación
+function verVentas() {
+    alert('Mostrando detalles de ventas del mes...');
+}
+
+function verFacturas() {
+    alert('Mostrando facturas emitidas...');
+}
+
+function verTicket() {
+    alert('Mostrando análisis de ticket promedio...');
+}
+
+function verCobro() {
+    alert('Mostrando tasa de cobro...');
+}
+
+function verClientes() {
+    alert('Mostrando clientes activos...');
+}
+
+// Event Listeners y configuración inicial
+document.addEventListener('DOMContentLoaded', function() {
+    // Actualizar timestamp cada minuto
+    setInterval(() => {
+        const ahora = new Date();
+        const timestamp = document.getElementById('ultima-actualizacion');
+        if (timestamp) {
+            timestamp.textContent = ahora.toLocaleDateString('es-BO') + ' - ' + ahora.toLocaleTimeString('es-BO');
+        }
+    }, 60000);
+
+    // Teclas de acceso rápido
+    document.addEventListener('keydown', function(e) {
+        if (e.ctrlKey || e.metaKey) {
+            switch(e.key) {
+                case 'e':
+                    e.preventDefault();
+                    exportarReporte('excel');
+                    break;
+                case 'p':
+                    e.preventDefault();
+                    exportarReporte('pdf');
+                    break;
+                case 'r':
+                    e.preventDefault();
+                    resetearFiltros();
+                    break;
+                case 'm':
+                    e.preventDefault();
+                    enviarReporte();
+                    break;
+            }
+        }
+    });
+
+    // Tooltip para atajos de teclado
+    const atajos = document.createElement('div');
+    atajos.innerHTML = `
+        <div style="position: fixed; bottom: 20px; right: 20px; background: var(--bg-card); padding: 1rem; border-radius: var(--radius-lg); box-shadow: var(--shadow-lg); font-size: 0.75rem; color: var(--text-gray); max-width: 220px; z-index: 999; backdrop-filter: blur(10px); border: 1px solid rgba(255,255,255,0.2);">
+            <strong>⌨️ Atajos de Teclado:</strong><br>
+            <span style="color: var(--color-blue);">Ctrl+E</span> - Exportar Excel<br>
+            <span style="color: var(--color-blue);">Ctrl+P</span> - Exportar PDF<br>
+            <span style="color: var(--color-blue);">Ctrl+M</span> - Enviar Email<br>
+            <span style="color: var(--color-blue);">Ctrl+R</span> - Resetear Filtros<br><br>
+            <span style="color: var(--text-gray); font-size: 0.7rem;">Haz clic para cerrar</span>
+        </div>
+    `;
+    document.body.appendChild(atajos);
+
+    // Cerrar tooltip al hacer clic
+    atajos.addEventListener('click', () => {
+        atajos.style.opacity = '0';
+        atajos.style.transform = 'translateY(20px)';
+        setTimeout(() => atajos.remove(), 300);
+    });
+
+    // Auto-cerrar tooltip después de 10 segundos
+    setTimeout(() => {
+        if (atajos.parentNode) {
+            atajos.style.opacity = '0';
+            atajos.style.transform = 'translateY(20px)';
+            setTimeout(() => atajos.remove(), 300);
+        }
+    }, 10000);
+});
+
+// Animaciones de entrada
+document.addEventListener('DOMContentLoaded', function() {
+    const cards = document.querySelectorAll('.card, .kpi-card');
+    cards.forEach((card, index) => {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(20px)';
+
+        setTimeout(() => {
+            card.style.transition = 'all 0.6s cubic-bezier(0.4, 0, 0.2, 1)';
+            card.style.opacity = '1';
+            card.style.transform = 'translateY(0)';
+        }, index * 100);
+    });
+
+    // Efecto hover para las cards de KPIs
+    document.querySelectorAll('.kpi-card').forEach(card => {
+        card.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateY(-4px) scale(1.02)';
+            this.style.boxShadow = 'var(--shadow-lg)';
+        });
+
+        card.addEventListener('mouseleave', function() {
+            this.style.transform = 'translateY(0) scale(1)';
+            this.style.boxShadow = 'var(--shadow-md)';
+        });
+    });
+});
+
+// Función de utilidad para mostrar notificaciones
+function mostrarNotificacion(mensaje, tipo = 'info') {
+    const colores = {
+        'info': '#3B82F6',
+        'success': '#28C76F',
+        'warning': '#F59E0B',
+        'error': '#e53e3e'
+    };
+
+    const notificacion = document.createElement('div');
+    notificacion.innerHTML = `
+        <div style="
+            position: fixed;
+            top: 90px;
+            right: 20px;
+            background: white;
+            padding: 1rem 1.5rem;
+            border-radius: var(--radius-lg);
+            box-shadow: var(--shadow-xl);
+            border-left: 4px solid ${colores[tipo]};
+            max-width: 300px;
+            z-index: 9999;
+            animation: slideIn 0.3s ease;
+        ">
+            ${mensaje}
+        </div>
+        <style>
+            @keyframes slideIn {
+                from { transform: translateX(100%); opacity: 0; }
+                to { transform: translateX(0); opacity: 1; }
+            }
+        </style>
+    `;
+
+    document.body.appendChild(notificacion);
+
+    setTimeout(() => {
+        notificacion.style.opacity = '0';
+        notificacion.style.transform = 'translateX(100%)';
+        setTimeout(() => notificacion.remove(), 300);
+    }, 5000);
+}
+
+// Inicialización del sistema
+console.log('🚀 Sistema de Reportes Roy Representaciones iniciado');
+console.log('📊 Módulos cargados: KPIs, Reportes, Filtros, Exportación, Alertas');
+console.log('⌨️ Atajos disponibles: Ctrl+E, Ctrl+P, Ctrl+M, Ctrl+R');
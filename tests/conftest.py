@@ -0,0 +1,36 @@
+"""
+Fixtures comunes: datos iniciales, usuarios por rol y clientes HTTP con JWT
+"""
+import pytest
+from django.test import Client
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from autenticacion import referencias, semillas
+from autenticacion.factories import UsuarioRolFactory
+
+
+@pytest.fixture
+def sembrado():
+    """Roles, permisos y tipos de cliente de semillas.py, también en una BD vacía"""
+    semillas.sembrar()
+    referencias.limpiar()
+
+
+@pytest.fixture
+def administrador(sembrado):
+    return UsuarioRolFactory(rol=referencias.obtener_rol('ADMINISTRADOR')).usuario
+
+
+@pytest.fixture
+def vendedor(sembrado):
+    return UsuarioRolFactory(rol=referencias.obtener_rol('VENDEDOR_ROYDENT')).usuario
+
+
+@pytest.fixture
+def api():
+    """api(usuario) retorna un Client que envía el JWT del usuario; api() es anónimo"""
+    def crear(usuario=None):
+        if usuario is None:
+            return Client()
+        return Client(headers={'Authorization': f'Bearer {RefreshToken.for_user(usuario).access_token}'})
+    return crear
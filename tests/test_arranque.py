@@ -0,0 +1,68 @@
+"""
+Regresiones en el arranque de los workers
+
+Un worker nuevo (aplicación WSGI + URLconf) no debe cargar las librerías
+pesadas que solo usan algunas vistas, ni tardar en arrancar mucho más que
+un proyecto mínimo de Django + DRF medido en la misma máquina, ni superar
+un RSS máximo. Los límites dejan margen sobre lo medido (~1,5x la base y
+~60 MB); si un cambio los supera, `manage.py perfil_arranque` muestra qué
+paquete creció.
+"""
+import subprocess
+import sys
+
+import pytest
+from django.conf import settings
+
+from core.arranque import medir_arranque, medir_base
+
+# Veces el arranque del proyecto mínimo (core.arranque.medir_base)
+MAX_ARRANQUE_RELATIVO = 2.5
+MAX_RSS_MB = 90
+
+
+@pytest.fixture(scope='module')
+def medicion():
+    return medir_arranque()
+
+
+def test_no_carga_librerias_pesadas(medicion):
+    assert medicion['perezosos_cargados'] == []
+
+
+def test_tiempo_de_arranque(medicion):
+    base = medir_base()
+
+    assert medicion['tiempo_ms'] < base * MAX_ARRANQUE_RELATIVO, (base, medicion['paquetes'][:10])
+
+
+def test_memoria_de_arranque(medicion):
+    assert medicion['rss_kb'] / 1024 < MAX_RSS_MB, medicion['paquetes'][:10]
+
+
+def test_exportacion_excel_carga_openpyxl():
+    # En un intérprete nuevo: en este proceso otro test pudo haberlo importado
+    codigo = """
+import sys
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+from autenticacion.views import _respuesta_excel
+assert 'openpyxl' not in sys.modules, 'openpyxl cargado al arrancar'
+response = _respuesta_excel('prueba', 'Prueba', ['columna'], [(1,)])
+assert 'openpyxl' in sys.modules
+assert response.content[:2] == b'PK'
+"""
+    proceso = subprocess.run(
+        [sys.executable, '-c', codigo], capture_output=True, text=True, cwd=settings.BASE_DIR, timeout=120,
+    )
+
+    assert proceso.returncode == 0, proceso.stderr[-2000:]
+
+
+def test_exportacion_excel_responde_xlsx():
+    from django.test import Client
+
+    response = Client().get('/auth/api/proveedores/exportar-excel/')
+
+    assert response.status_code == 200
+    assert response.content[:2] == b'PK'
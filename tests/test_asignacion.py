@@ -0,0 +1,120 @@
+"""
+Asignación de salidas a lotes en orden FIFO/FEFO (inventario/asignacion.py)
+"""
+import datetime
+import uuid
+
+import pytest
+from django.utils import timezone
+
+from core.consultas import registrar_consultas
+from inventario.asignacion import FEFO, FIFO, StockInsuficiente, asignar, lotes_con_stock, stock_disponible
+from inventario.kardex import ingresar, stock_base
+from inventario.models import Lote, MovimientoStock, SaldoStock
+from productos.models import Producto
+
+HOY = timezone.localdate()
+
+
+@pytest.fixture
+def producto():
+    return Producto.objects.create(codigo=f'P-{uuid.uuid4().hex[:8]}', nombre='Anestesia Lidocaína 2%')
+
+
+def _lote(producto, cantidad, dias_ingreso, dias_vencimiento=None, sucursal='roydent'):
+    return ingresar(
+        producto,
+        sucursal,
+        cantidad,
+        fecha_ingreso=timezone.now() - datetime.timedelta(days=dias_ingreso),
+        fecha_vencimiento=HOY + datetime.timedelta(days=dias_vencimiento) if dias_vencimiento is not None else None,
+    )
+
+
+@pytest.fixture
+def lotes(producto):
+    return {
+        'antiguo_sin_vencimiento': _lote(producto, 5, dias_ingreso=90),
+        'vence_tarde': _lote(producto, 5, dias_ingreso=60, dias_vencimiento=400),
+        'vence_pronto': _lote(producto, 5, dias_ingreso=10, dias_vencimiento=20),
+        'otra_sucursal': _lote(producto, 50, dias_ingreso=100, dias_vencimiento=5, sucursal='deposito'),
+    }
+
+
+def _tomado(asignaciones):
+    return [(saldo.lote_id, unidades) for saldo, unidades in asignaciones]
+
+
+def test_fefo(producto, lotes):
+    asignaciones = asignar(producto, 'roydent', 8, FEFO)
+
+    assert _tomado(asignaciones) == [(lotes['vence_pronto'].pk, 5), (lotes['vence_tarde'].pk, 3)]
+    assert stock_base(lotes['vence_tarde']) == 2
+    assert stock_disponible(producto, 'roydent') == 7
+    ventas = MovimientoStock.objects.filter(producto=producto, tipo=MovimientoStock.VENTA)
+    assert sorted(ventas.values_list('cantidad', flat=True)) == [-5, -3]
+
+
+def test_fifo(producto, lotes):
+    asignaciones = asignar(producto, 'roydent', 8, FIFO)
+
+    assert _tomado(asignaciones) == [(lotes['antiguo_sin_vencimiento'].pk, 5), (lotes['vence_tarde'].pk, 3)]
+
+
+def test_metodo_por_defecto(settings, producto, lotes):
+    settings.ROY_REPRESENTACIONES_CONFIG = {**settings.ROY_REPRESENTACIONES_CONFIG, 'METODO_ASIGNACION': FIFO}
+
+    assert list(lotes_con_stock(producto, 'roydent'))[0].lote_id == lotes['antiguo_sin_vencimiento'].pk
+
+
+def test_stock_insuficiente_no_descuenta(producto, lotes):
+    with pytest.raises(StockInsuficiente) as error:
+        asignar(producto, 'roydent', 16)
+
+    assert (error.value.solicitado, error.value.disponible) == (16, 15)
+    assert stock_disponible(producto, 'roydent') == 15
+    assert not MovimientoStock.objects.filter(producto=producto, tipo=MovimientoStock.VENTA).exists()
+
+
+def test_solo_lee_los_lotes_que_consume(producto):
+    # Historial largo de lotes agotados delante de los que tienen stock
+    agotados = Lote.objects.bulk_create([
+        Lote(
+            producto=producto, sucursal='roydent', cantidad_inicial=10,
+            fecha_ingreso=timezone.now() - datetime.timedelta(days=1000 - i),
+        )
+        for i in range(500)
+    ])
+    SaldoStock.objects.bulk_create([
+        SaldoStock(lote=lote, producto=producto, sucursal='roydent', fecha_ingreso=lote.fecha_ingreso, cantidad=0)
+        for lote in agotados
+    ])
+    for dias in (5, 4, 3, 2, 1):
+        _lote(producto, 10, dias_ingreso=dias)
+
+    with registrar_consultas(guardar_sql=True) as registro:
+        asignaciones = asignar(producto, 'roydent', 25, FIFO)
+
+    assert [unidades for _, unidades in asignaciones] == [10, 10, 5]
+    # Una tanda de lectura (LIMIT 4), un UPDATE por lote consumido y un INSERT al kardex
+    sentencias = [c['sql'] for c in registro.consultas if 'SAVEPOINT' not in c['sql']]
+    lecturas = [sql for sql in sentencias if sql.startswith('SELECT')]
+    assert len(lecturas) == 1 and 'LIMIT 4' in lecturas[0]
+    assert len(sentencias) == 5
+
+
+def test_varias_tandas(producto):
+    for dias in range(20, 0, -1):
+        _lote(producto, 1, dias_ingreso=dias)
+
+    asignaciones = asignar(producto, 'roydent', 15, FIFO)
+
+    assert len(asignaciones) == 15
+    assert stock_disponible(producto, 'roydent') == 5
+
+
+def test_cantidad_invalida(producto):
+    with pytest.raises(ValueError):
+        asignar(producto, 'roydent', 0)
+    with pytest.raises(ValueError):
+        asignar(producto, 'roydent', 1, 'LIFO')
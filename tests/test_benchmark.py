@@ -0,0 +1,54 @@
+"""
+Comando benchmark (autenticacion/management/commands/benchmark.py)
+"""
+import json
+import re
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from autenticacion.models import Cliente
+
+
+@pytest.mark.parametrize('opciones', [
+    {'escalas': 'mil'},
+    {'escalas': '0,10'},
+    {'escalas': ','},
+    {'repeticiones': 0},
+    {'comparar': '/no/existe.json'},
+])
+def test_argumentos_invalidos(opciones, tmp_path):
+    with pytest.raises(CommandError):
+        call_command('benchmark', salida=str(tmp_path / 'r.json'), **opciones)
+
+
+def test_casos_desconocidos(sembrado, tmp_path):
+    with pytest.raises(CommandError, match='Casos desconocidos: otro'):
+        call_command('benchmark', escalas='2', casos='otro', salida=str(tmp_path / 'r.json'), stdout=StringIO())
+
+
+def test_corrida_y_comparacion(sembrado, tmp_path):
+    clientes = Cliente.objects.count()
+    anterior = tmp_path / 'antes.json'
+    anterior.write_text(json.dumps({
+        'entorno': {'commit': 'abc1234'},
+        'escalas': [{'escala': 3, 'casos': {'listar_clientes': {'ms_mediana': 0.001, 'consultas': 0}}}],
+    }))
+    salida = tmp_path / 'despues.json'
+    stdout = StringIO()
+
+    call_command(
+        'benchmark', escalas='3', repeticiones=3, casos='listar_clientes',
+        salida=str(salida), comparar=str(anterior), stdout=stdout,
+    )
+
+    resultado = json.loads(salida.read_text())
+    medida = resultado['escalas'][0]['casos']['listar_clientes']
+    assert resultado['repeticiones'] == 3
+    assert medida['estado'] == 200
+    assert medida['ms_min'] <= medida['ms_mediana'] <= medida['ms_p95']
+    assert 'Comparación con abc1234' in stdout.getvalue()
+    assert re.search(r'listar_clientes .* consultas 0 -> \d+', stdout.getvalue())
+    # La corrida se revierte
+    assert Cliente.objects.count() == clientes
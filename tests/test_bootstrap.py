@@ -0,0 +1,49 @@
+"""
+Datos iniciales (autenticacion/semillas.py) y el comando bootstrap
+"""
+from io import StringIO
+
+from django.core.management import call_command
+
+from autenticacion import referencias, semillas
+from autenticacion.models import Permiso, Rol, RolPermiso
+from core.consultas import registrar_consultas
+
+
+def test_idempotente():
+    semillas.sembrar()
+    with registrar_consultas() as registro:
+        creados = semillas.sembrar()
+
+    assert creados == {'roles': 0, 'permisos': 0, 'tipos_cliente': 0, 'roles_permisos': 0}
+    # Un INSERT por tabla, sin consultas por fila
+    assert registro.total <= 16
+
+
+def test_completa_lo_que_falta_sin_pisar_cambios(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        semillas.sembrar()
+        Permiso.objects.filter(codigo_permiso='IMPORTAR_CLIENTES').delete()
+        RolPermiso.objects.filter(rol__nombre_rol='VENDEDOR_ROYDENT', permiso__codigo_permiso='VER_REPORTES').delete()
+        Rol.objects.filter(nombre_rol='CLIENTE').update(descripcion='Editada por el administrador')
+    # Referencias cargadas sin el permiso borrado
+    assert 'IMPORTAR_CLIENTES' not in {permiso.codigo_permiso for permiso in referencias.permisos()}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        creados = semillas.sembrar()
+
+    assert creados['permisos'] == 1
+    # IMPORTAR_CLIENTES para el administrador y VER_REPORTES para el vendedor
+    assert creados['roles_permisos'] == 2
+    assert Rol.objects.get(nombre_rol='CLIENTE').descripcion == 'Editada por el administrador'
+    # bulk_create no emite señales: sembrar invalida las referencias
+    assert 'IMPORTAR_CLIENTES' in {permiso.codigo_permiso for permiso in referencias.permisos()}
+    assert len(referencias.matriz_permisos()['ADMINISTRADOR']) == Permiso.objects.count()
+
+
+def test_comando():
+    salida = StringIO()
+    call_command('bootstrap', stdout=salida)
+
+    assert 'roles_permisos' in salida.getvalue()
+    assert 'Datos iniciales listos' in salida.getvalue()
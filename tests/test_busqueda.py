@@ -0,0 +1,108 @@
+"""
+Búsqueda indexada y paginación estimada del admin (busqueda.py y admin.py)
+"""
+import uuid
+from unittest import mock
+
+import pytest
+from django.contrib import admin
+from django.contrib.messages import get_messages
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.test import RequestFactory
+
+from autenticacion import admin as admin_autenticacion
+from autenticacion import busqueda, referencias
+from autenticacion.admin import PaginadorEstimado, PersonaAdmin
+from autenticacion.factories import ClienteFactory, PersonaFactory
+from autenticacion.models import Cliente, Persona
+
+
+def _request():
+    request = RequestFactory().get('/admin/')
+    request._messages = CookieStorage(request)
+    return request
+
+
+def _buscar(modelo, termino, search_fields=None):
+    model_admin = admin.site._registry[modelo]
+    if search_fields is not None:
+        model_admin = type('Admin', (PersonaAdmin,), {'search_fields': search_fields})(modelo, admin.site)
+    request = _request()
+    queryset, duplicados = model_admin.get_search_results(request, modelo.objects.all(), termino)
+    assert not duplicados
+    return set(queryset.values_list('pk', flat=True)), request
+
+
+@pytest.fixture
+def marca():
+    return f'Zq{uuid.uuid4().hex[:8]}'
+
+
+def test_palabras_cortas_se_buscan_dentro(marca):
+    persona = PersonaFactory(nombre='Juanita', apellido_materno=marca)
+
+    encontrados, _ = _buscar(Persona, f'{marca} an')
+
+    assert encontrados == {persona.pk}
+
+
+def test_prefijos_por_campo(marca):
+    persona = PersonaFactory(nombre='Juanita', apellido_materno=marca)
+
+    assert _buscar(Persona, 'uanit', ['^nombre', 'apellido_materno'])[0] & {persona.pk} == set()
+    assert persona.pk in _buscar(Persona, 'juan', ['^nombre'])[0]
+    assert _buscar(Persona, persona.cedula_identidad[:-1], ['=cedula_identidad'])[0] == set()
+    assert _buscar(Persona, persona.cedula_identidad, ['=cedula_identidad'])[0] == {persona.pk}
+    assert _buscar(Persona, persona.cedula_identidad, ['cedula_identidad__iexact'])[0] == {persona.pk}
+    assert persona.pk in _buscar(Persona, 'uanit', ['@nombre'])[0]
+
+
+def test_columnas_de_tablas_relacionadas(sembrado, marca):
+    cliente = ClienteFactory(razon_social=f'Clinica {marca}', tipo_cliente=referencias.tipos_cliente()[0])
+    persona = cliente.usuario.persona
+
+    # Una palabra en la tabla principal y otra en una relacionada
+    encontrados, _ = _buscar(Cliente, f'{marca} {persona.cedula_identidad}')
+
+    assert encontrados == {cliente.pk}
+
+
+def test_frase_entre_comillas(marca):
+    persona = PersonaFactory(nombre='Ana Maria', apellido_materno=marca)
+    PersonaFactory(nombre='Maria Ana', apellido_materno=marca)
+
+    assert _buscar(Persona, f'{marca} "ana maria"')[0] == {persona.pk}
+
+
+def test_palabras_sobrantes_se_avisan(marca):
+    persona = PersonaFactory(apellido_materno=marca)
+    termino = ' '.join([marca] * busqueda.MAX_PALABRAS + ['inexistente'])
+
+    encontrados, request = _buscar(Persona, termino)
+
+    assert encontrados == {persona.pk}
+    assert [str(m) for m in get_messages(request)] == [
+        f'Solo se buscaron las primeras {busqueda.MAX_PALABRAS} palabras del término.'
+    ]
+
+
+def test_paginador_cuenta_en_sqlite_y_con_filtros(marca):
+    PersonaFactory.create_batch(3, apellido_materno=marca)
+
+    assert PaginadorEstimado(Persona.objects.filter(apellido_materno=marca).order_by('pk'), 2).count == 3
+    assert PaginadorEstimado(Persona.objects.order_by('pk'), 2).count == Persona.objects.count()
+
+
+@pytest.mark.parametrize('estimacion, esperado', [(50000, 50000), (10, None)])
+def test_paginador_estima_tablas_grandes_en_postgresql(estimacion, esperado):
+    conexion = mock.MagicMock(vendor='postgresql')
+    conexion.cursor.return_value.__enter__.return_value.fetchone.return_value = (estimacion,)
+
+    with mock.patch.object(admin_autenticacion, 'connection', conexion):
+        total = PaginadorEstimado(Persona.objects.order_by('pk'), 10).count
+        filtrado = PaginadorEstimado(Persona.objects.filter(pk=0).order_by('pk'), 10).count
+
+    # En tablas pequeñas la estimación no se usa y se cuenta con COUNT(*)
+    assert total == (esperado if esperado is not None else Persona.objects.count())
+    assert filtrado == 0
+    assert conexion.cursor.call_count == 1
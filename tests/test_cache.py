@@ -0,0 +1,171 @@
+"""
+Caché del proyecto (core/cache.py)
+"""
+import threading
+import time
+import uuid
+
+import pytest
+from django.test import RequestFactory
+from prometheus_client import REGISTRY
+from rest_framework.response import Response
+
+from autenticacion.caches import ESTADISTICAS
+from autenticacion.factories import PASSWORD_GENERADA
+from core import cache as core_cache
+from core.cache import EspacioCache, RedisConRespaldo, cachear_respuesta
+
+
+@pytest.fixture
+def espacio():
+    """Espacio con nombre propio y sin LRU local, para ver la caché compartida"""
+    return EspacioCache(f'prueba-{uuid.uuid4().hex[:8]}', ttl_local=0)
+
+
+# ============ REDIS CON RESPALDO ============
+
+def test_redis_caido_usa_memoria_local(monkeypatch):
+    # Puerto sin servidor: la conexión se rechaza de inmediato
+    servidor = 'redis://127.0.0.1:1/0'
+    monkeypatch.setattr(core_cache, '_redis_caido_hasta', {})
+    backend = RedisConRespaldo(servidor, {'OPTIONS': {'socket_connect_timeout': 0.5}})
+
+    backend.set('clave', 'valor')
+
+    assert backend.get('clave') == 'valor'
+    assert backend.add('contador', 1)
+    assert backend.incr('contador') == 2
+    assert core_cache._redis_caido_hasta[servidor] > time.monotonic()
+
+    # Vencido el plazo se vuelve a intentar Redis (y se vuelve a marcar caído)
+    core_cache._redis_caido_hasta[servidor] = 0
+    assert backend.get('clave') == 'valor'
+    assert core_cache._redis_caido_hasta[servidor] > time.monotonic()
+
+
+# ============ ESPACIOS ============
+
+def test_invalidar_descarta_en_otras_instancias(espacio):
+    otro_worker = EspacioCache(espacio.nombre, ttl_local=0)
+    espacio.guardar(('a',), 1)
+
+    assert otro_worker.obtener(('a',)) == 1
+
+    otro_worker.invalidar()
+
+    assert espacio.obtener(('a',)) is None
+    assert espacio.version() == otro_worker.version()
+
+
+def test_un_solo_hilo_calcula(espacio):
+    llamadas = []
+
+    def calcular():
+        llamadas.append(1)
+        time.sleep(0.2)
+        return 'resultado'
+
+    resultados = []
+    hilos = [
+        threading.Thread(target=lambda: resultados.append(espacio.obtener_o_calcular(('k',), calcular)))
+        for _ in range(5)
+    ]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert resultados == ['resultado'] * 5
+    assert len(llamadas) == 1
+
+
+def test_lock_en_uso_se_conserva(espacio):
+    lock = espacio._lock_de('k')
+    with lock:
+        # Muchas otras claves no descartan el lock que un hilo tiene tomado
+        for i in range(2000):
+            espacio._lock_de(f'otra-{i}')
+        assert espacio._lock_de('k') is lock
+
+    del lock
+    # Los locks que nadie usa se liberan solos
+    assert len(espacio._locks) == 0
+
+
+def test_espera_el_calculo_de_otro_proceso(espacio):
+    clave = espacio.clave(('k',))
+    # Otro proceso tomó el cálculo y guarda el resultado un momento después
+    espacio._compartida.add(f'{clave}:calculando', 1, 5)
+    threading.Timer(0.1, lambda: espacio._compartida.set(clave, 'del otro', 60)).start()
+
+    def calcular():
+        raise AssertionError('no debe calcular')
+
+    assert espacio.obtener_o_calcular(('k',), calcular) == 'del otro'
+
+
+def _lecturas(espacio):
+    return {
+        resultado: REGISTRY.get_sample_value(
+            'roy_cache_lecturas_total', {'espacio': espacio.nombre, 'resultado': resultado}
+        ) or 0
+        for resultado in ('local', 'compartida', 'fallo')
+    }
+
+
+def test_una_lectura_por_llamada(espacio):
+    espacio.obtener_o_calcular(('k',), lambda: 1)
+    assert _lecturas(espacio) == {'local': 0, 'compartida': 0, 'fallo': 1}
+
+    espacio.obtener_o_calcular(('k',), lambda: 1)
+    assert _lecturas(espacio) == {'local': 0, 'compartida': 1, 'fallo': 1}
+
+
+def test_espera_cuenta_un_acierto(espacio):
+    clave = espacio.clave(('k',))
+    espacio._compartida.add(f'{clave}:calculando', 1, 5)
+    threading.Timer(0.1, lambda: espacio._compartida.set(clave, 'del otro', 60)).start()
+
+    espacio.obtener_o_calcular(('k',), lambda: None)
+
+    assert _lecturas(espacio) == {'local': 0, 'compartida': 1, 'fallo': 0}
+
+
+# ============ DECORADOR PARA VISTAS ============
+
+def test_cachear_respuesta_no_guarda_errores(espacio):
+    llamadas = []
+
+    @cachear_respuesta(espacio)
+    def vista(request):
+        llamadas.append(request.GET.get('estado'))
+        estado = int(request.GET.get('estado', 200))
+        return Response({'estado': estado}, status=estado)
+
+    fabrica = RequestFactory()
+    for _ in range(2):
+        respuesta = vista(fabrica.get('/vista/', {'estado': 404}))
+        assert respuesta.status_code == 404
+    assert len(llamadas) == 2
+
+    primera = vista(fabrica.get('/vista/'))
+    segunda = vista(fabrica.get('/vista/'))
+
+    assert (primera.status_code, segunda.status_code) == (200, 200)
+    assert segunda.data == {'estado': 200}
+    assert len(llamadas) == 3
+
+
+# ============ ESTADÍSTICAS ============
+
+def test_login_no_invalida_estadisticas(api, vendedor):
+    version = ESTADISTICAS._compartida.get(ESTADISTICAS._clave_version)
+    response = api().post(
+        '/auth/api/login/', {'nombre_usuario': vendedor.nombre_usuario, 'password': PASSWORD_GENERADA},
+        content_type='application/json',
+    )
+
+    assert response.status_code == 200
+    vendedor.refresh_from_db()
+    assert vendedor.ultimo_login is not None
+    assert ESTADISTICAS._compartida.get(ESTADISTICAS._clave_version) == version
@@ -0,0 +1,76 @@
+"""
+Calentamiento de workers (roy_representaciones/calentamiento.py) y el
+comando warmup
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.template import engines
+from rest_framework.test import APIClient
+
+from autenticacion import referencias
+from roy_representaciones import paginas
+from roy_representaciones.calentamiento import calentar, plantillas_del_proyecto
+from roy_representaciones.paginas import PAGINAS
+
+
+@pytest.fixture(autouse=True)
+def sin_manifiesto(settings):
+    # Sin collectstatic no hay manifiesto de estáticos
+    settings.STORAGES = {
+        **settings.STORAGES,
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }
+    settings.PAGINAS_CACHE = {'ACTIVA': True}
+    PAGINAS.invalidar()
+    yield
+    PAGINAS.invalidar()
+
+
+def test_calienta_todo():
+    referencias.limpiar()
+    pasos, errores = calentar()
+
+    assert errores == []
+    assert [nombre for nombre, _, _ in pasos] == ['conexiones', 'referencias', 'plantillas', 'páginas']
+    assert referencias.registro._datos is not None
+    # El loader cacheado conserva las plantillas compiladas
+    cargador = engines['django'].engine.template_loaders[0]
+    compiladas = set(cargador.get_template_cache)
+    assert {nombre for _, nombre in plantillas_del_proyecto()} <= compiladas
+    assert PAGINAS.obtener(paginas._clave('components/sidebar.html')) is not None
+
+
+def test_errores_de_plantilla(settings, tmp_path):
+    (tmp_path / 'rota.html').write_text('{% if %}')
+    settings.TEMPLATES = [{**settings.TEMPLATES[0], 'DIRS': [*settings.TEMPLATES[0]['DIRS'], tmp_path]}]
+    _, errores = calentar()
+
+    assert len(errores) == 1 and errores[0].startswith('rota.html')
+    with pytest.raises(CommandError, match='rota.html'):
+        call_command('warmup', stdout=StringIO())
+
+
+def test_comando():
+    salida = StringIO()
+    call_command('warmup', renovar_paginas=True, stdout=salida)
+
+    assert 'páginas renderizadas' in salida.getvalue()
+    assert 'Proceso caliente' in salida.getvalue()
+
+
+def test_matriz_de_permisos_se_invalida_al_actualizar(administrador, django_capture_on_commit_callbacks):
+    cliente = APIClient()
+    cliente.force_authenticate(administrador)
+    permisos = [permiso.id for permiso in referencias.permisos()[:2]]
+
+    # La matriz se invalida al confirmar la transacción
+    with django_capture_on_commit_callbacks(execute=True):
+        response = cliente.post(
+            f'/auth/api/usuarios/{administrador.id}/permisos/actualizar/', {'permisos': permisos}, format='json'
+        )
+    assert response.data['success']
+
+    matriz = cliente.get('/auth/api/roles/permisos/').data['roles_permisos']
+    assert sorted(matriz['ADMINISTRADOR']) == sorted(permisos)
@@ -0,0 +1,46 @@
+"""
+Comando carga (autenticacion/management/commands/carga.py)
+"""
+import pytest
+from django.core.management import CommandError, call_command
+
+from autenticacion.management.commands.carga import MEZCLA, Command
+
+
+def test_argumentos_por_defecto():
+    opciones = Command().create_parser('manage.py', 'carga').parse_args([])
+
+    assert (opciones.hilos, opciones.duracion, opciones.modo) == (4, 30, 'cliente')
+
+
+@pytest.mark.parametrize('argumentos', [['--hilos', '0'], ['--duracion', '0'], ['--modo', 'http']])
+def test_argumentos_invalidos(argumentos):
+    with pytest.raises(CommandError):
+        call_command('carga', *argumentos)
+
+
+def test_mezcla():
+    leer = Command()._leer_mezcla
+
+    assert leer('') == MEZCLA
+    assert leer('login=2, buscar_clientes') == {'login': 2.0, 'buscar_clientes': 1.0}
+    for invalida in ('otra=1', 'login=x', 'login=0'):
+        with pytest.raises(CommandError):
+            leer(invalida)
+
+
+def test_reporte_une_los_hilos():
+    comando = Command()
+    comando.mezcla = {'login': 1, 'buscar_clientes': 1}
+    resultados = [
+        ({'login': [10.0, 30.0]}, {'login': 1}),
+        ({'login': [20.0], 'buscar_clientes': [5.0]}, {}),
+    ]
+
+    reporte = comando._reporte(resultados, {'modo': 'cliente', 'hilos': 2, 'duracion': 2})
+
+    assert reporte['endpoints']['login'] == {
+        'peticiones': 3, 'errores': 1, 'rps': 1.5, 'p50_ms': 20.0, 'p95_ms': 30.0, 'p99_ms': 30.0, 'max_ms': 30.0,
+    }
+    assert reporte['total']['peticiones'] == 4
+    assert reporte['total']['p50_ms'] == 10.0
@@ -0,0 +1,86 @@
+"""
+Registro de consultas lentas (core/consultas_lentas.py) y el comando
+consultas_lentas
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+
+from core.consultas_lentas import ALMACEN, CAPTURA, huella, leer_registros, normalizar
+
+
+@pytest.fixture
+def lentas(settings, tmp_path):
+    # Umbral 0: todas las consultas cuentan como lentas
+    settings.CONSULTAS_LENTAS = {'UMBRAL_MS': 0, 'MUESTREO_PILA': 1, 'DIRECTORIO': str(tmp_path)}
+    yield tmp_path
+    ALMACEN.cerrar()
+
+
+def test_normalizar():
+    con_valores = "SELECT * FROM t WHERE id IN (1, 2, 3) AND nombre LIKE '%o''a%' AND t.x = -2.5 LIMIT 21"
+    con_marcadores = 'SELECT  *  FROM t\nWHERE id IN (%s, %s) AND nombre LIKE %s AND t.x = %s LIMIT 21'
+
+    assert normalizar(con_valores) == 'SELECT * FROM t WHERE id IN (?+) AND nombre LIKE ? AND t.x = ? LIMIT ?'
+    assert huella(normalizar(con_valores)) == huella(normalizar(con_marcadores))
+    # Los números que forman parte de identificadores se conservan
+    assert normalizar('SELECT "t1"."col2" FROM "t1"') == 'SELECT "t1"."col2" FROM "t1"'
+    assert normalizar('INSERT INTO t VALUES (%s, %s), (%s, %s)') == 'INSERT INTO t VALUES (?+)'
+
+
+def test_wrapper_instalado_una_vez():
+    connection.ensure_connection()
+    assert connection.execute_wrappers.count(CAPTURA) == 1
+
+
+def test_registra_vista_y_pila(lentas):
+    Client().get('/auth/api/clientes/?busqueda=a')
+    registros = list(leer_registros())
+
+    assert registros
+    assert {registro['vista'] for registro in registros} == {'autenticacion:api_listar_clientes'}
+    assert all(registro['ruta'] == '/auth/api/clientes/' for registro in registros)
+    assert any('autenticacion/views.py' in marco for registro in registros for marco in registro['pila'])
+    # Sin valores de los parámetros
+    assert not any("'a'" in registro['sql'] or '%a%' in registro['sql'] for registro in registros)
+
+
+def test_atribuye_las_consultas_de_exportaciones_en_streaming(administrador, api, lentas):
+    response = api(administrador).get('/auth/api/proveedores/exportar-csv/')
+    b''.join(response.streaming_content)
+
+    assert {registro['vista'] for registro in leer_registros()} == {'autenticacion:api_exportar_proveedores_csv'}
+
+
+def test_debajo_del_umbral(settings, tmp_path):
+    settings.CONSULTAS_LENTAS = {'UMBRAL_MS': 60_000, 'DIRECTORIO': str(tmp_path)}
+    Client().get('/auth/api/clientes/')
+
+    assert list(leer_registros()) == []
+
+
+def test_comando_top(lentas):
+    for _ in range(3):
+        Client().get('/auth/api/clientes/')
+    Client().get('/auth/api/proveedores/')
+    salida = StringIO()
+    call_command('consultas_lentas', top=2, stdout=salida)
+    salida = salida.getvalue()
+
+    assert 'Por tiempo total' in salida and 'Por cantidad' in salida
+    assert 'autenticacion:api_listar_clientes (3)' in salida
+
+    salida = StringIO()
+    call_command('consultas_lentas', vista='autenticacion:api_listar_proveedores', stdout=salida)
+    assert 'autenticacion:api_listar_clientes' not in salida.getvalue()
+
+
+def test_comando_sin_registros(settings, tmp_path):
+    settings.CONSULTAS_LENTAS = {'DIRECTORIO': str(tmp_path)}
+    salida = StringIO()
+    call_command('consultas_lentas', stdout=salida)
+
+    assert 'No hay consultas lentas registradas' in salida.getvalue()
@@ -0,0 +1,122 @@
+"""
+Verificación de disponibilidad con filtros de Bloom (autenticacion/disponibilidad.py)
+"""
+import json
+import uuid
+
+import pytest
+
+from autenticacion import disponibilidad
+from autenticacion.disponibilidad import FiltroBloom, RegistroFiltros, verificar
+from autenticacion.factories import PersonaFactory, UsuarioFactory
+from autenticacion.models import Persona
+from core.consultas import registrar_consultas
+
+
+def test_filtro_sin_falsos_negativos():
+    filtro = FiltroBloom(5000)
+    valores = [f'valor{i}' for i in range(5000)]
+    for valor in valores:
+        filtro.agregar(valor)
+
+    assert all(valor in filtro for valor in valores)
+    falsos = sum(f'otro{i}' in filtro for i in range(10000))
+    # Objetivo FILTRO_ERROR = 1 %, con margen
+    assert falsos < 300
+
+
+@pytest.fixture
+def persona():
+    return PersonaFactory(correo=f'Disp.{uuid.uuid4().hex[:8]}@Correo.com')
+
+
+def test_verificar(persona):
+    resultados = verificar({
+        'correo': persona.correo.lower(),
+        'cedula_identidad': persona.cedula_identidad.lower(),
+        'nombre_usuario': f'libre{uuid.uuid4().hex[:8]}',
+        'desconocido': 'x',
+    })
+
+    assert set(resultados) == {'correo', 'cedula_identidad', 'nombre_usuario'}
+    assert not resultados['correo']['disponible']
+    assert not resultados['cedula_identidad']['disponible']
+    assert resultados['nombre_usuario']['disponible']
+    assert verificar({'cedula_identidad': '12AB'})['cedula_identidad'] == {
+        'valor': '12AB', 'valido': False, 'disponible': False,
+    }
+
+
+def test_valores_libres_no_consultan_la_bd():
+    disponibilidad.registro.filtros()
+    with registrar_consultas() as registro:
+        verificar({'nombre_usuario': f'libre{uuid.uuid4().hex[:8]}', 'nit': '123456789012345'})
+
+    assert registro.total == 0
+
+
+def test_alta_en_otro_worker_se_ve_de_inmediato(django_capture_on_commit_callbacks):
+    otro_worker = RegistroFiltros()
+    otro_worker.filtros()
+    nombre_usuario = f'nuevo{uuid.uuid4().hex[:8]}'
+
+    # El alta la procesa el registro de este proceso (signals.py); la
+    # versión compartida cambia al confirmar la transacción
+    with django_capture_on_commit_callbacks(execute=True):
+        UsuarioFactory(nombre_usuario=nombre_usuario)
+
+    assert nombre_usuario in otro_worker.filtros()['nombre_usuario']
+
+
+def test_guardado_parcial_no_cambia_la_version(persona, django_capture_on_commit_callbacks):
+    usuario = UsuarioFactory(persona=persona)
+    version = disponibilidad.registro.version()
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        usuario.save(update_fields=['ultimo_login'])
+
+    assert not callbacks
+    assert disponibilidad.registro.version() == version
+
+
+def test_guardado_sin_cambios_no_cambia_la_version(persona, django_capture_on_commit_callbacks):
+    persona = Persona.objects.get(pk=persona.pk)
+    version = disponibilidad.registro.version()
+
+    # Editar el celular no registra valores nuevos
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        persona.numero_celular = '79999999'
+        persona.save()
+
+    assert not callbacks
+    assert disponibilidad.registro.version() == version
+
+    # Cambiar el correo sí, una sola vez
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        persona.correo = f'cambio.{uuid.uuid4().hex[:8]}@correo.com'
+        persona.save()
+        persona.save()
+
+    assert len(callbacks) == 1
+    assert disponibilidad.registro.version() > version
+
+
+@pytest.mark.parametrize('cuerpo', [['correo'], 'correo', 5])
+def test_cuerpo_que_no_es_objeto(client, cuerpo):
+    response = client.post('/auth/api/validar-disponibilidad/', json.dumps(cuerpo), content_type='application/json')
+
+    assert response.status_code == 400
+    assert 'objeto JSON' in response.json()['error']
+
+
+def test_worker_que_registra_no_reconstruye(django_capture_on_commit_callbacks):
+    disponibilidad.registro.filtros()
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        UsuarioFactory(nombre_usuario=f'propio{uuid.uuid4().hex[:8]}')
+
+    assert callbacks
+
+    with registrar_consultas() as registro:
+        disponibilidad.registro.filtros()
+
+    assert registro.total == 0
@@ -0,0 +1,18 @@
+"""
+Estadísticas de latencias (core/estadistica.py)
+"""
+import pytest
+
+from core.estadistica import percentil
+
+
+@pytest.mark.parametrize('p, esperado', [(50, 50), (95, 95), (99, 99), (100, 100), (0, 1)])
+def test_percentil_rango_mas_cercano(p, esperado):
+    assert percentil(list(range(1, 101)), p) == esperado
+
+
+def test_percentil_con_pocos_valores():
+    # ⌈0.95 · 30⌉ = 29: el 29.º valor, no el 28.º que daría el redondeo
+    assert percentil(list(range(1, 31)), 95) == 29
+    assert percentil([7.0], 99) == 7.0
+    assert percentil([], 50) == 0.0
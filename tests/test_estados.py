@@ -0,0 +1,55 @@
+"""
+Activación y desactivación masiva (autenticacion/estados.py y vistas *_lote)
+"""
+import pytest
+from django.core.cache import cache
+
+from autenticacion import estados, referencias
+from autenticacion.caches import ESTADISTICAS
+from autenticacion.factories import ProveedorFactory, UsuarioRolFactory
+from autenticacion.models import Proveedor, Usuario, UsuarioRol
+
+ENTIDADES = ['usuarios', 'clientes', 'proveedores']
+
+
+def _version_estadisticas():
+    return cache.get(ESTADISTICAS._clave_version)
+
+
+@pytest.mark.parametrize('url', [
+    f'/auth/api/{entidad}/{accion}-lote/' for entidad in ENTIDADES for accion in ('activar', 'desactivar')
+])
+def test_requiere_administrador(api, vendedor, administrador, url):
+    def enviar(usuario):
+        return api(usuario).post(url, {'ids': [0]}, content_type='application/json')
+
+    assert enviar(None).status_code == 401
+    assert enviar(vendedor).status_code == 403
+    assert enviar(administrador).json()['no_encontrados'] == 1
+
+
+def test_desactivar_usuarios_desactiva_sus_roles(api, administrador, vendedor):
+    otro = UsuarioRolFactory(rol=referencias.obtener_rol('VENDEDOR_ROYDENT')).usuario
+
+    datos = api(administrador).post(
+        '/auth/api/usuarios/desactivar-lote/', {'ids': [vendedor.id, otro.id, 0]}, content_type='application/json'
+    ).json()
+
+    assert (datos['actualizados'], datos['no_encontrados']) == (2, 1)
+    assert not Usuario.objects.filter(id__in=[vendedor.id, otro.id], is_active=True).exists()
+    assert not UsuarioRol.objects.filter(usuario__in=[vendedor, otro]).exclude(estado='INACTIVO').exists()
+
+
+def test_estadisticas_se_invalidan_al_confirmar(sembrado, django_capture_on_commit_callbacks):
+    proveedor = ProveedorFactory()
+    ESTADISTICAS.version()
+    version = _version_estadisticas()
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        assert estados.cambiar_estado_proveedores(Proveedor.objects.filter(pk=proveedor.pk), False) == 1
+        # Otro worker no debe recalcular los conteos antes de ver el cambio
+        assert _version_estadisticas() == version
+
+    assert callbacks
+    assert _version_estadisticas() > version
+    assert Proveedor.objects.get(pk=proveedor.pk).estado == 'INACTIVO'
@@ -0,0 +1,51 @@
+"""
+Plantillas y archivos estáticos
+
+El CSS y el JS de las páginas viven en static/ (css/comun.css,
+css/sidebar-panel.css, css/paginas/, js/paginas/) para que el navegador los
+guarde en caché; las plantillas solo los referencian con {% static %}.
+"""
+import re
+
+import pytest
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.template.loader import render_to_string
+
+PLANTILLAS = sorted(
+    ruta.relative_to(settings.BASE_DIR / 'templates').as_posix()
+    for ruta in (settings.BASE_DIR / 'templates').rglob('*.html')
+)
+
+
+@pytest.mark.parametrize('plantilla', PLANTILLAS)
+def test_sin_css_ni_js_en_linea(plantilla):
+    html = (settings.BASE_DIR / 'templates' / plantilla).read_text(encoding='utf-8')
+
+    # Solo queda en línea la configuración de Tailwind (la procesa su script)
+    assert re.findall(r'<style(?![^>]*text/tailwindcss)[^>]*>', html.split('</head>')[0]) == []
+    assert re.findall(r'<script(?![^>]*\bsrc=)[^>]*>', html) == []
+    assert '"/static/' not in html
+
+
+@pytest.mark.parametrize('plantilla', PLANTILLAS)
+def test_archivos_estaticos_existen(plantilla):
+    html = (settings.BASE_DIR / 'templates' / plantilla).read_text(encoding='utf-8')
+
+    for ruta in re.findall(r"{% static '([^']+)' %}", html):
+        # En Linux las mayúsculas importan: LOGO-1.PNG no es LOGO-1.png
+        assert finders.find(ruta), ruta
+
+
+def test_almacenamiento_con_hash_y_compresion():
+    assert settings.STORAGES['staticfiles']['BACKEND'] == 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+
+
+def test_plantillas_renderizan(settings):
+    # Sin collectstatic no hay manifiesto; se renderiza con las URLs sin hash
+    settings.STORAGES = {
+        **settings.STORAGES,
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }
+    for plantilla in PLANTILLAS:
+        assert "{% static" not in render_to_string(plantilla)
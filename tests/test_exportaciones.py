@@ -0,0 +1,114 @@
+"""
+Exportaciones CSV en streaming, opcionalmente en gzip (autenticacion/views.py)
+"""
+import csv
+import gzip
+import io
+import uuid
+
+import pytest
+
+from autenticacion import referencias, semillas
+from autenticacion.factories import ClienteFactory, ProveedorFactory, UsuarioRolFactory
+from core.consultas import registrar_consultas
+
+
+@pytest.fixture
+def apellido():
+    """Apellido único para filtrar solo las filas creadas por cada test"""
+    semillas.sembrar()
+    referencias.limpiar()
+    return f'Exportacion{uuid.uuid4().hex[:8]}'
+
+
+def _usuarios(apellido, cantidad):
+    UsuarioRolFactory.create_batch(
+        cantidad,
+        rol=referencias.obtener_rol('VENDEDOR_ROYDENT'),
+        usuario__persona__apellido_paterno=apellido,
+    )
+
+
+@pytest.fixture
+def descargar(administrador, api):
+    """descargar(url) consume la respuesta en streaming; retorna (respuesta, cuerpo, consultas)"""
+    cliente = api(administrador)
+
+    def descargar(url):
+        response = cliente.get(url)
+        with registrar_consultas() as registro:
+            cuerpo = b''.join(response.streaming_content)
+        return response, cuerpo, registro.total
+    return descargar
+
+
+def _filas(cuerpo):
+    return list(csv.reader(io.StringIO(cuerpo.decode('utf-8'))))
+
+
+def test_usuarios_csv(apellido, descargar):
+    _usuarios(apellido, 2)
+
+    response, cuerpo, _ = descargar(f'/auth/api/usuarios/exportar-csv/?busqueda={apellido}')
+    filas = _filas(cuerpo)
+
+    assert response['Content-Type'] == 'text/csv; charset=utf-8'
+    assert response['Content-Disposition'].startswith('attachment; filename=usuarios_')
+    assert filas[0][:3] == ['id', 'nombre_usuario', 'nombre_completo']
+    assert len(filas) == 3
+    assert all(apellido in fila[2] and fila[6] == 'VENDEDOR_ROYDENT' and fila[7] == 'SI' for fila in filas[1:])
+
+
+def test_gzip_valido(apellido, descargar):
+    _usuarios(apellido, 2)
+    url = f'/auth/api/usuarios/exportar-csv/?busqueda={apellido}'
+
+    response, cuerpo, _ = descargar(url + '&gzip=1')
+    _, plano, _ = descargar(url)
+
+    assert response['Content-Type'] == 'application/gzip'
+    assert response['Content-Disposition'].endswith('.csv.gz')
+    assert gzip.decompress(cuerpo) == plano
+
+
+def test_consultas_constantes_al_transmitir(apellido, descargar):
+    url = f'/auth/api/usuarios/exportar-csv/?busqueda={apellido}'
+    _usuarios(apellido, 3)
+    _, cuerpo, pocas = descargar(url)
+    assert len(_filas(cuerpo)) == 4
+
+    _usuarios(apellido, 10)
+    _, cuerpo, muchas = descargar(url)
+    assert len(_filas(cuerpo)) == 14
+
+    # Usuarios, personas y roles se leen por tandas, no por fila
+    assert muchas == pocas
+
+
+@pytest.mark.parametrize('url,fabricar', [
+    ('/auth/api/clientes/exportar-csv/', lambda apellido: ClienteFactory(
+        tipo_cliente=referencias.tipos_cliente()[0], usuario__persona__apellido_paterno=apellido
+    )),
+    ('/auth/api/proveedores/exportar-csv/', lambda apellido: ProveedorFactory(
+        persona__apellido_paterno=apellido
+    )),
+])
+def test_clientes_y_proveedores_csv(apellido, descargar, url, fabricar):
+    fabricar(apellido)
+    _, cuerpo, pocas = descargar(f'{url}?busqueda={apellido}')
+    for _ in range(4):
+        fabricar(apellido)
+    _, cuerpo, muchas = descargar(f'{url}?busqueda={apellido}')
+
+    filas = _filas(cuerpo)
+    assert len(filas) == 6
+    assert filas[0][:2] == ['id', 'nombre_completo']
+    assert all(apellido in fila[1] for fila in filas[1:])
+    assert muchas == pocas
+
+
+@pytest.mark.parametrize('entidad', ['usuarios', 'clientes', 'proveedores', 'permisos'])
+def test_exportar_requiere_permiso(vendedor, api, entidad):
+    url = f'/auth/api/{entidad}/exportar-csv/'
+    assert api().get(url).status_code == 401
+    assert api(vendedor).get(url).status_code == 403
@@ -0,0 +1,30 @@
+"""
+Comando generar_datos (autenticacion/management/commands/generar_datos.py)
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from autenticacion.models import Cliente, UsuarioRol
+
+
+def test_sin_debug_requiere_forzar(settings):
+    settings.DEBUG = False
+    clientes = Cliente.objects.count()
+
+    with pytest.raises(CommandError, match='--forzar'):
+        call_command('generar_datos', clientes=1, stdout=StringIO())
+
+    assert Cliente.objects.count() == clientes
+
+
+def test_forzar(sembrado, settings):
+    settings.DEBUG = False
+    clientes = Cliente.objects.count()
+    administradores = UsuarioRol.objects.filter(rol__nombre_rol='ADMINISTRADOR').count()
+
+    call_command('generar_datos', clientes=2, proveedores=1, personal=1, forzar=True, stdout=StringIO())
+
+    assert Cliente.objects.count() == clientes + 2
+    assert UsuarioRol.objects.filter(rol__nombre_rol='ADMINISTRADOR').count() == administradores + 1
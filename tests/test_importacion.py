@@ -0,0 +1,143 @@
+"""
+Importación masiva de clientes y proveedores (autenticacion/importacion.py)
+"""
+import random
+import uuid
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from autenticacion import referencias
+from autenticacion.factories import PersonaFactory, UsuarioFactory
+from autenticacion.models import Cliente, Permiso, Persona, Proveedor, Rol, RolPermiso, UsuarioRol
+
+ENCABEZADO_CLIENTES = 'nombre,apellido_paterno,cedula_identidad,numero_celular,correo,tipo_cliente,nombre_usuario'
+
+
+def _cedula():
+    return str(random.randint(1000000, 8999999))
+
+
+def _fila_cliente(cedula=None, correo=None, nombre_usuario=None, tipo='ODONTOLOGO'):
+    cedula = cedula or _cedula()
+    correo = correo or f'c{uuid.uuid4().hex[:10]}@correo.com'
+    return f'Ana,Quispe,{cedula},71234567,{correo},{tipo},{nombre_usuario or ""}'
+
+
+def _archivo(encabezado, filas, nombre='clientes.csv'):
+    return SimpleUploadedFile(nombre, '\n'.join([encabezado, *filas]).encode('utf-8'), content_type='text/csv')
+
+
+def _importar(cliente_http, url, archivo, **datos):
+    return cliente_http.post(url, {'archivo': archivo, **datos})
+
+
+def test_reporte_por_fila(api, administrador):
+    correcta = _fila_cliente()
+    filas = [
+        correcta,
+        _fila_cliente(cedula='12AB'),
+        _fila_cliente(correo='sin-arroba'),
+        _fila_cliente(tipo='NO_EXISTE'),
+    ]
+
+    response = _importar(api(administrador), '/auth/api/clientes/importar/', _archivo(ENCABEZADO_CLIENTES, filas))
+    reporte = response.json()['reporte']
+
+    assert response.status_code == 200
+    assert (reporte['total_filas'], reporte['creados'], reporte['con_errores']) == (4, 1, 3)
+    # La fila 1 es el encabezado
+    assert [(e['fila'], list(e['errores'])) for e in reporte['errores']] == [
+        (3, ['cedula_identidad']), (4, ['correo']), (5, ['tipo_cliente']),
+    ]
+    cedula = correcta.split(',')[2]
+    cliente = Cliente.objects.select_related('usuario__persona').get(usuario__persona__cedula_identidad=cedula)
+    assert cliente.usuario.nombre_usuario == cedula
+    assert UsuarioRol.objects.filter(usuario=cliente.usuario, rol__nombre_rol='CLIENTE').exists()
+
+
+def test_duplicados_en_archivo_y_en_bd(api, administrador):
+    sufijo = uuid.uuid4().hex[:8]
+    PersonaFactory(correo=f'Ana.{sufijo}@Correo.com')
+    UsuarioFactory(nombre_usuario=f'Usr{sufijo}')
+    cedula = _cedula()
+    filas = [
+        # Ya registrados, con otras mayúsculas
+        _fila_cliente(correo=f'ana.{sufijo}@correo.com'),
+        _fila_cliente(nombre_usuario=f'usr{sufijo}'),
+        # La misma cédula dos veces dentro del archivo: se crea la primera
+        _fila_cliente(cedula=cedula),
+        _fila_cliente(cedula=cedula),
+    ]
+
+    reporte = _importar(
+        api(administrador), '/auth/api/clientes/importar/', _archivo(ENCABEZADO_CLIENTES, filas)
+    ).json()['reporte']
+
+    assert reporte['creados'] == 1
+    errores = {e['fila']: e['errores'] for e in reporte['errores']}
+    assert errores[2] == {'correo': 'Este correo electrónico ya está registrado'}
+    assert errores[3] == {'nombre_usuario': 'Este nombre de usuario ya existe'}
+    assert errores[5] == {'cedula_identidad': 'Valor repetido dentro del archivo'}
+    assert Persona.objects.filter(cedula_identidad=cedula).count() == 1
+
+
+def test_solo_validar_no_crea(api, administrador):
+    cedula = _cedula()
+    response = _importar(
+        api(administrador), '/auth/api/clientes/importar/',
+        _archivo(ENCABEZADO_CLIENTES, [_fila_cliente(cedula=cedula)]), solo_validar='1',
+    )
+
+    assert response.json()['reporte']['validos'] == 1
+    assert not Persona.objects.filter(cedula_identidad=cedula).exists()
+
+
+def test_longitud_maxima_es_error_de_fila(api, administrador):
+    nit = str(random.randint(10 ** 9, 2 * 10 ** 9))
+    archivo = _archivo(
+        'nombre,apellido_paterno,cedula_identidad,numero_celular,correo,tipo_proveedor,nit,razon_social',
+        [f'Luis,Mamani,{_cedula()},61234567,p{nit}@correo.com,FABRICANTE,{nit},{"x" * 201}',
+         f'Luis,Mamani,{_cedula()},61234567,{"q" * 250}@correo.com,FABRICANTE,{nit}1,Clínica'],
+        nombre='proveedores.csv',
+    )
+
+    reporte = _importar(api(administrador), '/auth/api/proveedores/importar/', archivo).json()['reporte']
+
+    assert reporte['creados'] == 0
+    assert reporte['errores'] == [
+        {'fila': 2, 'errores': {'razon_social': 'Máximo 200 caracteres'}},
+        {'fila': 3, 'errores': {'correo': 'Máximo 254 caracteres'}},
+    ]
+
+
+def test_proveedores(api, administrador):
+    nit = str(random.randint(10 ** 9, 2 * 10 ** 9))
+    archivo = _archivo(
+        'nombre,apellido_paterno,cedula_identidad,numero_celular,correo,tipo_proveedor,nit',
+        [f'Luis,Mamani,{_cedula()},61234567,p{nit}@correo.com,FABRICANTE,{nit}',
+         f'Luis,Mamani,{_cedula()},61234567,q{nit}@correo.com,FABRICANTE,{nit}'],
+        nombre='proveedores.csv',
+    )
+
+    reporte = _importar(api(administrador), '/auth/api/proveedores/importar/', archivo).json()['reporte']
+
+    assert reporte['creados'] == 1
+    assert reporte['errores'] == [{'fila': 3, 'errores': {'nit': 'Valor repetido dentro del archivo'}}]
+    assert Proveedor.objects.get(nit=nit).tipo_proveedor == 'FABRICANTE'
+
+
+@pytest.mark.parametrize('url', ['/auth/api/clientes/importar/', '/auth/api/proveedores/importar/'])
+def test_requiere_permiso_importar(api, vendedor, url):
+    def importar(usuario):
+        return _importar(api(usuario), url, _archivo(ENCABEZADO_CLIENTES, []))
+
+    assert importar(None).status_code == 401
+    assert importar(vendedor).status_code == 403
+
+    # Un rol con IMPORTAR_CLIENTES en la matriz de permisos puede importar
+    rol = Rol.objects.create(nombre_rol=f'IMPORTADOR_{uuid.uuid4().hex[:6]}')
+    RolPermiso.objects.create(rol=rol, permiso=Permiso.objects.get(codigo_permiso='IMPORTAR_CLIENTES'))
+    UsuarioRol.objects.create(usuario=vendedor, rol=rol, estado='ACTIVO')
+    referencias.limpiar()
+    assert importar(vendedor).status_code == 200
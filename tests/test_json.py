@@ -0,0 +1,115 @@
+"""
+JSON con orjson (core/renderers.py) y compresión de respuestas
+(core/middleware.CompresionMiddleware)
+"""
+import datetime
+import decimal
+import gzip
+import io
+import threading
+import uuid
+import zoneinfo
+
+import brotli
+import pytest
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse, JsonResponse
+from django.test import RequestFactory
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from core.middleware import CompresionMiddleware
+from core.renderers import ORJSONParser, ORJSONRenderer
+
+DATOS = {
+    'texto': 'Ñandú – “comillas”\u2028\u2029fin',
+    'entero': 12,
+    'real': 1.5,
+    'nulo': None,
+    'lista': [1, 'dos', (3, 4)],
+    'decimal': decimal.Decimal('10.25'),
+    'fecha': datetime.date(2024, 5, 1),
+    'hora': datetime.time(13, 45, 10),
+    'utc': datetime.datetime(2024, 5, 1, 12, 30, 5, 123456, tzinfo=datetime.timezone.utc),
+    'la_paz': datetime.datetime(2024, 5, 1, 8, 30, tzinfo=zoneinfo.ZoneInfo('America/La_Paz')),
+    'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'traducible': gettext_lazy('Clientes'),
+    1: 'clave entera',
+}
+
+
+def test_misma_salida_que_jsonrenderer():
+    assert ORJSONRenderer().render(DATOS) == JSONRenderer().render(DATOS)
+
+
+def test_enteros_grandes_usan_el_renderer_de_drf():
+    datos = {'grande': 2 ** 70}
+    assert ORJSONRenderer().render(datos) == JSONRenderer().render(datos)
+
+
+def test_parser():
+    assert ORJSONParser().parse(io.BytesIO('{"nombre": "Ñandú", "n": [1, 2]}'.encode())) == {
+        'nombre': 'Ñandú', 'n': [1, 2],
+    }
+    with pytest.raises(ParseError):
+        ORJSONParser().parse(io.BytesIO(b'{"nombre": '))
+
+
+def _responder(response, accept_encoding=None):
+    extra = {'HTTP_ACCEPT_ENCODING': accept_encoding} if accept_encoding else {}
+    request = RequestFactory().get('/', **extra)
+    return CompresionMiddleware(lambda request: response)(request)
+
+
+def _json_grande():
+    return JsonResponse({'clientes': [{'id': i, 'nombre': f'Cliente {i}'} for i in range(500)]})
+
+
+@pytest.mark.parametrize('codificacion,descomprimir', [
+    ('br', brotli.decompress),
+    ('gzip', gzip.decompress),
+])
+def test_comprime_json_grande(codificacion, descomprimir):
+    original = _json_grande().content
+    response = _responder(_json_grande(), f'{codificacion}, deflate')
+
+    assert response['Content-Encoding'] == codificacion
+    assert response['Vary'] == 'Accept-Encoding'
+    assert int(response['Content-Length']) == len(response.content) < len(original)
+    assert descomprimir(response.content) == original
+
+
+def test_prefiere_brotli():
+    assert _responder(_json_grande(), 'gzip, deflate, br')['Content-Encoding'] == 'br'
+
+
+def test_no_comprime():
+    # Sin Accept-Encoding, JSON pequeño o contenido que no es JSON
+    assert not _responder(_json_grande()).has_header('Content-Encoding')
+    assert not _responder(JsonResponse({'success': True}), 'br').has_header('Content-Encoding')
+    assert not _responder(HttpResponse('x' * 5000, content_type='text/plain'), 'br').has_header('Content-Encoding')
+
+
+def test_async_comprime_fuera_del_event_loop(monkeypatch):
+    hilos = []
+    original = CompresionMiddleware._comprimir
+
+    def registrar(self, request, response):
+        hilos.append(threading.current_thread())
+        return original(self, request, response)
+
+    monkeypatch.setattr(CompresionMiddleware, '_comprimir', registrar)
+
+    async def vista(request):
+        return _json_grande()
+
+    async def pedir():
+        middleware = CompresionMiddleware(vista)
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip')
+        return threading.current_thread(), await middleware(request)
+
+    hilo_del_loop, response = async_to_sync(pedir)()
+
+    assert response['Content-Encoding'] == 'gzip'
+    assert len(hilos) == 1 and hilos[0] is not hilo_del_loop
@@ -0,0 +1,143 @@
+"""
+Kardex de movimientos y saldos de stock (inventario/kardex.py) y el comando
+verificar_kardex
+"""
+import uuid
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Sum
+
+from core.consultas import registrar_consultas
+from inventario import kardex
+from inventario.kardex import StockInsuficiente
+from inventario.models import MovimientoStock, SaldoStock
+from productos.models import Producto
+
+
+@pytest.fixture
+def producto():
+    return Producto.objects.create(codigo=f'P-{uuid.uuid4().hex[:8]}', nombre='Guantes Látex Talla M x 100')
+
+
+@pytest.fixture
+def lote(producto):
+    return kardex.ingresar(producto, 'deposito', 100, codigo_lote='L-01', costo_unitario=12)
+
+
+def _kardex(lote):
+    return MovimientoStock.objects.filter(lote=lote).aggregate(total=Sum('cantidad'))['total']
+
+
+def test_ingreso(lote):
+    assert kardex.stock_base(lote) == 100
+    movimiento = MovimientoStock.objects.get(lote=lote)
+    assert (movimiento.tipo, movimiento.cantidad, movimiento.sucursal) == (kardex.INGRESO, 100, 'deposito')
+
+
+def test_stock_base_por_clave_primaria(lote):
+    with registrar_consultas(guardar_sql=True) as registro:
+        assert kardex.stock_base(lote.pk) == 100
+
+    assert registro.total == 1
+    assert '"saldo_stock"."lote_id" = ' in registro.consultas[0]['sql']
+
+
+def test_movimientos_actualizan_el_saldo(lote):
+    kardex.ajustar(lote, -3, observaciones='Conteo físico')
+    kardex.registrar_merma(lote, 2)
+    kardex.ajustar(lote, 1)
+
+    assert kardex.stock_base(lote) == 96 == _kardex(lote)
+    assert list(MovimientoStock.objects.filter(lote=lote).order_by('pk').values_list('tipo', flat=True)) == [
+        kardex.INGRESO, kardex.AJUSTE, kardex.MERMA, kardex.AJUSTE,
+    ]
+
+
+def test_salida_sin_stock_no_registra(lote):
+    with pytest.raises(StockInsuficiente) as error:
+        kardex.registrar_merma(lote, 101)
+
+    assert error.value.disponible == 100
+    assert kardex.stock_base(lote) == 100
+    assert MovimientoStock.objects.filter(lote=lote).count() == 1
+
+
+def test_signo_por_tipo(lote):
+    with pytest.raises(ValueError):
+        kardex.registrar([(lote, 5)], kardex.VENTA)
+    with pytest.raises(ValueError):
+        kardex.registrar([(lote, -5)], kardex.INGRESO)
+    with pytest.raises(ValueError):
+        kardex.ajustar(lote, 0)
+
+
+def test_transferencia(lote):
+    destino = kardex.transferir(lote, 'roydent', 30)
+
+    assert kardex.stock_base(lote) == 70
+    assert kardex.stock_base(destino) == 30
+    assert (destino.sucursal, destino.codigo_lote, destino.fecha_ingreso) == ('roydent', 'L-01', lote.fecha_ingreso)
+    transferencias = MovimientoStock.objects.filter(tipo=kardex.TRANSFERENCIA, producto=lote.producto)
+    assert sorted(transferencias.values_list('cantidad', flat=True)) == [-30, 30]
+    assert len(set(transferencias.values_list('referencia', flat=True))) == 1
+
+    with pytest.raises(ValueError):
+        kardex.transferir(lote, 'deposito', 1)
+
+
+def test_movimientos_inmutables(lote):
+    movimiento = MovimientoStock.objects.get(lote=lote)
+    movimiento.cantidad = 1
+
+    with pytest.raises(ValueError):
+        movimiento.save()
+    with pytest.raises(ValueError):
+        movimiento.delete()
+    # Tampoco en masa
+    with pytest.raises(ValueError):
+        MovimientoStock.objects.filter(lote=lote).update(cantidad=1)
+    with pytest.raises(ValueError):
+        MovimientoStock.objects.filter(lote=lote).delete()
+    assert MovimientoStock.objects.get(lote=lote).cantidad == 100
+
+
+def test_fechas_del_lote_se_copian_al_saldo(lote):
+    lote.fecha_vencimiento = lote.fecha_ingreso.date()
+    lote.save()
+
+    assert SaldoStock.objects.get(pk=lote.pk).fecha_vencimiento == lote.fecha_vencimiento
+
+
+def test_verificar_saldos(producto):
+    lotes = [kardex.ingresar(producto, 'roydent', 10) for _ in range(5)]
+    SaldoStock.objects.filter(pk=lotes[1].pk).update(cantidad=7)
+    SaldoStock.objects.filter(pk=lotes[3].pk).delete()
+
+    # Tandas de 2 lotes: las diferencias caen en tandas distintas
+    revisados, diferencias = kardex.verificar_saldos(tamano=2)
+    propias = [d for d in diferencias if d[0] in {lote.pk for lote in lotes}]
+    assert revisados >= 5
+    assert propias == [(lotes[1].pk, 7, 10), (lotes[3].pk, None, 10)]
+
+    kardex.verificar_saldos(tamano=2, corregir=True)
+    assert [kardex.stock_base(lote) for lote in lotes] == [10] * 5
+
+
+def test_comando(producto):
+    lote = kardex.ingresar(producto, 'roydent', 10)
+    SaldoStock.objects.filter(pk=lote.pk).update(cantidad=12)
+
+    with pytest.raises(CommandError):
+        call_command('verificar_kardex', stdout=StringIO())
+
+    salida = StringIO()
+    call_command('verificar_kardex', '--corregir', stdout=salida)
+    assert f'lote {lote.pk}' in salida.getvalue()
+    assert 'diferencia +2' in salida.getvalue()
+
+    salida = StringIO()
+    call_command('verificar_kardex', '--tamano', '50', stdout=salida)
+    assert 'sin diferencias' in salida.getvalue()
@@ -0,0 +1,84 @@
+"""
+Métricas de Prometheus (core/metricas.py) y el endpoint /metrics
+"""
+import subprocess
+import sys
+
+from django.test import Client
+from prometheus_client import REGISTRY
+
+from autenticacion.caches import ESTADISTICAS
+
+
+def _valor(nombre, **etiquetas):
+    return REGISTRY.get_sample_value(nombre, etiquetas) or 0
+
+
+def test_latencia_y_consultas_por_vista():
+    antes = _valor('roy_peticion_segundos_count', vista='autenticacion:api_listar_clientes', metodo='GET', estado='200')
+    Client().get('/auth/api/clientes/')
+
+    assert _valor(
+        'roy_peticion_segundos_count', vista='autenticacion:api_listar_clientes', metodo='GET', estado='200'
+    ) == antes + 1
+    assert _valor('roy_peticion_consultas_count', vista='autenticacion:api_listar_clientes') >= 1
+
+
+def test_intentos_de_login():
+    antes = _valor('roy_login_intentos_total', resultado='fallido')
+    Client().post('/auth/api/login/', {'nombre_usuario': 'nadie', 'password': 'x'}, content_type='application/json')
+
+    assert _valor('roy_login_intentos_total', resultado='fallido') == antes + 1
+
+
+def test_lecturas_de_cache():
+    ESTADISTICAS.invalidar()
+    antes = {
+        resultado: _valor('roy_cache_lecturas_total', espacio='estadisticas', resultado=resultado)
+        for resultado in ('fallo', 'local')
+    }
+    ESTADISTICAS.obtener_o_calcular(('prueba_metricas',), lambda: 1)
+    ESTADISTICAS.obtener_o_calcular(('prueba_metricas',), lambda: 1)
+
+    # Una lectura por llamada, aunque se vuelva a mirar la caché con el lock tomado
+    assert _valor('roy_cache_lecturas_total', espacio='estadisticas', resultado='fallo') == antes['fallo'] + 1
+    assert _valor('roy_cache_lecturas_total', espacio='estadisticas', resultado='local') == antes['local'] + 1
+    ESTADISTICAS.invalidar()
+
+
+def test_duracion_de_exportaciones():
+    antes = _valor('roy_exportacion_segundos_count', exportacion='proveedores_excel')
+    Client().get('/auth/api/proveedores/exportar-excel/')
+
+    assert _valor('roy_exportacion_segundos_count', exportacion='proveedores_excel') == antes + 1
+
+
+def test_endpoint_formato_prometheus():
+    Client().get('/auth/api/clientes/')
+    response = Client().get('/metrics')
+
+    assert response.status_code == 200
+    assert response['Content-Type'].startswith('text/plain; version=0.0.4')
+    assert b'roy_peticion_segundos_bucket{' in response.content
+
+
+def test_endpoint_con_token(settings):
+    settings.METRICAS_TOKEN = 'secreto'
+
+    assert Client().get('/metrics').status_code == 403
+    assert Client().get('/metrics', HTTP_AUTHORIZATION='Bearer otro').status_code == 403
+    assert Client().get('/metrics', HTTP_AUTHORIZATION='Bearer secreto').status_code == 200
+
+
+def test_suma_los_workers_en_modo_multiproceso(tmp_path, monkeypatch):
+    monkeypatch.setenv('PROMETHEUS_MULTIPROC_DIR', str(tmp_path))
+    # Dos "workers": procesos que registran un login cada uno y terminan
+    for _ in range(2):
+        subprocess.run(
+            [sys.executable, '-c', "from core.metricas import LOGIN; LOGIN.labels('exitoso').inc()"],
+            check=True,
+        )
+
+    response = Client().get('/metrics')
+
+    assert b'roy_login_intentos_total{resultado="exitoso"} 2.0' in response.content
@@ -0,0 +1,126 @@
+"""
+Caché de las páginas HTML (roy_representaciones/paginas.py)
+"""
+import json
+import re
+
+import pytest
+from django.test import Client
+
+from autenticacion import referencias
+from autenticacion.factories import UsuarioRolFactory
+from roy_representaciones import paginas
+from roy_representaciones.paginas import PAGINAS, calentar_paginas
+
+
+@pytest.fixture(autouse=True)
+def sin_manifiesto(settings):
+    # Sin collectstatic no hay manifiesto de estáticos
+    settings.STORAGES = {
+        **settings.STORAGES,
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }
+    settings.PAGINAS_CACHE = {'ACTIVA': True}
+    PAGINAS.invalidar()
+    yield
+    PAGINAS.invalidar()
+
+
+@pytest.fixture
+def renderizadas(monkeypatch):
+    """Plantillas renderizadas (las que no salieron de la caché)"""
+    lista = []
+    original = paginas._renderizar
+
+    def contar(template_name):
+        lista.append(template_name)
+        return original(template_name)
+
+    monkeypatch.setattr(paginas, '_renderizar', contar)
+    return lista
+
+
+def test_pagina_publica_con_etag_y_cache_control(renderizadas):
+    primera = Client().get('/login/')
+    segunda = Client().get('/login/')
+
+    assert primera.status_code == segunda.status_code == 200
+    assert primera.content == segunda.content
+    assert renderizadas == ['login.html']
+    assert 'public' in primera['Cache-Control'] and 'max-age=300' in primera['Cache-Control']
+
+    no_modificada = Client().get('/login/', HTTP_IF_NONE_MATCH=primera['ETag'])
+    assert no_modificada.status_code == 304
+    assert no_modificada.content == b''
+
+
+def test_panel_requiere_login():
+    response = Client().get('/panel-admin/')
+
+    assert response.status_code == 302
+    assert response['Location'].startswith('/login/')
+
+
+def test_panel_compartido_con_datos_del_usuario(administrador, vendedor, renderizadas):
+    otro_administrador = UsuarioRolFactory(rol=referencias.obtener_rol('ADMINISTRADOR')).usuario
+    usuarios = [administrador, otro_administrador, vendedor]
+    cliente = Client()
+
+    for usuario in usuarios:
+        cliente.force_login(usuario)
+        response = cliente.get('/panel-admin/')
+        assert response.status_code == 200
+        datos = re.search(
+            r'<script id="usuario-actual" type="application/json">(.*?)</script>',
+            response.content.decode(),
+        ).group(1)
+        assert json.loads(datos) == {
+            'id': usuario.pk, 'nombre_usuario': usuario.nombre_usuario,
+            'roles': [usuario.usuario_roles.get().rol.nombre_rol],
+        }
+        assert 'private' in response['Cache-Control']
+
+    # La plantilla no depende de los roles: todos comparten la página cacheada
+    assert renderizadas == ['panel-admin.html']
+
+
+def test_calentar_paginas(administrador, renderizadas):
+    generadas = calentar_paginas()
+    renderizadas_al_calentar = len(renderizadas)
+
+    cliente = Client()
+    cliente.get('/')
+    cliente.force_login(administrador)
+    cliente.get('/gestionclientes/')
+
+    assert generadas == renderizadas_al_calentar
+    assert 'gestionclientes.html' in renderizadas
+    assert len(renderizadas) == renderizadas_al_calentar
+
+
+def test_clave_con_version_del_despliegue(settings, renderizadas):
+    Client().get('/login/')
+    settings.PAGINAS_CACHE = {'ACTIVA': True, 'VERSION': 'despliegue-2'}
+    Client().get('/login/')
+    Client().get('/login/')
+
+    # Un despliegue nuevo no reutiliza el HTML que apunta a los estáticos anteriores
+    assert renderizadas == ['login.html', 'login.html']
+    assert paginas.version_despliegue() == 'despliegue-2'
+
+
+def test_version_desde_el_manifiesto(settings, tmp_path):
+    settings.STATIC_ROOT = str(tmp_path)
+    settings.STORAGES = {
+        **settings.STORAGES,
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage'},
+    }
+    manifiesto = tmp_path / 'staticfiles.json'
+    manifiesto.write_text('{"paths": {"css/app.css": "css/app.1.css"}, "version": "1.1"}')
+    primera = paginas.version_despliegue()
+
+    manifiesto.write_text('{"paths": {"css/app.css": "css/app.2.css"}, "version": "1.1"}')
+    settings.STATIC_ROOT = str(tmp_path)
+
+    assert primera
+    assert paginas.version_despliegue() not in ('', primera)
@@ -0,0 +1,199 @@
+"""
+Tests del pool de conexiones (core/db/pool.py)
+
+Se usan conexiones falsas con la misma interfaz que psycopg2, así que no
+hace falta un servidor PostgreSQL.
+"""
+import threading
+import time
+
+import pytest
+
+from core.db.pool import PoolAgotado, PoolConexiones, cerrar_pools, estadisticas_pools, obtener_pool
+
+
+class InfoFalsa:
+    def __init__(self):
+        self.transaction_status = 0
+
+
+class CursorFalso:
+    def __init__(self, conexion):
+        self.conexion = conexion
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute(self, sql):
+        if self.conexion.caida:
+            raise RuntimeError('server closed the connection unexpectedly')
+        self.conexion.consultas.append(sql)
+
+
+class ConexionFalsa:
+    """Sustituto de una conexión psycopg2"""
+
+    def __init__(self):
+        self.closed = 0
+        self.caida = False
+        self.info = InfoFalsa()
+        self.consultas = []
+        self.rollbacks = 0
+
+    def cursor(self):
+        return CursorFalso(self)
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = 0
+
+    def close(self):
+        self.closed = 1
+
+
+class ConectorFalso:
+    """Sustituto de psycopg2.connect que cuenta las conexiones abiertas"""
+
+    def __init__(self):
+        self.creadas = []
+
+    def __call__(self):
+        conexion = ConexionFalsa()
+        self.creadas.append(conexion)
+        return conexion
+
+
+@pytest.fixture
+def conectar():
+    return ConectorFalso()
+
+
+class TestPoolConexiones:
+
+    def test_reutiliza_conexion_devuelta(self, conectar):
+        pool = PoolConexiones(maximo=2)
+        primera = pool.obtener(conectar)
+        pool.devolver(primera)
+        segunda = pool.obtener(conectar)
+
+        assert segunda is primera
+        assert len(conectar.creadas) == 1
+        assert pool.estadisticas()['reutilizadas'] == 1
+
+    def test_revierte_transaccion_abierta_al_devolver(self, conectar):
+        pool = PoolConexiones(maximo=1)
+        conexion = pool.obtener(conectar)
+        conexion.info.transaction_status = 2  # INTRANS
+
+        pool.devolver(conexion)
+
+        assert conexion.rollbacks == 1
+        assert pool.obtener(conectar) is conexion
+
+    def test_descarta_conexion_cerrada_o_en_estado_desconocido(self, conectar):
+        pool = PoolConexiones(maximo=2)
+        cerrada = pool.obtener(conectar)
+        desconocida = pool.obtener(conectar)
+        cerrada.closed = 2
+        desconocida.info.transaction_status = 4  # UNKNOWN
+
+        pool.devolver(cerrada)
+        pool.devolver(desconocida)
+
+        estadisticas = pool.estadisticas()
+        assert estadisticas['libres'] == 0
+        assert estadisticas['descartadas'] == 2
+        assert desconocida.closed
+
+    def test_verifica_conexion_inactiva_antes_de_entregarla(self, conectar):
+        pool = PoolConexiones(maximo=1, verificar_tras=0)
+        conexion = pool.obtener(conectar)
+        pool.devolver(conexion)
+        conexion.caida = True
+
+        nueva = pool.obtener(conectar)
+
+        assert nueva is not conexion
+        assert conexion.closed
+        assert len(conectar.creadas) == 2
+
+    def test_reemplaza_conexion_que_supera_vida_maxima(self, conectar):
+        pool = PoolConexiones(maximo=1, vida_maxima=0.01)
+        conexion = pool.obtener(conectar)
+        pool.devolver(conexion)
+        time.sleep(0.02)
+
+        assert pool.obtener(conectar) is not conexion
+
+    def test_lleno_espera_y_luego_falla(self, conectar):
+        pool = PoolConexiones(maximo=1, espera=0.05)
+        pool.obtener(conectar)
+
+        with pytest.raises(PoolAgotado):
+            pool.obtener(conectar)
+        assert pool.estadisticas()['agotado'] == 1
+
+    def test_hilo_en_espera_recibe_conexion_liberada(self, conectar):
+        pool = PoolConexiones(maximo=1, espera=2)
+        conexion = pool.obtener(conectar)
+        recibida = []
+
+        hilo = threading.Thread(target=lambda: recibida.append(pool.obtener(conectar)))
+        hilo.start()
+        time.sleep(0.05)
+        pool.devolver(conexion)
+        hilo.join(1)
+
+        assert recibida == [conexion]
+        assert pool.estadisticas()['esperas'] >= 1
+
+    def test_no_supera_el_maximo_con_muchos_hilos(self, conectar):
+        pool = PoolConexiones(maximo=3, espera=5)
+        en_uso = []
+        maximo_visto = []
+        lock = threading.Lock()
+
+        def trabajar():
+            for _ in range(20):
+                conexion = pool.obtener(conectar)
+                with lock:
+                    en_uso.append(conexion)
+                    maximo_visto.append(len(en_uso))
+                time.sleep(0.001)
+                with lock:
+                    en_uso.remove(conexion)
+                pool.devolver(conexion)
+
+        hilos = [threading.Thread(target=trabajar) for _ in range(8)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        assert max(maximo_visto) <= 3
+        assert len(conectar.creadas) <= 3
+        assert pool.estadisticas()['en_uso'] == 0
+
+    def test_error_al_conectar_libera_el_cupo(self):
+        pool = PoolConexiones(maximo=1, espera=0.05)
+
+        def fallar():
+            raise RuntimeError('could not connect to server')
+
+        with pytest.raises(RuntimeError):
+            pool.obtener(fallar)
+        assert pool.estadisticas()['en_uso'] == 0
+
+    def test_cerrar_pools_descarta_conexiones_libres(self, conectar):
+        pool = obtener_pool('prueba', {'MAX': 2})
+        conexion = pool.obtener(conectar)
+        pool.devolver(conexion)
+        assert 'prueba' in estadisticas_pools()
+
+        cerrar_pools()
+
+        assert conexion.closed
+        assert 'prueba' not in estadisticas_pools()
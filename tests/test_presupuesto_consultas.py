@@ -0,0 +1,115 @@
+"""
+Presupuesto de consultas SQL por endpoint
+
+Cada endpoint debe ejecutar un número de consultas que no crezca con la
+cantidad de filas. Si un cambio introduce un N+1, estos tests fallan y
+muestran las consultas ejecutadas. Los datos se crean en cada test con las
+factories, así el resultado no depende de lo que haya en la BD.
+"""
+import uuid
+
+import pytest
+from django.test import Client
+
+from autenticacion import referencias
+from autenticacion.factories import ClienteFactory, ProveedorFactory, UsuarioRolFactory
+from core.consultas import presupuesto_consultas, registrar_consultas
+
+# URL -> máximo de consultas
+PRESUPUESTOS = {
+    '/auth/api/usuarios/': 2,
+    '/auth/api/clientes/': 2,
+    '/auth/api/proveedores/': 2,
+    '/auth/api/roles/': 3,
+    '/api/permisos/': 3,
+    '/api/roles/permisos/': 5,
+}
+
+
+# Listado -> factory que crea una fila con el apellido indicado
+LISTADOS = {
+    '/auth/api/usuarios/': lambda apellido: UsuarioRolFactory(
+        rol=referencias.obtener_rol('VENDEDOR_ROYDENT'), usuario__persona__apellido_paterno=apellido
+    ),
+    '/auth/api/clientes/': lambda apellido: ClienteFactory(
+        tipo_cliente=referencias.tipos_cliente()[0], usuario__persona__apellido_paterno=apellido
+    ),
+    '/auth/api/proveedores/': lambda apellido: ProveedorFactory(persona__apellido_paterno=apellido),
+}
+
+
+@pytest.fixture
+def client():
+    return Client()
+
+
+@pytest.fixture
+def apellido(sembrado):
+    """Apellido único para que los listados devuelvan solo las filas del test"""
+    return f'Presupuesto{uuid.uuid4().hex[:8]}'
+
+
+@pytest.fixture
+def con_datos(apellido):
+    """Algunas filas con rol en cada listado"""
+    for fabricar in LISTADOS.values():
+        for _ in range(3):
+            fabricar(apellido)
+
+
+@pytest.mark.parametrize('url,maximo', PRESUPUESTOS.items())
+def test_presupuesto_por_endpoint(client, con_datos, url, maximo):
+    with presupuesto_consultas(maximo):
+        response = client.get(url)
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('url,fabricar', LISTADOS.items())
+def test_consultas_no_crecen_con_las_filas(client, apellido, url, fabricar):
+    def listar():
+        with registrar_consultas() as registro:
+            response = client.get(url, {'busqueda': apellido})
+        return response.json()['count'], registro.total
+
+    for _ in range(3):
+        fabricar(apellido)
+    filas, pocas = listar()
+    assert filas == 3
+
+    for _ in range(7):
+        fabricar(apellido)
+    filas, muchas = listar()
+    assert filas == 10
+
+    assert muchas == pocas
+
+
+def test_presupuesto_excedido_lista_las_consultas():
+    from autenticacion.models import Rol
+
+    with pytest.raises(AssertionError) as error:
+        with presupuesto_consultas(1):
+            list(Rol.objects.all())
+            list(Rol.objects.all())
+
+    assert '2 consultas (presupuesto: 1)' in str(error.value)
+    assert 'duplicadas' in str(error.value)
+
+
+def test_registro_detecta_repeticiones():
+    from autenticacion.models import Rol
+
+    with registrar_consultas() as registro:
+        for nombre in ('A', 'B', 'C'):
+            Rol.objects.filter(nombre_rol=nombre).first()
+
+    assert registro.total == 3
+    assert registro.duplicadas == 0
+    assert registro.max_repeticiones == 3
+
+
+def test_middleware_agrega_encabezados(client):
+    response = client.get('/auth/api/roles/')
+
+    assert 'X-Consultas' in response
+    assert 'Server-Timing' in response
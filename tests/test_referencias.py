@@ -0,0 +1,53 @@
+"""
+Invalidación de los datos de referencia (autenticacion/referencias.py)
+"""
+import uuid
+
+from django.core.cache import cache
+
+from autenticacion import referencias
+from autenticacion.models import Permiso, Rol, RolPermiso
+
+
+def _version():
+    return cache.get(referencias.CLAVE_VERSION)
+
+
+def test_cambio_invalida_al_confirmar(sembrado, django_capture_on_commit_callbacks):
+    referencias.registro.datos()
+    version = _version()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        rol = Rol.objects.create(nombre_rol=f'ROL_{uuid.uuid4().hex[:6]}')
+        RolPermiso.objects.create(rol=rol, permiso=Permiso.objects.first())
+        # Antes de confirmar otro worker seguiría leyendo la versión anterior
+        assert _version() == version
+
+    assert _version() > version
+    assert rol.nombre_rol in referencias.matriz_permisos()
+
+
+def test_actualizar_permisos_usuario(api, administrador, vendedor, django_capture_on_commit_callbacks):
+    permiso = Permiso.objects.get(codigo_permiso='IMPORTAR_CLIENTES')
+    version = _version()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api(administrador).post(
+            f'/auth/api/usuarios/{vendedor.id}/permisos/actualizar/',
+            {'permisos': [permiso.id, permiso.id, 'x', 999999]}, content_type='application/json',
+        )
+
+    assert response.json()['success']
+    assert _version() > version
+    assert referencias.matriz_permisos()['VENDEDOR_ROYDENT'] == [permiso.id]
+
+
+def test_actualizar_permisos_solo_administrador(api, vendedor):
+    # Un vendedor no puede darse IMPORTAR_CLIENTES a sí mismo
+    permiso = Permiso.objects.get(codigo_permiso='IMPORTAR_CLIENTES')
+    url = f'/auth/api/usuarios/{vendedor.id}/permisos/actualizar/'
+    datos = {'permisos': [permiso.id]}
+
+    assert api().post(url, datos, content_type='application/json').status_code == 401
+    assert api(vendedor).post(url, datos, content_type='application/json').status_code == 403
+    assert permiso.id not in referencias.matriz_permisos()['VENDEDOR_ROYDENT']
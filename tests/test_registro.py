@@ -0,0 +1,46 @@
+"""
+Registro transaccional de clientes (RegistroSerializer.create)
+"""
+import random
+import uuid
+from unittest import mock
+
+from autenticacion.models import Cliente, Persona, Usuario, UsuarioRol
+
+
+def _datos():
+    sufijo = uuid.uuid4().hex[:8]
+    return {
+        'nombre': 'Ana',
+        'apellido_paterno': 'Quispe',
+        'cedula_identidad': str(random.randint(1000000, 8999999)),
+        'numero_celular': '71234567',
+        'correo': f'registro.{sufijo}@correo.com',
+        'nombre_usuario': f'reg{sufijo}',
+        'password': 'Clave.123',
+        'confirmar_password': 'Clave.123',
+    }
+
+
+def test_registro_crea_todo(api, sembrado):
+    datos = _datos()
+
+    response = api().post('/auth/api/registro/', datos, content_type='application/json')
+
+    assert response.status_code == 201
+    usuario = Usuario.objects.get(nombre_usuario=datos['nombre_usuario'])
+    assert usuario.persona.cedula_identidad == datos['cedula_identidad']
+    assert UsuarioRol.objects.filter(usuario=usuario, rol__nombre_rol='CLIENTE').exists()
+    assert Cliente.objects.filter(usuario=usuario).exists()
+
+
+def test_fallo_a_mitad_no_deja_registros(api, sembrado):
+    datos = _datos()
+
+    # Persona, Usuario y UsuarioRol ya se insertaron cuando falla el Cliente
+    with mock.patch.object(Cliente.objects, 'create', side_effect=RuntimeError('fallo simulado')):
+        response = api().post('/auth/api/registro/', datos, content_type='application/json')
+
+    assert response.status_code == 500
+    assert not Persona.objects.filter(cedula_identidad=datos['cedula_identidad']).exists()
+    assert not Usuario.objects.filter(nombre_usuario=datos['nombre_usuario']).exists()
@@ -0,0 +1,86 @@
+"""
+Alta masiva de usuarios (crear_usuarios_lote e ImportadorUsuarios)
+"""
+import random
+import uuid
+from unittest import mock
+
+from django.db import connection
+
+from autenticacion import importacion, views
+from autenticacion.factories import UsuarioFactory
+from autenticacion.importacion import ImportadorUsuarios, leer_items
+from autenticacion.models import Usuario, UsuarioRol
+
+URL = '/auth/api/usuarios/crear-lote/'
+
+
+def _usuario(**campos):
+    sufijo = uuid.uuid4().hex[:8]
+    return {
+        'nombre': 'Luis',
+        'apellido_paterno': 'Mamani',
+        'cedula_identidad': str(random.randint(1000000, 8999999)),
+        'numero_celular': '61234567',
+        'correo': f'lote.{sufijo}@correo.com',
+        'nombre_usuario': f'lote{sufijo}',
+        'password': 'Clave.123',
+        'rol': 'vendedor_roydent',
+        **campos,
+    }
+
+
+def _enviar(cliente_http, items):
+    return cliente_http.post(URL, items, content_type='application/json')
+
+
+def test_requiere_administrador(api, vendedor, administrador):
+    assert _enviar(api(), [_usuario()]).status_code == 401
+    assert _enviar(api(vendedor), [_usuario()]).status_code == 403
+    assert _enviar(api(administrador), [_usuario()]).status_code == 201
+
+
+def test_resultados_por_elemento(api, administrador):
+    existente = UsuarioFactory(nombre_usuario=f'Ya{uuid.uuid4().hex[:8]}')
+    items = [_usuario(), _usuario(nombre_usuario=existente.nombre_usuario.lower()), _usuario(rol='NO_EXISTE')]
+
+    reporte = _enviar(api(administrador), items).json()['reporte']
+
+    assert [r['success'] for r in reporte['resultados']] == [True, False, False]
+    assert reporte['resultados'][1]['errores'] == {'nombre_usuario': 'El nombre de usuario ya existe'}
+    assert 'rol' in reporte['resultados'][2]['errores']
+    usuario = Usuario.objects.get(id=reporte['resultados'][0]['id'])
+    assert usuario.check_password('Clave.123')
+    assert UsuarioRol.objects.filter(usuario=usuario, rol__nombre_rol='VENDEDOR_ROYDENT').exists()
+
+
+def test_limite_del_lote(api, administrador):
+    response = _enviar(api(administrador), [{}] * (views.LOTE_USUARIOS_MAXIMO + 1))
+
+    assert response.status_code == 400
+    assert str(views.LOTE_USUARIOS_MAXIMO) in response.json()['error']
+
+
+def test_hashea_fuera_de_la_transaccion(sembrado):
+    bloques_abiertos = []
+    hashear = importacion.hashear_passwords
+
+    def registrar(passwords):
+        bloques_abiertos.append(len(connection.atomic_blocks))
+        return hashear(passwords)
+
+    # El test ya corre dentro de una transacción; el bloque no debe abrir otra
+    fuera = len(connection.atomic_blocks)
+    with mock.patch.object(importacion, 'hashear_passwords', registrar):
+        reporte = ImportadorUsuarios().procesar(leer_items([_usuario(), _usuario()]))
+
+    assert reporte['creados'] == 2
+    assert bloques_abiertos == [fuera]
+
+
+def test_solo_validar_no_hashea(sembrado):
+    with mock.patch.object(importacion, 'hashear_passwords') as hashear:
+        reporte = ImportadorUsuarios(solo_validar=True).procesar(leer_items([_usuario()]))
+
+    assert reporte['validos'] == 1
+    hashear.assert_not_called()
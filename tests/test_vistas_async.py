@@ -0,0 +1,122 @@
+"""
+Vistas async (ASGI): deben responder lo mismo que las vistas síncronas
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+from django.conf import settings
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from autenticacion import referencias
+from autenticacion.caches import ESTADISTICAS
+from autenticacion.factories import ClienteFactory, ProveedorFactory, UsuarioRolFactory
+from autenticacion.models import Usuario
+
+# URL síncrona -> URL async
+EQUIVALENTES = {
+    '/auth/api/usuarios/': '/auth/api/async/usuarios/',
+    '/auth/api/usuarios/?estado=activo&sucursal=deposito': '/auth/api/async/usuarios/?estado=activo&sucursal=deposito',
+    '/auth/api/clientes/': '/auth/api/async/clientes/',
+    '/auth/api/clientes/?busqueda=a': '/auth/api/async/clientes/?busqueda=a',
+    '/auth/api/proveedores/': '/auth/api/async/proveedores/',
+    '/auth/api/usuarios/estadisticas/': '/auth/api/async/usuarios/estadisticas/',
+    '/auth/api/clientes/estadisticas/': '/auth/api/async/clientes/estadisticas/',
+    '/auth/api/proveedores/estadisticas/': '/auth/api/async/proveedores/estadisticas/',
+}
+
+
+@pytest.fixture
+def datos(sembrado):
+    tipo = referencias.tipos_cliente()[0]
+    ClienteFactory.create_batch(3, tipo_cliente=tipo)
+    ClienteFactory(tipo_cliente=tipo, empresa=True)
+    ProveedorFactory.create_batch(2)
+    administrador = UsuarioRolFactory(rol=referencias.obtener_rol('ADMINISTRADOR')).usuario
+    ESTADISTICAS.invalidar()
+    yield administrador
+    ESTADISTICAS.invalidar()
+
+
+def _async(metodo, url, headers=None):
+    async def pedir():
+        return await getattr(AsyncClient(), metodo)(url, headers=headers)
+    return async_to_sync(pedir)()
+
+
+def _get_async(url, headers=None):
+    return _async('get', url, headers)
+
+
+def _token(usuario):
+    return f'Bearer {RefreshToken.for_user(usuario).access_token}'
+
+
+@pytest.mark.parametrize('url_sync,url_async', EQUIVALENTES.items())
+def test_misma_respuesta_que_la_vista_sincrona(datos, url_sync, url_async):
+    esperada = Client().get(url_sync)
+    response = _get_async(url_async)
+
+    assert response.status_code == 200
+    assert response.json() == esperada.json()
+
+
+def test_obtener_por_id(datos):
+    cliente = ClienteFactory(tipo_cliente=referencias.tipos_cliente()[0])
+    for url in (f'/auth/api/usuarios/{datos.id}/', f'/auth/api/clientes/{cliente.id}/'):
+        esperada = Client().get(url)
+        response = _get_async(url.replace('/api/', '/api/async/'))
+        assert response.json() == esperada.json()
+
+    assert _get_async('/auth/api/async/proveedores/0/').status_code == 404
+
+
+def test_verificar_token(datos):
+    esperada = Client().get('/auth/api/verificar-token/', HTTP_AUTHORIZATION=_token(datos))
+    response = _get_async('/auth/api/async/verificar-token/', {'Authorization': _token(datos)})
+
+    assert response.status_code == 200
+    assert response.json() == esperada.json()
+    assert _get_async('/auth/api/async/verificar-token/').status_code == 401
+    assert _get_async('/auth/api/async/verificar-token/', {'Authorization': 'Bearer x'}).status_code == 401
+
+
+def test_estadisticas_del_panel(datos):
+    response = _get_async('/auth/api/async/estadisticas/', {'Authorization': _token(datos)})
+    ESTADISTICAS.invalidar()
+    esperada = Client().get('/auth/api/estadisticas/', HTTP_AUTHORIZATION=_token(datos))
+
+    assert response.status_code == 200
+    assert response.json() == esperada.json()
+    assert response.json()['total_usuarios'] == Usuario.objects.filter(is_active=True).count()
+
+
+def test_solo_get(datos):
+    response = _async('post', '/auth/api/async/clientes/')
+    assert response.status_code == 405
+
+
+def test_asgi_cierra_las_conexiones():
+    codigo = (
+        'import roy_representaciones.asgi; from django.conf import settings; '
+        'print(settings.DATABASES["default"]["CONN_MAX_AGE"])'
+    )
+    entorno = {k: v for k, v in os.environ.items() if k not in ('DB_CONN_MAX_AGE', 'DJANGO_SETTINGS_MODULE')}
+    salida = subprocess.run(
+        [sys.executable, '-c', codigo], capture_output=True, text=True, env=entorno, cwd=settings.BASE_DIR,
+    )
+
+    assert salida.stdout.strip() == '0', salida.stderr
+
+
+def test_metricas_cuentan_las_consultas_async(datos, settings):
+    # Las consultas corren en el hilo de sync_to_async, no en el del event loop
+    settings.METRICAS_PETICIONES = {'ENCABEZADOS': True}
+    esperada = Client().get('/auth/api/clientes/')
+    response = _get_async('/auth/api/async/clientes/')
+
+    assert int(response['X-Consultas']) > 0
+    assert response['X-Consultas'] == esperada['X-Consultas']